@@ -0,0 +1,116 @@
+"""
+Compares the throughput of sequential, threaded (`PaystackClient.map`) and async
+(`AsyncPaystackClient.map`) batch calls against a local stand-in for paystack's API,
+with and without a shared connection pool (`http_client`).
+
+The stand-in server answers every request after a fixed delay to simulate network
+and processing latency, so no request leaves the machine.
+
+Usage:
+    uv run python benchmarks/batch_throughput.py --requests 400 --latency 0.02 --workers 16
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import httpx
+
+from pypaystack2 import AsyncPaystackClient, PaystackClient
+from pypaystack2.base_clients import AbstractAPIClient
+
+
+def start_stand_in_server(latency: float) -> ThreadingHTTPServer:
+    body = json.dumps(
+        {"status": True, "message": "Verification successful", "data": None}
+    ).encode()
+
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+        disable_nagle_algorithm = True
+
+        def do_GET(self) -> None:
+            time.sleep(latency)
+            self.send_response(200)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, *args: object) -> None:
+            pass
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+def report(label: str, requests: int, elapsed: float) -> None:
+    print(f"{label:<20}{elapsed:>10.2f}s{requests / elapsed:>12.1f} req/s")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--requests", type=int, default=400)
+    parser.add_argument("--latency", type=float, default=0.02)
+    parser.add_argument("--workers", type=int, default=16)
+    args = parser.parse_args()
+
+    server = start_stand_in_server(args.latency)
+    AbstractAPIClient._BASE_URL = f"http://127.0.0.1:{server.server_address[1]}"
+    os.environ.setdefault("PAYSTACK_SECRET_KEY", "sk_test_benchmark")
+    references = [f"ref-{i}" for i in range(args.requests)]
+
+    limits = httpx.Limits(max_connections=args.workers)
+
+    client = PaystackClient()
+    started_at = time.perf_counter()
+    for reference in references:
+        client.transactions.verify(reference)
+    report("sequential", args.requests, time.perf_counter() - started_at)
+
+    with httpx.Client(limits=limits) as http_client:
+        pooled_client = PaystackClient(http_client=http_client)
+        started_at = time.perf_counter()
+        for reference in references:
+            pooled_client.transactions.verify(reference)
+        report("sequential (pooled)", args.requests, time.perf_counter() - started_at)
+
+    started_at = time.perf_counter()
+    results = client.map(client.transactions.verify, references, workers=args.workers)
+    report("threaded", args.requests, time.perf_counter() - started_at)
+    assert all(result.ok for result in results)
+
+    with httpx.Client(limits=limits) as http_client:
+        pooled_client = PaystackClient(http_client=http_client)
+        started_at = time.perf_counter()
+        results = pooled_client.map(
+            pooled_client.transactions.verify, references, workers=args.workers
+        )
+        report("threaded (pooled)", args.requests, time.perf_counter() - started_at)
+        assert all(result.ok for result in results)
+
+    async def run_async(pooled: bool) -> None:
+        async with httpx.AsyncClient(limits=limits) as http_client:
+            async_client = AsyncPaystackClient(
+                http_client=http_client if pooled else None
+            )
+            async for result in async_client.map(
+                async_client.transactions.verify, references, concurrency=args.workers
+            ):
+                assert result.ok
+
+    for label, pooled in (("async", False), ("async (pooled)", True)):
+        started_at = time.perf_counter()
+        asyncio.run(run_async(pooled))
+        report(label, args.requests, time.perf_counter() - started_at)
+    server.shutdown()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,66 @@
+"""
+Compares `calculate_fee` called in a loop with `calculate_fees` over a list and over a
+numpy array of amounts, for NGN local transactions and NGN transfers.
+
+`calculate_fees` only takes its vectorized path when numpy is installed.
+
+Usage:
+    uv run python benchmarks/fee_calculation.py --amounts 1000000
+"""
+
+import argparse
+import random
+import time
+from typing import Any
+
+from pypaystack2 import PaystackClient
+from pypaystack2.enums import Currency
+from pypaystack2.fees import numpy
+
+
+def report(label: str, amounts: int, elapsed: float) -> None:
+    print(f"{label:<32}{elapsed:>10.3f}s{amounts / elapsed:>16,.0f} amounts/s")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--amounts", type=int, default=1_000_000)
+    parser.add_argument("--scalar-amounts", type=int, default=100_000)
+    args = parser.parse_args()
+
+    client = PaystackClient(secret_key="sk_test_benchmark")
+    generator = random.Random(0)
+    amounts = [generator.randrange(100, 100_000_000) for _ in range(args.amounts)]
+    scalar_amounts = amounts[: args.scalar_amounts]
+
+    for label, options in (
+        ("transactions", {}),
+        ("transfers", {"service": "transfers"}),
+    ):
+        print(f"NGN {label}")
+        started_at = time.perf_counter()
+        expected = [
+            client.calculate_fee(amount, Currency.NGN, **options)  # type: ignore[misc]
+            for amount in scalar_amounts
+        ]
+        report(
+            "calculate_fee loop", len(scalar_amounts), time.perf_counter() - started_at
+        )
+
+        started_at = time.perf_counter()
+        fees: Any = client.calculate_fees(amounts, Currency.NGN, **options)
+        report("calculate_fees (list)", len(amounts), time.perf_counter() - started_at)
+        assert fees[: len(expected)] == expected
+
+        if numpy is not None:
+            array = numpy.array(amounts, dtype=numpy.int64)
+            started_at = time.perf_counter()
+            fees = client.calculate_fees(array, Currency.NGN, **options)
+            report(
+                "calculate_fees (numpy)", len(amounts), time.perf_counter() - started_at
+            )
+            assert fees[: len(expected)].tolist() == expected
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,65 @@
+"""
+Compares the latency of computing one fee with `calculate_fee`, with
+`PaystackClient.fee_schedule(...).fee` and with a `FeeSchedule` kept by the caller,
+for a few currencies and services.
+
+Usage:
+    uv run python benchmarks/fee_schedule_latency.py --calls 200000
+"""
+
+import argparse
+import random
+import time
+from typing import Any, Callable
+
+from pypaystack2 import PaystackClient
+from pypaystack2.enums import Currency
+
+CASES: list[tuple[str, Currency, dict[str, Any]]] = [
+    ("NGN transactions", Currency.NGN, {}),
+    ("NGN transfers", Currency.NGN, {"service": "transfers"}),
+    ("ZAR transactions", Currency.ZAR, {"service": "transactions"}),
+    ("KES mpesa paybill", Currency.KES, {"service": "transfers_to_mpesa_paybill"}),
+]
+
+
+def report(label: str, calls: int, elapsed: float) -> None:
+    print(f"{label:<32}{elapsed / calls * 1e9:>12,.0f} ns/call")
+
+
+def measure(label: str, amounts: list[int], fee: Callable[[int], int]) -> list[int]:
+    started_at = time.perf_counter()
+    fees = [fee(amount) for amount in amounts]
+    report(label, len(amounts), time.perf_counter() - started_at)
+    return fees
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--calls", type=int, default=200_000)
+    args = parser.parse_args()
+
+    client = PaystackClient(secret_key="sk_test_benchmark")
+    generator = random.Random(0)
+    amounts = [generator.randrange(100, 100_000_000) for _ in range(args.calls)]
+
+    for label, currency, options in CASES:
+        print(label)
+        expected = measure(
+            "calculate_fee",
+            amounts,
+            lambda amount: client.calculate_fee(amount, currency, **options),  # type: ignore[misc]
+        )
+        fees = measure(
+            "fee_schedule(...).fee",
+            amounts,
+            lambda amount: client.fee_schedule(currency, **options).fee(amount),
+        )
+        assert fees == expected
+        schedule = client.fee_schedule(currency, **options)
+        fees = measure("schedule.fee", amounts, schedule.fee)
+        assert fees == expected
+
+
+if __name__ == "__main__":
+    main()
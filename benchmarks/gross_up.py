@@ -0,0 +1,82 @@
+"""
+Compares finding the amount to charge for a net amount by searching with
+`calculate_fee` with `calculate_gross_amount` and `calculate_gross_amounts`, for NGN
+local transactions.
+
+The search is a bisection for an amount netting at least the net amount, which is
+only correct where net amounts grow with amounts, i.e. away from the flat fee waiver.
+
+Usage:
+    uv run python benchmarks/gross_up.py --net-amounts 100000
+"""
+
+import argparse
+import random
+import time
+
+from pypaystack2 import PaystackClient
+from pypaystack2.enums import Currency
+from pypaystack2.fees import numpy
+
+
+def report(label: str, net_amounts: int, elapsed: float) -> None:
+    print(f"{label:<32}{elapsed:>10.3f}s{net_amounts / elapsed:>16,.0f} amounts/s")
+
+
+def search(client: PaystackClient, net_amount: int) -> int:
+    low, high = net_amount, 2 * net_amount + 1_000_000
+    while low < high:
+        middle = (low + high) // 2
+        if middle - client.calculate_fee(middle, Currency.NGN) >= net_amount:
+            high = middle
+        else:
+            low = middle + 1
+    return low
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--net-amounts", type=int, default=100_000)
+    parser.add_argument("--search-net-amounts", type=int, default=2_000)
+    args = parser.parse_args()
+
+    client = PaystackClient(secret_key="sk_test_benchmark")
+    generator = random.Random(0)
+    net_amounts = [
+        generator.randrange(1_000_000, 100_000_000) for _ in range(args.net_amounts)
+    ]
+    search_net_amounts = net_amounts[: args.search_net_amounts]
+
+    started_at = time.perf_counter()
+    expected = [search(client, net_amount) for net_amount in search_net_amounts]
+    report("calculate_fee search", len(expected), time.perf_counter() - started_at)
+
+    started_at = time.perf_counter()
+    amounts = [
+        client.calculate_gross_amount(net_amount, Currency.NGN)
+        for net_amount in net_amounts
+    ]
+    report("calculate_gross_amount", len(amounts), time.perf_counter() - started_at)
+    assert amounts[: len(expected)] == expected
+
+    started_at = time.perf_counter()
+    amounts = client.calculate_gross_amounts(net_amounts, Currency.NGN)
+    report(
+        "calculate_gross_amounts (list)", len(amounts), time.perf_counter() - started_at
+    )
+    assert amounts[: len(expected)] == expected
+
+    if numpy is not None:
+        array = numpy.array(net_amounts, dtype=numpy.int64)
+        started_at = time.perf_counter()
+        amounts = client.calculate_gross_amounts(array, Currency.NGN)
+        report(
+            "calculate_gross_amounts (numpy)",
+            len(amounts),
+            time.perf_counter() - started_at,
+        )
+        assert amounts[: len(expected)].tolist() == expected
+
+
+if __name__ == "__main__":
+    main()
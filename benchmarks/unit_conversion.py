@@ -0,0 +1,71 @@
+"""
+Compares `to_subunit` and `to_base_unit` called in a loop with `to_subunits` and
+`to_base_units` over a list and over a numpy array of values.
+
+`to_subunits` only takes its vectorized path when numpy is installed.
+
+Usage:
+    uv run python benchmarks/unit_conversion.py --values 1000000
+"""
+
+import argparse
+import random
+import time
+from typing import Any
+
+from pypaystack2 import PaystackClient
+from pypaystack2.fees import numpy
+
+
+def report(label: str, values: int, elapsed: float) -> None:
+    print(f"{label:<32}{elapsed:>10.3f}s{values / elapsed:>16,.0f} values/s")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--values", type=int, default=1_000_000)
+    args = parser.parse_args()
+
+    client = PaystackClient(secret_key="sk_test_benchmark")
+    generator = random.Random(0)
+    subunits = [generator.randrange(100, 100_000_000) for _ in range(args.values)]
+    floats = [subunit / 100 for subunit in subunits]
+
+    for label, values in (("floats", floats), ("integers", subunits)):
+        print(f"to_subunit ({label})")
+        started_at = time.perf_counter()
+        expected = [client.to_subunit(value) for value in values]
+        report("to_subunit loop", len(values), time.perf_counter() - started_at)
+
+        started_at = time.perf_counter()
+        results: Any = client.to_subunits(values)
+        report("to_subunits (list)", len(values), time.perf_counter() - started_at)
+        assert results == expected
+
+        if numpy is not None:
+            array = numpy.array(values)
+            started_at = time.perf_counter()
+            results = client.to_subunits(array)
+            report("to_subunits (numpy)", len(values), time.perf_counter() - started_at)
+            assert results.tolist() == expected
+
+    print("to_base_unit")
+    started_at = time.perf_counter()
+    expected = [client.to_base_unit(subunit) for subunit in subunits]
+    report("to_base_unit loop", len(subunits), time.perf_counter() - started_at)
+
+    started_at = time.perf_counter()
+    results = client.to_base_units(subunits)
+    report("to_base_units (list)", len(subunits), time.perf_counter() - started_at)
+    assert results == expected
+
+    if numpy is not None:
+        array = numpy.array(subunits, dtype=numpy.int64)
+        started_at = time.perf_counter()
+        results = client.to_base_units(array)
+        report("to_base_units (numpy)", len(subunits), time.perf_counter() - started_at)
+        assert results.tolist() == expected
+
+
+if __name__ == "__main__":
+    main()
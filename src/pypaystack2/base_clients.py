@@ -15,9 +15,12 @@ from httpx import HTTPError
 from pydantic import ValidationError
 
 from pypaystack2._metadata import __version__
+from pypaystack2.caching import ResponseCache
 from pypaystack2.exceptions import ClientNetworkError, MissingSecretKeyException
+from pypaystack2.fees import FeeScheduleBook
 from pypaystack2.fees_calculation_mixin import FeesCalculationMixin
 from pypaystack2.models import Response
+from pypaystack2.rate_limiting import AsyncRateLimiter, RateLimiter
 from pypaystack2.types import PaystackDataModel
 
 logger = logging.getLogger(__name__)
@@ -63,14 +66,33 @@ class AbstractAPIClient(FeesCalculationMixin, ABC):
     _BASE_URL = "https://api.paystack.co"
     _SECRET_KEY_IN_ENV_KEY = "PAYSTACK_SECRET_KEY"
 
-    def __init__(self, secret_key: str | None = None):
+    def __init__(
+        self,
+        secret_key: str | None = None,
+        rate_limiter: RateLimiter | AsyncRateLimiter | None = None,
+        response_cache: ResponseCache | None = None,
+        fee_schedule_book: FeeScheduleBook | None = None,
+    ):
         """
         Args:
             secret_key:
                 Your paystack integration secret key. Required only
                 if it is not provided in your environmental
                 variables as ``PAYSTACK_SECRET_KEY=your_key``
+            rate_limiter:
+                An optional rate limiter every request made by the client
+                waits on. A `RateLimiter` for sync clients and an
+                `AsyncRateLimiter` for async clients.
+            response_cache:
+                An optional `ResponseCache` the responses of GET requests
+                are served from.
+            fee_schedule_book:
+                An optional `FeeScheduleBook` the fee calculation methods
+                look the fees up in instead of the built-in fees.
         """
+        self._rate_limiter = rate_limiter
+        self._response_cache = response_cache
+        self.fee_schedule_book = fee_schedule_book
         self._secret_key: str | None
         if secret_key:
             self._secret_key = secret_key
@@ -146,7 +168,23 @@ class AbstractAPIClient(FeesCalculationMixin, ABC):
                 code=None,
                 raw=raw_response.content,
             )
+        return self._build_response(
+            raw_response.status_code,
+            response_body,
+            response_data_model_class,
+            raise_serialization_exception,
+        )
 
+    def _build_response(
+        self,
+        status_code: int,
+        response_body: dict[str, Any],
+        response_data_model_class: Type[PaystackDataModel] | None = None,
+        raise_serialization_exception: bool = False,
+    ) -> (
+        Response[None] | Response[list[PaystackDataModel]] | Response[PaystackDataModel]
+    ):
+        """Serializes the JSON body of a response into a `Response`."""
         status = response_body.get("status", False)
         message = response_body.get("message", "")
         meta = response_body.get("meta", None)
@@ -155,14 +193,14 @@ class AbstractAPIClient(FeesCalculationMixin, ABC):
         if data := response_body.get("data", None):
             data = self._to_pydantic_model(
                 self._normalize_data(data),
-                raw_response.status_code,
+                status_code,
                 response_data_model_class,
                 raise_serialization_exception,
             )
         if isinstance(data, dict) and len(data) == 0:  # Data is empty
             data = None
         return Response(
-            status_code=cast(HTTPStatus, raw_response.status_code),
+            status_code=cast(HTTPStatus, status_code),
             status=status,
             message=message,
             data=data,
@@ -237,12 +275,85 @@ class AbstractAPIClient(FeesCalculationMixin, ABC):
             return value
         return re.sub(r"(?<!^)(?=[A-Z])", "_", value).lower()
 
+    def _cached_response(
+        self,
+        method: HTTPMethod,
+        url: str,
+        response_data_model_class: Type[PaystackDataModel] | None,
+        raise_serialization_exception: bool,
+    ) -> (
+        Response[None]
+        | Response[list[PaystackDataModel]]
+        | Response[PaystackDataModel]
+        | None
+    ):
+        """Returns the cached response of a GET request, if any."""
+        if self._response_cache is None or method != HTTPMethod.GET:
+            return None
+        cached = self._response_cache.get(cast(str, self._secret_key), url)
+        if cached is None:
+            return None
+        status_code, response_body = cached
+        return self._build_response(
+            status_code,
+            response_body,
+            response_data_model_class,
+            raise_serialization_exception,
+        )
+
+    def _update_response_cache(
+        self, method: HTTPMethod, url: str, response: Response[Any]
+    ) -> None:
+        """Caches the response of a GET request or invalidates the resource of a write request."""
+        if self._response_cache is None or not isinstance(response.raw, dict):
+            return
+        secret_key = cast(str, self._secret_key)
+        if method == HTTPMethod.GET:
+            self._response_cache.store(
+                secret_key, url, response.status_code, response.raw
+            )
+        else:
+            self._response_cache.invalidate(secret_key, url, response.raw)
+
 
 class BaseAPIClient(AbstractAPIClient):
     """
     Base class for the pypaystack API wrappers.
     """
 
+    _rate_limiter: RateLimiter | None
+
+    def __init__(
+        self,
+        secret_key: str | None = None,
+        rate_limiter: RateLimiter | None = None,
+        http_client: httpx.Client | None = None,
+        response_cache: ResponseCache | None = None,
+        fee_schedule_book: FeeScheduleBook | None = None,
+    ):
+        """
+        Args:
+            secret_key: Your paystack integration secret key. Required only
+                if it is not provided in your environmental
+                variables as ``PAYSTACK_SECRET_KEY=your_key``
+            rate_limiter: An optional rate limiter every request made by the client waits on.
+            http_client: An optional `httpx.Client` used to make requests. Its connection
+                pool is reused across requests and threads. When it is not provided,
+                every request is made with a new connection. The caller is responsible
+                for closing it.
+            response_cache: An optional `ResponseCache` the responses of GET requests are
+                served from. Write requests invalidate the responses they affect.
+            fee_schedule_book: An optional `FeeScheduleBook` the fee calculation methods
+                look the fees up in instead of the built-in fees.
+        """
+        super().__init__(
+            secret_key=secret_key,
+            rate_limiter=rate_limiter,
+            response_cache=response_cache,
+            fee_schedule_book=fee_schedule_book,
+        )
+        self._http_client = http_client
+
     def _handle_request(
         self,
         method: HTTPMethod,
@@ -276,7 +387,10 @@ class BaseAPIClient(AbstractAPIClient):
             HTTPMethod.HEAD: httpx.head,
         }
 
-        http_method_handler = http_method_handlers_mapping.get(method)
+        if self._http_client is not None:
+            http_method_handler = getattr(self._http_client, method.value.lower(), None)
+        else:
+            http_method_handler = http_method_handlers_mapping.get(method)
 
         request_kwargs = self._serialize_request_kwargs(
             url=url, method=method, data=data
@@ -285,16 +399,58 @@ class BaseAPIClient(AbstractAPIClient):
         if not http_method_handler:
             raise ValueError("HTTP Request method not recognised or implemented")
 
+        cached_response = self._cached_response(
+            method, url, response_data_model_class, raise_serialization_exception
+        )
+        if cached_response is not None:
+            return cached_response
+        if self._rate_limiter is not None:
+            self._rate_limiter.acquire()
         try:
             response = http_method_handler(**request_kwargs)  # type: ignore
         except HTTPError as error:
             raise ClientNetworkError(f"network error occurred: {error}", error)
-        return self._deserialize_response(
+        deserialized_response = self._deserialize_response(
             response, response_data_model_class, raise_serialization_exception
         )
+        self._update_response_cache(method, url, deserialized_response)
+        return deserialized_response
 
 
 class BaseAsyncAPIClient(AbstractAPIClient):
+    _rate_limiter: AsyncRateLimiter | None
+
+    def __init__(
+        self,
+        secret_key: str | None = None,
+        rate_limiter: AsyncRateLimiter | None = None,
+        http_client: httpx.AsyncClient | None = None,
+        response_cache: ResponseCache | None = None,
+        fee_schedule_book: FeeScheduleBook | None = None,
+    ):
+        """
+        Args:
+            secret_key: Your paystack integration secret key. Required only
+                if it is not provided in your environmental
+                variables as ``PAYSTACK_SECRET_KEY=your_key``
+            rate_limiter: An optional rate limiter every request made by the client waits on.
+            http_client: An optional `httpx.AsyncClient` used to make requests. Its connection
+                pool is reused across requests, so it must only be used from the event loop
+                it was created on. When it is not provided, every request is made with a
+                new connection. The caller is responsible for closing it.
+            response_cache: An optional `ResponseCache` the responses of GET requests are
+                served from. Write requests invalidate the responses they affect.
+            fee_schedule_book: An optional `FeeScheduleBook` the fee calculation methods
+                look the fees up in instead of the built-in fees.
+        """
+        super().__init__(
+            secret_key=secret_key,
+            rate_limiter=rate_limiter,
+            response_cache=response_cache,
+            fee_schedule_book=fee_schedule_book,
+        )
+        self._http_client = http_client
+
     async def _handle_request(  # type: ignore
         self,
         method: HTTPMethod,
@@ -318,21 +474,42 @@ class BaseAsyncAPIClient(AbstractAPIClient):
             Returns a python namedtuple of Response which contains
             status code, status(bool), message, data
         """
-        async with httpx.AsyncClient() as client:
-            http_method_handler = getattr(client, method.value.lower(), None)
-            request_kwargs = self._serialize_request_kwargs(
-                url=url, method=method, data=data
-            )
-            if not http_method_handler:
-                raise ValueError("HTTP Request method not recognised or implemented")
-            try:
-                response = await http_method_handler(**request_kwargs)
-            except HTTPError as error:
-                raise ClientNetworkError(f"network error occurred: {error}", error)
-
-        return self._deserialize_response(
+        cached_response = self._cached_response(
+            method, url, response_data_model_class, raise_serialization_exception
+        )
+        if cached_response is not None:
+            return cached_response
+        if self._rate_limiter is not None:
+            await self._rate_limiter.acquire()
+        if self._http_client is not None:
+            response = await self._send_request(self._http_client, method, url, data)
+        else:
+            async with httpx.AsyncClient() as client:
+                response = await self._send_request(client, method, url, data)
+
+        deserialized_response = self._deserialize_response(
             response, response_data_model_class, raise_serialization_exception
         )
+        self._update_response_cache(method, url, deserialized_response)
+        return deserialized_response
+
+    async def _send_request(
+        self,
+        client: httpx.AsyncClient,
+        method: HTTPMethod,
+        url: str,
+        data: dict[str, Any] | list[Any] | None,
+    ) -> httpx.Response:
+        http_method_handler = getattr(client, method.value.lower(), None)
+        request_kwargs = self._serialize_request_kwargs(
+            url=url, method=method, data=data
+        )
+        if not http_method_handler:
+            raise ValueError("HTTP Request method not recognised or implemented")
+        try:
+            return await http_method_handler(**request_kwargs)
+        except HTTPError as error:
+            raise ClientNetworkError(f"network error occurred: {error}", error)
 
 
 def add_to_payload(
@@ -0,0 +1,374 @@
+import hashlib
+import json
+import secrets
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Protocol
+from urllib.parse import urlsplit
+
+
+class CacheBackend(Protocol):
+    """The interface of the caches used by pypaystack2.
+
+    Keys are strings and values are JSON compatible python values. A backend may
+    evict any entry at any time, so `get` returning `None` only means the value has
+    to be fetched again.
+    """
+
+    def get(self, key: str) -> Any | None:
+        """Returns the value cached under `key` or `None` if it is missing or expired."""
+        ...
+
+    def set(self, key: str, value: Any, ttl: float | None = None) -> None:
+        """Caches `value` under `key` for `ttl` seconds or until it is evicted if `ttl` is `None`."""
+        ...
+
+    def delete(self, key: str) -> None:
+        """Removes the value cached under `key`, if any."""
+        ...
+
+    def clear(self) -> None:
+        """Removes every cached value."""
+        ...
+
+
+class MemoryCache:
+    """A thread-safe in-memory `CacheBackend` that evicts the least recently used entries.
+
+    Example:
+        ```python
+        from pypaystack2.caching import MemoryCache
+
+        cache = MemoryCache(max_size=10_000)
+        cache.set("bin:539983", {"brand": "Mastercard"}, ttl=86_400)
+        ```
+    """
+
+    def __init__(self, max_size: int | None = 1024):
+        """
+        Args:
+            max_size: The maximum number of entries kept. `None` keeps every entry
+                until it expires.
+        """
+        if max_size is not None and max_size < 1:
+            raise ValueError("max_size must be at least 1")
+        self.max_size = max_size
+        self._entries: OrderedDict[str, tuple[float | None, Any]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: str) -> Any | None:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            expires_at, value = entry
+            if expires_at is not None and expires_at <= time.monotonic():
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return value
+
+    def set(self, key: str, value: Any, ttl: float | None = None) -> None:
+        expires_at = time.monotonic() + ttl if ttl is not None else None
+        with self._lock:
+            self._entries[key] = (expires_at, value)
+            self._entries.move_to_end(key)
+            if self.max_size is not None:
+                while len(self._entries) > self.max_size:
+                    self._entries.popitem(last=False)
+
+    def delete(self, key: str) -> None:
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS cache (
+    key TEXT PRIMARY KEY,
+    value TEXT NOT NULL,
+    expires_at REAL,
+    used_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS cache_used_at ON cache (used_at);
+"""
+
+
+class SQLiteCache:
+    """A `CacheBackend` persisted in a SQLite file that evicts the least recently used entries.
+
+    The file can be shared by several processes. Values are stored as JSON.
+
+    Example:
+        ```python
+        from pypaystack2.caching import SQLiteCache
+
+        with SQLiteCache("paystack-cache.db", max_size=100_000) as cache:
+            cache.set("bank:058", {"name": "Guaranty Trust Bank"}, ttl=86_400)
+        ```
+    """
+
+    def __init__(self, path: str | Path, max_size: int | None = None):
+        """
+        Args:
+            path: The path of the SQLite database file. It is created if it does not exist.
+                Use `":memory:"` for a cache that is not persisted.
+            max_size: The maximum number of entries kept. `None` keeps every entry
+                until it expires.
+        """
+        if max_size is not None and max_size < 1:
+            raise ValueError("max_size must be at least 1")
+        self.max_size = max_size
+        self._connection = sqlite3.connect(str(path), check_same_thread=False)
+        # every read updates `used_at`, WAL keeps those writes cheap and lets
+        # other processes read the file while one of them writes
+        self._connection.execute("PRAGMA journal_mode=WAL")
+        self._connection.execute("PRAGMA synchronous=NORMAL")
+        self._connection.executescript(_SCHEMA)
+        self._lock = threading.Lock()
+
+    def __enter__(self) -> "SQLiteCache":
+        return self
+
+    def __exit__(self, *args: Any) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Closes the database connection."""
+        self._connection.close()
+
+    def __len__(self) -> int:
+        with self._lock:
+            (count,) = self._connection.execute(
+                "SELECT COUNT(*) FROM cache WHERE expires_at IS NULL OR expires_at > ?",
+                (time.time(),),
+            ).fetchone()
+        return count
+
+    def get(self, key: str) -> Any | None:
+        now = time.time()
+        with self._lock, self._connection:
+            row = self._connection.execute(
+                "SELECT value, expires_at FROM cache WHERE key = ?", (key,)
+            ).fetchone()
+            if row is None:
+                return None
+            value, expires_at = row
+            if expires_at is not None and expires_at <= now:
+                self._connection.execute("DELETE FROM cache WHERE key = ?", (key,))
+                return None
+            self._connection.execute(
+                "UPDATE cache SET used_at = ? WHERE key = ?", (now, key)
+            )
+        return json.loads(value)
+
+    def set(self, key: str, value: Any, ttl: float | None = None) -> None:
+        self.set_many({key: value}, ttl)
+
+    def set_many(self, values: dict[str, Any], ttl: float | None = None) -> None:
+        """Caches several values in one transaction.
+
+        Args:
+            values: The values to cache by key.
+            ttl: The number of seconds the values are cached for.
+        """
+        now = time.time()
+        expires_at = now + ttl if ttl is not None else None
+        with self._lock, self._connection:
+            self._connection.executemany(
+                "INSERT INTO cache (key, value, expires_at, used_at) VALUES (?, ?, ?, ?) "
+                "ON CONFLICT (key) DO UPDATE SET value = excluded.value, "
+                "expires_at = excluded.expires_at, used_at = excluded.used_at",
+                [
+                    (key, json.dumps(value, default=str), expires_at, now)
+                    for key, value in values.items()
+                ],
+            )
+            if self.max_size is not None:
+                self._connection.execute(
+                    "DELETE FROM cache WHERE expires_at <= ?", (now,)
+                )
+                self._connection.execute(
+                    "DELETE FROM cache WHERE key IN ("
+                    "SELECT key FROM cache ORDER BY used_at DESC LIMIT -1 OFFSET ?)",
+                    (self.max_size,),
+                )
+
+    def delete(self, key: str) -> None:
+        with self._lock, self._connection:
+            self._connection.execute("DELETE FROM cache WHERE key = ?", (key,))
+
+    def clear(self) -> None:
+        with self._lock, self._connection:
+            self._connection.execute("DELETE FROM cache")
+
+
+DEFAULT_RESPONSE_CACHE_TTLS: dict[str, float | None] = {
+    "plan": 300.0,
+    "product": 300.0,
+    "subaccount": 300.0,
+    "split": 300.0,
+}
+"""The number of seconds responses are cached for by resource.
+
+A resource is the first segment of an endpoint, e.g. `plan` for `GET /plan/{id_or_code}`.
+"""
+
+
+class ResponseCache:
+    """Caches the responses of GET requests for a single resource, e.g. `plans.get_plan`.
+
+    Pass it to a client via `response_cache`. Only successful responses of GET requests
+    to endpoints of the form `/{resource}/{id_or_code}` are cached, for the number of
+    seconds `ttls` maps `resource` to. Any other request to `/{resource}/{id_or_code}`
+    e.g. `plans.update` or `splits.add_or_update` removes the cached responses of the
+    resource, whether it was fetched by id or by code. Responses are cached per secret
+    key, so clients of different integrations can share a cache.
+
+    Example:
+        ```python
+        from pypaystack2 import PaystackClient
+        from pypaystack2.caching import ResponseCache, SQLiteCache
+
+        # cache plans for 10 minutes and products for the default 5 minutes in a file
+        # shared by every worker process
+        cache = ResponseCache(SQLiteCache("responses.db"), ttls={"plan": 600})
+        client = PaystackClient(response_cache=cache)
+        client.plans.get_plan("PLN_xxx")  # fetched from paystack
+        client.plans.get_plan("PLN_xxx")  # served from the cache
+        ```
+    """
+
+    def __init__(
+        self,
+        backend: CacheBackend | None = None,
+        ttls: dict[str, float | None] | None = None,
+    ):
+        """
+        Args:
+            backend: The `CacheBackend` the responses are stored in. It defaults to a
+                `MemoryCache` of 1024 responses.
+            ttls: The number of seconds responses are cached for by resource. It is
+                merged into `DEFAULT_RESPONSE_CACHE_TTLS`, map a resource to `0` to
+                stop caching it and to `None` to cache it until it is invalidated.
+        """
+        self.backend: CacheBackend = backend if backend is not None else MemoryCache()
+        self.ttls = {**DEFAULT_RESPONSE_CACHE_TTLS, **(ttls or {})}
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _scope(secret_key: str) -> str:
+        return hashlib.sha256(secret_key.encode()).hexdigest()[:16]
+
+    @staticmethod
+    def _resource(url: str) -> tuple[str, str] | None:
+        """Returns the resource and the id or code of a request, if it targets one resource."""
+        segments = [segment for segment in urlsplit(url).path.split("/") if segment]
+        if len(segments) < 2:
+            return None
+        return segments[0], segments[1]
+
+    def _ttl(self, url: str) -> float | None | bool:
+        """Returns the ttl of a GET request, `False` if its response is not cached."""
+        segments = [segment for segment in urlsplit(url).path.split("/") if segment]
+        if len(segments) != 2 or urlsplit(url).query or segments[0] not in self.ttls:
+            return False
+        ttl = self.ttls[segments[0]]
+        return False if ttl is not None and ttl <= 0 else ttl
+
+    def cacheable(self, url: str) -> bool:
+        """Whether the response of a GET request to `url` is cached."""
+        return self._ttl(url) is not False
+
+    def get(self, secret_key: str, url: str) -> tuple[int, dict[str, Any]] | None:
+        """Returns the status code and body of the cached response to a GET request, if any."""
+        if not self.cacheable(url):
+            return None
+        cached = self.backend.get(f"{self._scope(secret_key)}:response:{url}")
+        # a response is only served while the generations of its tags are the ones
+        # it was cached with, so an invalidated or evicted generation is a miss
+        fresh = cached is not None and all(
+            self.backend.get(tag_key) == generation
+            for tag_key, generation in cached[2].items()
+        )
+        with self._lock:
+            if not fresh:
+                self.misses += 1
+                return None
+            self.hits += 1
+        return cached[0], cached[1]
+
+    def _tags(self, resource: str, identifier: str, body: dict[str, Any]) -> set[str]:
+        tags = {f"/{resource}/{identifier}"}
+        data = body.get("data")
+        if isinstance(data, dict):
+            for field, value in data.items():
+                if (field == "id" or field.endswith("_code")) and value:
+                    tags.add(f"/{resource}/{value}")
+        return tags
+
+    def store(
+        self, secret_key: str, url: str, status_code: int, body: dict[str, Any]
+    ) -> None:
+        """Caches the response to a GET request if it is cacheable and successful.
+
+        Args:
+            secret_key: The secret key the request was made with.
+            url: The url of the request.
+            status_code: The status code of the response.
+            body: The JSON body of the response.
+        """
+        ttl = self._ttl(url)
+        resource = self._resource(url)
+        if ttl is False or resource is None:
+            return
+        if not 200 <= status_code <= 299 or not body.get("status"):
+            return
+        scope = self._scope(secret_key)
+        generations: dict[str, str] = {}
+        with self._lock:
+            for tag in self._tags(*resource, body):
+                tag_key = f"{scope}:tag:{tag}"
+                generation = self.backend.get(tag_key)
+                if generation is None:
+                    generation = secrets.token_hex(8)
+                    self.backend.set(tag_key, generation)
+                generations[tag_key] = generation
+        self.backend.set(
+            f"{scope}:response:{url}",
+            [status_code, body, generations],
+            ttl,  # type: ignore[arg-type]
+        )
+
+    def invalidate(
+        self, secret_key: str, url: str, body: dict[str, Any] | None = None
+    ) -> None:
+        """Removes the cached responses of the resource a write request targets.
+
+        Every response cached for the resource, whether it was fetched by id or by
+        code, was stored with the current generation of both, so deleting the
+        generations turns them into misses.
+
+        Args:
+            secret_key: The secret key the request was made with.
+            url: The url of the write request.
+            body: The JSON body of its response, used to find the id and code of the resource.
+        """
+        resource = self._resource(url)
+        if resource is None or resource[0] not in self.ttls:
+            return
+        scope = self._scope(secret_key)
+        with self._lock:
+            for tag in self._tags(*resource, body or {}):
+                self.backend.delete(f"{scope}:tag:{tag}")
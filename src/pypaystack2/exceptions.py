@@ -1,3 +1,6 @@
+from typing import Any
+
+
 class MissingSecretKeyException(Exception):
     """Custom exception raised when we can't find the secret key"""
 
@@ -12,3 +15,11 @@ class ClientNetworkError(Exception):
         self.original_exception = (
             original_exception  # Store the original exception for debugging
         )
+
+
+class PaystackResponseError(Exception):
+    """Custom exception raised by helpers when paystack returns an unsuccessful response."""
+
+    def __init__(self, message: str, response: Any | None = None):
+        super().__init__(message)
+        self.response = response  # The `Response` that could not be used
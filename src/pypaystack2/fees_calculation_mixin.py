@@ -1,8 +1,21 @@
+import math
+from datetime import date
 from decimal import Decimal
-from typing import Unpack, TypedDict, cast
+from typing import Any, Callable, Sequence, Unpack, TypedDict, cast
 
 from pypaystack2.enums import Currency
+from pypaystack2.fees import (
+    FeeRule,
+    FeeSchedule,
+    FeeScheduleBook,
+    FeeScheduleVersion,
+    FeeTier,
+    numpy,
+    fee_option_sets,
+    validate_fee_options,
+)
 from pypaystack2.models.payload_models import (
+    BaseServiceFeeOptions,
     NigeriaServiceFeeOptions,
     CoteDIvoreServiceFeeOptions,
     GhanaServiceFeeOptions,
@@ -20,7 +33,17 @@ class ServiceFeeOptions(TypedDict):
     card: str | None
 
 
+_FEE_SCHEDULES: dict[tuple[Any, ...], FeeSchedule] = {}
+_HUNDRED = Decimal(100)
+_INT64_MAX = 2**63 - 1
+# floats up to this magnitude are converted to their subunit with float arithmetic
+# unless they are this close to halfway between two subunits
+_EXACT_FLOAT_LIMIT = 1e9
+_HALFWAY_TOLERANCE = 1e-4
+
+
 class FeesCalculationMixin:
+    fee_schedule_book: FeeScheduleBook | None = None
     _NGN_LOCAL_TRANSACTIONS_DECIMAL_FEE = Decimal("0.015")
     _NGN_LOCAL_TRANSACTIONS_FLAT_FEE = 10_000
     _NGN_LOCAL_TRANSACTIONS_FEE_CAP = 200_000
@@ -103,21 +126,7 @@ class FeesCalculationMixin:
             Please create an issue here https://github.com/gray-adeyi/pypaystack2/issues
             if you find a bug.
         """
-        try:
-            options_validator_class = {
-                Currency.NGN: NigeriaServiceFeeOptions,
-                Currency.GHS: GhanaServiceFeeOptions,
-                Currency.ZAR: SouthAfricaServiceFeeOptions,
-                Currency.KES: KenyaServiceFeeOptions,
-                Currency.XOF: CoteDIvoreServiceFeeOptions,
-                Currency.RWF: RwandaServiceFeeOptions,
-                Currency.EGP: EgyptServiceFeeOptions,
-            }[currency]
-        except KeyError:
-            raise ValueError(
-                f"fees calculation for currency {currency} is not supported"
-            )
-        options_model = options_validator_class.model_validate(options)  # type: ignore
+        options_model = self._validate_fee_options(currency, options)  # type: ignore[arg-type]
 
         if currency == Currency.NGN and isinstance(
             options_model, NigeriaServiceFeeOptions
@@ -151,6 +160,232 @@ class FeesCalculationMixin:
             f"calculations not supported for the provided currency {currency}"
         )
 
+    def calculate_fees(
+        self,
+        amounts: Sequence[int] | Any,
+        currency: Currency | Sequence[Currency],
+        **options: Any,
+    ) -> list[int] | Any:
+        """Calculates the fees paystack charges on several amounts.
+
+        The batch version of `calculate_fee`. The options are validated once per
+        distinct combination of currency and options rather than once per amount, and
+        the fees are computed with vectorized integer arithmetic when numpy is installed.
+        The fees are exactly those `calculate_fee` returns.
+
+        Args:
+            amounts: A sequence or a numpy array of currency values in their subunit (e.g. kobo).
+            currency: The currency of every amount, or a sequence with the currency of each amount.
+            options: The options of `calculate_fee`. Each option is either a single value
+                applied to every amount or a sequence with a value per amount.
+
+        Returns:
+            The fees in the order of the amounts, as a numpy array if `amounts` is a numpy
+            array and as a list otherwise.
+
+        Example:
+            ```python
+            import numpy
+
+            from pypaystack2 import PaystackClient
+            from pypaystack2.enums import Currency
+
+            client = PaystackClient()
+            amounts = numpy.array([240_000, 500_000, 20_000_000])
+            client.calculate_fees(amounts, Currency.NGN)  # array([3600, 17500, 200000])
+            client.calculate_fees(
+                amounts,
+                Currency.NGN,
+                is_international=[False, True, True],
+                card=[None, "visa", "american_express"],
+            )
+            ```
+        """
+        return self._apply_fee_schedules(FeeRule.fees, amounts, currency, options)
+
+    def calculate_gross_amount(
+        self, net_amount: int, currency: Currency, **options: Unpack[ServiceFeeOptions]
+    ) -> int:
+        """Calculates the amount to charge for paystack to settle `net_amount` after its fee.
+
+        The inverse of `calculate_fee`. It returns the smallest amount such that
+        `amount - calculate_fee(amount, currency, **options)` is at least `net_amount`,
+        exactly `net_amount` whenever rounding makes it possible. The amount is solved
+        for rather than searched for, and accounts for flat fees, waived flat fees,
+        fee caps and tiered fees.
+
+        Args:
+            net_amount: The currency value in its subunit (e.g. kobo) to receive.
+            currency: The currency of the amount.
+            options: The options of `calculate_fee`.
+
+        Raises:
+            ValueError: If the options are invalid, or the fees of the service do not
+                depend on an amount, e.g. service="physical_terminal_live_smartpeak_p1000".
+
+        Example:
+            ```python
+            from pypaystack2 import PaystackClient
+            from pypaystack2.enums import Currency
+
+            client = PaystackClient()
+            amount = client.calculate_gross_amount(1_000_000, Currency.NGN)  # 1025381
+            amount - client.calculate_fee(amount, Currency.NGN)  # 1000000
+            ```
+        """
+        return self.fee_schedule(currency, **options).gross_amount(net_amount)
+
+    def calculate_gross_amounts(
+        self,
+        net_amounts: Sequence[int] | Any,
+        currency: Currency | Sequence[Currency],
+        **options: Any,
+    ) -> list[int] | Any:
+        """Calculates the amounts to charge for paystack to settle several net amounts.
+
+        The batch version of `calculate_gross_amount`, it takes its arguments like
+        `calculate_fees` and is vectorized when numpy is installed.
+
+        Args:
+            net_amounts: A sequence or a numpy array of currency values in their subunit
+                (e.g. kobo) to receive.
+            currency: The currency of every amount, or a sequence with the currency of each amount.
+            options: The options of `calculate_fee`. Each option is either a single value
+                applied to every amount or a sequence with a value per amount.
+
+        Returns:
+            The amounts in the order of the net amounts, as a numpy array if
+            `net_amounts` is a numpy array and as a list otherwise.
+        """
+        return self._apply_fee_schedules(
+            FeeRule.gross_amounts, net_amounts, currency, options
+        )
+
+    def _apply_fee_schedules(
+        self,
+        compute: Callable[[FeeRule, Any], Any],
+        amounts: Sequence[int] | Any,
+        currency: Currency | Sequence[Currency],
+        options: dict[str, Any],
+    ) -> list[int] | Any:
+        """Applies a batch method of `FeeRule` to amounts with per amount currencies and options."""
+        columns: dict[str, Any] = {"currency": currency, **options}
+        per_amount = {
+            name: value
+            for name, value in columns.items()
+            if not isinstance(value, (str, bytes))
+            and isinstance(value, Sequence)
+            or (numpy is not None and isinstance(value, numpy.ndarray))
+        }
+        if not per_amount:
+            return compute(self.fee_schedule(currency, **options).rule, amounts)  # type: ignore[arg-type]
+
+        is_array = numpy is not None and isinstance(amounts, numpy.ndarray)
+        values = numpy.asarray(amounts) if numpy is not None else list(amounts)
+        for name, value in per_amount.items():
+            if len(value) != len(values):
+                raise ValueError(
+                    f"{name} has {len(value)} values for {len(values)} amounts"
+                )
+        groups: dict[tuple[Any, ...], list[int]] = {}
+        for index, key in enumerate(zip(*per_amount.values())):
+            groups.setdefault(key, []).append(index)
+        results: Any = (
+            numpy.zeros(len(values), dtype=numpy.int64) if numpy else [0] * len(values)
+        )
+        for key, indices in groups.items():
+            group_columns = {**columns, **dict(zip(per_amount, key))}
+            rule = self.fee_schedule(
+                group_columns.pop("currency"), **group_columns
+            ).rule
+            if numpy is None:
+                for index, result in zip(
+                    indices, compute(rule, [values[i] for i in indices])
+                ):
+                    results[index] = result
+                continue
+            group_results = compute(rule, values[indices])
+            if group_results.dtype == object:
+                results = results.astype(object)
+            results[indices] = group_results
+        return results if is_array or numpy is None else results.tolist()
+
+    def fee_schedule(self, currency: Currency, **options: Any) -> FeeSchedule:
+        """Returns the schedule of the fees `calculate_fee` computes for a currency and options.
+
+        The options are validated and the schedule is built on the first call for a
+        currency and options, later calls return the same schedule. Use it where
+        `calculate_fee` is called for many amounts with the same options, e.g. to
+        display the fees of every item of a checkout.
+
+        When the client has a `fee_schedule_book`, the schedule in effect today is
+        looked up in the book instead, so `calculate_fee`, `calculate_fees`,
+        `calculate_gross_amount` and `calculate_gross_amounts` apply the fees of the
+        book. Its options are then validated on every call.
+
+        Args:
+            currency: The currency of the amounts.
+            options: The options of `calculate_fee`.
+
+        Raises:
+            ValueError: If fees are not calculated for `currency` or the options are invalid.
+
+        Example:
+            ```python
+            from pypaystack2 import PaystackClient
+            from pypaystack2.enums import Currency
+
+            client = PaystackClient()
+            schedule = client.fee_schedule(Currency.NGN, service="transfers")
+            schedule.fee(1_000_000)  # 2500
+            schedule.fees([100_000, 1_000_000])  # [1000, 2500]
+            ```
+        """
+        if self.fee_schedule_book is not None:
+            return self.fee_schedule_book.schedule(currency, **options)
+        return self._builtin_fee_schedule(currency, options)
+
+    def _builtin_fee_schedule(
+        self, currency: Currency, options: dict[str, Any]
+    ) -> FeeSchedule:
+        key: tuple[Any, ...] | None = (type(self), currency, *sorted(options.items()))
+        try:
+            schedule = _FEE_SCHEDULES.get(key)  # type: ignore[arg-type]
+        except TypeError:  # an unhashable option value, rejected by the validation
+            key, schedule = None, None
+        if schedule is None:
+            options_model = self._validate_fee_options(currency, options)
+            schedule = FeeSchedule(
+                currency=currency,
+                options=options_model.model_dump(exclude_defaults=True),
+                rule=self._fee_rule(currency, options),
+            )
+            if key is not None:
+                _FEE_SCHEDULES[key] = schedule
+        return schedule
+
+    def fee_schedules(
+        self, version: str = "builtin", effective_from: date | None = None
+    ) -> FeeScheduleVersion:
+        """Returns the schedules of every currency and service `calculate_fee` supports.
+
+        Save it in a `FeeScheduleBook` to edit the fees without waiting for a new
+        release of pypaystack2. The schedules are always the built-in ones, even when
+        the client has a `fee_schedule_book`.
+
+        Args:
+            version: The name of the version.
+            effective_from: The first day the version applies.
+        """
+        return FeeScheduleVersion(
+            version=version,
+            effective_from=effective_from,
+            schedules=tuple(
+                self._builtin_fee_schedule(currency, options)
+                for currency, options in fee_option_sets()
+            ),
+        )
+
     def to_base_unit(self, value: int | Decimal) -> Decimal:
         """Converts a currency value from its subunit to its base unit.
 
@@ -192,173 +427,306 @@ class FeesCalculationMixin:
             value = Decimal(str(round(value, 2)))
         return round(value * 100)
 
-    def _calculate_ngn_fee(self, amount: int, options: NigeriaServiceFeeOptions) -> int:
-        if (
-            options.service == "transactions" and not options.is_international
-        ) or options.service in [
-            "virtual_terminal_ussd_transactions",
-            "virtual_terminal_local_card_transactions",
-            "physical_terminal_ussd_transactions",
-            "physical_terminal_bank_transfers",
-        ]:
-            return self._calculate_ngn_local_transaction_fee(amount)
-        if (
-            options.service == "transactions" and options.is_international
-        ) or options.service == "virtual_terminal_international_card_transactions":
-            if options.card == "american_express":
-                return round(
-                    amount
-                    * self._NGN_INTERNATIONAL_TRANSACTIONS_AMERICAN_EXPRESS_CARDS_DECIMAL_FEE
+    def to_base_units(
+        self, values: Sequence[int | Decimal] | Any
+    ) -> list[Decimal] | Any:
+        """Converts several currency values from their subunit to their base unit.
+
+        The batch version of `to_base_unit`, it returns exactly the same values.
+
+        Args:
+            values: A sequence or a numpy array of currency values in their subunit. e.g. Kobo
+
+        Returns:
+            The values in their base unit, as a numpy array of `Decimal` if `values` is a
+            numpy array and as a list otherwise.
+        """
+        is_array = numpy is not None and isinstance(values, numpy.ndarray)
+        items = values.reshape(-1).tolist() if is_array else values
+        results = []
+        for value in items:
+            if not isinstance(value, (int, Decimal)):
+                raise ValueError("value must be an integer or Decimal")
+            results.append(Decimal(value) / _HUNDRED)
+        if is_array:
+            return numpy.fromiter(results, dtype=object, count=len(results)).reshape(
+                values.shape
+            )
+        return results
+
+    def to_subunits(
+        self, values: Sequence[int | float | Decimal] | Any
+    ) -> list[int] | Any:
+        """Converts several currency values from their base unit to their subunit.
+
+        The batch version of `to_subunit`, it returns exactly the same values. Integers
+        are converted with integer arithmetic and floats with float arithmetic wherever
+        it is exact, i.e. except for values too large or too close to halfway between
+        two subunits. The conversion is vectorized when numpy is installed.
+
+        Args:
+            values: A sequence or a numpy array of currency values in their base unit. e.g. Naira
+
+        Returns:
+            The values in their subunit, as a numpy array if `values` is a numpy array
+            and as a list otherwise.
+        """
+        if numpy is None:
+            return [self._to_subunit(value) for value in values]
+        is_array = isinstance(values, numpy.ndarray)
+        array = numpy.asarray(values)
+        if array.dtype.kind in "iub":
+            largest = int(numpy.abs(array).max()) if array.size else 0
+            if largest * 100 < _INT64_MAX:
+                results = array.astype(numpy.int64) * 100
+                return results if is_array else results.tolist()
+        if array.dtype.kind == "f":
+            results = self._float_subunits(array, values)
+            return results if is_array else results.tolist()
+        items = array.reshape(-1).tolist() if is_array else values
+        converted = [self._to_subunit(value) for value in items]
+        if is_array:
+            return numpy.fromiter(
+                converted, dtype=object, count=len(converted)
+            ).reshape(array.shape)
+        return converted
+
+    def _to_subunit(self, value: int | float | Decimal) -> int:
+        """`to_subunit` with shortcuts for the integers and floats it converts exactly."""
+        if type(value) is int:
+            return value * 100
+        if type(value) is float and -_EXACT_FLOAT_LIMIT < value < _EXACT_FLOAT_LIMIT:
+            scaled = value * 100
+            if abs(scaled - math.floor(scaled) - 0.5) > _HALFWAY_TOLERANCE:
+                return round(scaled)
+        return self.to_subunit(value)
+
+    def _float_subunits(self, array: Any, values: Any) -> Any:
+        scaled = array.astype(numpy.float64) * 100
+        with numpy.errstate(invalid="ignore"):
+            exact = (numpy.abs(scaled) < _EXACT_FLOAT_LIMIT * 100) & (
+                numpy.abs(scaled - numpy.floor(scaled) - 0.5) > _HALFWAY_TOLERANCE
+            )
+        results: Any = numpy.where(exact, numpy.rint(scaled), 0).astype(numpy.int64)
+        inexact = numpy.flatnonzero(~exact)
+        if inexact.size:
+            flat = values.reshape(-1) if isinstance(values, numpy.ndarray) else values
+            converted = [
+                self.to_subunit(
+                    float(flat[index])
+                    if isinstance(flat, numpy.ndarray)
+                    else flat[index]
+                )
+                for index in inexact.tolist()
+            ]
+            if any(abs(value) >= _INT64_MAX for value in converted):
+                results = results.astype(object)
+            results.flat[inexact] = converted
+        return results
+
+    @staticmethod
+    def _validate_fee_options(
+        currency: Currency, options: dict[str, Any]
+    ) -> BaseServiceFeeOptions:
+        return validate_fee_options(currency, options)
+
+    def _fee_rule(self, currency: Currency, options: dict[str, Any]) -> FeeRule:
+        """Returns the `FeeRule` `calculate_fee` applies for a currency and options."""
+        options_model: Any = self._validate_fee_options(currency, options)
+        unsupported = FeeRule(unsupported="unsupported service option")
+        service = options_model.service
+        if currency == Currency.NGN:
+            if (service == "transactions" and not options_model.is_international) or (
+                service
+                in [
+                    "virtual_terminal_ussd_transactions",
+                    "virtual_terminal_local_card_transactions",
+                    "physical_terminal_ussd_transactions",
+                    "physical_terminal_bank_transfers",
+                ]
+            ):
+                return FeeRule(
+                    rate=self._NGN_LOCAL_TRANSACTIONS_DECIMAL_FEE,
+                    flat_fee=self._NGN_LOCAL_TRANSACTIONS_FLAT_FEE,
+                    flat_fee_waived_up_to=self._NGN_LOCAL_TRANSACTIONS_FLAT_FEE_WAIVED,
+                    cap=self._NGN_LOCAL_TRANSACTIONS_FEE_CAP,
+                )
+            if (
+                service == "transactions" and options_model.is_international
+            ) or service == "virtual_terminal_international_card_transactions":
+                if options_model.card == "american_express":
+                    return FeeRule(
+                        rate=self._NGN_INTERNATIONAL_TRANSACTIONS_AMERICAN_EXPRESS_CARDS_DECIMAL_FEE
+                    )
+                return FeeRule(
+                    rate=self._NGN_INTERNATIONAL_TRANSACTIONS_NON_AMERICAN_EXPRESS_CARDS_DECIMAL_FEE,
+                    flat_fee=self._NGN_INTERNATIONAL_TRANSACTIONS_FLAT_FEE,
+                )
+            if service == "transfers":
+                return FeeRule(
+                    tiers=(
+                        FeeTier(maximum=500_000, fee=1000),
+                        FeeTier(minimum=500_001, maximum=5_000_000, fee=2500),
+                        FeeTier(fee=5000),
+                    )
+                )
+            if service in [
+                "virtual_account_transactions",
+                "virtual_terminal_transfers",
+            ]:
+                return FeeRule(rate=Decimal("0.01"), float_rate=True, cap=30_000)
+            if service == "physical_terminal_live_smartpeak_p1000":
+                return FeeRule(
+                    per_unit_fee=self._NGN_LIVE_SMARTPEAK_P1000_COST_PER_DEVICE
+                )
+            if service == "physical_terminal_test_smartpeak_p1000":
+                return FeeRule(
+                    per_unit_fee=self._NGN_TEST_SMARTPEAK_P1000_COST_PER_DEVICE
+                )
+            if service == "physical_terminal_card_transactions":
+                return FeeRule(
+                    rate=self._NGN_PHYSICAL_TERMINAL_CARD_TRANSACTIONS_DECIMAL_FEE,
+                    cap=self._NGN_PHYSICAL_TERMINAL_CARD_TRANSACTIONS_FEE_CAP,
+                )
+            return unsupported
+        if currency == Currency.GHS:
+            if service == "transactions":
+                return FeeRule(
+                    rate=self._GHS_LOCAL_AND_INTERNATIONAL_TRANSACTIONS_DECIMAL_FEE
                 )
-            return round(
-                (
-                    amount
-                    * self._NGN_INTERNATIONAL_TRANSACTIONS_NON_AMERICAN_EXPRESS_CARDS_DECIMAL_FEE
+            if service == "transfers_to_mobile_money":
+                return FeeRule(
+                    tiers=(FeeTier(fee=self._GHS_FEE_PER_MOBILE_MONEY_TRANSFERS),)
                 )
-                + self._NGN_INTERNATIONAL_TRANSACTIONS_FLAT_FEE
+            if service == "transfers_to_bank_accounts":
+                return FeeRule(
+                    tiers=(FeeTier(fee=self._GHS_FEE_PER_BANK_ACCOUNT_TRANSFERS),)
+                )
+            return unsupported
+        if currency == Currency.ZAR:
+            if service == "transactions" and not options_model.is_international:
+                if options_model.is_eft:
+                    return FeeRule(rate=self._ZAR_LOCAL_EFT_TRANSACTIONS_DECIMAL_FEE)
+                return FeeRule(
+                    rate=self._ZAR_LOCAL_TRANSACTIONS_DECIMAL_FEE,
+                    flat_fee=self._ZAR_LOCAL_TRANSACTIONS_FLAT_FEE,
+                    flat_fee_waived_up_to=self._ZAR_LOCAL_TRANSACTIONS_FLAT_FEE_WAIVED,
+                )
+            if service == "transactions" and options_model.is_international:
+                return FeeRule(
+                    rate=self._ZAR_INTERNATIONAL_TRANSACTIONS_DECIMAL_FEE,
+                    flat_fee=self._ZAR_INTERNATIONAL_TRANSACTIONS_FLAT_FEE,
+                )
+            if service == "transfers":
+                return FeeRule(
+                    tiers=(FeeTier(fee=self._ZAR_FEE_PER_BANK_ACCOUNT_TRANSFERS),)
+                )
+            return unsupported
+        if currency == Currency.KES:
+            invalid_amount_message = (
+                "{amount} is an invalid amount for %s. see "
+                "https://paystack.com/ke/pricing?localeUpdate=true for a valid amount"
+                % service
             )
-        if options.service == "transfers":
-            if amount <= 500_000:
-                return 1000
-            if 500_001 <= amount <= 5_000_000:
-                return 2500
-            return 5000
-        if (
-            options.service == "virtual_account_transactions"
-            or options.service == "virtual_terminal_transfers"
-        ):
-            fees = round(0.01 * amount)
-            return fees if fees < 30_000 else 30_000
-        if options.service == "physical_terminal_live_smartpeak_p1000":
-            return amount * self._NGN_LIVE_SMARTPEAK_P1000_COST_PER_DEVICE
-        if options.service == "physical_terminal_test_smartpeak_p1000":
-            return amount * self._NGN_TEST_SMARTPEAK_P1000_COST_PER_DEVICE
-        if options.service == "physical_terminal_card_transactions":
-            fee = amount * self._NGN_PHYSICAL_TERMINAL_CARD_TRANSACTIONS_DECIMAL_FEE
-            return (
-                round(fee)
-                if round(fee) < self._NGN_PHYSICAL_TERMINAL_CARD_TRANSACTIONS_FEE_CAP
-                else self._NGN_PHYSICAL_TERMINAL_CARD_TRANSACTIONS_FEE_CAP
+            if service == "mpesa_transactions":
+                return FeeRule(rate=self._KES_MPESA_TRANSACTIONS_DECIMAL_FEE)
+            if service == "card_transactions":
+                if options_model.is_international:
+                    return FeeRule(
+                        rate=self._KES_INTERNATIONAL_CARD_TRANSACTIONS_DECIMAL_FEE
+                    )
+                return FeeRule(rate=self._KES_LOCAL_CARD_TRANSACTIONS_DECIMAL_FEE)
+            if service == "transfers_to_mpesa_wallet":
+                return FeeRule(
+                    tiers=(
+                        FeeTier(minimum=100, maximum=150_000, fee=2000),
+                        FeeTier(minimum=150_100, maximum=2_000_000, fee=4000),
+                        FeeTier(minimum=2_000_100, fee=6000),
+                    ),
+                    invalid_amount_message=invalid_amount_message,
+                )
+            if service == "transfers_to_mpesa_paybill":
+                return FeeRule(
+                    tiers=(
+                        FeeTier(minimum=100, maximum=150_000, fee=4000),
+                        FeeTier(minimum=150_100, maximum=1_000_000, fee=8000),
+                        FeeTier(minimum=1_000_100, maximum=4_000_000, fee=14_000),
+                        FeeTier(minimum=4_000_100, maximum=99_999_900, fee=18_000),
+                        FeeTier(minimum=100_000_000, fee=35_000),
+                    ),
+                    invalid_amount_message=invalid_amount_message,
+                )
+            if service == "transfers_to_bank_account":
+                return FeeRule(
+                    tiers=(
+                        FeeTier(minimum=100, maximum=1_000_000, fee=8000),
+                        FeeTier(minimum=1_000_100, maximum=5_000_000, fee=14_000),
+                        FeeTier(minimum=5_000_100, maximum=99_999_900, fee=18_000),
+                        FeeTier(minimum=100_000_000, fee=35_000),
+                    ),
+                    invalid_amount_message=invalid_amount_message,
+                )
+            return unsupported
+        if currency == Currency.XOF:
+            if service == "mobile_money_transactions":
+                return FeeRule(rate=self._XOF_MOBILE_MONEY_DECIMAL_FEE)
+            if service == "card_transactions" and options_model.is_international:
+                return FeeRule(
+                    rate=self._XOF_INTERNATIONAL_CARD_TRANSACTIONS_DECIMAL_FEE
+                )
+            # the fees of local card transactions are not calculated for XOF
+            return unsupported
+        if currency == Currency.RWF:
+            if options_model.is_international:
+                return FeeRule(rate=self._RWF_INTERNATIONAL_TRANSACTIONS_DECIMAL_FEE)
+            return FeeRule(rate=self._RWF_LOCAL_TRANSACTIONS_DECIMAL_FEE)
+        if options_model.is_international:
+            return FeeRule(
+                rate=self._EGP_INTERNATIONAL_TRANSACTIONS_DECIMAL_FEE,
+                flat_fee=self._EGP_INTERNATIONAL_TRANSACTIONS_FLAT_FEE,
+            )
+        if options_model.card == "others":
+            return FeeRule(
+                rate=self._EGP_LOCAL_TRANSACTIONS_NON_MEEZA_CARD_DECIMAL_FEE,
+                flat_fee=self._EGP_LOCAL_TRANSACTIONS_FLAT_FEE,
             )
-        raise ValueError("unsupported service option")
+        return FeeRule(
+            rate=self._EGP_LOCAL_TRANSACTIONS_MEEZA_CARD_DECIMAL_FEE,
+            flat_fee=self._EGP_LOCAL_TRANSACTIONS_FLAT_FEE,
+        )
+
+    def _scheduled_fee(
+        self, amount: int, currency: Currency, options: BaseServiceFeeOptions
+    ) -> int:
+        """Applies the fee schedule of validated options, see `_fee_rule` for the fees."""
+        return self.fee_schedule(
+            currency, **options.model_dump(exclude_defaults=True)
+        ).fee(amount)
+
+    def _calculate_ngn_fee(self, amount: int, options: NigeriaServiceFeeOptions) -> int:
+        return self._scheduled_fee(amount, Currency.NGN, options)
 
     def _calculate_ngn_local_transaction_fee(self, amount: int) -> int:
-        fee = amount * self._NGN_LOCAL_TRANSACTIONS_DECIMAL_FEE
-        if amount > self._NGN_LOCAL_TRANSACTIONS_FLAT_FEE_WAIVED:
-            fee += self._NGN_LOCAL_TRANSACTIONS_FLAT_FEE
-        return (
-            round(fee)
-            if round(fee) < self._NGN_LOCAL_TRANSACTIONS_FEE_CAP
-            else self._NGN_LOCAL_TRANSACTIONS_FEE_CAP
-        )
+        return self._scheduled_fee(amount, Currency.NGN, NigeriaServiceFeeOptions())
 
     def _calculate_ghs_fee(self, amount: int, options: GhanaServiceFeeOptions) -> int:
-        if options.service == "transactions":
-            return round(
-                amount * self._GHS_LOCAL_AND_INTERNATIONAL_TRANSACTIONS_DECIMAL_FEE
-            )
-        if options.service == "transfers_to_mobile_money":
-            return self._GHS_FEE_PER_MOBILE_MONEY_TRANSFERS
-        if options.service == "transfers_to_bank_accounts":
-            return self._GHS_FEE_PER_BANK_ACCOUNT_TRANSFERS
-        raise ValueError("unsupported service option")
+        return self._scheduled_fee(amount, Currency.GHS, options)
 
     def _calculate_zar_fee(
         self, amount: int, options: SouthAfricaServiceFeeOptions
     ) -> int:
-        if options.service == "transactions" and not options.is_international:
-            if options.is_eft:
-                return round(amount * self._ZAR_LOCAL_EFT_TRANSACTIONS_DECIMAL_FEE)
-            fee = amount * self._ZAR_LOCAL_TRANSACTIONS_DECIMAL_FEE
-            if amount > self._ZAR_LOCAL_TRANSACTIONS_FLAT_FEE_WAIVED:
-                fee += self._ZAR_LOCAL_TRANSACTIONS_FLAT_FEE
-            return round(fee)
-        if options.service == "transactions" and options.is_international:
-            return round(
-                (amount * self._ZAR_INTERNATIONAL_TRANSACTIONS_DECIMAL_FEE)
-                + self._ZAR_INTERNATIONAL_TRANSACTIONS_FLAT_FEE
-            )
-        if options.service == "transfers":
-            return self._ZAR_FEE_PER_BANK_ACCOUNT_TRANSFERS
-        raise ValueError("unsupported service option")
+        return self._scheduled_fee(amount, Currency.ZAR, options)
 
     def _calculate_kes_fee(self, amount: int, options: KenyaServiceFeeOptions) -> int:
-        if options.service == "mpesa_transactions":
-            return round(amount * self._KES_MPESA_TRANSACTIONS_DECIMAL_FEE)
-        if options.service == "card_transactions":
-            if options.is_international:
-                return round(
-                    amount * self._KES_INTERNATIONAL_CARD_TRANSACTIONS_DECIMAL_FEE
-                )
-            return round(amount * self._KES_LOCAL_CARD_TRANSACTIONS_DECIMAL_FEE)
-        if options.service == "transfers_to_mpesa_wallet":
-            if 100 <= amount <= 150_000:
-                return 2000
-            if 150_100 <= amount <= 2_000_000:
-                return 4000
-            if amount >= 2_000_100:
-                return 6000
-            raise ValueError(
-                f"{amount} is an invalid amount for transfers_to_mpesa_wallet. see https://paystack.com/ke/pricing?localeUpdate=true for a valid amount"
-            )
-        if options.service == "transfers_to_mpesa_paybill":
-            if 100 <= amount <= 150_000:
-                return 4000
-            if 150_100 <= amount <= 1_000_000:
-                return 8000
-            if 1_000_100 <= amount <= 4_000_000:
-                return 14000
-            if 4_000_100 <= amount <= 99_999_900:
-                return 18_000
-            if amount >= 100_000_000:
-                return 35_000
-            raise ValueError(
-                f"{amount} is an invalid amount for transfers_to_mpesa_paybill. see https://paystack.com/ke/pricing?localeUpdate=true for a valid amount"
-            )
-        if options.service == "transfers_to_bank_account":
-            if 100 <= amount <= 1_000_000:
-                return 8000
-            if 1_000_100 <= amount <= 5_000_000:
-                return 14_000
-            if 5_000_100 <= amount <= 99_999_900:
-                return 18_000
-            if amount >= 100_000_000:
-                return 35_000
-            raise ValueError(
-                f"{amount} is an invalid amount for transfers_to_bank_account. see https://paystack.com/ke/pricing?localeUpdate=true for a valid amount"
-            )
-        raise ValueError("unsupported service option")
+        return self._scheduled_fee(amount, Currency.KES, options)
 
     def _calculate_xof_fee(
         self, amount: int, options: CoteDIvoreServiceFeeOptions
     ) -> int:
-        if options.service == "mobile_money_transactions":
-            return round(amount * self._XOF_MOBILE_MONEY_DECIMAL_FEE)
-        if options.service == "card_transactions":
-            if options.is_international:
-                return round(
-                    amount * self._XOF_INTERNATIONAL_CARD_TRANSACTIONS_DECIMAL_FEE
-                )
-            round(amount * self._XOF_LOCAL_CARD_TRANSACTIONS_DECIMAL_FEE)
-        raise ValueError("unsupported service option")
+        return self._scheduled_fee(amount, Currency.XOF, options)
 
     def _calculate_rwf_fee(self, amount: int, options: RwandaServiceFeeOptions) -> int:
-        if options.is_international:
-            return round(amount * self._RWF_INTERNATIONAL_TRANSACTIONS_DECIMAL_FEE)
-        return round(amount * self._RWF_LOCAL_TRANSACTIONS_DECIMAL_FEE)
+        return self._scheduled_fee(amount, Currency.RWF, options)
 
     def _calculate_egp_fee(self, amount: int, options: EgyptServiceFeeOptions) -> int:
-        if options.is_international:
-            return round(
-                (amount * self._EGP_INTERNATIONAL_TRANSACTIONS_DECIMAL_FEE)
-                + self._EGP_INTERNATIONAL_TRANSACTIONS_FLAT_FEE
-            )
-        if options.card == "others":
-            return round(
-                (amount * self._EGP_LOCAL_TRANSACTIONS_NON_MEEZA_CARD_DECIMAL_FEE)
-                + self._EGP_LOCAL_TRANSACTIONS_FLAT_FEE
-            )
-        return round(
-            (amount * self._EGP_LOCAL_TRANSACTIONS_MEEZA_CARD_DECIMAL_FEE)
-            + self._EGP_LOCAL_TRANSACTIONS_FLAT_FEE
-        )
+        return self._scheduled_fee(amount, Currency.EGP, options)
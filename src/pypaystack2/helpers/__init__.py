@@ -0,0 +1,137 @@
+"""
+Higher-level helpers built on top of the sub clients.
+
+Unlike the sub clients which map one-to-one to paystack's API endpoints, the helpers
+in this package compose several API calls to solve common integration problems.
+"""
+
+# ruff: noqa: F401
+from pypaystack2.helpers.pagination import (
+    PaginationCheckpoint,
+    Paginator,
+    AsyncPaginator,
+)
+from pypaystack2.helpers.mirror import LocalMirror
+from pypaystack2.helpers.batch import BatchResult, BatchProgress
+from pypaystack2.helpers.bridge import AsyncBridge
+from pypaystack2.helpers.bulk_transfers import (
+    BulkTransferPipeline,
+    AsyncBulkTransferPipeline,
+    BulkTransferReport,
+    FailedBulkTransferChunk,
+)
+from pypaystack2.helpers.bulk_recipients import (
+    BulkRecipientPipeline,
+    AsyncBulkRecipientPipeline,
+    BulkRecipientReport,
+    FailedBulkRecipientChunk,
+)
+from pypaystack2.helpers.polling import AdaptivePollInterval
+from pypaystack2.helpers.bulk_charges import (
+    BulkChargeDriver,
+    AsyncBulkChargeDriver,
+    BulkChargeBatch,
+    BulkChargeOutcome,
+)
+from pypaystack2.helpers.billing import (
+    BillingEngine,
+    AsyncBillingEngine,
+    BillingItem,
+    BillingResult,
+    BillingSummary,
+    BillingCheckpoint,
+)
+from pypaystack2.helpers.transfer_reconciliation import (
+    TransferReconciler,
+    TransferStateChange,
+)
+from pypaystack2.helpers.payouts import PayoutScheduler
+from pypaystack2.helpers.events import EventBus, InProcessEventBus
+from pypaystack2.helpers.charge_flow import (
+    ChargeFlowDriver,
+    ChargeFlowResult,
+    ChargeInputRequest,
+)
+from pypaystack2.helpers.account_resolution import (
+    AccountResolver,
+    AsyncAccountResolver,
+    AccountResolution,
+    AccountResolutionReport,
+)
+from pypaystack2.helpers.card_bins import CardBinIndex, AsyncCardBinIndex
+from pypaystack2.helpers.banks import BankCatalog, AsyncBankCatalog, BankIndex
+from pypaystack2.helpers.customer_cache import CustomerCache, AsyncCustomerCache
+from pypaystack2.helpers.customer_directory import (
+    CustomerDirectory,
+    CustomerDirectoryBuilder,
+    AsyncCustomerDirectoryBuilder,
+    CustomerRecord,
+)
+from pypaystack2.helpers.catalog import Catalog, AsyncCatalog, CatalogSnapshot
+from pypaystack2.helpers.split_settlement import (
+    SplitCalculator,
+    AsyncSplitCalculator,
+    SplitRule,
+    SplitShares,
+    MAIN_ACCOUNT,
+)
+
+__all__ = [
+    "PaginationCheckpoint",
+    "Paginator",
+    "AsyncPaginator",
+    "LocalMirror",
+    "BatchResult",
+    "BatchProgress",
+    "AsyncBridge",
+    "BulkTransferPipeline",
+    "AsyncBulkTransferPipeline",
+    "BulkTransferReport",
+    "FailedBulkTransferChunk",
+    "BulkRecipientPipeline",
+    "AsyncBulkRecipientPipeline",
+    "BulkRecipientReport",
+    "FailedBulkRecipientChunk",
+    "AdaptivePollInterval",
+    "BulkChargeDriver",
+    "AsyncBulkChargeDriver",
+    "BulkChargeBatch",
+    "BulkChargeOutcome",
+    "BillingEngine",
+    "AsyncBillingEngine",
+    "BillingItem",
+    "BillingResult",
+    "BillingSummary",
+    "BillingCheckpoint",
+    "TransferReconciler",
+    "TransferStateChange",
+    "PayoutScheduler",
+    "EventBus",
+    "InProcessEventBus",
+    "ChargeFlowDriver",
+    "ChargeFlowResult",
+    "ChargeInputRequest",
+    "AccountResolver",
+    "AsyncAccountResolver",
+    "AccountResolution",
+    "AccountResolutionReport",
+    "CardBinIndex",
+    "AsyncCardBinIndex",
+    "BankCatalog",
+    "AsyncBankCatalog",
+    "BankIndex",
+    "CustomerCache",
+    "AsyncCustomerCache",
+    "CustomerDirectory",
+    "CustomerDirectoryBuilder",
+    "AsyncCustomerDirectoryBuilder",
+    "CustomerRecord",
+    "Catalog",
+    "AsyncCatalog",
+    "CatalogSnapshot",
+    "SplitCalculator",
+    "AsyncSplitCalculator",
+    "SplitRule",
+    "SplitShares",
+    "MAIN_ACCOUNT",
+]
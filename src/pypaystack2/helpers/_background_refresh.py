@@ -0,0 +1,97 @@
+import asyncio
+import threading
+import time
+from typing import Any, Callable
+
+_REFRESH_RETRY_INTERVAL = 60.0
+"""The number of seconds a failed refresh is retried after."""
+
+
+class BaseBackgroundRefresh:
+    """Tracks the age of data that is served stale while it is refreshed in the background.
+
+    A failed refresh keeps the stale data, is stored in `last_error` and is retried
+    `_REFRESH_RETRY_INTERVAL` seconds later.
+    """
+
+    def __init__(self, ttl: float):
+        self.ttl = ttl
+        self.last_error: Exception | None = None
+        self._clock: Callable[[], float] = time.monotonic
+        self._loaded_at: float | None = None
+        self._retry_refresh_at = 0.0
+
+    @property
+    def stale(self) -> bool:
+        """Whether the data was never loaded or was loaded more than `ttl` seconds ago."""
+        return self._loaded_at is None or self._clock() - self._loaded_at >= self.ttl
+
+    def _should_refresh(self) -> bool:
+        return self.stale and self._clock() >= self._retry_refresh_at
+
+    def _refreshed(self) -> None:
+        self._loaded_at = self._clock()
+        self.last_error = None
+
+    def _refresh_failed(self, error: Exception) -> None:
+        self._retry_refresh_at = self._clock() + _REFRESH_RETRY_INTERVAL
+        self.last_error = error
+
+
+class BackgroundRefresh(BaseBackgroundRefresh):
+    """Refreshes stale data by calling `load` on a daemon thread."""
+
+    _refresh_thread_name = "pypaystack2-refresh"
+
+    def __init__(self, ttl: float):
+        super().__init__(ttl)
+        self._lock = threading.Lock()
+        self._refreshing: threading.Thread | None = None
+
+    def load(self) -> Any:
+        raise NotImplementedError
+
+    def _refresh_in_background(self) -> None:
+        try:
+            self.load()
+        except Exception as error:
+            self._refresh_failed(error)
+        finally:
+            with self._lock:
+                self._refreshing = None
+
+    def _refresh_if_stale(self) -> None:
+        if self._should_refresh():
+            with self._lock:
+                if self._refreshing is None:
+                    self._refreshing = threading.Thread(
+                        target=self._refresh_in_background,
+                        name=self._refresh_thread_name,
+                        daemon=True,
+                    )
+                    self._refreshing.start()
+
+
+class AsyncBackgroundRefresh(BaseBackgroundRefresh):
+    """Refreshes stale data by awaiting `load` in a task on the running event loop."""
+
+    def __init__(self, ttl: float):
+        super().__init__(ttl)
+        self._refreshing: asyncio.Task[None] | None = None
+
+    async def load(self) -> Any:
+        raise NotImplementedError
+
+    async def _refresh_in_background(self) -> None:
+        try:
+            await self.load()
+        except Exception as error:
+            self._refresh_failed(error)
+        finally:
+            self._refreshing = None
+
+    def _refresh_if_stale(self) -> None:
+        if self._refreshing is None and self._should_refresh():
+            self._refreshing = asyncio.get_running_loop().create_task(
+                self._refresh_in_background()
+            )
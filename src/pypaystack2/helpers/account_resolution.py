@@ -0,0 +1,299 @@
+from http import HTTPStatus
+from typing import TYPE_CHECKING, Any, Callable, Iterable
+
+from pydantic import BaseModel
+
+from pypaystack2.caching import CacheBackend, MemoryCache
+from pypaystack2.helpers.batch import BatchProgress, BatchResult, amap, map_in_threads
+from pypaystack2.models import BankAccountInfo
+
+if TYPE_CHECKING:  # pragma: no cover
+    from pypaystack2.main_clients import AsyncPaystackClient, PaystackClient
+
+AccountKey = tuple[str, str]
+"""An `(account_number, bank_code)` pair."""
+
+
+class AccountResolution(BaseModel):
+    """A pydantic model for representing the resolution of one row of a batch.
+
+    Attributes:
+        row: The position of the row in the batch.
+        account_number: The account number of the row.
+        bank_code: The bank code of the row.
+        account_name: The name the account is registered to, `None` if it could not be resolved.
+        error: The reason the account could not be resolved, if any.
+        cached: Whether the resolution was served from the cache.
+    """
+
+    row: int
+    account_number: str
+    bank_code: str
+    account_name: str | None = None
+    error: str | None = None
+    cached: bool = False
+
+    @property
+    def ok(self) -> bool:
+        """`True` if the account was resolved."""
+        return self.account_name is not None
+
+
+class AccountResolutionReport(BaseModel):
+    """A pydantic model for representing the outcome of a batch of account resolutions.
+
+    Attributes:
+        rows: The resolution of every row, in the order of the rows.
+        unique_accounts: The number of distinct accounts in the batch.
+        cache_hits: The number of distinct accounts served from the cache.
+        api_calls: The number of `resolve_account_number` calls made.
+    """
+
+    rows: list[AccountResolution]
+    unique_accounts: int = 0
+    cache_hits: int = 0
+    api_calls: int = 0
+
+    def failed(self) -> list[AccountResolution]:
+        """Returns the rows that could not be resolved."""
+        return [row for row in self.rows if not row.ok]
+
+
+def account_key(row: AccountKey | dict[str, Any]) -> AccountKey:
+    """Normalizes a row to an `(account_number, bank_code)` pair.
+
+    Args:
+        row: An `(account_number, bank_code)` tuple or a dict with `account_number`
+            and `bank_code` keys.
+    """
+    if isinstance(row, dict):
+        account_number, bank_code = row["account_number"], row["bank_code"]
+    else:
+        account_number, bank_code = row
+    return str(account_number).strip(), str(bank_code).strip()
+
+
+class _BaseAccountResolver:
+    def __init__(
+        self,
+        cache: CacheBackend | None,
+        ttl: float | None,
+        failure_ttl: float | None,
+    ):
+        self.cache: CacheBackend = (
+            cache if cache is not None else MemoryCache(max_size=100_000)
+        )
+        self.ttl = ttl
+        self.failure_ttl = failure_ttl
+
+    @staticmethod
+    def _cache_key(key: AccountKey) -> str:
+        account_number, bank_code = key
+        return f"resolve_account_number:{bank_code}:{account_number}"
+
+    def _plan(
+        self, rows: Iterable[AccountKey | dict[str, Any]]
+    ) -> tuple[list[AccountKey], dict[AccountKey, dict[str, Any]], list[AccountKey]]:
+        """Returns the keys of the rows, the cached resolutions and the keys to resolve."""
+        keys = [account_key(row) for row in rows]
+        resolved: dict[AccountKey, dict[str, Any]] = {}
+        misses: list[AccountKey] = []
+        for key in dict.fromkeys(keys):
+            cached = self.cache.get(self._cache_key(key))
+            if isinstance(cached, dict):
+                resolved[key] = {**cached, "cached": True}
+            else:
+                misses.append(key)
+        return keys, resolved, misses
+
+    def _store(self, key: AccountKey, result: BatchResult) -> dict[str, Any]:
+        """Caches the outcome of a `resolve_account_number` call and returns it."""
+        response = result.response
+        if result.error is not None or response is None:
+            return {"error": str(result.error)}  # may be transient, not cached
+        if response.status and isinstance(response.data, BankAccountInfo):
+            value: dict[str, Any] = {"account_name": response.data.account_name}
+            self.cache.set(self._cache_key(key), value, self.ttl)
+            return value
+        value = {"error": response.message or "unable to resolve account"}
+        if response.status_code in (HTTPStatus.BAD_REQUEST, 422):
+            # paystack could not resolve the account, it is unlikely to on retry
+            self.cache.set(self._cache_key(key), value, self.failure_ttl)
+        return value
+
+    def _report(
+        self,
+        keys: list[AccountKey],
+        resolved: dict[AccountKey, dict[str, Any]],
+        api_calls: int,
+    ) -> AccountResolutionReport:
+        cache_hits = sum(1 for value in resolved.values() if value.get("cached"))
+        return AccountResolutionReport(
+            rows=[
+                AccountResolution(
+                    row=index,
+                    account_number=key[0],
+                    bank_code=key[1],
+                    **resolved[key],
+                )
+                for index, key in enumerate(keys)
+            ],
+            unique_accounts=len(resolved),
+            cache_hits=cache_hits,
+            api_calls=api_calls,
+        )
+
+
+class AccountResolver(_BaseAccountResolver):
+    """Resolves the account numbers of a batch of rows, calling paystack once per distinct account.
+
+    Rows repeating an `(account_number, bank_code)` pair share one resolution.
+    Resolutions are cached for `ttl` seconds, so accounts resolved in an earlier batch
+    are not resolved again. Use a `SQLiteCache` to keep the cache across runs.
+    Accounts paystack could not resolve are cached for `failure_ttl` seconds while
+    requests that raised are retried on the next batch. The remaining accounts are
+    resolved on a pool of threads that waits on the client's rate limiter.
+
+    Example:
+        ```python
+        import csv
+
+        from pypaystack2 import PaystackClient
+        from pypaystack2.caching import SQLiteCache
+        from pypaystack2.helpers import AccountResolver
+        from pypaystack2.rate_limiting import RateLimiter
+
+        client = PaystackClient(rate_limiter=RateLimiter(rate=10))
+        resolver = AccountResolver(client, cache=SQLiteCache("accounts.db"))
+        with open("payroll.csv") as payroll:
+            report = resolver.resolve(csv.DictReader(payroll))
+        print(report.unique_accounts, report.cache_hits, report.api_calls)
+        for row in report.failed():
+            print(row.row, row.account_number, row.error)
+        ```
+    """
+
+    def __init__(
+        self,
+        client: "PaystackClient",
+        cache: CacheBackend | None = None,
+        ttl: float | None = 30 * 24 * 3600,
+        failure_ttl: float | None = 24 * 3600,
+        workers: int = 8,
+    ):
+        """
+        Args:
+            client: The client used to resolve the accounts.
+            cache: The cache resolutions are kept in. It defaults to a `MemoryCache`
+                of 100,000 accounts.
+            ttl: The number of seconds a resolved account is cached for.
+            failure_ttl: The number of seconds an account paystack could not resolve
+                is cached for.
+            workers: The number of threads resolving accounts.
+        """
+        super().__init__(cache, ttl, failure_ttl)
+        self._client = client
+        self.workers = workers
+
+    def resolve(
+        self,
+        rows: Iterable[AccountKey | dict[str, Any]],
+        on_progress: Callable[[BatchProgress], None] | None = None,
+    ) -> AccountResolutionReport:
+        """Resolves the account of every row.
+
+        Args:
+            rows: `(account_number, bank_code)` tuples or dicts with `account_number`
+                and `bank_code` keys.
+            on_progress: A callable that is called with a `BatchProgress` after every
+                `resolve_account_number` call.
+
+        Returns:
+            An `AccountResolutionReport` with a resolution for every row.
+        """
+        keys, resolved, misses = self._plan(rows)
+        results = map_in_threads(
+            self._client.verification.resolve_account_number,
+            [
+                {"account_number": account_number, "bank_code": bank_code}
+                for account_number, bank_code in misses
+            ],
+            self.workers,
+            on_progress,
+        )
+        for key, result in zip(misses, results):
+            resolved[key] = self._store(key, result)
+        return self._report(keys, resolved, len(misses))
+
+
+class AsyncAccountResolver(_BaseAccountResolver):
+    """Resolves the account numbers of a batch of rows, calling paystack once per distinct account.
+
+    The async version of `AccountResolver`. The remaining accounts are resolved
+    concurrently and wait on the client's rate limiter.
+
+    Example:
+        ```python
+        from pypaystack2 import AsyncPaystackClient
+        from pypaystack2.caching import SQLiteCache
+        from pypaystack2.helpers import AsyncAccountResolver
+
+        resolver = AsyncAccountResolver(
+            AsyncPaystackClient(), cache=SQLiteCache("accounts.db"), concurrency=10
+        )
+        report = await resolver.resolve([("0022728151", "063"), ("0022728151", "063")])
+        print(report.rows[0].account_name, report.api_calls)
+        ```
+    """
+
+    def __init__(
+        self,
+        client: "AsyncPaystackClient",
+        cache: CacheBackend | None = None,
+        ttl: float | None = 30 * 24 * 3600,
+        failure_ttl: float | None = 24 * 3600,
+        concurrency: int = 10,
+    ):
+        """
+        Args:
+            client: The client used to resolve the accounts.
+            cache: The cache resolutions are kept in. It defaults to a `MemoryCache`
+                of 100,000 accounts.
+            ttl: The number of seconds a resolved account is cached for.
+            failure_ttl: The number of seconds an account paystack could not resolve
+                is cached for.
+            concurrency: The maximum number of `resolve_account_number` calls in flight at once.
+        """
+        super().__init__(cache, ttl, failure_ttl)
+        self._client = client
+        self.concurrency = concurrency
+
+    async def resolve(
+        self,
+        rows: Iterable[AccountKey | dict[str, Any]],
+        on_progress: Callable[[BatchProgress], None] | None = None,
+    ) -> AccountResolutionReport:
+        """Resolves the account of every row.
+
+        Args:
+            rows: `(account_number, bank_code)` tuples or dicts with `account_number`
+                and `bank_code` keys.
+            on_progress: A callable that is called with a `BatchProgress` after every
+                `resolve_account_number` call.
+
+        Returns:
+            An `AccountResolutionReport` with a resolution for every row.
+        """
+        keys, resolved, misses = self._plan(rows)
+        async for result in amap(
+            self._client.verification.resolve_account_number,
+            [
+                {"account_number": account_number, "bank_code": bank_code}
+                for account_number, bank_code in misses
+            ],
+            self.concurrency,
+            on_progress,
+        ):
+            key = misses[result.index]
+            resolved[key] = self._store(key, result)
+        return self._report(keys, resolved, len(misses))
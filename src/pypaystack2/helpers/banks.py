@@ -0,0 +1,363 @@
+import asyncio
+import bisect
+import time
+from typing import TYPE_CHECKING, Any, Iterable
+
+from pypaystack2.enums import Country
+from pypaystack2.exceptions import PaystackResponseError
+from pypaystack2.helpers._background_refresh import (
+    AsyncBackgroundRefresh,
+    BackgroundRefresh,
+    BaseBackgroundRefresh,
+)
+from pypaystack2.models import Bank, PaystackSupportedCountry, Response, State
+
+if TYPE_CHECKING:  # pragma: no cover
+    from pypaystack2.main_clients import AsyncPaystackClient, PaystackClient
+
+
+def _normalize(name: str) -> str:
+    return " ".join(name.lower().split())
+
+
+class BankIndex:
+    """An immutable index of the banks, countries and states loaded by a bank catalog.
+
+    Lookups are dictionary lookups and prefix searches are binary searches over the
+    sorted words of the bank names.
+    """
+
+    def __init__(
+        self,
+        banks: dict[Country, list[Bank]],
+        countries: list[PaystackSupportedCountry],
+        states: dict[Country, list[State]],
+    ):
+        self.banks = banks
+        self.countries = countries
+        self.states = states
+        self.loaded_at = time.monotonic()
+        self._by_code: dict[Country, dict[str, Bank]] = {}
+        self._by_slug: dict[str, Bank] = {}
+        self._by_name: dict[Country, dict[str, Bank]] = {}
+        self._by_nip_sort_code: dict[str, Bank] = {}
+        self._words: list[tuple[str, Country, int]] = []
+        for country, country_banks in banks.items():
+            by_code = self._by_code[country] = {}
+            by_name = self._by_name[country] = {}
+            for position, bank in enumerate(country_banks):
+                by_code.setdefault(bank.code, bank)
+                by_name.setdefault(_normalize(bank.name), bank)
+                self._by_slug.setdefault(bank.slug, bank)
+                if bank.nip_sort_code:
+                    self._by_nip_sort_code.setdefault(bank.nip_sort_code, bank)
+                words = _normalize(bank.name).split(" ")
+                # every word of a name starts a searchable suffix,
+                # so "trust" finds "Guaranty Trust Bank"
+                for start in range(len(words)):
+                    self._words.append((" ".join(words[start:]), country, position))
+        self._words.sort()
+
+    def by_code(self, code: str, country: Country) -> Bank | None:
+        return self._by_code.get(country, {}).get(code)
+
+    def by_slug(self, slug: str) -> Bank | None:
+        return self._by_slug.get(slug)
+
+    def by_name(self, name: str, country: Country) -> Bank | None:
+        return self._by_name.get(country, {}).get(_normalize(name))
+
+    def by_nip_sort_code(self, nip_sort_code: str) -> Bank | None:
+        return self._by_nip_sort_code.get(nip_sort_code)
+
+    def search(self, prefix: str, country: Country | None, limit: int) -> list[Bank]:
+        prefix = _normalize(prefix)
+        found: dict[tuple[Country, int], Bank] = {}
+        index = bisect.bisect_left(self._words, (prefix,))
+        while index < len(self._words) and len(found) < limit:
+            words, bank_country, position = self._words[index]
+            if not words.startswith(prefix):
+                break
+            if country is None or bank_country == country:
+                found.setdefault(
+                    (bank_country, position), self.banks[bank_country][position]
+                )
+            index += 1
+        return list(found.values())
+
+
+class _BaseBankCatalog(BaseBackgroundRefresh):
+    def __init__(
+        self,
+        countries: Iterable[Country],
+        ttl: float,
+        include_nip_sort_code: bool,
+        pagination: int,
+    ):
+        self.countries = [Country(country) for country in countries]
+        if not self.countries:
+            raise ValueError("at least one country is required")
+        super().__init__(ttl)
+        self.include_nip_sort_code = include_nip_sort_code
+        self.pagination = pagination
+        self._index: BankIndex | None = None
+
+    def _loaded(self, index: BankIndex) -> None:
+        self._index = index
+        self._refreshed()
+
+    def _bank_page_arguments(
+        self, country: Country, cursor: str | None
+    ) -> dict[str, Any]:
+        return {
+            "country": country,
+            "use_cursor": True,
+            "next_": cursor,
+            "pagination": self.pagination,
+            "include_nip_sort_code": self.include_nip_sort_code or None,
+        }
+
+    @staticmethod
+    def _page(response: Response[Any], what: str) -> list[Any]:
+        if not response.status or not isinstance(response.data, list):
+            raise PaystackResponseError(
+                f"unable to load {what}: {response.message}", response
+            )
+        return response.data
+
+    @staticmethod
+    def _next_cursor(response: Response[Any], cursor: str | None) -> str | None:
+        next_cursor = (response.meta or {}).get("next")
+        if not next_cursor or next_cursor == cursor:
+            return None
+        return next_cursor
+
+    def _country(self, country: Country | str | None) -> Country:
+        return Country(country) if country is not None else self.countries[0]
+
+    @property
+    def index(self) -> BankIndex:
+        raise NotImplementedError
+
+    def get(self, code: str, country: Country | str | None = None) -> Bank | None:
+        """Returns the bank with a bank code.
+
+        Args:
+            code: The bank code, e.g. `058`.
+            country: The country of the bank. It defaults to the first country of the catalog.
+        """
+        return self.index.by_code(code, self._country(country))
+
+    def by_slug(self, slug: str) -> Bank | None:
+        """Returns the bank with a slug, e.g. `guaranty-trust-bank`."""
+        return self.index.by_slug(slug)
+
+    def by_name(self, name: str, country: Country | str | None = None) -> Bank | None:
+        """Returns the bank with a name, ignoring case and repeated spaces."""
+        return self.index.by_name(name, self._country(country))
+
+    def by_nip_sort_code(self, nip_sort_code: str) -> Bank | None:
+        """Returns the Nigerian bank with a NIP institution code."""
+        return self.index.by_nip_sort_code(nip_sort_code)
+
+    def name(self, code: str, country: Country | str | None = None) -> str | None:
+        """Returns the name of the bank with a bank code."""
+        bank = self.get(code, country)
+        return bank.name if bank is not None else None
+
+    def search(
+        self, prefix: str, country: Country | str | None = None, limit: int = 10
+    ) -> list[Bank]:
+        """Returns the banks with a word in their name that starts with `prefix`.
+
+        Args:
+            prefix: The start of any word of the bank names, e.g. `first` or `trust b`.
+            country: The country of the banks. Banks of every country are searched if
+                it is not provided.
+            limit: The maximum number of banks returned.
+        """
+        return self.index.search(
+            prefix, Country(country) if country is not None else None, limit
+        )
+
+    def banks(self, country: Country | str | None = None) -> list[Bank]:
+        """Returns every bank of a country."""
+        return list(self.index.banks.get(self._country(country), []))
+
+    def supported_countries(self) -> list[PaystackSupportedCountry]:
+        """Returns the countries paystack supports."""
+        return list(self.index.countries)
+
+    def states(self, country: Country | str | None = None) -> list[State]:
+        """Returns the states of a country for address verification."""
+        return list(self.index.states.get(self._country(country), []))
+
+
+class BankCatalog(_BaseBankCatalog, BackgroundRefresh):
+    """An in-memory catalog of paystack's banks, countries and states.
+
+    Every page of `MiscellaneousClient.get_banks` is loaded once per country together
+    with `get_countries` and `get_states`, and the banks are indexed by code, slug,
+    name and NIP sort code. Lookups never make a request once the catalog is loaded.
+    When the catalog is older than `ttl` seconds, the next lookup starts a refresh on
+    a background thread and is served from the stale catalog until the refresh
+    completes. A failed refresh keeps the stale catalog, is stored in `last_error` and
+    is retried a minute later.
+
+    Example:
+        ```python
+        from pypaystack2 import PaystackClient
+        from pypaystack2.enums import Country
+        from pypaystack2.helpers import BankCatalog
+
+        catalog = BankCatalog(PaystackClient(), countries=[Country.NIGERIA, Country.GHANA])
+        catalog.load()
+        print(catalog.get("058").name)
+        print([bank.name for bank in catalog.search("first")])
+        ```
+    """
+
+    _refresh_thread_name = "pypaystack2-bank-catalog"
+
+    def __init__(
+        self,
+        client: "PaystackClient",
+        countries: Iterable[Country] = (Country.NIGERIA,),
+        ttl: float = 24 * 3600,
+        include_nip_sort_code: bool = True,
+        pagination: int = 100,
+    ):
+        """
+        Args:
+            client: The client used to load the catalog.
+            countries: The countries whose banks and states are loaded. The first
+                country is used by lookups that do not specify one.
+            ttl: The number of seconds after which the catalog is refreshed.
+            include_nip_sort_code: Whether to load the NIP sort codes of Nigerian banks.
+            pagination: The number of banks requested per page.
+        """
+        super().__init__(countries, ttl, include_nip_sort_code, pagination)
+        self._client = client
+
+    def _fetch(self) -> BankIndex:
+        banks: dict[Country, list[Bank]] = {}
+        states: dict[Country, list[State]] = {}
+        miscellaneous = self._client.miscellaneous
+        for country in self.countries:
+            banks[country], cursor = [], None
+            while True:
+                response = miscellaneous.get_banks(
+                    **self._bank_page_arguments(country, cursor)
+                )
+                banks[country].extend(self._page(response, f"{country} banks"))
+                if (cursor := self._next_cursor(response, cursor)) is None:
+                    break
+            states[country] = self._page(
+                miscellaneous.get_states(country), f"{country} states"
+            )
+        countries = self._page(miscellaneous.get_countries(), "countries")
+        return BankIndex(banks, countries, states)
+
+    def load(self) -> None:
+        """Loads the catalog, blocking until it is loaded."""
+        index = self._fetch()
+        with self._lock:
+            self._loaded(index)
+
+    @property
+    def index(self) -> BankIndex:
+        """The current `BankIndex`, loading the catalog first if it was never loaded."""
+        index = self._index
+        if index is None:
+            self.load()
+            return self._index  # type: ignore[return-value]
+        self._refresh_if_stale()
+        return index
+
+
+class AsyncBankCatalog(_BaseBankCatalog, AsyncBackgroundRefresh):
+    """An in-memory catalog of paystack's banks, countries and states.
+
+    The async version of `BankCatalog`. Lookups are synchronous once the catalog is
+    loaded with `AsyncBankCatalog.load`. A stale catalog is refreshed in a task on the
+    running event loop.
+
+    Example:
+        ```python
+        from pypaystack2 import AsyncPaystackClient
+        from pypaystack2.helpers import AsyncBankCatalog
+
+        catalog = AsyncBankCatalog(AsyncPaystackClient())
+        await catalog.load()
+        print(catalog.name("058"))
+        ```
+    """
+
+    def __init__(
+        self,
+        client: "AsyncPaystackClient",
+        countries: Iterable[Country] = (Country.NIGERIA,),
+        ttl: float = 24 * 3600,
+        include_nip_sort_code: bool = True,
+        pagination: int = 100,
+    ):
+        """
+        Args:
+            client: The client used to load the catalog.
+            countries: The countries whose banks and states are loaded. The first
+                country is used by lookups that do not specify one.
+            ttl: The number of seconds after which the catalog is refreshed.
+            include_nip_sort_code: Whether to load the NIP sort codes of Nigerian banks.
+            pagination: The number of banks requested per page.
+        """
+        super().__init__(countries, ttl, include_nip_sort_code, pagination)
+        self._client = client
+
+    async def _fetch_country(self, country: Country) -> tuple[list[Bank], list[State]]:
+        miscellaneous = self._client.miscellaneous
+        banks: list[Bank] = []
+        cursor = None
+        while True:
+            response = await miscellaneous.get_banks(
+                **self._bank_page_arguments(country, cursor)
+            )
+            banks.extend(self._page(response, f"{country} banks"))
+            if (cursor := self._next_cursor(response, cursor)) is None:
+                break
+        states = self._page(
+            await miscellaneous.get_states(country), f"{country} states"
+        )
+        return banks, states
+
+    async def load(self) -> None:
+        """Loads the catalog, fetching every country concurrently."""
+        *country_data, countries = await asyncio.gather(
+            *(self._fetch_country(country) for country in self.countries),
+            self._client.miscellaneous.get_countries(),
+        )
+        self._loaded(
+            BankIndex(
+                {
+                    country: banks
+                    for country, (banks, _) in zip(self.countries, country_data)
+                },
+                self._page(countries, "countries"),
+                {
+                    country: states
+                    for country, (_, states) in zip(self.countries, country_data)
+                },
+            )
+        )
+
+    @property
+    def index(self) -> BankIndex:
+        """The current `BankIndex`.
+
+        Raises:
+            RuntimeError: If the catalog was never loaded.
+        """
+        index = self._index
+        if index is None:
+            raise RuntimeError("the catalog is not loaded, call `load` first")
+        self._refresh_if_stale()
+        return index
@@ -0,0 +1,236 @@
+import asyncio
+from collections.abc import Sized
+from concurrent.futures import (
+    FIRST_COMPLETED,
+    Future,
+    ThreadPoolExecutor,
+    as_completed,
+    wait,
+)
+from typing import Any, AsyncIterator, Awaitable, Callable, Iterable, Iterator
+
+from pydantic import BaseModel, ConfigDict
+
+from pypaystack2.models import Response
+
+
+class BatchResult(BaseModel):
+    """A pydantic model for representing the outcome of one call in a batch.
+
+    Attributes:
+        index: The position of `input` in the inputs of the batch.
+        input: The input the method was called with.
+        response: The response returned by the method. `None` if the call raised an exception.
+        error: The exception raised by the call, if any.
+    """
+
+    model_config = ConfigDict(arbitrary_types_allowed=True)
+
+    index: int
+    input: Any
+    response: Any = None
+    error: Exception | None = None
+
+    @property
+    def ok(self) -> bool:
+        """`True` if the call completed without an exception and paystack reported success."""
+        return (
+            self.error is None
+            and self.response is not None
+            and bool(self.response.status)
+        )
+
+
+class BatchProgress(BaseModel):
+    """A pydantic model for representing the progress of a batch.
+
+    Attributes:
+        completed: The number of calls that have completed, including failed calls.
+        failed: The number of calls that raised an exception.
+        total: The number of inputs in the batch, `None` if the inputs are not sized.
+    """
+
+    completed: int = 0
+    failed: int = 0
+    total: int | None = None
+
+
+def to_call_arguments(input_: Any) -> tuple[tuple[Any, ...], dict[str, Any]]:
+    """Converts a batch input to the positional and keyword arguments of a call.
+
+    A `dict` is passed as keyword arguments, a `tuple` as positional arguments and
+    any other value as the only positional argument.
+    """
+    if isinstance(input_, dict):
+        return (), input_
+    if isinstance(input_, tuple):
+        return input_, {}
+    return (input_,), {}
+
+
+async def amap(
+    method: Callable[..., Awaitable[Response[Any]]],
+    inputs: Iterable[Any],
+    concurrency: int = 10,
+    on_progress: Callable[[BatchProgress], None] | None = None,
+) -> AsyncIterator[BatchResult]:
+    """Calls an async sub client method for every input with bounded concurrency.
+
+    Results are yielded as the calls complete. Exceptions raised by a call are
+    captured in its `BatchResult` instead of aborting the batch. Inputs are consumed
+    lazily, so `inputs` may be a generator over a large file.
+
+    Args:
+        method: A bound method of an async sub client. e.g. `AsyncPaystackClient.transactions.verify`
+        inputs: The inputs of the batch. See `to_call_arguments` for how an input is passed to `method`.
+        concurrency: The maximum number of calls in flight at once.
+        on_progress: A callable that is called with a `BatchProgress` after every completed call.
+    """
+    if concurrency < 1:
+        raise ValueError("concurrency must be at least 1")
+    total = len(inputs) if isinstance(inputs, Sized) else None
+    pending_inputs = enumerate(inputs)
+    results: asyncio.Queue[BatchResult | Exception | None] = asyncio.Queue(
+        maxsize=concurrency
+    )
+
+    async def worker() -> None:
+        while True:
+            try:
+                index, input_ = next(pending_inputs)
+            except StopIteration:
+                break
+            except Exception as error:  # the inputs iterable itself failed
+                await results.put(error)
+                return
+            try:
+                args, kwargs = to_call_arguments(input_)
+                result = BatchResult(
+                    index=index, input=input_, response=await method(*args, **kwargs)
+                )
+            except Exception as error:
+                result = BatchResult(index=index, input=input_, error=error)
+            await results.put(result)
+        await results.put(None)
+
+    workers = [asyncio.create_task(worker()) for _ in range(concurrency)]
+    completed = failed = finished_workers = 0
+    try:
+        while finished_workers < len(workers):
+            result = await results.get()
+            if result is None:
+                finished_workers += 1
+                continue
+            if isinstance(result, Exception):
+                raise result
+            completed += 1
+            if result.error is not None:
+                failed += 1
+            if on_progress is not None:
+                on_progress(
+                    BatchProgress(completed=completed, failed=failed, total=total)
+                )
+            yield result
+    finally:
+        for task in workers:
+            task.cancel()
+        await asyncio.gather(*workers, return_exceptions=True)
+
+
+def _call_with_input(
+    method: Callable[..., Response[Any]], index: int, input_: Any
+) -> BatchResult:
+    try:
+        args, kwargs = to_call_arguments(input_)
+        return BatchResult(index=index, input=input_, response=method(*args, **kwargs))
+    except Exception as error:
+        return BatchResult(index=index, input=input_, error=error)
+
+
+def map_in_threads(
+    method: Callable[..., Response[Any]],
+    inputs: Iterable[Any],
+    workers: int = 8,
+    on_progress: Callable[[BatchProgress], None] | None = None,
+) -> list[BatchResult]:
+    """Calls a sub client method for every input on a pool of threads.
+
+    Exceptions raised by a call are captured in its `BatchResult` instead of
+    aborting the batch.
+
+    Args:
+        method: A bound method of a sub client. e.g. `PaystackClient.transactions.verify`
+        inputs: The inputs of the batch. See `to_call_arguments` for how an input is passed to `method`.
+        workers: The number of threads making calls.
+        on_progress: A callable that is called from the calling thread with a `BatchProgress`
+            after every completed call.
+
+    Returns:
+        A list of `BatchResult`s in the same order as `inputs`.
+    """
+    if workers < 1:
+        raise ValueError("workers must be at least 1")
+    inputs = list(inputs)
+    results: list[BatchResult] = [None] * len(inputs)  # type: ignore[list-item]
+    failed = 0
+    with ThreadPoolExecutor(
+        max_workers=workers, thread_name_prefix="pypaystack2"
+    ) as executor:
+        futures = [
+            executor.submit(_call_with_input, method, index, input_)
+            for index, input_ in enumerate(inputs)
+        ]
+        for completed, future in enumerate(as_completed(futures), start=1):
+            result = future.result()
+            results[result.index] = result
+            if result.error is not None:
+                failed += 1
+            if on_progress is not None:
+                on_progress(
+                    BatchProgress(completed=completed, failed=failed, total=len(inputs))
+                )
+    return results
+
+
+def imap_in_threads(
+    method: Callable[..., Any],
+    inputs: Iterable[Any],
+    workers: int = 8,
+) -> Iterator[BatchResult]:
+    """Calls a method for every input on a pool of threads, yielding results as they complete.
+
+    Unlike `map_in_threads`, inputs are consumed lazily and at most `2 * workers`
+    calls are queued at once, so `inputs` may be a generator over a large file.
+
+    Args:
+        method: The method to call. e.g. `PaystackClient.transactions.verify`
+        inputs: The inputs of the batch. See `to_call_arguments` for how an input is passed to `method`.
+        workers: The number of threads making calls.
+    """
+    if workers < 1:
+        raise ValueError("workers must be at least 1")
+    pending_inputs = enumerate(inputs)
+    in_flight: set[Future[BatchResult]] = set()
+    with ThreadPoolExecutor(
+        max_workers=workers, thread_name_prefix="pypaystack2"
+    ) as executor:
+        try:
+            exhausted = False
+            while True:
+                while not exhausted and len(in_flight) < 2 * workers:
+                    try:
+                        index, input_ = next(pending_inputs)
+                    except StopIteration:
+                        exhausted = True
+                        break
+                    in_flight.add(
+                        executor.submit(_call_with_input, method, index, input_)
+                    )
+                if not in_flight:
+                    return
+                done, in_flight = wait(in_flight, return_when=FIRST_COMPLETED)
+                for future in done:
+                    yield future.result()
+        finally:
+            for future in in_flight:
+                future.cancel()
@@ -0,0 +1,483 @@
+import hashlib
+import os
+import re
+from http import HTTPStatus
+from pathlib import Path
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    BinaryIO,
+    Callable,
+    Iterable,
+    Iterator,
+    Literal,
+)
+
+from pydantic import BaseModel, ValidationError
+
+from pypaystack2.enums import Currency
+from pypaystack2.helpers.batch import BatchResult, amap, imap_in_threads
+from pypaystack2.models import Response, Transaction
+
+if TYPE_CHECKING:  # pragma: no cover
+    from pypaystack2.main_clients import AsyncPaystackClient, PaystackClient
+
+BillingOutcome = Literal["charged", "partially_charged", "failed", "pending", "error"]
+"""The outcome of billing an item.
+
+`charged`, `partially_charged` and `failed` are final and recorded in the checkpoint.
+`pending` and `error` items are billed again when the run is resumed.
+"""
+
+_FINAL_OUTCOMES = {"charged", "partially_charged", "failed"}
+# client errors that say nothing about the charge itself, so the item is billed again
+_RETRYABLE_STATUS_CODES = {
+    HTTPStatus.REQUEST_TIMEOUT,
+    HTTPStatus.CONFLICT,
+    HTTPStatus.TOO_EARLY,
+    HTTPStatus.TOO_MANY_REQUESTS,
+}
+_CYCLE_PATTERN = re.compile(r"^[A-Za-z0-9.=-]+$")
+
+
+class BillingItem(BaseModel):
+    """A pydantic model for representing a row of a billing file.
+
+    Attributes:
+        key: A value that identifies the item within the billing cycle, e.g. a subscription id.
+            It is used to derive the transaction reference of the item.
+        email: The customer's email address.
+        auth_code: The reusable authorization code to charge.
+        amount: The amount to charge in the subunit of `currency`.
+        currency: The currency to charge in.
+        at_least: The minimum amount to collect with a partial debit if the customer has
+            insufficient funds. Paystack's default applies when it is `None`.
+        metadata: Metadata to attach to the transaction.
+    """
+
+    key: str
+    email: str
+    auth_code: str
+    amount: int
+    currency: Currency = Currency.NGN
+    at_least: int | None = None
+    metadata: dict[str, Any] | None = None
+
+
+class BillingResult(BaseModel):
+    """A pydantic model for representing the outcome of billing an item.
+
+    Attributes:
+        key: The key of the billed item.
+        reference: The reference of the last transaction made for the item.
+        outcome: See `BillingOutcome`.
+        amount: The amount collected.
+        message: Paystack's gateway response or message, or the exception raised.
+    """
+
+    key: str
+    reference: str
+    outcome: BillingOutcome
+    amount: int = 0
+    message: str | None = None
+
+
+class BillingSummary(BaseModel):
+    """A pydantic model for representing the totals of a billing run.
+
+    Attributes:
+        skipped: The number of items skipped because the checkpoint already had their final result.
+        charged: The number of items charged in full.
+        partially_charged: The number of items collected with a partial debit.
+        failed: The number of items that could not be charged.
+        pending: The number of items whose transaction was still pending.
+        errors: The number of items that raised an exception or got a retryable
+            response, e.g. a server error or a rate limit.
+        amount: The total amount collected during the run.
+    """
+
+    skipped: int = 0
+    charged: int = 0
+    partially_charged: int = 0
+    failed: int = 0
+    pending: int = 0
+    errors: int = 0
+    amount: int = 0
+
+    def add(self, result: BillingResult) -> None:
+        """Counts a result in the summary."""
+        field = "errors" if result.outcome == "error" else result.outcome
+        setattr(self, field, getattr(self, field) + 1)
+        self.amount += result.amount
+
+
+class BillingCheckpoint:
+    """An append-only json lines file of the final results of a billing run.
+
+    Every result is flushed and fsynced before the next one is written, so after a
+    crash the file holds every result that was reported, and at most its last line is
+    incomplete, in which case it is ignored. A complete last line that only lacks its
+    newline is kept.
+    """
+
+    def __init__(self, path: str | Path):
+        """
+        Args:
+            path: The checkpoint file. It is created if it does not exist.
+        """
+        self.path = Path(path)
+        self.results: dict[str, BillingResult] = {}
+        if self.path.exists():
+            valid_size = 0
+            missing_newline = False
+            with self.path.open("rb") as file:
+                for offset, line in self._lines(file):
+                    try:
+                        result = BillingResult.model_validate_json(line)
+                    except ValidationError:  # a line torn by a crash
+                        continue
+                    valid_size = offset + len(line)
+                    missing_newline = not line.endswith(b"\n")
+                    self.results[result.key] = result
+            # drop the torn tail, so the next result starts on a line of its own
+            with self.path.open("r+b") as file:
+                file.truncate(valid_size)
+                if missing_newline:
+                    file.seek(valid_size)
+                    file.write(b"\n")
+        self._file = self.path.open("a")
+
+    @staticmethod
+    def _lines(file: BinaryIO) -> Iterator[tuple[int, bytes]]:
+        offset = 0
+        for line in file:
+            yield offset, line
+            offset += len(line)
+
+    def __contains__(self, key: str) -> bool:
+        return key in self.results
+
+    def record(self, result: BillingResult) -> None:
+        """Durably appends a final result to the checkpoint."""
+        self._file.write(result.model_dump_json() + "\n")
+        self._file.flush()
+        os.fsync(self._file.fileno())
+        self.results[result.key] = result
+
+    def close(self) -> None:
+        """Closes the checkpoint file."""
+        self._file.close()
+
+
+class _BaseBillingEngine:
+    def __init__(
+        self,
+        cycle: str,
+        checkpoint_path: str | Path,
+        partial_debit: bool = True,
+    ):
+        if not _CYCLE_PATTERN.match(cycle):
+            raise ValueError(
+                "cycle may only contain alphanumeric characters, '-', '.' and '='"
+            )
+        self.cycle = cycle
+        self.checkpoint_path = Path(checkpoint_path)
+        self.partial_debit = partial_debit
+
+    def reference_for(self, item: BillingItem, partial: bool = False) -> str:
+        """Returns the deterministic transaction reference of an item in this cycle.
+
+        Re-running a cycle reuses the references, so paystack rejects a transaction
+        that was already made instead of charging the customer twice.
+        """
+        digest = hashlib.sha256(f"{self.cycle}:{item.key}".encode()).hexdigest()[:24]
+        return f"{self.cycle}-{digest}{'-pd' if partial else ''}"
+
+    @staticmethod
+    def _is_duplicate(response: Response[Any]) -> bool:
+        return not response.status and "duplicate" in response.message.lower()
+
+    def _needs_partial_debit(self, response: Response[Any]) -> bool:
+        if not self.partial_debit:
+            return False
+        message = response.message
+        if isinstance(response.data, Transaction):
+            if response.data.status == "success":
+                return False
+            message = f"{message} {response.data.gateway_response or ''}"
+        return "insufficient" in message.lower()
+
+    @staticmethod
+    def _result(
+        item: BillingItem, reference: str, response: Response[Any], partial: bool
+    ) -> BillingResult:
+        if not response.status:
+            outcome: BillingOutcome = (
+                "error"
+                if response.status_code in _RETRYABLE_STATUS_CODES
+                or response.status_code >= HTTPStatus.INTERNAL_SERVER_ERROR
+                else "failed"
+            )
+            return BillingResult(
+                key=item.key,
+                reference=reference,
+                outcome=outcome,
+                message=response.message,
+            )
+        transaction = response.data
+        if not isinstance(transaction, Transaction):
+            return BillingResult(
+                key=item.key,
+                reference=reference,
+                outcome="pending",
+                message=response.message,
+            )
+        if transaction.status == "success":
+            outcome = "partially_charged" if partial else "charged"
+            amount = transaction.amount
+        elif transaction.status in ("failed", "abandoned", "reversed"):
+            outcome, amount = "failed", 0
+        else:
+            outcome, amount = "pending", 0
+        return BillingResult(
+            key=item.key,
+            reference=reference,
+            outcome=outcome,
+            amount=amount,
+            message=transaction.gateway_response or response.message,
+        )
+
+    @staticmethod
+    def _error_result(
+        item: BillingItem, reference: str, error: Exception
+    ) -> BillingResult:
+        return BillingResult(
+            key=item.key, reference=reference, outcome="error", message=str(error)
+        )
+
+    def _report(
+        self,
+        checkpoint: BillingCheckpoint,
+        summary: BillingSummary,
+        batch_result: BatchResult,
+        on_result: Callable[[BillingResult], None] | None,
+    ) -> None:
+        if batch_result.error is not None:  # only raised by a bug in the engine
+            raise batch_result.error
+        result: BillingResult = batch_result.response
+        if result.outcome in _FINAL_OUTCOMES:
+            checkpoint.record(result)
+        summary.add(result)
+        if on_result is not None:
+            on_result(result)
+
+
+class BillingEngine(_BaseBillingEngine):
+    """Charges the stored authorizations of a billing file with bounded concurrency.
+
+    Every item is charged with `transactions.charge` using a reference derived from the
+    cycle and the item's key. If the customer has insufficient funds, the engine falls
+    back to `transactions.partial_debit`. Final results are appended to a checkpoint
+    file as they complete, and a run resumed with the same cycle and checkpoint skips
+    them. An item whose result was lost in a crash is charged again with the same
+    reference, which paystack rejects as a duplicate, and its result is recovered with
+    `transactions.verify`, so no customer is charged twice.
+
+    Example:
+        ```python
+        from pypaystack2 import PaystackClient
+        from pypaystack2.helpers import BillingEngine, BillingItem
+        from pypaystack2.rate_limiting import RateLimiter
+
+        client = PaystackClient(rate_limiter=RateLimiter(rate=50))
+        engine = BillingEngine(client, cycle="2026-10", checkpoint_path="2026-10.jsonl")
+        items = (BillingItem(**row) for row in csv.DictReader(open("billing.csv")))
+        summary = engine.run(items)
+        ```
+    """
+
+    def __init__(
+        self,
+        client: "PaystackClient",
+        cycle: str,
+        checkpoint_path: str | Path,
+        workers: int = 8,
+        partial_debit: bool = True,
+    ):
+        """
+        Args:
+            client: The client used to charge the items.
+            cycle: A name for the billing cycle, e.g. `2026-10`. It is part of the
+                references, so it must only contain alphanumeric characters, `-`, `.` and `=`.
+            checkpoint_path: The file the final results of the run are appended to.
+            workers: The number of items charged at once.
+            partial_debit: Whether to fall back to a partial debit when the customer
+                has insufficient funds.
+        """
+        super().__init__(cycle, checkpoint_path, partial_debit)
+        self._client = client
+        self.workers = workers
+
+    def bill(self, item: BillingItem) -> BillingResult:
+        """Charges a single item and returns its result without checkpointing it."""
+        reference = self.reference_for(item)
+        try:
+            response = self._client.transactions.charge(
+                amount=item.amount,
+                email=item.email,
+                auth_code=item.auth_code,
+                reference=reference,
+                currency=item.currency,
+                metadata=item.metadata,
+            )
+            if self._is_duplicate(response):
+                response = self._client.transactions.verify(reference)
+            if not self._needs_partial_debit(response):
+                return self._result(item, reference, response, partial=False)
+            reference = self.reference_for(item, partial=True)
+            response = self._client.transactions.partial_debit(
+                auth_code=item.auth_code,
+                currency=item.currency,
+                amount=item.amount,
+                email=item.email,
+                reference=reference,
+                at_least=item.at_least,
+            )
+            if self._is_duplicate(response):
+                response = self._client.transactions.verify(reference)
+            return self._result(item, reference, response, partial=True)
+        except Exception as error:
+            return self._error_result(item, reference, error)
+
+    def run(
+        self,
+        items: Iterable[BillingItem],
+        on_result: Callable[[BillingResult], None] | None = None,
+    ) -> BillingSummary:
+        """Bills every item that does not have a final result in the checkpoint yet.
+
+        Args:
+            items: The items of the billing cycle. They are consumed lazily.
+            on_result: A callable that is called with every `BillingResult` as it completes.
+
+        Returns:
+            The `BillingSummary` of the run.
+        """
+        checkpoint = BillingCheckpoint(self.checkpoint_path)
+        summary = BillingSummary()
+
+        def unbilled() -> Iterable[BillingItem]:
+            for item in items:
+                if item.key in checkpoint:
+                    summary.skipped += 1
+                else:
+                    yield item
+
+        try:
+            for batch_result in imap_in_threads(self.bill, unbilled(), self.workers):
+                self._report(checkpoint, summary, batch_result, on_result)
+        finally:
+            checkpoint.close()
+        return summary
+
+
+class AsyncBillingEngine(_BaseBillingEngine):
+    """Charges the stored authorizations of a billing file with bounded concurrency.
+
+    The async version of `BillingEngine`.
+
+    Example:
+        ```python
+        from pypaystack2 import AsyncPaystackClient
+        from pypaystack2.helpers import AsyncBillingEngine
+
+        engine = AsyncBillingEngine(
+            AsyncPaystackClient(), cycle="2026-10", checkpoint_path="2026-10.jsonl"
+        )
+        summary = await engine.run(items)
+        ```
+    """
+
+    def __init__(
+        self,
+        client: "AsyncPaystackClient",
+        cycle: str,
+        checkpoint_path: str | Path,
+        concurrency: int = 20,
+        partial_debit: bool = True,
+    ):
+        """
+        Args:
+            client: The client used to charge the items.
+            cycle: A name for the billing cycle, e.g. `2026-10`. It is part of the
+                references, so it must only contain alphanumeric characters, `-`, `.` and `=`.
+            checkpoint_path: The file the final results of the run are appended to.
+            concurrency: The number of items charged at once.
+            partial_debit: Whether to fall back to a partial debit when the customer
+                has insufficient funds.
+        """
+        super().__init__(cycle, checkpoint_path, partial_debit)
+        self._client = client
+        self.concurrency = concurrency
+
+    async def bill(self, item: BillingItem) -> BillingResult:
+        """Charges a single item and returns its result without checkpointing it."""
+        reference = self.reference_for(item)
+        try:
+            response = await self._client.transactions.charge(
+                amount=item.amount,
+                email=item.email,
+                auth_code=item.auth_code,
+                reference=reference,
+                currency=item.currency,
+                metadata=item.metadata,
+            )
+            if self._is_duplicate(response):
+                response = await self._client.transactions.verify(reference)
+            if not self._needs_partial_debit(response):
+                return self._result(item, reference, response, partial=False)
+            reference = self.reference_for(item, partial=True)
+            response = await self._client.transactions.partial_debit(
+                auth_code=item.auth_code,
+                currency=item.currency,
+                amount=item.amount,
+                email=item.email,
+                reference=reference,
+                at_least=item.at_least,
+            )
+            if self._is_duplicate(response):
+                response = await self._client.transactions.verify(reference)
+            return self._result(item, reference, response, partial=True)
+        except Exception as error:
+            return self._error_result(item, reference, error)
+
+    async def run(
+        self,
+        items: Iterable[BillingItem],
+        on_result: Callable[[BillingResult], None] | None = None,
+    ) -> BillingSummary:
+        """Bills every item that does not have a final result in the checkpoint yet.
+
+        Args:
+            items: The items of the billing cycle. They are consumed lazily.
+            on_result: A callable that is called with every `BillingResult` as it completes.
+
+        Returns:
+            The `BillingSummary` of the run.
+        """
+        checkpoint = BillingCheckpoint(self.checkpoint_path)
+        summary = BillingSummary()
+
+        def unbilled() -> Iterable[BillingItem]:
+            for item in items:
+                if item.key in checkpoint:
+                    summary.skipped += 1
+                else:
+                    yield item
+
+        try:
+            async for batch_result in amap(self.bill, unbilled(), self.concurrency):
+                self._report(checkpoint, summary, batch_result, on_result)
+        finally:
+            checkpoint.close()
+        return summary
@@ -0,0 +1,213 @@
+import asyncio
+import functools
+import inspect
+import threading
+from concurrent.futures import Future
+from typing import TYPE_CHECKING, Any, Awaitable, Callable, Coroutine, Iterable, TypeVar
+
+import httpx
+
+from pypaystack2.helpers.batch import BatchProgress, BatchResult, amap
+from pypaystack2.models import Response
+
+if TYPE_CHECKING:  # pragma: no cover
+    from pypaystack2.main_clients import AsyncPaystackClient
+    from pypaystack2.rate_limiting import AsyncRateLimiter
+
+T = TypeVar("T")
+
+
+class _BlockingProxy:
+    """Exposes the coroutine methods of an async (sub) client as blocking methods."""
+
+    def __init__(self, bridge: "AsyncBridge", target: Any):
+        self._bridge = bridge
+        self._target = target
+
+    def __getattr__(self, name: str) -> Any:
+        attribute = getattr(self._target, name)
+        if inspect.iscoroutinefunction(attribute):
+
+            @functools.wraps(attribute)
+            def blocking(*args: Any, **kwargs: Any) -> Any:
+                return self._bridge.run(attribute(*args, **kwargs))
+
+            return blocking
+        if hasattr(attribute, "_handle_request"):  # a sub client
+            return _BlockingProxy(self._bridge, attribute)
+        return attribute
+
+
+class AsyncBridge:
+    """Runs an `AsyncPaystackClient` on a background event loop for use from sync code.
+
+    The bridge owns a daemon thread running an event loop, and an `AsyncPaystackClient`
+    with a single `httpx.AsyncClient` connection pool created on that loop. Blocking
+    calls made from any thread are scheduled as coroutines on the loop, so a WSGI
+    app or a small thread pool gets the fan-out of asyncio without a thread
+    per request in flight.
+
+    Example:
+        ```python
+        from pypaystack2.helpers import AsyncBridge
+
+        with AsyncBridge() as bridge:
+            # a blocking call, safe to make from any thread
+            response = bridge.transactions.verify(reference="ref-1")
+
+            # many calls multiplexed on the bridge's event loop
+            results = bridge.map(
+                bridge.transactions.verify, references, concurrency=50
+            )
+        ```
+    """
+
+    def __init__(
+        self,
+        secret_key: str | None = None,
+        rate_limiter: "AsyncRateLimiter | None" = None,
+        limits: httpx.Limits | None = None,
+        timeout: float | None = None,
+    ):
+        """
+        Args:
+            secret_key: Your paystack integration secret key.
+            rate_limiter: An optional `AsyncRateLimiter` shared by every call made through the bridge.
+            limits: The connection pool limits of the bridge's `httpx.AsyncClient`.
+            timeout: The number of seconds a blocking call waits for its result before
+                raising `TimeoutError`. It waits indefinitely when `None`.
+        """
+        self.timeout = timeout
+        self._loop = asyncio.new_event_loop()
+        self._thread = threading.Thread(
+            target=self._loop.run_forever, name="pypaystack2-bridge", daemon=True
+        )
+        self._thread.start()
+        self._closed = False
+        try:
+            self._http_client, self._client = self.run(
+                self._create_client(secret_key, rate_limiter, limits)
+            )
+        except BaseException:
+            self._stop_loop()
+            raise
+        self._proxy = _BlockingProxy(self, self._client)
+
+    @staticmethod
+    async def _create_client(
+        secret_key: str | None,
+        rate_limiter: "AsyncRateLimiter | None",
+        limits: httpx.Limits | None,
+    ) -> tuple[httpx.AsyncClient, "AsyncPaystackClient"]:
+        # Imported here because `pypaystack2.main_clients` imports this package.
+        from pypaystack2.main_clients import AsyncPaystackClient
+
+        http_client = (
+            httpx.AsyncClient(limits=limits) if limits else httpx.AsyncClient()
+        )
+        client = AsyncPaystackClient(
+            secret_key=secret_key, rate_limiter=rate_limiter, http_client=http_client
+        )
+        return http_client, client
+
+    @property
+    def client(self) -> "AsyncPaystackClient":
+        """The `AsyncPaystackClient` running on the bridge's event loop.
+
+        Its coroutine methods must only be awaited on the bridge's loop, e.g.
+        via `AsyncBridge.run` or `AsyncBridge.submit`.
+        """
+        return self._client
+
+    def __getattr__(self, name: str) -> Any:
+        # Only called for attributes not found on the bridge, i.e. the sub clients.
+        if name.startswith("_"):
+            raise AttributeError(name)
+        return getattr(self._proxy, name)
+
+    def submit(self, coroutine: Coroutine[Any, Any, T]) -> "Future[T]":
+        """Schedules a coroutine on the bridge's event loop without waiting for it.
+
+        Args:
+            coroutine: A coroutine. e.g. `bridge.client.transactions.verify(reference="ref-1")`
+
+        Returns:
+            A `concurrent.futures.Future` for the result of the coroutine.
+        """
+        if self._closed:
+            coroutine.close()
+            raise RuntimeError("AsyncBridge is closed")
+        return asyncio.run_coroutine_threadsafe(coroutine, self._loop)
+
+    def run(self, coroutine: Coroutine[Any, Any, T]) -> T:
+        """Runs a coroutine on the bridge's event loop and blocks until it completes.
+
+        Args:
+            coroutine: A coroutine. e.g. `bridge.client.transactions.verify(reference="ref-1")`
+
+        Returns:
+            The result of the coroutine.
+        """
+        if threading.current_thread() is self._thread:
+            coroutine.close()
+            raise RuntimeError(
+                "AsyncBridge.run cannot be called from the bridge's event loop"
+            )
+        future = self.submit(coroutine)
+        try:
+            return future.result(self.timeout)
+        except TimeoutError:
+            future.cancel()
+            raise
+
+    def map(
+        self,
+        method: Callable[..., Awaitable[Response[Any]]],
+        inputs: Iterable[Any],
+        concurrency: int = 10,
+        on_progress: Callable[[BatchProgress], None] | None = None,
+    ) -> list[BatchResult]:
+        """Calls a sub client method for every input, multiplexed on the bridge's event loop.
+
+        Args:
+            method: A sub client method of the bridge e.g. `bridge.transactions.verify`
+                or of `AsyncBridge.client` e.g. `bridge.client.transactions.verify`.
+            inputs: The inputs to call `method` with. A `dict` is passed as keyword
+                arguments, a `tuple` as positional arguments and any other value as
+                the only positional argument.
+            concurrency: The maximum number of calls in flight at once.
+            on_progress: A callable that is called with a `BatchProgress` after every
+                completed call. It is called from the bridge's thread.
+
+        Returns:
+            A list of `BatchResult`s in the same order as `inputs`.
+        """
+        method = inspect.unwrap(method)
+
+        async def collect() -> list[BatchResult]:
+            results = [
+                result
+                async for result in amap(method, inputs, concurrency, on_progress)
+            ]
+            return sorted(results, key=lambda result: result.index)
+
+        return self.run(collect())
+
+    def _stop_loop(self) -> None:
+        self._closed = True
+        self._loop.call_soon_threadsafe(self._loop.stop)
+        self._thread.join()
+        self._loop.close()
+
+    def close(self) -> None:
+        """Closes the connection pool and stops the bridge's event loop."""
+        if self._closed:
+            return
+        self.run(self._http_client.aclose())
+        self._stop_loop()
+
+    def __enter__(self) -> "AsyncBridge":
+        return self
+
+    def __exit__(self, *args: Any) -> None:
+        self.close()
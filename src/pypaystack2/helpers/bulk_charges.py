@@ -0,0 +1,508 @@
+import asyncio
+import time
+from typing import TYPE_CHECKING, Any, AsyncIterator, Iterable, Iterator
+
+from pydantic import BaseModel
+
+from pypaystack2.enums import BulkChargeStatus, Status
+from pypaystack2.exceptions import PaystackResponseError
+from pypaystack2.helpers.pagination import (
+    AsyncPaginator,
+    PaginationCheckpoint,
+    Paginator,
+)
+from pypaystack2.helpers.polling import AdaptivePollInterval
+from pypaystack2.models import (
+    BulkCharge,
+    BulkChargeInstruction,
+    BulkChargeUnitCharge,
+    Response,
+)
+
+if TYPE_CHECKING:  # pragma: no cover
+    from pypaystack2.main_clients import AsyncPaystackClient, PaystackClient
+
+_FINAL_STATUSES = (Status.SUCCESS, Status.FAILED)
+
+
+class BulkChargeBatch(BaseModel):
+    """A pydantic model for representing the progress of a tracked bulk charge batch.
+
+    Attributes:
+        batch_code: The code of the batch.
+        status: The last known status of the batch.
+        total_charges: The number of charges in the batch.
+        pending_charges: The last known number of charges that are not final yet.
+        reported_charges: The number of final charges reported by the driver.
+        paused: `True` while the driver is not polling the batch.
+        done: `True` once the batch is complete and all its charges have been reported.
+    """
+
+    batch_code: str
+    status: BulkChargeStatus | None = None
+    total_charges: int | None = None
+    pending_charges: int | None = None
+    reported_charges: int = 0
+    paused: bool = False
+    done: bool = False
+
+
+class BulkChargeOutcome(BaseModel):
+    """A pydantic model for representing the final outcome of a charge in a bulk charge batch.
+
+    Attributes:
+        batch_code: The code of the batch the charge belongs to.
+        reference: The reference of the transaction of the charge.
+        status: `Status.SUCCESS` or `Status.FAILED`.
+        charge: The charge as returned by paystack.
+    """
+
+    batch_code: str
+    reference: str | None
+    status: Status
+    charge: BulkChargeUnitCharge
+
+
+class _TrackedBatch:
+    def __init__(self, batch_code: str, poll_interval: AdaptivePollInterval):
+        self.state = BulkChargeBatch(batch_code=batch_code)
+        self.poll_interval = poll_interval
+        self.next_poll_at = time.monotonic()
+        self.reported_ids: set[str] = set()
+        # where the last listing of the charges with each final status stopped
+        self.checkpoints: dict[Status, PaginationCheckpoint] = {}
+
+
+class _BaseBulkChargeDriver:
+    def __init__(
+        self,
+        chunk_size: int = 500,
+        pagination: int = 100,
+        poll_interval: float = 1.0,
+        max_poll_interval: float = 60.0,
+        backoff_factor: float = 2.0,
+    ):
+        if chunk_size < 1:
+            raise ValueError("chunk_size must be at least 1")
+        self.chunk_size = chunk_size
+        self.pagination = pagination
+        self._poll_interval_options = (poll_interval, max_poll_interval, backoff_factor)
+        AdaptivePollInterval(*self._poll_interval_options)  # validate early
+        self._batches: dict[str, _TrackedBatch] = {}
+
+    @property
+    def batches(self) -> list[BulkChargeBatch]:
+        """The progress of every tracked batch."""
+        return [batch.state.model_copy() for batch in self._batches.values()]
+
+    def track(self, batch_code: str) -> None:
+        """Starts tracking a batch that was not submitted through the driver.
+
+        Args:
+            batch_code: The code of the batch.
+        """
+        if batch_code not in self._batches:
+            self._batches[batch_code] = _TrackedBatch(
+                batch_code, AdaptivePollInterval(*self._poll_interval_options)
+            )
+
+    def _chunks(
+        self, instructions: Iterable[BulkChargeInstruction]
+    ) -> Iterator[list[BulkChargeInstruction]]:
+        chunk: list[BulkChargeInstruction] = []
+        for instruction in instructions:
+            chunk.append(instruction)
+            if len(chunk) == self.chunk_size:
+                yield chunk
+                chunk = []
+        if chunk:
+            yield chunk
+
+    def _track_initiated(self, response: Response[Any]) -> str:
+        if not response.status or not isinstance(response.data, BulkCharge):
+            raise PaystackResponseError(
+                f"unable to initiate bulk charge: {response.message}", response
+            )
+        self.track(response.data.batch_code)
+        return response.data.batch_code
+
+    def _selected(self, batch_code: str | None) -> list[_TrackedBatch]:
+        if batch_code is None:
+            return [batch for batch in self._batches.values() if not batch.state.done]
+        if batch_code not in self._batches:
+            raise ValueError(f"batch {batch_code!r} is not tracked")
+        return [self._batches[batch_code]]
+
+    @staticmethod
+    def _set_paused(
+        batch: _TrackedBatch, paused: bool, response: Response[Any]
+    ) -> None:
+        if not response.status:
+            action = "pause" if paused else "resume"
+            raise PaystackResponseError(
+                f"unable to {action} batch {batch.state.batch_code}: {response.message}",
+                response,
+            )
+        batch.state.paused = paused
+        if not paused:
+            batch.poll_interval.reset()
+            batch.next_poll_at = time.monotonic()
+
+    def _due_batches(self) -> list[_TrackedBatch]:
+        now = time.monotonic()
+        return [
+            batch
+            for batch in self._batches.values()
+            if not batch.state.done
+            and not batch.state.paused
+            and batch.next_poll_at <= now
+        ]
+
+    def _seconds_until_next_poll(self) -> float | None:
+        """`None` when there is no batch left to poll."""
+        polled = [
+            batch.next_poll_at
+            for batch in self._batches.values()
+            if not batch.state.done and not batch.state.paused
+        ]
+        if not polled:
+            return None
+        return max(0.0, min(polled) - time.monotonic())
+
+    @staticmethod
+    def _record_status(batch: _TrackedBatch, response: Response[Any]) -> bool:
+        """Updates the batch with a `get_batch` response and returns whether it progressed."""
+        if not response.status or not isinstance(response.data, BulkCharge):
+            raise PaystackResponseError(
+                f"unable to fetch batch {batch.state.batch_code}: {response.message}",
+                response,
+            )
+        data = response.data
+        state = batch.state
+        progressed = (
+            data.pending_charges != state.pending_charges or data.status != state.status
+        )
+        state.status = data.status
+        state.total_charges = data.total_charges
+        state.pending_charges = data.pending_charges
+        state.paused = data.status == BulkChargeStatus.PAUSED
+        return progressed
+
+    @staticmethod
+    def _final_charges_reported(batch: _TrackedBatch) -> bool:
+        state = batch.state
+        if state.total_charges is None or state.pending_charges is None:
+            return False
+        return state.reported_charges >= state.total_charges - state.pending_charges
+
+    @staticmethod
+    def _outcome(
+        batch: _TrackedBatch, status: Status, charge: BulkChargeUnitCharge
+    ) -> BulkChargeOutcome | None:
+        if charge.id in batch.reported_ids:
+            return None
+        batch.reported_ids.add(charge.id)
+        batch.state.reported_charges += 1
+        return BulkChargeOutcome(
+            batch_code=batch.state.batch_code,
+            reference=charge.transaction.reference,
+            status=status,
+            charge=charge,
+        )
+
+    def _charges_checkpoint(
+        self, batch: _TrackedBatch, status: Status
+    ) -> PaginationCheckpoint:
+        checkpoint = batch.checkpoints.get(status)
+        if checkpoint is None:
+            checkpoint = PaginationCheckpoint(
+                filters={"id_or_code": batch.state.batch_code, "status": status},
+                pagination=self.pagination,
+            )
+        return checkpoint
+
+    @staticmethod
+    def _save_charges_checkpoint(
+        batch: _TrackedBatch, status: Status, checkpoint: PaginationCheckpoint
+    ) -> None:
+        # the last page is fetched again on the next poll for the charges added to it
+        checkpoint.completed = False
+        batch.checkpoints[status] = checkpoint
+
+    @staticmethod
+    def _resumes_listing(batch: _TrackedBatch) -> bool:
+        return any(
+            checkpoint.page > 1 or checkpoint.offset > 0
+            for checkpoint in batch.checkpoints.values()
+        )
+
+    def _schedule(self, batch: _TrackedBatch, progressed: bool) -> None:
+        state = batch.state
+        if state.status == BulkChargeStatus.COMPLETE and (
+            state.total_charges is None or self._final_charges_reported(batch)
+        ):
+            state.done = True
+            return
+        batch.next_poll_at = time.monotonic() + batch.poll_interval.next(progressed)
+
+
+class BulkChargeDriver(_BaseBulkChargeDriver):
+    """Submits bulk charges in chunks and streams the outcome of every charge.
+
+    Every tracked batch is polled with `get_batch` at an interval that starts at
+    `poll_interval` and backs off up to `max_poll_interval` while its `pending_charges`
+    stops moving. Charges are only listed with `get_charges_in_batch` when a batch
+    has final charges that have not been reported, and listing stops as soon as they
+    are found, so thousands of batches can be monitored with little chatter. The
+    listing of a batch resumes from the page it stopped at on the previous poll, and
+    only starts over from the first page when the charges it is missing were not
+    listed after the ones already reported.
+
+    Example:
+        ```python
+        from pypaystack2 import PaystackClient
+        from pypaystack2.helpers import BulkChargeDriver
+
+        driver = BulkChargeDriver(PaystackClient(), chunk_size=1000)
+        driver.submit(instructions)
+        for outcome in driver.outcomes():
+            print(outcome.reference, outcome.status)
+        ```
+    """
+
+    def __init__(
+        self,
+        client: "PaystackClient",
+        chunk_size: int = 500,
+        pagination: int = 100,
+        poll_interval: float = 1.0,
+        max_poll_interval: float = 60.0,
+        backoff_factor: float = 2.0,
+    ):
+        """
+        Args:
+            client: The client used to submit and poll the batches.
+            chunk_size: The number of charges submitted per batch.
+            pagination: The number of charges retrieved per request when listing the charges of a batch.
+            poll_interval: The interval in seconds between polls of a batch that is progressing.
+            max_poll_interval: The longest interval in seconds between polls of a batch.
+            backoff_factor: The number the interval of a batch is multiplied by on
+                every poll that finds it unchanged.
+        """
+        super().__init__(
+            chunk_size, pagination, poll_interval, max_poll_interval, backoff_factor
+        )
+        self._client = client
+
+    def submit(self, instructions: Iterable[BulkChargeInstruction]) -> list[str]:
+        """Initiates a batch for every chunk of instructions and tracks it.
+
+        Args:
+            instructions: The charges to make.
+
+        Returns:
+            The codes of the initiated batches.
+
+        Raises:
+            PaystackResponseError: If a chunk could not be initiated. The batches
+                initiated before it are already tracked.
+        """
+        return [
+            self._track_initiated(self._client.bulk_charges.initiate(chunk))
+            for chunk in self._chunks(instructions)
+        ]
+
+    def pause(self, batch_code: str | None = None) -> None:
+        """Pauses the processing of a batch, or of every unfinished batch, on paystack.
+
+        Args:
+            batch_code: The code of the batch to pause. Every unfinished batch is paused if omitted.
+        """
+        for batch in self._selected(batch_code):
+            response = self._client.bulk_charges.pause_batch(batch.state.batch_code)
+            self._set_paused(batch, True, response)
+
+    def resume(self, batch_code: str | None = None) -> None:
+        """Resumes the processing of a paused batch, or of every unfinished batch, on paystack.
+
+        Args:
+            batch_code: The code of the batch to resume. Every unfinished batch is resumed if omitted.
+        """
+        for batch in self._selected(batch_code):
+            response = self._client.bulk_charges.resume_batch(batch.state.batch_code)
+            self._set_paused(batch, False, response)
+
+    def outcomes(self) -> Iterator[BulkChargeOutcome]:
+        """Polls the tracked batches and yields every charge as soon as it is final.
+
+        The iteration ends when every tracked batch is either done or paused.
+        """
+        while (delay := self._seconds_until_next_poll()) is not None:
+            time.sleep(delay)
+            for batch in self._due_batches():
+                response = self._client.bulk_charges.get_batch(batch.state.batch_code)
+                progressed = self._record_status(batch, response)
+                if progressed or not self._final_charges_reported(batch):
+                    yield from self._new_final_charges(batch)
+                self._schedule(batch, progressed)
+
+    def _new_final_charges(self, batch: _TrackedBatch) -> Iterator[BulkChargeOutcome]:
+        resumed = self._resumes_listing(batch)
+        for status in _FINAL_STATUSES:
+            yield from self._list_final_charges(batch, status)
+        if resumed and not self._final_charges_reported(batch):
+            # the missing charges were not listed after the ones seen before
+            batch.checkpoints.clear()
+            for status in _FINAL_STATUSES:
+                yield from self._list_final_charges(batch, status)
+
+    def _list_final_charges(
+        self, batch: _TrackedBatch, status: Status
+    ) -> Iterator[BulkChargeOutcome]:
+        if self._final_charges_reported(batch):
+            return
+        paginator = Paginator(
+            self._client.bulk_charges.get_charges_in_batch,
+            checkpoint=self._charges_checkpoint(batch, status),
+        )
+        try:
+            for charge in paginator:
+                if outcome := self._outcome(batch, status, charge):
+                    yield outcome
+                if self._final_charges_reported(batch):
+                    return
+        finally:
+            self._save_charges_checkpoint(batch, status, paginator.checkpoint)
+
+
+class AsyncBulkChargeDriver(_BaseBulkChargeDriver):
+    """Submits bulk charges in chunks and streams the outcome of every charge.
+
+    The async version of `BulkChargeDriver`.
+
+    Example:
+        ```python
+        from pypaystack2 import AsyncPaystackClient
+        from pypaystack2.helpers import AsyncBulkChargeDriver
+
+        driver = AsyncBulkChargeDriver(AsyncPaystackClient(), chunk_size=1000)
+        await driver.submit(instructions)
+        async for outcome in driver.outcomes():
+            print(outcome.reference, outcome.status)
+        ```
+    """
+
+    def __init__(
+        self,
+        client: "AsyncPaystackClient",
+        chunk_size: int = 500,
+        pagination: int = 100,
+        poll_interval: float = 1.0,
+        max_poll_interval: float = 60.0,
+        backoff_factor: float = 2.0,
+    ):
+        """
+        Args:
+            client: The client used to submit and poll the batches.
+            chunk_size: The number of charges submitted per batch.
+            pagination: The number of charges retrieved per request when listing the charges of a batch.
+            poll_interval: The interval in seconds between polls of a batch that is progressing.
+            max_poll_interval: The longest interval in seconds between polls of a batch.
+            backoff_factor: The number the interval of a batch is multiplied by on
+                every poll that finds it unchanged.
+        """
+        super().__init__(
+            chunk_size, pagination, poll_interval, max_poll_interval, backoff_factor
+        )
+        self._client = client
+
+    async def submit(self, instructions: Iterable[BulkChargeInstruction]) -> list[str]:
+        """Initiates a batch for every chunk of instructions and tracks it.
+
+        Args:
+            instructions: The charges to make.
+
+        Returns:
+            The codes of the initiated batches.
+
+        Raises:
+            PaystackResponseError: If a chunk could not be initiated. The batches
+                initiated before it are already tracked.
+        """
+        return [
+            self._track_initiated(await self._client.bulk_charges.initiate(chunk))
+            for chunk in self._chunks(instructions)
+        ]
+
+    async def pause(self, batch_code: str | None = None) -> None:
+        """Pauses the processing of a batch, or of every unfinished batch, on paystack.
+
+        Args:
+            batch_code: The code of the batch to pause. Every unfinished batch is paused if omitted.
+        """
+        for batch in self._selected(batch_code):
+            response = await self._client.bulk_charges.pause_batch(
+                batch.state.batch_code
+            )
+            self._set_paused(batch, True, response)
+
+    async def resume(self, batch_code: str | None = None) -> None:
+        """Resumes the processing of a paused batch, or of every unfinished batch, on paystack.
+
+        Args:
+            batch_code: The code of the batch to resume. Every unfinished batch is resumed if omitted.
+        """
+        for batch in self._selected(batch_code):
+            response = await self._client.bulk_charges.resume_batch(
+                batch.state.batch_code
+            )
+            self._set_paused(batch, False, response)
+
+    async def outcomes(self) -> AsyncIterator[BulkChargeOutcome]:
+        """Polls the tracked batches and yields every charge as soon as it is final.
+
+        The iteration ends when every tracked batch is either done or paused.
+        """
+        while (delay := self._seconds_until_next_poll()) is not None:
+            await asyncio.sleep(delay)
+            for batch in self._due_batches():
+                response = await self._client.bulk_charges.get_batch(
+                    batch.state.batch_code
+                )
+                progressed = self._record_status(batch, response)
+                if progressed or not self._final_charges_reported(batch):
+                    async for outcome in self._new_final_charges(batch):
+                        yield outcome
+                self._schedule(batch, progressed)
+
+    async def _new_final_charges(
+        self, batch: _TrackedBatch
+    ) -> AsyncIterator[BulkChargeOutcome]:
+        resumed = self._resumes_listing(batch)
+        for status in _FINAL_STATUSES:
+            async for outcome in self._list_final_charges(batch, status):
+                yield outcome
+        if resumed and not self._final_charges_reported(batch):
+            # the missing charges were not listed after the ones seen before
+            batch.checkpoints.clear()
+            for status in _FINAL_STATUSES:
+                async for outcome in self._list_final_charges(batch, status):
+                    yield outcome
+
+    async def _list_final_charges(
+        self, batch: _TrackedBatch, status: Status
+    ) -> AsyncIterator[BulkChargeOutcome]:
+        if self._final_charges_reported(batch):
+            return
+        paginator = AsyncPaginator(
+            self._client.bulk_charges.get_charges_in_batch,
+            checkpoint=self._charges_checkpoint(batch, status),
+        )
+        try:
+            async for charge in paginator:
+                if outcome := self._outcome(batch, status, charge):
+                    yield outcome
+                if self._final_charges_reported(batch):
+                    return
+        finally:
+            self._save_charges_checkpoint(batch, status, paginator.checkpoint)
@@ -0,0 +1,321 @@
+from typing import TYPE_CHECKING, Any, Callable, Iterable
+
+from pydantic import BaseModel, ConfigDict
+
+from pypaystack2.helpers.batch import (
+    BatchProgress,
+    BatchResult,
+    amap,
+    map_in_threads,
+)
+from pypaystack2.helpers.pagination import AsyncPaginator, Paginator
+from pypaystack2.models import Recipient, TransferRecipient
+
+if TYPE_CHECKING:  # pragma: no cover
+    from pypaystack2.main_clients import AsyncPaystackClient, PaystackClient
+
+MAX_BULK_RECIPIENT_SIZE = 100
+"""The maximum number of recipients submitted in one bulk recipient creation request."""
+
+RecipientKey = tuple[str, str | None]
+"""The account number and bank code that identify a transfer recipient."""
+
+
+def recipient_key(recipient: Recipient | TransferRecipient) -> RecipientKey:
+    """Returns the account number and bank code that identify a recipient."""
+    if isinstance(recipient, Recipient):
+        return recipient.account_number, recipient.bank_code
+    return (
+        recipient.details.account_number or recipient.recipient_account or "",
+        recipient.details.bank_code or recipient.institution_code,
+    )
+
+
+class FailedBulkRecipientChunk(BaseModel):
+    """A pydantic model for representing a chunk of recipients that could not be created.
+
+    Attributes:
+        index: The position of the chunk among the chunks of the submission.
+        recipients: The recipients of the chunk.
+        message: The message returned by paystack or the exception raised while submitting the chunk.
+        error: The exception raised while submitting the chunk, if any.
+    """
+
+    model_config = ConfigDict(arbitrary_types_allowed=True)
+
+    index: int
+    recipients: list[Recipient]
+    message: str
+    error: Exception | None = None
+
+
+class BulkRecipientReport(BaseModel):
+    """A pydantic model for representing the outcome of a chunked bulk recipient creation.
+
+    Attributes:
+        recipient_codes: A mapping of the position of each input row to its recipient code.
+            Rows whose recipient could not be created are missing from it.
+        existing: The number of input rows that matched a known recipient and were not submitted.
+        created: The number of recipients created by paystack.
+        failed_rows: The positions of the input rows whose recipient could not be created.
+        errors: The errors paystack reported for individual recipients.
+        failed_chunks: The chunks that could not be submitted.
+    """
+
+    recipient_codes: dict[int, str] = {}
+    existing: int = 0
+    created: int = 0
+    failed_rows: list[int] = []
+    errors: list[Any] = []
+    failed_chunks: list[FailedBulkRecipientChunk] = []
+
+    @property
+    def ok(self) -> bool:
+        """`True` if every input row has a recipient code."""
+        return not self.failed_rows
+
+
+class _BaseBulkRecipientPipeline:
+    def __init__(
+        self,
+        chunk_size: int = MAX_BULK_RECIPIENT_SIZE,
+        known_recipients: dict[RecipientKey, str] | None = None,
+    ):
+        if not 1 <= chunk_size <= MAX_BULK_RECIPIENT_SIZE:
+            raise ValueError(
+                f"chunk_size must be between 1 and {MAX_BULK_RECIPIENT_SIZE}"
+            )
+        self.chunk_size = chunk_size
+        self.known_recipients: dict[RecipientKey, str] = (
+            known_recipients if known_recipients is not None else {}
+        )
+
+    def _remember(self, recipient: TransferRecipient) -> None:
+        if not recipient.is_deleted:
+            self.known_recipients[recipient_key(recipient)] = recipient.recipient_code
+
+    def _plan(
+        self, recipients: Iterable[Recipient]
+    ) -> tuple[
+        BulkRecipientReport, dict[RecipientKey, list[int]], list[dict[str, Any]]
+    ]:
+        """Resolves rows of known recipients and chunks the rest, one chunk input per request."""
+        report = BulkRecipientReport()
+        pending_rows: dict[RecipientKey, list[int]] = {}
+        chunks: list[list[Recipient]] = []
+        for row, recipient in enumerate(recipients):
+            key = recipient_key(recipient)
+            if key in self.known_recipients:
+                report.recipient_codes[row] = self.known_recipients[key]
+                report.existing += 1
+                continue
+            if key in pending_rows:  # a duplicate row in the input
+                pending_rows[key].append(row)
+                continue
+            pending_rows[key] = [row]
+            if not chunks or len(chunks[-1]) == self.chunk_size:
+                chunks.append([])
+            chunks[-1].append(recipient)
+        return report, pending_rows, [{"batch": chunk} for chunk in chunks]
+
+    def _merge(
+        self,
+        report: BulkRecipientReport,
+        pending_rows: dict[RecipientKey, list[int]],
+        results: list[BatchResult],
+    ) -> BulkRecipientReport:
+        for result in sorted(results, key=lambda result: result.index):
+            if not result.ok:
+                report.failed_chunks.append(
+                    FailedBulkRecipientChunk(
+                        index=result.index,
+                        recipients=result.input["batch"],
+                        message=str(result.error)
+                        if result.error is not None
+                        else result.response.message,
+                        error=result.error,
+                    )
+                )
+                continue
+            data = result.response.data
+            if data is None:
+                continue
+            report.errors.extend(data.errors)
+            for recipient in data.success:
+                self._remember(recipient)
+                report.created += 1
+        for key, rows in pending_rows.items():
+            recipient_code = self.known_recipients.get(key)
+            for row in rows:
+                if recipient_code is None:
+                    report.failed_rows.append(row)
+                else:
+                    report.recipient_codes[row] = recipient_code
+        report.failed_rows.sort()
+        return report
+
+
+class BulkRecipientPipeline(_BaseBulkRecipientPipeline):
+    """Creates transfer recipients in concurrent, API-sized chunks, skipping existing ones.
+
+    Rows are de-duplicated by account number and bank code, both within the input and
+    against `known_recipients`, a local cache of the recipients on your integration
+    that can be filled with `BulkRecipientPipeline.load_existing`. Only the remaining
+    rows are submitted to `PaystackClient.transfer_recipients.bulk_create`.
+
+    Example:
+        ```python
+        from pypaystack2 import PaystackClient
+        from pypaystack2.helpers import BulkRecipientPipeline
+
+        pipeline = BulkRecipientPipeline(PaystackClient(), workers=4)
+        pipeline.load_existing()
+        report = pipeline.create(payees)
+        for row, recipient_code in report.recipient_codes.items():
+            print(payees[row].name, recipient_code)
+        ```
+    """
+
+    def __init__(
+        self,
+        client: "PaystackClient",
+        chunk_size: int = MAX_BULK_RECIPIENT_SIZE,
+        workers: int = 4,
+        known_recipients: dict[RecipientKey, str] | None = None,
+    ):
+        """
+        Args:
+            client: The client used to create the recipients.
+            chunk_size: The number of recipients submitted per request.
+            workers: The number of chunks submitted at once.
+            known_recipients: A mapping of `(account_number, bank_code)` to the recipient
+                code of existing recipients. It is updated with the recipients created
+                by the pipeline, so it can be persisted and passed to a later pipeline.
+        """
+        super().__init__(chunk_size, known_recipients)
+        self._client = client
+        self.workers = workers
+
+    def load_existing(self, pagination: int = 100) -> int:
+        """Adds the recipients on your integration to `known_recipients`.
+
+        Args:
+            pagination: The number of recipients retrieved per request.
+
+        Returns:
+            The number of recipients retrieved.
+        """
+        count = 0
+        for recipient in Paginator(
+            self._client.transfer_recipients.get_transfer_recipients,
+            pagination=pagination,
+        ):
+            self._remember(recipient)
+            count += 1
+        return count
+
+    def create(
+        self,
+        recipients: Iterable[Recipient],
+        on_progress: Callable[[BatchProgress], None] | None = None,
+    ) -> BulkRecipientReport:
+        """Creates the recipients that are not known yet.
+
+        Args:
+            recipients: The recipients to create, e.g. the rows of a payee file.
+            on_progress: A callable that is called with a `BatchProgress` of the
+                chunks after every submitted chunk.
+
+        Returns:
+            A `BulkRecipientReport` mapping every input row to its recipient code.
+        """
+        report, pending_rows, chunk_inputs = self._plan(recipients)
+        results = map_in_threads(
+            self._client.transfer_recipients.bulk_create,
+            chunk_inputs,
+            self.workers,
+            on_progress,
+        )
+        return self._merge(report, pending_rows, results)
+
+
+class AsyncBulkRecipientPipeline(_BaseBulkRecipientPipeline):
+    """Creates transfer recipients in concurrent, API-sized chunks, skipping existing ones.
+
+    The async version of `BulkRecipientPipeline`.
+
+    Example:
+        ```python
+        from pypaystack2 import AsyncPaystackClient
+        from pypaystack2.helpers import AsyncBulkRecipientPipeline
+
+        pipeline = AsyncBulkRecipientPipeline(AsyncPaystackClient(), concurrency=4)
+        await pipeline.load_existing()
+        report = await pipeline.create(payees)
+        ```
+    """
+
+    def __init__(
+        self,
+        client: "AsyncPaystackClient",
+        chunk_size: int = MAX_BULK_RECIPIENT_SIZE,
+        concurrency: int = 4,
+        known_recipients: dict[RecipientKey, str] | None = None,
+    ):
+        """
+        Args:
+            client: The client used to create the recipients.
+            chunk_size: The number of recipients submitted per request.
+            concurrency: The number of chunks submitted at once.
+            known_recipients: A mapping of `(account_number, bank_code)` to the recipient
+                code of existing recipients. It is updated with the recipients created
+                by the pipeline, so it can be persisted and passed to a later pipeline.
+        """
+        super().__init__(chunk_size, known_recipients)
+        self._client = client
+        self.concurrency = concurrency
+
+    async def load_existing(self, pagination: int = 100) -> int:
+        """Adds the recipients on your integration to `known_recipients`.
+
+        Args:
+            pagination: The number of recipients retrieved per request.
+
+        Returns:
+            The number of recipients retrieved.
+        """
+        count = 0
+        async for recipient in AsyncPaginator(
+            self._client.transfer_recipients.get_transfer_recipients,
+            pagination=pagination,
+        ):
+            self._remember(recipient)
+            count += 1
+        return count
+
+    async def create(
+        self,
+        recipients: Iterable[Recipient],
+        on_progress: Callable[[BatchProgress], None] | None = None,
+    ) -> BulkRecipientReport:
+        """Creates the recipients that are not known yet.
+
+        Args:
+            recipients: The recipients to create, e.g. the rows of a payee file.
+            on_progress: A callable that is called with a `BatchProgress` of the
+                chunks after every submitted chunk.
+
+        Returns:
+            A `BulkRecipientReport` mapping every input row to its recipient code.
+        """
+        report, pending_rows, chunk_inputs = self._plan(recipients)
+        results = [
+            result
+            async for result in amap(
+                self._client.transfer_recipients.bulk_create,
+                chunk_inputs,
+                self.concurrency,
+                on_progress,
+            )
+        ]
+        return self._merge(report, pending_rows, results)
@@ -0,0 +1,266 @@
+import uuid
+from typing import TYPE_CHECKING, Any, Callable, Iterable
+
+from pydantic import BaseModel, ConfigDict
+
+from pypaystack2.helpers.batch import (
+    BatchProgress,
+    BatchResult,
+    amap,
+    map_in_threads,
+)
+from pypaystack2.models import BulkTransferItem, TransferInstruction
+
+if TYPE_CHECKING:  # pragma: no cover
+    from pypaystack2.main_clients import AsyncPaystackClient, PaystackClient
+
+MAX_BULK_TRANSFER_SIZE = 100
+"""The maximum number of transfers paystack accepts in one bulk transfer request."""
+
+
+class FailedBulkTransferChunk(BaseModel):
+    """A pydantic model for representing a chunk of transfers that could not be submitted.
+
+    Attributes:
+        index: The position of the chunk among the chunks of the submission.
+        transfers: The transfer instructions of the chunk.
+        message: The message returned by paystack or the exception raised while submitting the chunk.
+        error: The exception raised while submitting the chunk, if any.
+    """
+
+    model_config = ConfigDict(arbitrary_types_allowed=True)
+
+    index: int
+    transfers: list[TransferInstruction]
+    message: str
+    error: Exception | None = None
+
+
+class BulkTransferReport(BaseModel):
+    """A pydantic model for representing the outcome of a chunked bulk transfer.
+
+    Attributes:
+        transfers: The submitted transfer instructions in input order. Instructions
+            submitted without a reference have the reference they were assigned.
+        items: The `BulkTransferItem` returned by paystack for each instruction in
+            `transfers`, `None` if paystack did not return one for it.
+        failed_chunks: The chunks that could not be submitted.
+    """
+
+    transfers: list[TransferInstruction]
+    items: list[BulkTransferItem | None]
+    failed_chunks: list[FailedBulkTransferChunk] = []
+
+    @property
+    def ok(self) -> bool:
+        """`True` if paystack returned an item for every transfer instruction."""
+        return all(item is not None for item in self.items)
+
+    def pending_transfers(self) -> list[TransferInstruction]:
+        """Returns the transfer instructions paystack did not return an item for.
+
+        They keep their references, so submitting them again is idempotent: paystack
+        rejects a transfer whose reference it has already processed.
+        """
+        return [
+            transfer
+            for transfer, item in zip(self.transfers, self.items)
+            if item is None
+        ]
+
+
+class _BaseBulkTransferPipeline:
+    def __init__(
+        self, chunk_size: int = MAX_BULK_TRANSFER_SIZE, source: str = "balance"
+    ):
+        if not 1 <= chunk_size <= MAX_BULK_TRANSFER_SIZE:
+            raise ValueError(
+                f"chunk_size must be between 1 and {MAX_BULK_TRANSFER_SIZE}"
+            )
+        self.chunk_size = chunk_size
+        self.source = source
+
+    def _chunk(
+        self, transfers: Iterable[TransferInstruction]
+    ) -> tuple[list[TransferInstruction], list[list[TransferInstruction]]]:
+        """Assigns missing references and splits the instructions into chunks in one pass."""
+        instructions: list[TransferInstruction] = []
+        chunks: list[list[TransferInstruction]] = []
+        references: set[str] = set()
+        for transfer in transfers:
+            if transfer.reference is None:
+                transfer = transfer.model_copy(update={"reference": uuid.uuid4().hex})
+            elif transfer.reference in references:
+                raise ValueError(f"duplicate transfer reference {transfer.reference!r}")
+            references.add(transfer.reference)
+            instructions.append(transfer)
+            if not chunks or len(chunks[-1]) == self.chunk_size:
+                chunks.append([])
+            chunks[-1].append(transfer)
+        return instructions, chunks
+
+    def _chunk_inputs(
+        self, chunks: list[list[TransferInstruction]]
+    ) -> list[dict[str, Any]]:
+        return [{"transfers": chunk, "source": self.source} for chunk in chunks]
+
+    @staticmethod
+    def _report(
+        instructions: list[TransferInstruction], results: list[BatchResult]
+    ) -> BulkTransferReport:
+        items_by_reference: dict[str, BulkTransferItem] = {}
+        failed_chunks: list[FailedBulkTransferChunk] = []
+        for result in sorted(results, key=lambda result: result.index):
+            chunk = result.input["transfers"]
+            if not result.ok:
+                failed_chunks.append(
+                    FailedBulkTransferChunk(
+                        index=result.index,
+                        transfers=chunk,
+                        message=str(result.error)
+                        if result.error is not None
+                        else result.response.message,
+                        error=result.error,
+                    )
+                )
+                continue
+            for item in result.response.data or []:
+                if isinstance(item, BulkTransferItem):
+                    items_by_reference[item.reference] = item
+        return BulkTransferReport(
+            transfers=instructions,
+            items=[
+                items_by_reference.get(transfer.reference)  # type: ignore[arg-type]
+                for transfer in instructions
+            ],
+            failed_chunks=failed_chunks,
+        )
+
+
+class BulkTransferPipeline(_BaseBulkTransferPipeline):
+    """Submits any number of transfers as concurrent, API-sized bulk transfer requests.
+
+    `PaystackClient.transfers.bulk_transfer` posts its instructions as-is in a single
+    request. This pipeline splits the instructions into chunks paystack accepts, submits
+    the chunks on a pool of threads through the client (honouring its rate limiter)
+    and merges the returned `BulkTransferItem`s back into input order.
+
+    Example:
+        ```python
+        from pypaystack2 import PaystackClient
+        from pypaystack2.helpers import BulkTransferPipeline
+        from pypaystack2.rate_limiting import RateLimiter
+
+        client = PaystackClient(rate_limiter=RateLimiter(rate=5))
+        pipeline = BulkTransferPipeline(client, workers=4)
+        report = pipeline.submit(payroll_instructions)
+        if not report.ok:
+            # safe to re-run, the transfers keep their references
+            retry_report = pipeline.submit(report.pending_transfers())
+        ```
+    """
+
+    def __init__(
+        self,
+        client: "PaystackClient",
+        chunk_size: int = MAX_BULK_TRANSFER_SIZE,
+        workers: int = 4,
+        source: str = "balance",
+    ):
+        """
+        Args:
+            client: The client used to submit the chunks.
+            chunk_size: The number of transfers submitted per request.
+            workers: The number of chunks submitted at once.
+            source: The source of the funds to transfer.
+        """
+        super().__init__(chunk_size, source)
+        self._client = client
+        self.workers = workers
+
+    def submit(
+        self,
+        transfers: Iterable[TransferInstruction],
+        on_progress: Callable[[BatchProgress], None] | None = None,
+    ) -> BulkTransferReport:
+        """Submits the transfers in chunks.
+
+        Args:
+            transfers: The transfer instructions. Instructions without a reference
+                are assigned one so that they can be re-submitted idempotently.
+            on_progress: A callable that is called with a `BatchProgress` of the
+                chunks after every submitted chunk.
+
+        Returns:
+            A `BulkTransferReport` of the submission.
+        """
+        instructions, chunks = self._chunk(transfers)
+        results = map_in_threads(
+            self._client.transfers.bulk_transfer,
+            self._chunk_inputs(chunks),
+            self.workers,
+            on_progress,
+        )
+        return self._report(instructions, results)
+
+
+class AsyncBulkTransferPipeline(_BaseBulkTransferPipeline):
+    """Submits any number of transfers as concurrent, API-sized bulk transfer requests.
+
+    The async version of `BulkTransferPipeline`.
+
+    Example:
+        ```python
+        from pypaystack2 import AsyncPaystackClient
+        from pypaystack2.helpers import AsyncBulkTransferPipeline
+
+        pipeline = AsyncBulkTransferPipeline(AsyncPaystackClient(), concurrency=4)
+        report = await pipeline.submit(payroll_instructions)
+        ```
+    """
+
+    def __init__(
+        self,
+        client: "AsyncPaystackClient",
+        chunk_size: int = MAX_BULK_TRANSFER_SIZE,
+        concurrency: int = 4,
+        source: str = "balance",
+    ):
+        """
+        Args:
+            client: The client used to submit the chunks.
+            chunk_size: The number of transfers submitted per request.
+            concurrency: The number of chunks submitted at once.
+            source: The source of the funds to transfer.
+        """
+        super().__init__(chunk_size, source)
+        self._client = client
+        self.concurrency = concurrency
+
+    async def submit(
+        self,
+        transfers: Iterable[TransferInstruction],
+        on_progress: Callable[[BatchProgress], None] | None = None,
+    ) -> BulkTransferReport:
+        """Submits the transfers in chunks.
+
+        Args:
+            transfers: The transfer instructions. Instructions without a reference
+                are assigned one so that they can be re-submitted idempotently.
+            on_progress: A callable that is called with a `BatchProgress` of the
+                chunks after every submitted chunk.
+
+        Returns:
+            A `BulkTransferReport` of the submission.
+        """
+        instructions, chunks = self._chunk(transfers)
+        results = [
+            result
+            async for result in amap(
+                self._client.transfers.bulk_transfer,
+                self._chunk_inputs(chunks),
+                self.concurrency,
+                on_progress,
+            )
+        ]
+        return self._report(instructions, results)
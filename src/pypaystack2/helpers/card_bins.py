@@ -0,0 +1,279 @@
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Iterable
+
+from pydantic import ValidationError
+
+from pypaystack2.caching import MemoryCache, SQLiteCache
+from pypaystack2.helpers.batch import BatchResult, amap, map_in_threads
+from pypaystack2.models import CardBin
+
+if TYPE_CHECKING:  # pragma: no cover
+    from pypaystack2.main_clients import AsyncPaystackClient, PaystackClient
+
+_UNKNOWN_BIN = False  # cached for BINs paystack does not know
+
+
+def card_bin(card_number: str) -> str:
+    """Returns the BIN, i.e. the first 6 digits, of a card number or BIN.
+
+    Raises:
+        ValueError: If `card_number` has less than 6 digits.
+    """
+    digits = "".join(character for character in card_number if character.isdigit())
+    if len(digits) < 6:
+        raise ValueError(f"{card_number!r} does not contain a 6 digit BIN")
+    return digits[:6]
+
+
+class _BaseCardBinIndex:
+    def __init__(
+        self,
+        path: str | Path | None,
+        ttl: float | None,
+        unknown_ttl: float | None,
+        max_size: int | None,
+        memory_size: int,
+    ):
+        self.ttl = ttl
+        self.unknown_ttl = unknown_ttl
+        self.api_calls = 0
+        self._memory = MemoryCache(max_size=memory_size)
+        self._store = SQLiteCache(path, max_size=max_size) if path else None
+
+    def __enter__(self) -> Any:
+        return self
+
+    def __exit__(self, *args: Any) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Closes the index file."""
+        if self._store is not None:
+            self._store.close()
+
+    def _cached(self, bin_: str) -> CardBin | bool | None:
+        """Returns the cached `CardBin`, `False` for an unknown BIN or `None` on a miss."""
+        entry = self._memory.get(bin_)
+        if entry is not None:
+            return entry
+        if self._store is None:
+            return None
+        stored = self._store.get(f"bin:{bin_}")
+        if stored is None:
+            return None
+        try:
+            entry = CardBin.model_validate(stored) if stored else _UNKNOWN_BIN
+        except ValidationError:
+            return None
+        self._memory.set(bin_, entry, self.ttl if entry else self.unknown_ttl)
+        return entry
+
+    def _misses(self, card_numbers: Iterable[str]) -> list[str]:
+        bins = dict.fromkeys(card_bin(card_number) for card_number in card_numbers)
+        return [bin_ for bin_ in bins if self._cached(bin_) is None]
+
+    def _save(self, results: list[tuple[str, BatchResult]]) -> None:
+        """Caches the outcome of `resolve_card_bin` calls.
+
+        Calls that raised or failed for another reason than an unknown BIN are not cached.
+        """
+        found: dict[str, Any] = {}
+        unknown: dict[str, Any] = {}
+        for bin_, result in results:
+            response = result.response
+            if result.error is not None or response is None:
+                continue
+            if response.status and isinstance(response.data, CardBin):
+                self._memory.set(bin_, response.data, self.ttl)
+                found[f"bin:{bin_}"] = response.data.model_dump(mode="json")
+            elif response.status_code in (400, 404, 422):
+                self._memory.set(bin_, _UNKNOWN_BIN, self.unknown_ttl)
+                unknown[f"bin:{bin_}"] = _UNKNOWN_BIN
+        if self._store is not None:
+            if found:
+                self._store.set_many(found, self.ttl)
+            if unknown:
+                self._store.set_many(unknown, self.unknown_ttl)
+
+    def _resolved(self, bin_: str, response: Any) -> CardBin | None:
+        """Caches the response of a single `resolve_card_bin` call and returns its `CardBin`."""
+        self._save([(bin_, BatchResult(index=0, input=bin_, response=response))])
+        entry = self._cached(bin_)
+        return entry if isinstance(entry, CardBin) else None
+
+
+class CardBinIndex(_BaseCardBinIndex):
+    """A persistent index of card BINs filled through `VerificationClient.resolve_card_bin`.
+
+    Lookups are served from an in-memory LRU cache of `memory_size` BINs backed by an
+    SQLite file of at most `max_size` BINs, so a BIN is resolved with paystack once
+    per `ttl` across restarts and processes sharing the file. BINs paystack does not
+    know are cached for `unknown_ttl` seconds. Use `CardBinIndex.warm` to resolve a
+    list of BINs ahead of time.
+
+    Example:
+        ```python
+        from pypaystack2 import PaystackClient
+        from pypaystack2.helpers import CardBinIndex
+
+        with CardBinIndex(PaystackClient(), "bins.db") as bins:
+            bins.warm(known_bins)
+            card = bins.lookup("5399830000000008")
+            if card is not None:
+                print(card.brand, card.bank, card.country_code)
+        ```
+    """
+
+    def __init__(
+        self,
+        client: "PaystackClient",
+        path: str | Path | None = None,
+        ttl: float | None = 90 * 24 * 3600,
+        unknown_ttl: float | None = 24 * 3600,
+        max_size: int | None = 1_000_000,
+        memory_size: int = 100_000,
+    ):
+        """
+        Args:
+            client: The client used to resolve BINs missing from the index.
+            path: The path of the SQLite file of the index. The index is only kept
+                in memory if it is not provided.
+            ttl: The number of seconds a BIN is kept for.
+            unknown_ttl: The number of seconds a BIN paystack does not know is kept for.
+            max_size: The maximum number of BINs kept in the file. The least
+                recently used BINs are evicted first.
+            memory_size: The maximum number of BINs kept in memory.
+        """
+        super().__init__(path, ttl, unknown_ttl, max_size, memory_size)
+        self._client = client
+
+    def __enter__(self) -> "CardBinIndex":
+        return self
+
+    def lookup(self, card_number: str) -> CardBin | None:
+        """Returns the details of the BIN of a card, resolving it with paystack on a miss.
+
+        Args:
+            card_number: A card number or its first 6 digits.
+
+        Returns:
+            The `CardBin` of the card or `None` if paystack does not know the BIN or
+            could not be reached.
+        """
+        bin_ = card_bin(card_number)
+        entry = self._cached(bin_)
+        if entry is not None:
+            return entry if isinstance(entry, CardBin) else None
+        self.api_calls += 1
+        try:
+            response = self._client.verification.resolve_card_bin(bin_)
+        except Exception:  # not cached, the BIN is resolved again on the next lookup
+            return None
+        return self._resolved(bin_, response)
+
+    def warm(self, card_numbers: Iterable[str], workers: int = 8) -> int:
+        """Resolves the BINs missing from the index on a pool of threads.
+
+        Args:
+            card_numbers: Card numbers or BINs.
+            workers: The number of threads resolving BINs.
+
+        Returns:
+            The number of BINs resolved with paystack.
+        """
+        misses = self._misses(card_numbers)
+        if not misses:
+            return 0
+        results = map_in_threads(
+            self._client.verification.resolve_card_bin, misses, workers
+        )
+        self.api_calls += len(misses)
+        self._save(list(zip(misses, results)))
+        return len(misses)
+
+
+class AsyncCardBinIndex(_BaseCardBinIndex):
+    """A persistent index of card BINs filled through `AsyncVerificationClient.resolve_card_bin`.
+
+    The async version of `CardBinIndex`. Lookups of cached BINs do not block on the
+    network, the SQLite file is read from the calling thread.
+
+    Example:
+        ```python
+        from pypaystack2 import AsyncPaystackClient
+        from pypaystack2.helpers import AsyncCardBinIndex
+
+        with AsyncCardBinIndex(AsyncPaystackClient(), "bins.db") as bins:
+            card = await bins.lookup("539983")
+        ```
+    """
+
+    def __init__(
+        self,
+        client: "AsyncPaystackClient",
+        path: str | Path | None = None,
+        ttl: float | None = 90 * 24 * 3600,
+        unknown_ttl: float | None = 24 * 3600,
+        max_size: int | None = 1_000_000,
+        memory_size: int = 100_000,
+    ):
+        """
+        Args:
+            client: The client used to resolve BINs missing from the index.
+            path: The path of the SQLite file of the index. The index is only kept
+                in memory if it is not provided.
+            ttl: The number of seconds a BIN is kept for.
+            unknown_ttl: The number of seconds a BIN paystack does not know is kept for.
+            max_size: The maximum number of BINs kept in the file. The least
+                recently used BINs are evicted first.
+            memory_size: The maximum number of BINs kept in memory.
+        """
+        super().__init__(path, ttl, unknown_ttl, max_size, memory_size)
+        self._client = client
+
+    def __enter__(self) -> "AsyncCardBinIndex":
+        return self
+
+    async def lookup(self, card_number: str) -> CardBin | None:
+        """Returns the details of the BIN of a card, resolving it with paystack on a miss.
+
+        Args:
+            card_number: A card number or its first 6 digits.
+
+        Returns:
+            The `CardBin` of the card or `None` if paystack does not know the BIN or
+            could not be reached.
+        """
+        bin_ = card_bin(card_number)
+        entry = self._cached(bin_)
+        if entry is not None:
+            return entry if isinstance(entry, CardBin) else None
+        self.api_calls += 1
+        try:
+            response = await self._client.verification.resolve_card_bin(bin_)
+        except Exception:  # not cached, the BIN is resolved again on the next lookup
+            return None
+        return self._resolved(bin_, response)
+
+    async def warm(self, card_numbers: Iterable[str], concurrency: int = 10) -> int:
+        """Resolves the BINs missing from the index concurrently.
+
+        Args:
+            card_numbers: Card numbers or BINs.
+            concurrency: The maximum number of `resolve_card_bin` calls in flight at once.
+
+        Returns:
+            The number of BINs resolved with paystack.
+        """
+        misses = self._misses(card_numbers)
+        if not misses:
+            return 0
+        results = [
+            (misses[result.index], result)
+            async for result in amap(
+                self._client.verification.resolve_card_bin, misses, concurrency
+            )
+        ]
+        self.api_calls += len(misses)
+        self._save(results)
+        return len(misses)
@@ -0,0 +1,366 @@
+import asyncio
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import TYPE_CHECKING, Any
+
+from pypaystack2.exceptions import PaystackResponseError
+from pypaystack2.helpers._background_refresh import (
+    AsyncBackgroundRefresh,
+    BackgroundRefresh,
+    BaseBackgroundRefresh,
+)
+from pypaystack2.helpers.pagination import AsyncPaginator, Paginator
+from pypaystack2.models import PaymentPage, Plan, Product, Response
+
+if TYPE_CHECKING:  # pragma: no cover
+    from pypaystack2.main_clients import AsyncPaystackClient, PaystackClient
+
+
+Key = int | str
+
+
+def _key(id_or_code: Key) -> Key:
+    if isinstance(id_or_code, str) and id_or_code.isdigit():
+        return int(id_or_code)
+    return id_or_code
+
+
+class CatalogSnapshot:
+    """An immutable snapshot of the products, plans, payment pages and storefronts of an integration.
+
+    Every record is indexed by its id and its code or slug, and the relations between
+    them are indexed both ways, so every lookup is a dictionary lookup. Storefronts
+    are plain dicts as paystack's storefront responses are not modelled by the library.
+
+    Attributes:
+        products: Every product.
+        plans: Every plan.
+        pages: Every payment page.
+        storefronts: Every storefront.
+        loaded_at: The `time.monotonic` time the snapshot was built at.
+    """
+
+    def __init__(
+        self,
+        products: list[Product],
+        plans: list[Plan],
+        pages: list[PaymentPage],
+        storefronts: list[dict[str, Any]],
+        storefront_products: dict[int, list[dict[str, Any]]],
+    ):
+        self.products = products
+        self.plans = plans
+        self.pages = pages
+        self.storefronts = storefronts
+        self.loaded_at = time.monotonic()
+        self._products: dict[Key, Product] = {}
+        for product in products:
+            self._products[product.id] = product
+            self._products.setdefault(product.product_code, product)
+            self._products.setdefault(product.slug, product)
+        self._plans: dict[Key, Plan] = {}
+        for plan in plans:
+            self._plans[plan.id] = plan
+            self._plans.setdefault(plan.plan_code, plan)
+        self._pages: dict[Key, PaymentPage] = {}
+        self._plan_pages: dict[int, list[PaymentPage]] = {}
+        self._page_products: dict[int, list[Product]] = {}
+        self._product_pages: dict[int, list[PaymentPage]] = {}
+        for page in pages:
+            self._pages[page.id] = page
+            self._pages.setdefault(page.slug, page)
+            if page.plan is not None:
+                self._plan_pages.setdefault(page.plan, []).append(page)
+            for page_product in page.products or []:
+                product = self._products.get(page_product.id, page_product)
+                self._page_products.setdefault(page.id, []).append(product)
+                self._product_pages.setdefault(product.id, []).append(page)
+        self._storefronts: dict[Key, dict[str, Any]] = {}
+        self._storefront_products: dict[int, list[Product]] = {}
+        self._product_storefronts: dict[int, list[dict[str, Any]]] = {}
+        for storefront in storefronts:
+            self._storefronts[storefront["id"]] = storefront
+            if storefront.get("slug"):
+                self._storefronts.setdefault(storefront["slug"], storefront)
+            for item in storefront_products.get(storefront["id"], []):
+                product = self._products.get(item.get("id")) or self._products.get(
+                    item.get("product_code")
+                )
+                if product is None:
+                    continue
+                self._storefront_products.setdefault(storefront["id"], []).append(
+                    product
+                )
+                self._product_storefronts.setdefault(product.id, []).append(storefront)
+
+    def product(self, id_or_code: Key) -> Product | None:
+        """Returns the product with an id, product code or slug."""
+        return self._products.get(_key(id_or_code))
+
+    def plan(self, id_or_code: Key) -> Plan | None:
+        """Returns the plan with an id or plan code."""
+        return self._plans.get(_key(id_or_code))
+
+    def page(self, id_or_slug: Key) -> PaymentPage | None:
+        """Returns the payment page with an id or slug."""
+        return self._pages.get(_key(id_or_slug))
+
+    def storefront(self, id_or_slug: Key) -> dict[str, Any] | None:
+        """Returns the storefront with an id or slug."""
+        return self._storefronts.get(_key(id_or_slug))
+
+    def plan_pages(self, plan: Key) -> list[PaymentPage]:
+        """Returns the payment pages of a plan, by the plan's id or code."""
+        found = self.plan(plan)
+        return list(self._plan_pages.get(found.id, [])) if found else []
+
+    def page_products(self, page: Key) -> list[Product]:
+        """Returns the products sold on a payment page, by the page's id or slug."""
+        found = self.page(page)
+        return list(self._page_products.get(found.id, [])) if found else []
+
+    def product_pages(self, product: Key) -> list[PaymentPage]:
+        """Returns the payment pages a product is sold on."""
+        found = self.product(product)
+        return list(self._product_pages.get(found.id, [])) if found else []
+
+    def storefront_products(self, storefront: Key) -> list[Product]:
+        """Returns the products of a storefront, by the storefront's id or slug."""
+        found = self.storefront(storefront)
+        return list(self._storefront_products.get(found["id"], [])) if found else []
+
+    def product_storefronts(self, product: Key) -> list[dict[str, Any]]:
+        """Returns the storefronts a product is listed on."""
+        found = self.product(product)
+        return list(self._product_storefronts.get(found.id, [])) if found else []
+
+
+class _BaseCatalog(BaseBackgroundRefresh):
+    def __init__(self, ttl: float, pagination: int):
+        super().__init__(ttl)
+        self.pagination = pagination
+        self._snapshot: CatalogSnapshot | None = None
+
+    def _loaded(self, snapshot: CatalogSnapshot) -> CatalogSnapshot:
+        self._snapshot = snapshot
+        self._refreshed()
+        return snapshot
+
+    @staticmethod
+    def _raw_page(response: Response[Any], what: str) -> tuple[list[Any], bool]:
+        """Returns the raw records of a page and whether it is the last page."""
+        data = response.raw.get("data") if isinstance(response.raw, dict) else None
+        if not response.status or not isinstance(data, list):
+            raise PaystackResponseError(
+                f"unable to load {what}: {response.message}", response
+            )
+        meta = response.meta or {}
+        page, page_count = meta.get("page"), meta.get("pageCount")
+        return data, page is None or page_count is None or page >= page_count
+
+
+class Catalog(_BaseCatalog, BackgroundRefresh):
+    """Serves the products, plans, payment pages and storefronts of an integration from memory.
+
+    `load` fetches every product, plan, payment page and storefront and the products of
+    every storefront on a pool of threads into a `CatalogSnapshot`, then swaps it in.
+    Reads go through `snapshot` and never wait on a lock or the network once the catalog
+    is loaded. When the snapshot is older than `ttl` seconds, the next read starts a
+    refresh on a background thread and is served from the stale snapshot until the new
+    one is swapped in. A failed refresh keeps the stale snapshot, is stored in
+    `last_error` and is retried a minute later.
+
+    Example:
+        ```python
+        from pypaystack2 import PaystackClient
+        from pypaystack2.helpers import Catalog
+
+        catalog = Catalog(PaystackClient(), ttl=300)
+        catalog.load()
+        snapshot = catalog.snapshot  # use one snapshot for a whole page view
+        plan = snapshot.plan("PLN_xxx")
+        pages = snapshot.plan_pages("PLN_xxx")
+        products = snapshot.storefront_products("my-store")
+        ```
+    """
+
+    _refresh_thread_name = "pypaystack2-catalog"
+
+    def __init__(
+        self,
+        client: "PaystackClient",
+        ttl: float = 300,
+        pagination: int = 100,
+        workers: int = 4,
+    ):
+        """
+        Args:
+            client: The client used to load the catalog.
+            ttl: The number of seconds after which the snapshot is refreshed.
+            pagination: The number of records requested per page.
+            workers: The number of threads loading the catalog.
+        """
+        super().__init__(ttl, pagination)
+        self._client = client
+        self.workers = workers
+
+    def _list(self, method: Any) -> list[Any]:
+        return list(Paginator(method, pagination=self.pagination))
+
+    def _storefronts(self) -> list[dict[str, Any]]:
+        storefronts, page = [], 1
+        while True:
+            response = self._client.storefronts.get_storefronts(
+                pagination=self.pagination, page=page
+            )
+            records, is_last_page = self._raw_page(response, "storefronts")
+            storefronts.extend(records)
+            if is_last_page or not records:
+                return storefronts
+            page += 1
+
+    def _storefront_products(self, storefront_id: int) -> list[dict[str, Any]]:
+        response = self._client.storefronts.get_products(str(storefront_id))
+        records, _ = self._raw_page(response, f"the products of {storefront_id}")
+        return records
+
+    def load(self) -> CatalogSnapshot:
+        """Builds a new snapshot and swaps it in, blocking until it is built."""
+        with ThreadPoolExecutor(self.workers) as pool:
+            products = pool.submit(self._list, self._client.products.get_products)
+            plans = pool.submit(self._list, self._client.plans.get_plans)
+            pages = pool.submit(self._list, self._client.payment_pages.get_pages)
+            storefronts = self._storefronts()
+            storefront_products = dict(
+                zip(
+                    [storefront["id"] for storefront in storefronts],
+                    pool.map(
+                        self._storefront_products,
+                        [storefront["id"] for storefront in storefronts],
+                    ),
+                )
+            )
+            snapshot = CatalogSnapshot(
+                products.result(),
+                plans.result(),
+                pages.result(),
+                storefronts,
+                storefront_products,
+            )
+        return self._loaded(snapshot)
+
+    @property
+    def snapshot(self) -> CatalogSnapshot:
+        """The current `CatalogSnapshot`, loading the catalog first if it was never loaded."""
+        snapshot = self._snapshot
+        if snapshot is None:
+            return self.load()
+        self._refresh_if_stale()
+        return snapshot
+
+
+class AsyncCatalog(_BaseCatalog, AsyncBackgroundRefresh):
+    """Serves the products, plans, payment pages and storefronts of an integration from memory.
+
+    The async version of `Catalog`. `load` makes its requests concurrently, at most
+    `concurrency` at once, and a stale snapshot is refreshed in a task on the running
+    event loop.
+
+    Example:
+        ```python
+        from pypaystack2 import AsyncPaystackClient
+        from pypaystack2.helpers import AsyncCatalog
+
+        catalog = AsyncCatalog(AsyncPaystackClient())
+        await catalog.load()
+        print(catalog.snapshot.product("PROD_xxx"))
+        ```
+    """
+
+    def __init__(
+        self,
+        client: "AsyncPaystackClient",
+        ttl: float = 300,
+        pagination: int = 100,
+        concurrency: int = 4,
+    ):
+        """
+        Args:
+            client: The client used to load the catalog.
+            ttl: The number of seconds after which the snapshot is refreshed.
+            pagination: The number of records requested per page.
+            concurrency: The maximum number of requests in flight at once.
+        """
+        super().__init__(ttl, pagination)
+        self._client = client
+        self.concurrency = concurrency
+
+    async def _list(self, method: Any, semaphore: asyncio.Semaphore) -> list[Any]:
+        async with semaphore:
+            return [
+                item
+                async for item in AsyncPaginator(method, pagination=self.pagination)
+            ]
+
+    async def _storefronts(
+        self, semaphore: asyncio.Semaphore
+    ) -> tuple[list[dict[str, Any]], dict[int, list[dict[str, Any]]]]:
+        storefronts, page = [], 1
+        async with semaphore:
+            while True:
+                response = await self._client.storefronts.get_storefronts(
+                    pagination=self.pagination, page=page
+                )
+                records, is_last_page = self._raw_page(response, "storefronts")
+                storefronts.extend(records)
+                if is_last_page or not records:
+                    break
+                page += 1
+        storefront_products = await asyncio.gather(
+            *(
+                self._storefront_products(storefront["id"], semaphore)
+                for storefront in storefronts
+            )
+        )
+        return storefronts, dict(
+            zip([storefront["id"] for storefront in storefronts], storefront_products)
+        )
+
+    async def _storefront_products(
+        self, storefront_id: int, semaphore: asyncio.Semaphore
+    ) -> list[dict[str, Any]]:
+        async with semaphore:
+            response = await self._client.storefronts.get_products(str(storefront_id))
+        records, _ = self._raw_page(response, f"the products of {storefront_id}")
+        return records
+
+    async def load(self) -> CatalogSnapshot:
+        """Builds a new snapshot and swaps it in, fetching its parts concurrently."""
+        semaphore = asyncio.Semaphore(self.concurrency)
+        (
+            products,
+            plans,
+            pages,
+            (storefronts, storefront_products),
+        ) = await asyncio.gather(
+            self._list(self._client.products.get_products, semaphore),
+            self._list(self._client.plans.get_plans, semaphore),
+            self._list(self._client.payment_pages.get_pages, semaphore),
+            self._storefronts(semaphore),
+        )
+        return self._loaded(
+            CatalogSnapshot(products, plans, pages, storefronts, storefront_products)
+        )
+
+    @property
+    def snapshot(self) -> CatalogSnapshot:
+        """The current `CatalogSnapshot`.
+
+        Raises:
+            RuntimeError: If the catalog was never loaded.
+        """
+        snapshot = self._snapshot
+        if snapshot is None:
+            raise RuntimeError("the catalog is not loaded, call `load` first")
+        self._refresh_if_stale()
+        return snapshot
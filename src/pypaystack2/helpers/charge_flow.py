@@ -0,0 +1,326 @@
+import asyncio
+import time
+import uuid
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Awaitable,
+    Callable,
+    Iterable,
+    Literal,
+    Mapping,
+    cast,
+)
+
+from pydantic import BaseModel, ValidationError
+
+from pypaystack2.helpers.polling import AdaptivePollInterval
+from pypaystack2.models import Response, Transaction
+
+if TYPE_CHECKING:  # pragma: no cover
+    from pypaystack2.main_clients import AsyncPaystackClient
+
+ChargeInputStep = Literal[
+    "send_pin", "send_otp", "send_phone", "send_birthday", "send_address"
+]
+INPUT_STEPS: frozenset[str] = frozenset(
+    {"send_pin", "send_otp", "send_phone", "send_birthday", "send_address"}
+)
+"""The charge statuses that need input from the customer to continue."""
+
+
+class ChargeInputRequest(BaseModel):
+    """Describes the input a charge needs from the customer to continue.
+
+    Attributes:
+        reference: The reference of the charge.
+        step: The status of the charge e.g. `send_otp`.
+        display_text: The text paystack suggests showing the customer.
+        data: The data paystack returned with the step.
+    """
+
+    reference: str
+    step: ChargeInputStep
+    display_text: str | None = None
+    data: dict[str, Any] = {}
+
+
+ChargeInputProvider = Callable[
+    [ChargeInputRequest], Awaitable[str | dict[str, str] | None]
+]
+"""Collects the input a charge needs, e.g. by prompting the customer.
+
+It returns the PIN, OTP, phone number or birthday as a `str`, the address as a `dict`
+with `address`, `city`, `state` and `zipcode` or `None` to stop driving the charge.
+"""
+
+
+class ChargeFlowResult(BaseModel):
+    """The status a charge was driven to.
+
+    Attributes:
+        reference: The reference of the charge.
+        status: The last status of the charge. One of `success` and `failed` when
+            the charge was completed, an input step when input was not provided,
+            `pending` when it was still pending at the deadline, or a status the
+            customer has to act on outside the flow, e.g. `open_url` or `pay_offline`.
+            `error` when `ChargeFlowDriver.drive_many` could not drive the charge, e.g.
+            because its input provider raised.
+        message: The last message returned by paystack, or the error of an `error` status.
+        steps: The statuses the charge went through, in order.
+        transaction: The transaction of a completed charge.
+        data: The data returned with the last status.
+    """
+
+    reference: str
+    status: str
+    message: str = ""
+    steps: list[str] = []
+    transaction: Transaction | None = None
+    data: dict[str, Any] = {}
+
+    @property
+    def ok(self) -> bool:
+        """Whether the charge succeeded."""
+        return self.status == "success"
+
+
+def _charge_state(response: Response[Any]) -> tuple[str | None, dict[str, Any]]:
+    """Returns the status and data of a charge response.
+
+    `ChargeStep` only models the input steps, so the status of every other step is
+    read from the raw response.
+    """
+    data = response.raw.get("data") if isinstance(response.raw, dict) else None
+    if not isinstance(data, dict):
+        data = response.data.model_dump() if response.data is not None else {}
+    status = data.get("status")
+    return (status if isinstance(status, str) else None), data
+
+
+class ChargeFlowDriver:
+    """Drives direct charges through their intermediate steps until they are completed.
+
+    A charge started with `AsyncPaystackClient.charge.charge` may need a PIN, an OTP,
+    a phone number, a birthday or an address before it completes, or stay pending for
+    a while. The driver calls the input provider registered for a step, submits its
+    answer with the matching `charge` method and polls `check_pending_charge` with an
+    interval that backs off while the charge is pending. Every charge is a task on the
+    event loop, so many charges can wait on their customers at once. `concurrency`
+    only bounds the number of requests in flight.
+
+    A request that raises is treated like a `pending` response, the charge is checked
+    again later. Charges without a reference are assigned one, so they can always be
+    checked.
+
+    Example:
+        ```python
+        from pypaystack2 import AsyncPaystackClient
+        from pypaystack2.helpers import ChargeFlowDriver
+
+        async def ask_for_otp(request):
+            return await prompt_customer(request.reference, request.display_text)
+
+        driver = ChargeFlowDriver(
+            AsyncPaystackClient(), input_providers={"send_otp": ask_for_otp}
+        )
+        result = await driver.drive(
+            email="customer@example.com",
+            amount=50_000,
+            bank={"code": "057", "account_number": "0000000000"},
+            birthday="1995-12-23",
+        )
+        print(result.status, result.steps)
+        ```
+    """
+
+    def __init__(
+        self,
+        client: "AsyncPaystackClient",
+        input_providers: Mapping[ChargeInputStep, ChargeInputProvider] | None = None,
+        concurrency: int = 20,
+        poll_interval: float = 10.0,
+        max_poll_interval: float = 60.0,
+        backoff_factor: float = 1.5,
+        pending_timeout: float = 600.0,
+        max_steps: int = 10,
+    ):
+        """
+        Args:
+            client: The client used to make the charges.
+            input_providers: The input provider of each input step. A charge that
+                reaches a step without a provider is returned at that step.
+            concurrency: The maximum number of requests in flight at once.
+            poll_interval: The interval in seconds before checking a pending charge.
+                Paystack recommends waiting at least 10 seconds.
+            max_poll_interval: The longest interval in seconds between checks.
+            backoff_factor: The number the interval is multiplied by after every check
+                that finds the charge still pending.
+            pending_timeout: The longest time in seconds a charge is checked for.
+            max_steps: The maximum number of inputs submitted for a charge.
+        """
+        if concurrency < 1:
+            raise ValueError("concurrency must be at least 1")
+        self._client = client
+        self.input_providers: dict[str, ChargeInputProvider] = dict(
+            input_providers or {}
+        )
+        self.poll_interval = poll_interval
+        self.max_poll_interval = max_poll_interval
+        self.backoff_factor = backoff_factor
+        self.pending_timeout = pending_timeout
+        self.max_steps = max_steps
+        self._semaphore = asyncio.Semaphore(concurrency)
+
+    async def _request(
+        self, method: Callable[..., Awaitable[Response[Any]]], **kwargs: Any
+    ) -> Response[Any] | None:
+        async with self._semaphore:
+            try:
+                return await method(**kwargs)
+            except Exception:  # the charge is checked again
+                return None
+
+    async def _submit(
+        self, step: str, answer: str | dict[str, str], reference: str
+    ) -> Response[Any] | None:
+        charge = self._client.charge
+        if step == "send_address":
+            if not isinstance(answer, dict):
+                raise ValueError("the address provider must return a dict")
+            return await self._request(
+                charge.set_address, reference=reference, **answer
+            )
+        if not isinstance(answer, str):
+            raise ValueError(f"the {step} provider must return a str")
+        if step == "send_pin":
+            return await self._request(
+                charge.submit_pin, pin=answer, reference=reference
+            )
+        if step == "send_otp":
+            return await self._request(
+                charge.submit_otp, otp=answer, reference=reference
+            )
+        if step == "send_phone":
+            return await self._request(
+                charge.submit_phone, phone=answer, reference=reference
+            )
+        return await self._request(
+            charge.submit_birthday, birthday=answer, reference=reference
+        )
+
+    async def drive(self, **charge: Any) -> ChargeFlowResult:
+        """Starts a charge and drives it until it is completed or needs outside action.
+
+        Args:
+            **charge: The arguments of `AsyncPaystackClient.charge.charge`.
+
+        Returns:
+            A `ChargeFlowResult` with the status the charge was driven to.
+        """
+        reference = charge.setdefault("reference", uuid.uuid4().hex)
+        steps: list[str] = []
+        inputs = 0
+        pending_since: float | None = None
+        interval = AdaptivePollInterval(
+            self.poll_interval, self.max_poll_interval, self.backoff_factor
+        )
+        response = await self._request(self._client.charge.charge, **charge)
+        while True:
+            status, data = (
+                _charge_state(response) if response is not None else ("pending", {})
+            )
+            message = response.message if response is not None else ""
+            if status is None:  # rejected before a charge was created
+                status = "pending" if response is None else "failed"
+            if response is not None:
+                steps.append(status)
+            reference = data.get("reference") or reference
+
+            if status in INPUT_STEPS:
+                pending_since = None
+                provider = self.input_providers.get(status)
+                if provider is None or inputs >= self.max_steps:
+                    return self._result(reference, status, message, steps, data)
+                answer = await provider(
+                    ChargeInputRequest(
+                        reference=reference,
+                        step=cast(ChargeInputStep, status),
+                        display_text=data.get("display_text"),
+                        data=data,
+                    )
+                )
+                if answer is None:
+                    return self._result(reference, status, message, steps, data)
+                inputs += 1
+                interval.reset()
+                response = await self._submit(status, answer, reference)
+            elif status == "pending":
+                now = time.monotonic()
+                if pending_since is None:
+                    pending_since = now
+                remaining = pending_since + self.pending_timeout - now
+                if remaining <= 0:
+                    return self._result(reference, status, message, steps, data)
+                await asyncio.sleep(min(interval.current, remaining))
+                interval.next(False)
+                response = await self._request(
+                    self._client.charge.check_pending_charge, reference=reference
+                )
+            else:
+                return self._result(reference, status, message, steps, data)
+
+    @staticmethod
+    def _result(
+        reference: str,
+        status: str,
+        message: str,
+        steps: list[str],
+        data: dict[str, Any],
+    ) -> ChargeFlowResult:
+        transaction = None
+        if status in ("success", "failed"):
+            try:
+                transaction = Transaction.model_validate(data)
+            except ValidationError:
+                pass
+        return ChargeFlowResult(
+            reference=reference,
+            status=status,
+            message=message,
+            steps=steps,
+            transaction=transaction,
+            data=data,
+        )
+
+    async def drive_many(
+        self,
+        charges: Iterable[dict[str, Any]],
+        on_result: Callable[[ChargeFlowResult], None] | None = None,
+    ) -> list[ChargeFlowResult]:
+        """Drives many charges concurrently.
+
+        Args:
+            charges: The arguments of `AsyncPaystackClient.charge.charge` for every charge.
+            on_result: A callable that is called with the result of every charge as
+                soon as it is driven to its last status.
+
+        Returns:
+            A list of `ChargeFlowResult`s in the same order as `charges`. A charge that
+            raised, e.g. because its input provider failed, has the `error` status and
+            does not stop the other charges.
+        """
+
+        async def drive(charge: dict[str, Any]) -> ChargeFlowResult:
+            reference = charge.setdefault("reference", uuid.uuid4().hex)
+            try:
+                result = await self.drive(**charge)
+            except Exception as error:
+                result = ChargeFlowResult(
+                    reference=reference, status="error", message=str(error)
+                )
+            if on_result is not None:
+                on_result(result)
+            return result
+
+        return list(await asyncio.gather(*(drive(dict(charge)) for charge in charges)))
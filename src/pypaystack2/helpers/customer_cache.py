@@ -0,0 +1,291 @@
+import asyncio
+from typing import TYPE_CHECKING, Any
+
+from pypaystack2.caching import MemoryCache
+from pypaystack2.enums import RiskAction
+from pypaystack2.models import Customer, Response
+
+if TYPE_CHECKING:  # pragma: no cover
+    from pypaystack2.main_clients import AsyncPaystackClient, PaystackClient
+
+
+def _cache_key(email_or_code: str) -> str:
+    email_or_code = email_or_code.strip()
+    if "@" in email_or_code:
+        return f"email:{email_or_code.lower()}"
+    return f"code:{email_or_code}"
+
+
+class _BaseCustomerCache:
+    def __init__(self, max_size: int, ttl: float | None):
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+        # customers are kept under their code and their email maps to the code, an
+        # email is only served while the customer under the code still has it
+        self._customers = MemoryCache(max_size=max_size)
+        self._generation = 0
+
+    @property
+    def hit_rate(self) -> float:
+        """The share of lookups served from the cache."""
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+    def _cached(self, email_or_code: str) -> Customer | None:
+        key = _cache_key(email_or_code)
+        entry = self._customers.get(key)
+        if isinstance(entry, str):
+            entry = self._customers.get(entry)
+            if isinstance(entry, Customer) and _cache_key(entry.email) != key:
+                # the email of the customer changed since it was cached
+                self._customers.delete(key)
+                entry = None
+        if isinstance(entry, Customer):
+            self.hits += 1
+            return entry
+        self.misses += 1
+        return None
+
+    def _store(self, response: Response[Any], generation: int) -> Customer | None:
+        if not response.status or not isinstance(response.data, Customer):
+            return None
+        customer = response.data
+        if generation == self._generation:
+            # a customer invalidated while it was being fetched may be stale
+            code_key = _cache_key(customer.customer_code)
+            self._customers.set(code_key, customer, self.ttl)
+            self._customers.set(_cache_key(customer.email), code_key, self.ttl)
+        return customer
+
+    def invalidate(
+        self, email_or_code: str, response: Response[Any] | None = None
+    ) -> None:
+        """Removes a customer from the cache.
+
+        Call it when a customer is changed without going through the cache, e.g. on a
+        `customeridentification.success` webhook event.
+
+        Args:
+            email_or_code: The email or code of the customer.
+            response: The response of the request that changed the customer. The
+                customer is also removed under the email and code it contains.
+        """
+        self._generation += 1
+        keys = [_cache_key(email_or_code)]
+        if response is not None and isinstance(response.data, Customer):
+            keys += [
+                _cache_key(response.data.email),
+                _cache_key(response.data.customer_code),
+            ]
+        for key in keys:
+            entry = self._customers.get(key)
+            if isinstance(entry, str):  # an email mapping to the code
+                self._customers.delete(key)
+                key, entry = entry, self._customers.get(entry)
+            if isinstance(entry, Customer):
+                # the cached email, which an update may have changed
+                self._customers.delete(_cache_key(entry.email))
+            self._customers.delete(key)
+
+    def clear(self) -> None:
+        """Removes every customer from the cache."""
+        self._generation += 1
+        self._customers.clear()
+
+
+class CustomerCache(_BaseCustomerCache):
+    """A read-through cache of `CustomerClient.get_customer` indexed by email and customer code.
+
+    A customer fetched by email is served from the cache when it is looked up by its
+    code and vice versa. At most `max_size` customers are kept, evicting the least
+    recently used first, each for at most `ttl` seconds. Updating, flagging or
+    validating a customer through the cache removes it from the cache. `hits`,
+    `misses` and `hit_rate` report how well the cache is doing.
+
+    Example:
+        ```python
+        from pypaystack2 import PaystackClient
+        from pypaystack2.enums import RiskAction
+        from pypaystack2.helpers import CustomerCache
+
+        customers = CustomerCache(PaystackClient(), max_size=50_000)
+        customer = customers.get("customer@example.com")  # fetched from paystack
+        customer = customers.get(customer.customer_code)  # served from the cache
+        customers.flag(customer.customer_code, RiskAction.BLACKLIST)  # removed from the cache
+        print(customers.hits, customers.misses)
+        ```
+    """
+
+    def __init__(
+        self,
+        client: "PaystackClient",
+        max_size: int = 10_000,
+        ttl: float | None = 300,
+    ):
+        """
+        Args:
+            client: The client used to fetch and change customers.
+            max_size: The maximum number of customers kept.
+            ttl: The number of seconds a customer is kept for. `None` keeps customers
+                until they are evicted or invalidated.
+        """
+        super().__init__(max_size, ttl)
+        self._client = client
+
+    def get(self, email_or_code: str) -> Customer | None:
+        """Returns a customer, fetching it from paystack if it is not cached.
+
+        Args:
+            email_or_code: The email or code of the customer.
+
+        Returns:
+            The customer or `None` if paystack could not return it. Failed lookups are
+            not cached.
+        """
+        customer = self._cached(email_or_code)
+        if customer is not None:
+            return customer
+        generation = self._generation
+        response = self._client.customers.get_customer(email_or_code)
+        return self._store(response, generation)
+
+    def update(self, code: str, **kwargs: Any) -> Response[Any]:
+        """Updates a customer with `CustomerClient.update` and removes it from the cache.
+
+        Args:
+            code: The customer's code.
+            **kwargs: The other arguments of `CustomerClient.update`.
+        """
+        response = self._client.customers.update(code, **kwargs)
+        self.invalidate(code, response)
+        return response
+
+    def flag(
+        self, customer: str, risk_action: RiskAction | None = None, **kwargs: Any
+    ) -> Response[Any]:
+        """Flags a customer with `CustomerClient.flag` and removes it from the cache.
+
+        Args:
+            customer: The customer's code or email.
+            risk_action: The risk action to set on the customer.
+            **kwargs: The other arguments of `CustomerClient.flag`.
+        """
+        response = self._client.customers.flag(customer, risk_action, **kwargs)
+        self.invalidate(customer, response)
+        return response
+
+    def validate(self, email_or_code: str, **kwargs: Any) -> Response[Any]:
+        """Validates a customer with `CustomerClient.validate` and removes it from the cache.
+
+        Args:
+            email_or_code: The customer's email or code.
+            **kwargs: The other arguments of `CustomerClient.validate`.
+        """
+        response = self._client.customers.validate(email_or_code, **kwargs)
+        self.invalidate(email_or_code, response)
+        return response
+
+
+class AsyncCustomerCache(_BaseCustomerCache):
+    """A read-through cache of `AsyncCustomerClient.get_customer` indexed by email and customer code.
+
+    The async version of `CustomerCache`. Concurrent lookups of a customer that is not
+    cached share a single `get_customer` call.
+
+    Example:
+        ```python
+        from pypaystack2 import AsyncPaystackClient
+        from pypaystack2.helpers import AsyncCustomerCache
+
+        customers = AsyncCustomerCache(AsyncPaystackClient())
+        customer = await customers.get("CUS_xxx")
+        ```
+    """
+
+    def __init__(
+        self,
+        client: "AsyncPaystackClient",
+        max_size: int = 10_000,
+        ttl: float | None = 300,
+    ):
+        """
+        Args:
+            client: The client used to fetch and change customers.
+            max_size: The maximum number of customers kept.
+            ttl: The number of seconds a customer is kept for. `None` keeps customers
+                until they are evicted or invalidated.
+        """
+        super().__init__(max_size, ttl)
+        self._client = client
+        self._in_flight: dict[str, asyncio.Future[Customer | None]] = {}
+
+    async def get(self, email_or_code: str) -> Customer | None:
+        """Returns a customer, fetching it from paystack if it is not cached.
+
+        Args:
+            email_or_code: The email or code of the customer.
+
+        Returns:
+            The customer or `None` if paystack could not return it. Failed lookups are
+            not cached.
+        """
+        customer = self._cached(email_or_code)
+        if customer is not None:
+            return customer
+        key = _cache_key(email_or_code)
+        if key in self._in_flight:
+            return await asyncio.shield(self._in_flight[key])
+        future: asyncio.Future[Customer | None] = (
+            asyncio.get_running_loop().create_future()
+        )
+        self._in_flight[key] = future
+        try:
+            generation = self._generation
+            response = await self._client.customers.get_customer(email_or_code)
+            customer = self._store(response, generation)
+        except BaseException as error:
+            future.set_exception(error)
+            future.exception()  # retrieved, in case nobody else was waiting
+            raise
+        else:
+            future.set_result(customer)
+            return customer
+        finally:
+            del self._in_flight[key]
+
+    async def update(self, code: str, **kwargs: Any) -> Response[Any]:
+        """Updates a customer with `AsyncCustomerClient.update` and removes it from the cache.
+
+        Args:
+            code: The customer's code.
+            **kwargs: The other arguments of `AsyncCustomerClient.update`.
+        """
+        response = await self._client.customers.update(code, **kwargs)
+        self.invalidate(code, response)
+        return response
+
+    async def flag(
+        self, customer: str, risk_action: RiskAction | None = None, **kwargs: Any
+    ) -> Response[Any]:
+        """Flags a customer with `AsyncCustomerClient.flag` and removes it from the cache.
+
+        Args:
+            customer: The customer's code or email.
+            risk_action: The risk action to set on the customer.
+            **kwargs: The other arguments of `AsyncCustomerClient.flag`.
+        """
+        response = await self._client.customers.flag(customer, risk_action, **kwargs)
+        self.invalidate(customer, response)
+        return response
+
+    async def validate(self, email_or_code: str, **kwargs: Any) -> Response[Any]:
+        """Validates a customer with `AsyncCustomerClient.validate` and removes it from the cache.
+
+        Args:
+            email_or_code: The customer's email or code.
+            **kwargs: The other arguments of `AsyncCustomerClient.validate`.
+        """
+        response = await self._client.customers.validate(email_or_code, **kwargs)
+        self.invalidate(email_or_code, response)
+        return response
@@ -0,0 +1,103 @@
+import threading
+from typing import Any, Callable, Protocol
+
+from pydantic import ValidationError
+
+from pypaystack2.webhook.models import PaystackWebhookPayload
+
+WebhookEventCallback = Callable[[PaystackWebhookPayload], None]
+
+
+class EventBus(Protocol):
+    """The interface of the event buses `await_transaction` listens to for webhook events.
+
+    Implement it to deliver webhook events received by another process, e.g. through
+    redis pub/sub, to the waiters in this process.
+    """
+
+    def subscribe(
+        self, reference: str, callback: WebhookEventCallback
+    ) -> Callable[[], None]:
+        """Calls `callback` with every webhook event about `reference`.
+
+        Returns:
+            A callable that cancels the subscription.
+        """
+        ...
+
+
+class InProcessEventBus:
+    """An in-process `EventBus` that webhook handlers publish verified paystack events to.
+
+    Subscriptions are indexed by reference, so publishing an event only touches the
+    waiters of its reference no matter how many waiters there are. It is thread-safe,
+    an event published from a webhook server thread reaches waiters on any thread or
+    event loop.
+
+    Example:
+        ```python
+        from pypaystack2 import PaystackClient
+        from pypaystack2.helpers import InProcessEventBus
+
+        event_bus = InProcessEventBus()
+        client = PaystackClient(event_bus=event_bus)
+
+        # in your webhook handler, after verifying the signature
+        event_bus.publish(request.json())
+
+        # in your checkout flow
+        transaction = client.await_transaction(reference, timeout=120)
+        ```
+    """
+
+    def __init__(self) -> None:
+        self._subscribers: dict[str, list[WebhookEventCallback]] = {}
+        self._lock = threading.Lock()
+
+    def subscribe(
+        self, reference: str, callback: WebhookEventCallback
+    ) -> Callable[[], None]:
+        """Calls `callback` with every event published about `reference`.
+
+        Args:
+            reference: The reference of the transaction.
+            callback: A callable that is called from the publishing thread with the event.
+
+        Returns:
+            A callable that cancels the subscription.
+        """
+        with self._lock:
+            self._subscribers.setdefault(reference, []).append(callback)
+
+        def unsubscribe() -> None:
+            with self._lock:
+                callbacks = self._subscribers.get(reference, [])
+                if callback in callbacks:
+                    callbacks.remove(callback)
+                if not callbacks:
+                    self._subscribers.pop(reference, None)
+
+        return unsubscribe
+
+    def publish(self, payload: PaystackWebhookPayload | dict[str, Any]) -> int:
+        """Delivers a webhook event to the subscribers of its reference.
+
+        Args:
+            payload: A verified webhook payload.
+
+        Returns:
+            The number of subscribers the event was delivered to.
+        """
+        if isinstance(payload, dict):
+            try:
+                payload = PaystackWebhookPayload.model_validate(payload)
+            except ValidationError:  # an event type pypaystack2 does not know about
+                return 0
+        reference = payload.data.get("reference")
+        if not isinstance(reference, str):
+            return 0
+        with self._lock:
+            callbacks = list(self._subscribers.get(reference, ()))
+        for callback in callbacks:
+            callback(payload)
+        return len(callbacks)
@@ -0,0 +1,404 @@
+import sqlite3
+from datetime import UTC, datetime
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+from pypaystack2.enums import TransactionStatus
+from pypaystack2.helpers.pagination import PaginationCheckpoint, Paginator
+from pypaystack2.models import Customer, Transaction
+
+if TYPE_CHECKING:  # pragma: no cover
+    from pypaystack2.main_clients import PaystackClient
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS transactions (
+    id INTEGER PRIMARY KEY,
+    reference TEXT NOT NULL,
+    customer_id INTEGER,
+    customer_email TEXT,
+    customer_code TEXT,
+    status TEXT,
+    amount INTEGER NOT NULL,
+    currency TEXT NOT NULL,
+    created_at TEXT,
+    paid_at TEXT,
+    data TEXT NOT NULL
+);
+CREATE UNIQUE INDEX IF NOT EXISTS transactions_reference ON transactions (reference);
+CREATE INDEX IF NOT EXISTS transactions_customer_id ON transactions (customer_id, created_at);
+CREATE INDEX IF NOT EXISTS transactions_customer_email ON transactions (customer_email, created_at);
+CREATE INDEX IF NOT EXISTS transactions_customer_code ON transactions (customer_code, created_at);
+CREATE INDEX IF NOT EXISTS transactions_status ON transactions (status, created_at);
+CREATE INDEX IF NOT EXISTS transactions_created_at ON transactions (created_at);
+
+CREATE TABLE IF NOT EXISTS customers (
+    id INTEGER PRIMARY KEY,
+    email TEXT NOT NULL,
+    customer_code TEXT NOT NULL,
+    created_at TEXT,
+    updated_at TEXT,
+    data TEXT NOT NULL
+);
+CREATE UNIQUE INDEX IF NOT EXISTS customers_customer_code ON customers (customer_code);
+CREATE INDEX IF NOT EXISTS customers_email ON customers (email);
+CREATE INDEX IF NOT EXISTS customers_created_at ON customers (created_at);
+
+CREATE TABLE IF NOT EXISTS sync_state (
+    resource TEXT PRIMARY KEY,
+    high_water_mark TEXT,
+    checkpoint TEXT
+);
+"""
+
+_UPSERT_TRANSACTION = """
+INSERT INTO transactions (
+    id, reference, customer_id, customer_email, customer_code,
+    status, amount, currency, created_at, paid_at, data
+) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+ON CONFLICT (id) DO UPDATE SET
+    reference = excluded.reference,
+    customer_id = excluded.customer_id,
+    customer_email = excluded.customer_email,
+    customer_code = excluded.customer_code,
+    status = excluded.status,
+    amount = excluded.amount,
+    currency = excluded.currency,
+    created_at = excluded.created_at,
+    paid_at = excluded.paid_at,
+    data = excluded.data
+"""
+
+_UPSERT_CUSTOMER = """
+INSERT INTO customers (id, email, customer_code, created_at, updated_at, data)
+VALUES (?, ?, ?, ?, ?, ?)
+ON CONFLICT (id) DO UPDATE SET
+    email = excluded.email,
+    customer_code = excluded.customer_code,
+    created_at = excluded.created_at,
+    updated_at = excluded.updated_at,
+    data = excluded.data
+"""
+
+
+def _to_timestamp(value: datetime | str | None) -> str | None:
+    """Normalizes a datetime or an ISO 8601 string to a fixed width UTC timestamp
+    e.g. 2016-09-24T00:00:05.000Z so that timestamps stored in the mirror sort lexically
+    and can be passed to paystack as a query parameter."""
+    if value is None:
+        return None
+    if isinstance(value, str):
+        value = datetime.fromisoformat(value.replace("Z", "+00:00"))
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=UTC)
+    return (
+        value.astimezone(UTC).isoformat(timespec="milliseconds").replace("+00:00", "Z")
+    )
+
+
+class LocalMirror:
+    """Keeps a local SQLite mirror of the transactions and customers on your integration.
+
+    Each call to `sync_transactions` or `sync_customers` only fetches records created
+    at or after the high-water mark of the previous sync, and upserts every page in a
+    single database transaction. A sync that is interrupted resumes from the page it
+    stopped on the next time it is called. Lookups on the mirror are served from indexed
+    local tables and make no API calls.
+
+    Example:
+        ```python
+        from pypaystack2 import PaystackClient
+        from pypaystack2.enums import TransactionStatus
+        from pypaystack2.helpers import LocalMirror
+
+        with LocalMirror(PaystackClient(), "paystack.sqlite3") as mirror:
+            mirror.sync()
+            transaction = mirror.get_transaction("my-reference")
+            failed = mirror.get_transactions(status=TransactionStatus.FAILED)
+        ```
+
+    Notes:
+        Paystack's list endpoints filter by creation date, so changes made to a record
+        after it has been mirrored (e.g. a customer's updated phone number) are only
+        picked up by `resync`.
+    """
+
+    def __init__(
+        self,
+        client: "PaystackClient",
+        path: str | Path = ":memory:",
+        pagination: int = 100,
+    ):
+        """
+        Args:
+            client: The client used to fetch the records.
+            path: The SQLite database file. Defaults to an in-memory database.
+            pagination: The number of records requested per page during a sync.
+        """
+        self._client = client
+        self._pagination = pagination
+        self._connection = sqlite3.connect(path)
+        self._connection.executescript(_SCHEMA)
+
+    def __enter__(self) -> "LocalMirror":
+        return self
+
+    def __exit__(self, *args: Any) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Closes the underlying database connection."""
+        self._connection.close()
+
+    def high_water_mark(self, resource: str) -> str | None:
+        """The creation time of the newest record mirrored by the last completed sync.
+
+        Args:
+            resource: Either `"transactions"` or `"customers"`.
+        """
+        row = self._connection.execute(
+            "SELECT high_water_mark FROM sync_state WHERE resource = ?", (resource,)
+        ).fetchone()
+        return row[0] if row else None
+
+    def sync(self) -> dict[str, int]:
+        """Syncs both transactions and customers.
+
+        Returns:
+            The number of records upserted per resource.
+        """
+        return {
+            "transactions": self.sync_transactions(),
+            "customers": self.sync_customers(),
+        }
+
+    def sync_transactions(self) -> int:
+        """Fetches transactions created since the last sync into the mirror.
+
+        Returns:
+            The number of transactions upserted.
+        """
+        return self._sync(
+            "transactions",
+            self._client.transactions.get_transactions,
+            _UPSERT_TRANSACTION,
+            self._transaction_row,
+        )
+
+    def sync_customers(self) -> int:
+        """Fetches customers created since the last sync into the mirror.
+
+        Returns:
+            The number of customers upserted.
+        """
+        return self._sync(
+            "customers",
+            self._client.customers.get_customers,
+            _UPSERT_CUSTOMER,
+            self._customer_row,
+        )
+
+    def resync(self, resource: str) -> int:
+        """Discards the high-water mark of `resource` and fetches all of its records again.
+
+        Args:
+            resource: Either `"transactions"` or `"customers"`.
+        """
+        sync_methods = {
+            "transactions": self.sync_transactions,
+            "customers": self.sync_customers,
+        }
+        if resource not in sync_methods:
+            raise ValueError(f"unsupported resource {resource}")
+        with self._connection:
+            self._connection.execute(
+                "DELETE FROM sync_state WHERE resource = ?", (resource,)
+            )
+        return sync_methods[resource]()
+
+    def get_transaction(self, reference: str) -> Transaction | None:
+        """Gets a mirrored transaction by its reference."""
+        row = self._connection.execute(
+            "SELECT data FROM transactions WHERE reference = ?", (reference,)
+        ).fetchone()
+        return Transaction.model_validate_json(row[0]) if row else None
+
+    def get_transactions(
+        self,
+        customer: int | str | None = None,
+        status: TransactionStatus | str | None = None,
+        start_date: datetime | str | None = None,
+        end_date: datetime | str | None = None,
+        limit: int | None = None,
+    ) -> list[Transaction]:
+        """Queries the mirrored transactions, newest first.
+
+        Args:
+            customer: The customer's ID, email or customer code.
+            status: Filter transactions by status.
+            start_date: Only include transactions created at or after this time.
+            end_date: Only include transactions created at or before this time.
+            limit: The maximum number of transactions to return.
+        """
+        clauses: list[str] = []
+        params: list[Any] = []
+        if customer is not None:
+            if isinstance(customer, int) or str(customer).isdigit():
+                clauses.append("customer_id = ?")
+                params.append(int(customer))
+            elif "@" in customer:
+                clauses.append("customer_email = ?")
+                params.append(customer)
+            else:
+                clauses.append("customer_code = ?")
+                params.append(customer)
+        if status is not None:
+            clauses.append("status = ?")
+            params.append(str(status))
+        if start_date is not None:
+            clauses.append("created_at >= ?")
+            params.append(_to_timestamp(start_date))
+        if end_date is not None:
+            clauses.append("created_at <= ?")
+            params.append(_to_timestamp(end_date))
+        query = "SELECT data FROM transactions"
+        if clauses:
+            query += " WHERE " + " AND ".join(clauses)
+        query += " ORDER BY created_at DESC"
+        if limit is not None:
+            query += " LIMIT ?"
+            params.append(limit)
+        return [
+            Transaction.model_validate_json(row[0])
+            for row in self._connection.execute(query, params)
+        ]
+
+    def get_customer(self, email_or_code: str) -> Customer | None:
+        """Gets a mirrored customer by their email or customer code."""
+        column = "email" if "@" in email_or_code else "customer_code"
+        row = self._connection.execute(
+            f"SELECT data FROM customers WHERE {column} = ?", (email_or_code,)
+        ).fetchone()
+        return Customer.model_validate_json(row[0]) if row else None
+
+    def get_customers(
+        self,
+        start_date: datetime | str | None = None,
+        end_date: datetime | str | None = None,
+        limit: int | None = None,
+    ) -> list[Customer]:
+        """Queries the mirrored customers, newest first.
+
+        Args:
+            start_date: Only include customers created at or after this time.
+            end_date: Only include customers created at or before this time.
+            limit: The maximum number of customers to return.
+        """
+        clauses: list[str] = []
+        params: list[Any] = []
+        if start_date is not None:
+            clauses.append("created_at >= ?")
+            params.append(_to_timestamp(start_date))
+        if end_date is not None:
+            clauses.append("created_at <= ?")
+            params.append(_to_timestamp(end_date))
+        query = "SELECT data FROM customers"
+        if clauses:
+            query += " WHERE " + " AND ".join(clauses)
+        query += " ORDER BY created_at DESC"
+        if limit is not None:
+            query += " LIMIT ?"
+            params.append(limit)
+        return [
+            Customer.model_validate_json(row[0])
+            for row in self._connection.execute(query, params)
+        ]
+
+    def _sync(
+        self,
+        resource: str,
+        method: Any,
+        upsert_statement: str,
+        to_row: Any,
+    ) -> int:
+        row = self._connection.execute(
+            "SELECT high_water_mark, checkpoint FROM sync_state WHERE resource = ?",
+            (resource,),
+        ).fetchone()
+        high_water_mark, saved_checkpoint = row if row else (None, None)
+        if saved_checkpoint:
+            paginator = Paginator(
+                method,
+                checkpoint=PaginationCheckpoint.model_validate_json(saved_checkpoint),
+            )
+        else:
+            paginator = Paginator(
+                method, pagination=self._pagination, start_date=high_water_mark
+            )
+        upserted = 0
+        for page in paginator.pages():
+            rows = [to_row(record) for record in page]
+            with self._connection:
+                self._connection.executemany(upsert_statement, rows)
+                self._save_state(resource, high_water_mark, paginator.checkpoint)
+            upserted += len(rows)
+        newest = self._connection.execute(
+            f"SELECT MAX(created_at) FROM {resource}"
+        ).fetchone()[0]
+        with self._connection:
+            self._save_state(resource, newest or high_water_mark, None)
+        return upserted
+
+    def _save_state(
+        self,
+        resource: str,
+        high_water_mark: str | None,
+        checkpoint: PaginationCheckpoint | None,
+    ) -> None:
+        self._connection.execute(
+            "INSERT INTO sync_state (resource, high_water_mark, checkpoint) VALUES (?, ?, ?) "
+            "ON CONFLICT (resource) DO UPDATE SET "
+            "high_water_mark = excluded.high_water_mark, checkpoint = excluded.checkpoint",
+            (
+                resource,
+                high_water_mark,
+                checkpoint.model_dump_json() if checkpoint else None,
+            ),
+        )
+
+    @staticmethod
+    def _transaction_row(transaction: Transaction) -> tuple[Any, ...]:
+        customer = transaction.customer
+        if isinstance(customer, Customer):
+            customer_id, email, code = (
+                customer.id,
+                customer.email,
+                customer.customer_code,
+            )
+        else:
+            customer_id = customer.get("id")
+            email = customer.get("email")
+            code = customer.get("customer_code")
+        return (
+            transaction.id,
+            transaction.reference,
+            customer_id,
+            email,
+            code,
+            transaction.status,
+            transaction.amount,
+            str(transaction.currency),
+            _to_timestamp(transaction.created_at),
+            _to_timestamp(transaction.paid_at),
+            transaction.model_dump_json(),
+        )
+
+    @staticmethod
+    def _customer_row(customer: Customer) -> tuple[Any, ...]:
+        return (
+            customer.id,
+            customer.email,
+            customer.customer_code,
+            _to_timestamp(customer.created_at),
+            _to_timestamp(customer.updated_at),
+            customer.model_dump_json(),
+        )
@@ -0,0 +1,314 @@
+import inspect
+import os
+import tempfile
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, AsyncIterator, Awaitable, Callable, Iterator, Self
+
+from pydantic import BaseModel
+
+from pypaystack2.exceptions import PaystackResponseError
+from pypaystack2.models import Response
+
+
+class PaginationCheckpoint(BaseModel):
+    """A pydantic model for representing the position of a paginated scan.
+
+    A checkpoint can be saved to disk and loaded back to resume a scan exactly
+    where it stopped.
+
+    Attributes:
+        filters: The keyword arguments passed to the list method on every page request
+            excluding `page`, `pagination`, `start_date` and `end_date`.
+        pagination: The number of records requested per page.
+        page: The page the scan is currently on.
+        offset: The number of records on `page` that have already been consumed.
+        start_date: The lower time bound of the scan.
+        end_date: The upper time bound of the scan. Paystack lists records newest first,
+            fixing this bound keeps records created during a scan from shifting the pages.
+        completed: `True` when the last page has been consumed.
+    """
+
+    filters: dict[str, Any] = {}
+    pagination: int = 50
+    page: int = 1
+    offset: int = 0
+    start_date: str | None = None
+    end_date: str | None = None
+    completed: bool = False
+
+    def save(self, path: str | Path) -> None:
+        """Atomically writes the checkpoint to `path` as json.
+
+        Args:
+            path: The file the checkpoint is written to.
+        """
+        path = Path(path)
+        fd, tmp_path = tempfile.mkstemp(dir=path.parent, prefix=path.name)
+        try:
+            with os.fdopen(fd, "w") as tmp_file:
+                tmp_file.write(self.model_dump_json())
+            os.replace(tmp_path, path)
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
+
+    @classmethod
+    def load(cls, path: str | Path) -> Self:
+        """Loads a checkpoint previously written with `PaginationCheckpoint.save`.
+
+        Args:
+            path: The file the checkpoint was written to.
+        """
+        return cls.model_validate_json(Path(path).read_text())
+
+
+class _BasePaginator:
+    def __init__(
+        self,
+        method: Callable[..., Any],
+        checkpoint: PaginationCheckpoint | None = None,
+        pagination: int = 50,
+        start_date: str | None = None,
+        end_date: str | None = None,
+        freeze_end_date: bool = True,
+        **filters: Any,
+    ):
+        self._method = method
+        parameters = inspect.signature(method).parameters
+        if "page" not in parameters:
+            raise ValueError(f"{method.__qualname__} does not support pagination")
+        if checkpoint is None:
+            if freeze_end_date and end_date is None and "end_date" in parameters:
+                end_date = (
+                    datetime.now(timezone.utc)
+                    .isoformat(timespec="milliseconds")
+                    .replace("+00:00", "Z")
+                )
+            checkpoint = PaginationCheckpoint(
+                filters=filters,
+                pagination=pagination,
+                start_date=start_date,
+                end_date=end_date,
+            )
+        self._checkpoint = checkpoint.model_copy(deep=True)
+        self._supports_pagination = "pagination" in parameters
+        self._supports_time_bounds = "start_date" in parameters
+
+    @property
+    def checkpoint(self) -> PaginationCheckpoint:
+        """A copy of the current position of the scan."""
+        return self._checkpoint.model_copy(deep=True)
+
+    def _request_kwargs(self) -> dict[str, Any]:
+        kwargs = dict(self._checkpoint.filters)
+        kwargs["page"] = self._checkpoint.page
+        if self._supports_pagination:
+            kwargs["pagination"] = self._checkpoint.pagination
+        if self._supports_time_bounds:
+            kwargs["start_date"] = self._checkpoint.start_date
+            kwargs["end_date"] = self._checkpoint.end_date
+        return kwargs
+
+    def _extract_items(self, response: Response[Any]) -> list[Any]:
+        if not response.status:
+            raise PaystackResponseError(
+                f"unable to fetch page {self._checkpoint.page}: {response.message}",
+                response,
+            )
+        if response.data is None:
+            raw_data = (
+                response.raw.get("data") if isinstance(response.raw, dict) else None
+            )
+            if raw_data:
+                raise PaystackResponseError(
+                    f"unable to deserialize page {self._checkpoint.page}. "
+                    "Consider passing an `alternate_model_class`",
+                    response,
+                )
+            return []
+        return list(response.data)
+
+    def _is_last_page(self, response: Response[Any], items: list[Any]) -> bool:
+        meta = response.meta or {}
+        page_count = meta.get("pageCount", meta.get("page_count"))
+        if page_count is not None:
+            return self._checkpoint.page >= int(page_count)
+        return len(items) < self._checkpoint.pagination
+
+    def _advance_page(self) -> None:
+        self._checkpoint.page += 1
+        self._checkpoint.offset = 0
+
+
+class Paginator(_BasePaginator):
+    """Iterates over every record returned by a paginated list method of a sub client.
+
+    Example:
+        ```python
+        from pypaystack2 import PaystackClient
+        from pypaystack2.helpers import Paginator, PaginationCheckpoint
+
+        client = PaystackClient()
+        paginator = Paginator(client.transactions.get_transactions, pagination=100)
+        for transaction in paginator:
+            process(transaction)
+            paginator.checkpoint.save("scan.json")
+
+        # after a crash
+        checkpoint = PaginationCheckpoint.load("scan.json")
+        for transaction in Paginator(client.transactions.get_transactions, checkpoint=checkpoint):
+            process(transaction)
+        ```
+    """
+
+    def __init__(
+        self,
+        method: Callable[..., Response[Any]],
+        checkpoint: PaginationCheckpoint | None = None,
+        pagination: int = 50,
+        start_date: str | None = None,
+        end_date: str | None = None,
+        freeze_end_date: bool = True,
+        **filters: Any,
+    ):
+        """
+        Args:
+            method: A bound list method of a sub client that accepts a `page` parameter.
+                e.g. `PaystackClient.transactions.get_transactions`
+            checkpoint: A checkpoint to resume the scan from. When provided, the other
+                arguments are ignored in favour of those stored in the checkpoint.
+            pagination: Specifies how many records you want to retrieve per page.
+            start_date: A timestamp from which to start listing records.
+            end_date: A timestamp at which to stop listing records.
+            freeze_end_date: When `True` and `end_date` is not provided, `end_date` is set
+                to the time the scan started so records created during the scan
+                do not shift the pages.
+            filters: Additional keyword arguments passed to `method` on every page request.
+        """
+        super().__init__(
+            method,
+            checkpoint,
+            pagination,
+            start_date,
+            end_date,
+            freeze_end_date,
+            **filters,
+        )
+
+    def pages(self) -> Iterator[list[Any]]:
+        """Yields the unconsumed records of every remaining page.
+
+        A page counts as consumed once it is yielded, so a checkpoint saved while
+        processing it resumes after it.
+        """
+        while not self._checkpoint.completed:
+            response = self._method(**self._request_kwargs())
+            items = self._extract_items(response)
+            page = items[self._checkpoint.offset :]
+            if self._is_last_page(response, items):
+                self._checkpoint.offset = len(items)
+                self._checkpoint.completed = True
+            else:
+                self._advance_page()
+            if page:
+                yield page
+
+    def __iter__(self) -> Iterator[Any]:
+        while not self._checkpoint.completed:
+            response = self._method(**self._request_kwargs())
+            items = self._extract_items(response)
+            is_last_page = self._is_last_page(response, items)
+            for index in range(self._checkpoint.offset, len(items)):
+                # a record counts as consumed once it is yielded, so a checkpoint
+                # saved while processing it resumes after it
+                self._checkpoint.offset = index + 1
+                yield items[index]
+            if is_last_page:
+                self._checkpoint.completed = True
+            else:
+                self._advance_page()
+
+
+class AsyncPaginator(_BasePaginator):
+    """Iterates over every record returned by a paginated list method of an async sub client.
+
+    Example:
+        ```python
+        from pypaystack2 import AsyncPaystackClient
+        from pypaystack2.helpers import AsyncPaginator
+
+        client = AsyncPaystackClient()
+        paginator = AsyncPaginator(client.customers.get_customers, pagination=100)
+        async for customer in paginator:
+            await process(customer)
+            paginator.checkpoint.save("scan.json")
+        ```
+    """
+
+    def __init__(
+        self,
+        method: Callable[..., Awaitable[Response[Any]]],
+        checkpoint: PaginationCheckpoint | None = None,
+        pagination: int = 50,
+        start_date: str | None = None,
+        end_date: str | None = None,
+        freeze_end_date: bool = True,
+        **filters: Any,
+    ):
+        """
+        Args:
+            method: A bound list method of an async sub client that accepts a `page` parameter.
+                e.g. `AsyncPaystackClient.transactions.get_transactions`
+            checkpoint: A checkpoint to resume the scan from. When provided, the other
+                arguments are ignored in favour of those stored in the checkpoint.
+            pagination: Specifies how many records you want to retrieve per page.
+            start_date: A timestamp from which to start listing records.
+            end_date: A timestamp at which to stop listing records.
+            freeze_end_date: When `True` and `end_date` is not provided, `end_date` is set
+                to the time the scan started so records created during the scan
+                do not shift the pages.
+            filters: Additional keyword arguments passed to `method` on every page request.
+        """
+        super().__init__(
+            method,
+            checkpoint,
+            pagination,
+            start_date,
+            end_date,
+            freeze_end_date,
+            **filters,
+        )
+
+    async def pages(self) -> AsyncIterator[list[Any]]:
+        """Yields the unconsumed records of every remaining page.
+
+        A page counts as consumed once it is yielded, so a checkpoint saved while
+        processing it resumes after it.
+        """
+        while not self._checkpoint.completed:
+            response = await self._method(**self._request_kwargs())
+            items = self._extract_items(response)
+            page = items[self._checkpoint.offset :]
+            if self._is_last_page(response, items):
+                self._checkpoint.offset = len(items)
+                self._checkpoint.completed = True
+            else:
+                self._advance_page()
+            if page:
+                yield page
+
+    async def __aiter__(self) -> AsyncIterator[Any]:
+        while not self._checkpoint.completed:
+            response = await self._method(**self._request_kwargs())
+            items = self._extract_items(response)
+            is_last_page = self._is_last_page(response, items)
+            for index in range(self._checkpoint.offset, len(items)):
+                # a record counts as consumed once it is yielded, so a checkpoint
+                # saved while processing it resumes after it
+                self._checkpoint.offset = index + 1
+                yield items[index]
+            if is_last_page:
+                self._checkpoint.completed = True
+            else:
+                self._advance_page()
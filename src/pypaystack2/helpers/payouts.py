@@ -0,0 +1,339 @@
+import asyncio
+import time
+from http import HTTPStatus
+from typing import TYPE_CHECKING, Any
+
+from pypaystack2.enums import Currency
+from pypaystack2.exceptions import PaystackResponseError
+from pypaystack2.helpers.bulk_transfers import MAX_BULK_TRANSFER_SIZE
+from pypaystack2.models import BulkTransferItem, IntegrationBalance, TransferInstruction
+
+if TYPE_CHECKING:  # pragma: no cover
+    from pypaystack2.main_clients import AsyncPaystackClient
+
+_RETRYABLE_STATUS_CODES = {HTTPStatus.REQUEST_TIMEOUT, HTTPStatus.TOO_MANY_REQUESTS}
+
+
+def _is_retryable(error: Exception) -> bool:
+    """Whether a failed balance check may succeed if it is made again."""
+    response = error.response if isinstance(error, PaystackResponseError) else None
+    if response is None:  # e.g. a network error
+        return True
+    return (
+        response.status_code in _RETRYABLE_STATUS_CODES
+        or response.status_code >= HTTPStatus.INTERNAL_SERVER_ERROR
+    )
+
+
+class _QueuedPayout:
+    def __init__(self, instruction: TransferInstruction, fee: int):
+        self.instruction = instruction
+        self.fee = fee
+        # the balance is debited with the amount and the transfer fee
+        self.cost = instruction.amount + fee
+        self.queued_at = time.monotonic()
+        self.future: asyncio.Future[BulkTransferItem] = (
+            asyncio.get_running_loop().create_future()
+        )
+
+
+class PayoutScheduler:
+    """Queues payouts and sends them as bulk transfers that fit the available balance.
+
+    Payouts submitted one at a time are packed into `AsyncPaystackClient.transfers.bulk_transfer`
+    requests of at most `max_batch_size` transfers. A batch is sent when the queue holds
+    `max_batch_size` payouts or its oldest payout has waited `max_wait` seconds. Only
+    payouts the balance returned by `transfer_control.check_balance` can cover are
+    packed into a batch, together with the transfer fee paystack debits for each of them.
+    The balance is cached for `balance_ttl` seconds and reduced by every batch sent, so
+    most batches do not need a balance check. Payouts that do not fit stay queued until
+    the balance allows them. Use `asyncio.wait_for` on `PayoutScheduler.submit` to give
+    up on a payout the balance does not cover in time, a cancelled payout is removed
+    from the queue. A balance check that fails with a network error, a rate limit or a
+    server error is retried with exponential backoff, the queued payouts only fail once
+    `max_balance_attempts` checks in a row failed or a check is rejected otherwise.
+
+    Example:
+        ```python
+        from pypaystack2 import AsyncPaystackClient
+        from pypaystack2.helpers import PayoutScheduler
+        from pypaystack2.models import TransferInstruction
+
+        async with PayoutScheduler(AsyncPaystackClient(), max_wait=2) as scheduler:
+            item = await scheduler.submit(
+                TransferInstruction(
+                    amount=50_000, recipient="RCP_xxx", reference="payout-1", reason="Payout"
+                )
+            )
+            print(item.transfer_code, item.status)
+        ```
+    """
+
+    def __init__(
+        self,
+        client: "AsyncPaystackClient",
+        currency: Currency = Currency.NGN,
+        max_batch_size: int = MAX_BULK_TRANSFER_SIZE,
+        max_wait: float = 1.0,
+        balance_ttl: float = 10.0,
+        source: str = "balance",
+        fee_options: dict[str, Any] | None = None,
+        balance_retry_delay: float = 1.0,
+        max_balance_attempts: int = 5,
+    ):
+        """
+        Args:
+            client: The client used to check the balance and send the transfers.
+            currency: The currency of the balance the payouts are paid from.
+            max_batch_size: The maximum number of transfers sent per request.
+            max_wait: The longest time in seconds a payout waits for its batch to fill up.
+            balance_ttl: The number of seconds a fetched balance is used for.
+            source: The source of the funds to transfer.
+            fee_options: The options of `calculate_fee` for the transfer fee of the
+                payouts, e.g. `{"service": "transfers_to_bank_accounts"}` for GHS. It
+                defaults to `{"service": "transfers"}`.
+            balance_retry_delay: The number of seconds before a failed balance check is
+                retried, doubled after every failed attempt.
+            max_balance_attempts: The number of balance checks in a row that may fail
+                before the queued payouts fail.
+
+        Raises:
+            ValueError: If the transfer fee of `currency` can not be calculated with `fee_options`.
+        """
+        if not 1 <= max_batch_size <= MAX_BULK_TRANSFER_SIZE:
+            raise ValueError(
+                f"max_batch_size must be between 1 and {MAX_BULK_TRANSFER_SIZE}"
+            )
+        if max_balance_attempts < 1:
+            raise ValueError("max_balance_attempts must be at least 1")
+        self._fee_schedule = client.fee_schedule(
+            currency,
+            **(fee_options if fee_options is not None else {"service": "transfers"}),
+        )
+        self._client = client
+        self.currency = currency
+        self.max_batch_size = max_batch_size
+        self.max_wait = max_wait
+        self.balance_ttl = balance_ttl
+        self.source = source
+        self._queue: list[_QueuedPayout] = []
+        self._balance: int | None = None
+        self._balance_expires_at = 0.0
+        self.balance_retry_delay = balance_retry_delay
+        self.max_balance_attempts = max_balance_attempts
+        self._failed_balance_checks = 0
+        self._retry_balance_at = 0.0
+        self._wakeup = asyncio.Event()
+        self._task: asyncio.Task[None] | None = None
+        self._closing = False
+
+    @property
+    def pending(self) -> int:
+        """The number of queued payouts."""
+        return sum(1 for payout in self._queue if not payout.future.done())
+
+    async def submit(self, instruction: TransferInstruction) -> BulkTransferItem:
+        """Queues a payout and waits until it is sent.
+
+        Args:
+            instruction: The payout. It must have a reference, so a payout that failed
+                because its batch may or may not have been queued can be submitted
+                again with the same reference without being paid twice.
+
+        Returns:
+            The `BulkTransferItem` paystack returned for the payout.
+
+        Raises:
+            PaystackResponseError: If the batch of the payout was rejected, paystack
+                did not return an item for it or the balance could not be checked.
+            ValueError: If the payout has no reference or the transfer fee of the
+                amount can not be calculated.
+        """
+        if self._task is None:
+            raise RuntimeError("PayoutScheduler is not running, use `async with`")
+        if instruction.reference is None:
+            raise ValueError("the payout must have a reference")
+        payout = _QueuedPayout(instruction, self._fee_schedule.fee(instruction.amount))
+        self._queue.append(payout)
+        self._wakeup.set()
+        return await payout.future
+
+    async def available_balance(self) -> int:
+        """Returns the balance available for payouts, fetching it if the cached balance expired."""
+        if self._balance is None or time.monotonic() >= self._balance_expires_at:
+            response = await self._client.transfer_control.check_balance()
+            balances = response.data if response.status else None
+            if not isinstance(balances, list):
+                raise PaystackResponseError(
+                    f"unable to check balance: {response.message}", response
+                )
+            self._balance = next(
+                (
+                    balance.balance
+                    for balance in balances
+                    if isinstance(balance, IntegrationBalance)
+                    and balance.currency == self.currency
+                ),
+                0,
+            )
+            self._balance_expires_at = time.monotonic() + self.balance_ttl
+        return self._balance
+
+    def _is_due(self) -> bool:
+        if self.pending >= self.max_batch_size:
+            return True
+        return any(
+            time.monotonic() - payout.queued_at >= self.max_wait
+            for payout in self._queue
+            if not payout.future.done()
+        )
+
+    def _pack(self, balance: int) -> list[_QueuedPayout]:
+        """Takes the oldest payouts the balance can cover off the queue."""
+        batch: list[_QueuedPayout] = []
+        remaining: list[_QueuedPayout] = []
+        for payout in self._queue:
+            if payout.future.done():  # cancelled while queued
+                continue
+            if len(batch) < self.max_batch_size and payout.cost <= balance:
+                batch.append(payout)
+                balance -= payout.cost
+            else:
+                remaining.append(payout)
+        self._queue = remaining
+        return batch
+
+    async def flush(self) -> int:
+        """Sends the queued payouts the balance can cover without waiting for their batch to fill up.
+
+        Returns:
+            The number of payouts sent.
+        """
+        sent = 0
+        while self.pending and time.monotonic() >= self._retry_balance_at:
+            try:
+                balance = await self.available_balance()
+            except Exception as error:
+                self._balance_check_failed(error)
+                break
+            self._failed_balance_checks = 0
+            batch = self._pack(balance)
+            if not batch:
+                break
+            await self._send(batch)
+            sent += len(batch)
+        return sent
+
+    def _balance_check_failed(self, error: Exception) -> None:
+        self._failed_balance_checks += 1
+        if (
+            _is_retryable(error)
+            and self._failed_balance_checks < self.max_balance_attempts
+        ):
+            # keep the queue and check the balance again after backing off
+            self._retry_balance_at = (
+                time.monotonic()
+                + self.balance_retry_delay * 2 ** (self._failed_balance_checks - 1)
+            )
+            return
+        self._failed_balance_checks = 0
+        self._fail(self._queue, error)
+        self._queue = []
+
+    async def _send(self, batch: list[_QueuedPayout]) -> None:
+        try:
+            response = await self._client.transfers.bulk_transfer(
+                [payout.instruction for payout in batch], source=self.source
+            )
+        except Exception as error:
+            self._balance = None  # the transfers may or may not have been queued
+            self._fail(batch, error)
+            return
+        if not response.status or not isinstance(response.data, list):
+            self._balance = None
+            self._fail(
+                batch,
+                PaystackResponseError(
+                    f"unable to send payouts: {response.message}", response
+                ),
+            )
+            return
+        items = {
+            item.reference: item
+            for item in response.data
+            if isinstance(item, BulkTransferItem)
+        }
+        for payout in batch:
+            item = items.get(payout.instruction.reference or "")
+            if item is None:
+                self._fail(
+                    [payout],
+                    PaystackResponseError(
+                        f"no transfer returned for {payout.instruction.reference}",
+                        response,
+                    ),
+                )
+                continue
+            if self._balance is not None:
+                self._balance -= item.amount + payout.fee
+            if not payout.future.done():
+                payout.future.set_result(item)
+
+    @staticmethod
+    def _fail(payouts: list[_QueuedPayout], error: Exception) -> None:
+        for payout in payouts:
+            if not payout.future.done():
+                payout.future.set_exception(error)
+
+    def _seconds_until_due(self) -> float | None:
+        queued_at = [
+            payout.queued_at for payout in self._queue if not payout.future.done()
+        ]
+        if not queued_at:
+            return None
+        return max(0.0, min(queued_at) + self.max_wait - time.monotonic())
+
+    async def _run(self) -> None:
+        while not self._closing:
+            self._wakeup.clear()
+            timeout = self._seconds_until_due()
+            if self._is_due():
+                if await self.flush() or not self.pending:
+                    continue
+                # nothing queued fits the balance, wait for it to be refreshed
+                refresh_at = max(self._balance_expires_at, self._retry_balance_at)
+                timeout = max(0.0, refresh_at - time.monotonic())
+            try:
+                await asyncio.wait_for(self._wakeup.wait(), timeout)
+            except TimeoutError:
+                pass
+        await self.flush()
+
+    async def __aenter__(self) -> "PayoutScheduler":
+        self._closing = False
+        self._task = asyncio.create_task(self._run())
+        return self
+
+    async def __aexit__(self, *args: Any) -> None:
+        await self.close()
+
+    async def close(self) -> None:
+        """Sends the queued payouts the balance can cover and stops the scheduler.
+
+        Payouts that are still queued afterwards fail with `PaystackResponseError`.
+        """
+        if self._task is None:
+            return
+        self._closing = True
+        self._wakeup.set()
+        try:
+            await self._task
+        finally:
+            self._task = None
+            self._fail(
+                self._queue,
+                PaystackResponseError(
+                    "the scheduler was closed before the balance could cover the payout"
+                ),
+            )
+            self._queue = []
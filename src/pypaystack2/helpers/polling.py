@@ -0,0 +1,48 @@
+class AdaptivePollInterval:
+    """Poll intervals that start fast and back off while the polled resource is not changing.
+
+    Example:
+        ```python
+        interval = AdaptivePollInterval(initial=1, maximum=30)
+        while not done:
+            progressed = poll()
+            time.sleep(interval.next(progressed))
+        ```
+    """
+
+    def __init__(
+        self, initial: float = 1.0, maximum: float = 60.0, factor: float = 2.0
+    ):
+        """
+        Args:
+            initial: The interval in seconds used after the resource changes.
+            maximum: The longest interval in seconds.
+            factor: The number the interval is multiplied by on every poll that
+                finds the resource unchanged.
+        """
+        if initial <= 0:
+            raise ValueError("initial must be greater than 0")
+        if maximum < initial:
+            raise ValueError("maximum must not be less than initial")
+        if factor < 1:
+            raise ValueError("factor must be at least 1")
+        self.initial = initial
+        self.maximum = maximum
+        self.factor = factor
+        self.current = initial
+
+    def next(self, progressed: bool) -> float:
+        """Returns the interval to wait before the next poll.
+
+        Args:
+            progressed: Whether the last poll found the resource changed.
+        """
+        if progressed:
+            self.current = self.initial
+        else:
+            self.current = min(self.maximum, self.current * self.factor)
+        return self.current
+
+    def reset(self) -> None:
+        """Starts polling fast again."""
+        self.current = self.initial
@@ -0,0 +1,171 @@
+import asyncio
+import threading
+import time
+from typing import TYPE_CHECKING, Any
+
+from pydantic import ValidationError
+
+from pypaystack2.exceptions import ClientNetworkError
+from pypaystack2.helpers.events import EventBus
+from pypaystack2.helpers.polling import AdaptivePollInterval
+from pypaystack2.models import Response, Transaction
+from pypaystack2.webhook.enums import PaystackWebhookEvent
+from pypaystack2.webhook.models import PaystackWebhookPayload
+
+if TYPE_CHECKING:  # pragma: no cover
+    from pypaystack2.main_clients import AsyncPaystackClient, PaystackClient
+
+FINAL_TRANSACTION_STATUSES = frozenset({"success", "failed", "reversed"})
+"""The statuses a transaction does not move out of."""
+
+
+def _settled_transaction(response: Response[Any] | None) -> Transaction | None:
+    transaction = response.data if response is not None and response.status else None
+    if (
+        isinstance(transaction, Transaction)
+        and transaction.status in FINAL_TRANSACTION_STATUSES
+    ):
+        return transaction
+    return None
+
+
+def _event_transaction(payloads: list[PaystackWebhookPayload]) -> Transaction | None:
+    for payload in payloads:
+        try:
+            transaction = Transaction.model_validate(payload.data)
+        except ValidationError:  # fall back to verifying the transaction
+            continue
+        if transaction.status in FINAL_TRANSACTION_STATUSES:
+            return transaction
+    return None
+
+
+def _timeout_error(reference: str, timeout: float) -> TimeoutError:
+    return TimeoutError(f"transaction {reference} did not settle within {timeout}s")
+
+
+def wait_for_transaction(
+    client: "PaystackClient",
+    reference: str,
+    timeout: float = 60.0,
+    event_bus: EventBus | None = None,
+    poll_interval: float = 1.0,
+    max_poll_interval: float = 30.0,
+    backoff_factor: float = 2.0,
+) -> Transaction:
+    """Blocks until a transaction is settled and returns it.
+
+    The transaction is verified right away, then again at intervals that back off from
+    `poll_interval` to `max_poll_interval`. If an `event_bus` is provided, a
+    `charge.success` webhook event for the transaction ends the wait immediately.
+    A verification that fails with a `ClientNetworkError` is retried at the next
+    interval until `timeout`.
+
+    Args:
+        client: The client used to verify the transaction.
+        reference: The reference of the transaction.
+        timeout: The longest time in seconds to wait.
+        event_bus: An optional `EventBus` that webhook events are published to.
+        poll_interval: The interval in seconds before the second verification.
+        max_poll_interval: The longest interval in seconds between verifications.
+        backoff_factor: The number the interval is multiplied by after every verification.
+
+    Raises:
+        TimeoutError: If the transaction did not settle within `timeout` seconds.
+    """
+    deadline = time.monotonic() + timeout
+    interval = AdaptivePollInterval(poll_interval, max_poll_interval, backoff_factor)
+    received = threading.Event()
+    payloads: list[PaystackWebhookPayload] = []
+
+    def on_event(payload: PaystackWebhookPayload) -> None:
+        if payload.event == PaystackWebhookEvent.CHARGE_SUCCESS:
+            payloads.append(payload)
+            received.set()
+
+    unsubscribe = event_bus.subscribe(reference, on_event) if event_bus else None
+    try:
+        while True:
+            if received.is_set():
+                received.clear()
+                if transaction := _event_transaction(payloads):
+                    return transaction
+            try:
+                response = client.transactions.verify(reference)
+            except ClientNetworkError:  # not settled as far as we know, verify again
+                response = None
+            if transaction := _settled_transaction(response):
+                return transaction
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                raise _timeout_error(reference, timeout)
+            received.wait(min(interval.current, remaining))
+            interval.next(False)
+    finally:
+        if unsubscribe is not None:
+            unsubscribe()
+
+
+async def await_transaction(
+    client: "AsyncPaystackClient",
+    reference: str,
+    timeout: float = 60.0,
+    event_bus: EventBus | None = None,
+    poll_interval: float = 1.0,
+    max_poll_interval: float = 30.0,
+    backoff_factor: float = 2.0,
+) -> Transaction:
+    """Waits until a transaction is settled and returns it.
+
+    The async version of `wait_for_transaction`. Events published to `event_bus` from
+    other threads are handed over to the waiter's event loop.
+
+    Args:
+        client: The client used to verify the transaction.
+        reference: The reference of the transaction.
+        timeout: The longest time in seconds to wait.
+        event_bus: An optional `EventBus` that webhook events are published to.
+        poll_interval: The interval in seconds before the second verification.
+        max_poll_interval: The longest interval in seconds between verifications.
+        backoff_factor: The number the interval is multiplied by after every verification.
+
+    Raises:
+        TimeoutError: If the transaction did not settle within `timeout` seconds.
+    """
+    loop = asyncio.get_running_loop()
+    deadline = loop.time() + timeout
+    interval = AdaptivePollInterval(poll_interval, max_poll_interval, backoff_factor)
+    received = asyncio.Event()
+    payloads: list[PaystackWebhookPayload] = []
+
+    def on_event(payload: PaystackWebhookPayload) -> None:
+        if payload.event == PaystackWebhookEvent.CHARGE_SUCCESS:
+            payloads.append(payload)
+            loop.call_soon_threadsafe(received.set)
+
+    unsubscribe = event_bus.subscribe(reference, on_event) if event_bus else None
+    try:
+        while True:
+            if received.is_set():
+                received.clear()
+                if transaction := _event_transaction(payloads):
+                    return transaction
+            try:
+                response = await client.transactions.verify(reference)
+            except ClientNetworkError:  # not settled as far as we know, verify again
+                response = None
+            if transaction := _settled_transaction(response):
+                return transaction
+            remaining = deadline - loop.time()
+            if remaining <= 0:
+                raise _timeout_error(reference, timeout)
+            try:
+                await asyncio.wait_for(
+                    received.wait(), min(interval.current, remaining)
+                )
+            except TimeoutError:
+                pass
+            interval.next(False)
+    finally:
+        if unsubscribe is not None:
+            unsubscribe()
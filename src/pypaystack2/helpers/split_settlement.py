@@ -0,0 +1,421 @@
+from decimal import Decimal
+from typing import TYPE_CHECKING, Any, Sequence
+
+from pypaystack2.enums import Bearer, Currency, Split
+from pypaystack2.exceptions import PaystackResponseError
+from pypaystack2.fees import numpy
+from pypaystack2.models import Response, TransactionSplit
+
+if TYPE_CHECKING:  # pragma: no cover
+    from pypaystack2.main_clients import AsyncPaystackClient, PaystackClient
+
+MAIN_ACCOUNT = Bearer.ACCOUNT.value
+"""The key of the share of the integration itself in `SplitShares.accounts`."""
+
+_INT64_MAX = 2**63 - 1
+
+
+class SplitShares:
+    """How the amounts of a batch of transactions are divided by a transaction split.
+
+    Shares are in the subunit of the currency, e.g. kobo. Every matrix has a row per
+    account, in the order of `accounts`, and a column per transaction. They are numpy
+    arrays when the shares were computed with numpy and lists of lists otherwise.
+
+    Attributes:
+        split_code: The code of the split.
+        currency: The currency of the amounts.
+        accounts: The codes of the subaccounts of the split followed by `MAIN_ACCOUNT`.
+        gross_shares: The share of every account before fees.
+        fee_shares: The fees borne by every account.
+        net_shares: The amount settled to every account, i.e. its gross share minus its fees.
+    """
+
+    def __init__(
+        self,
+        split_code: str,
+        currency: Currency,
+        accounts: tuple[str, ...],
+        gross_shares: Any,
+        fee_shares: Any,
+        net_shares: Any,
+    ):
+        self.split_code = split_code
+        self.currency = currency
+        self.accounts = accounts
+        self.gross_shares = gross_shares
+        self.fee_shares = fee_shares
+        self.net_shares = net_shares
+
+    @staticmethod
+    def _totals(accounts: tuple[str, ...], shares: Any) -> dict[str, int]:
+        if numpy is not None and isinstance(shares, numpy.ndarray):
+            return dict(zip(accounts, shares.sum(axis=1).tolist()))
+        return {account: sum(row) for account, row in zip(accounts, shares)}
+
+    @property
+    def totals(self) -> dict[str, int]:
+        """The amount settled to every account over the batch."""
+        return self._totals(self.accounts, self.net_shares)
+
+    @property
+    def fee_totals(self) -> dict[str, int]:
+        """The fees borne by every account over the batch."""
+        return self._totals(self.accounts, self.fee_shares)
+
+    def share(self, account: str) -> Any:
+        """Returns the amount settled to an account for every transaction.
+
+        Args:
+            account: The code of a subaccount of the split or `MAIN_ACCOUNT`.
+
+        Raises:
+            KeyError: If the account is not part of the split.
+        """
+        try:
+            return self.net_shares[self.accounts.index(account)]
+        except ValueError:
+            raise KeyError(account)
+
+
+class SplitRule:
+    """A transaction split compiled to compute the shares of many transactions at once.
+
+    Percentage shares are rounded down to the subunit and flat shares are in the
+    subunit of the currency. The integration receives what the subaccounts do not.
+    Fees are borne according to the bearer type of the split:
+
+    - `account`: by the integration.
+    - `subaccount`: by the bearer subaccount of the split.
+    - `all-proportional`: by every account in proportion to its gross share, rounded
+      down, the integration bearing what rounding leaves.
+    - `all`: by every account in equal parts, the integration bearing what division
+      leaves.
+
+    Attributes:
+        split_code: The code of the split.
+        currency: The currency of the split.
+        type: Whether the shares are percentages of the amounts or flat amounts.
+        bearer_type: Who bears the fees.
+        subaccounts: The code and share of every subaccount.
+        bearer_subaccount: The code of the subaccount bearing the fees when
+            `bearer_type` is `subaccount`.
+    """
+
+    def __init__(
+        self,
+        split_code: str,
+        currency: Currency,
+        type: Split,
+        bearer_type: Bearer,
+        subaccounts: Sequence[tuple[str, int | float | Decimal]],
+        bearer_subaccount: str | None = None,
+    ):
+        self.split_code = split_code
+        self.currency = currency
+        self.type = Split(type)
+        self.bearer_type = Bearer(bearer_type)
+        self.subaccounts = tuple(subaccounts)
+        self.bearer_subaccount = bearer_subaccount
+        self.accounts = (*(code for code, _ in self.subaccounts), MAIN_ACCOUNT)
+        if self.bearer_type == Bearer.SUB_ACCOUNT:
+            if bearer_subaccount not in self.accounts[:-1]:
+                raise ValueError(
+                    f"the bearer subaccount {bearer_subaccount} is not part of the split"
+                )
+            self._bearer = self.accounts.index(bearer_subaccount)
+        else:
+            self._bearer = len(self.subaccounts)
+        # a share of `numerator / denominator` of the amount, or a flat `numerator`
+        self._ratios = [
+            Decimal(str(share)).as_integer_ratio() for _, share in self.subaccounts
+        ]
+        if self.type == Split.PERCENTAGE:
+            self._ratios = [
+                (numerator, denominator * 100)
+                for numerator, denominator in self._ratios
+            ]
+        elif any(denominator != 1 for _, denominator in self._ratios):
+            raise ValueError("flat shares must be whole amounts in the subunit")
+
+    @classmethod
+    def from_split(cls, split: TransactionSplit) -> "SplitRule":
+        """Compiles a split returned by `TransactionSplitClient.get_split`."""
+        bearer_subaccount = split.bearer_subaccount
+        for subaccount in split.subaccounts:
+            # paystack may return the id of the bearer subaccount instead of its code
+            if bearer_subaccount == str(subaccount.subaccount.id):
+                bearer_subaccount = subaccount.subaccount.subaccount_code
+        return cls(
+            split_code=split.split_code,
+            currency=split.currency,
+            type=Split(split.type),
+            bearer_type=Bearer(split.bearer_type),
+            subaccounts=[
+                (subaccount.subaccount.subaccount_code, subaccount.share)
+                for subaccount in split.subaccounts
+            ],
+            bearer_subaccount=bearer_subaccount,
+        )
+
+    def shares(
+        self, amounts: Sequence[int] | Any, fees: Sequence[int] | Any
+    ) -> SplitShares:
+        """Computes how the amounts of a batch of transactions are divided.
+
+        The shares are computed with vectorized integer arithmetic when numpy is
+        installed.
+
+        Args:
+            amounts: The amount of every transaction in its subunit, e.g. kobo.
+            fees: The fee of every transaction, e.g. from `calculate_fees`.
+
+        Raises:
+            ValueError: If `amounts` and `fees` differ in length, or the flat shares of
+                the subaccounts exceed the amount of a transaction.
+        """
+        if len(amounts) != len(fees):
+            raise ValueError(
+                f"{len(fees)} fees were provided for {len(amounts)} amounts"
+            )
+        if numpy is not None:
+            values = numpy.asarray(amounts)
+            fee_values = numpy.asarray(fees)
+            if (
+                values.dtype.kind in "iu"
+                and fee_values.dtype.kind in "iu"
+                and self._fits_int64(values, fee_values)
+            ):
+                return self._vectorized_shares(
+                    values.astype(numpy.int64), fee_values.astype(numpy.int64)
+                )
+        gross_shares: list[list[int]] = [[] for _ in self.accounts]
+        fee_shares: list[list[int]] = [[] for _ in self.accounts]
+        for amount, fee in zip(amounts, fees):
+            gross, borne = self._transaction_shares(int(amount), int(fee))
+            for row, share in zip(gross_shares, gross):
+                row.append(share)
+            for row, share in zip(fee_shares, borne):
+                row.append(share)
+        net_shares = [
+            [gross - fee for gross, fee in zip(gross_row, fee_row)]
+            for gross_row, fee_row in zip(gross_shares, fee_shares)
+        ]
+        return SplitShares(
+            self.split_code,
+            self.currency,
+            self.accounts,
+            gross_shares,
+            fee_shares,
+            net_shares,
+        )
+
+    def _transaction_shares(self, amount: int, fee: int) -> tuple[list[int], list[int]]:
+        if self.type == Split.PERCENTAGE:
+            gross = [
+                amount * numerator // denominator
+                for numerator, denominator in self._ratios
+            ]
+        else:
+            gross = [numerator for numerator, _ in self._ratios]
+        remainder = amount - sum(gross)
+        if remainder < 0:
+            raise ValueError(
+                f"the shares of the subaccounts exceed the amount {amount}"
+            )
+        gross.append(remainder)
+        borne = [0] * len(gross)
+        if self.bearer_type == Bearer.ALL_PROPORTIONAL:
+            if amount:
+                borne[:-1] = [fee * share // amount for share in gross[:-1]]
+        elif self.bearer_type == Bearer.ALL:
+            borne[:-1] = [fee // len(gross)] * (len(gross) - 1)
+        borne[self._bearer] += fee - sum(borne)
+        return gross, borne
+
+    def _fits_int64(self, amounts: Any, fees: Any) -> bool:
+        largest = max(
+            (
+                max(abs(int(values.min())), abs(int(values.max())))
+                for values in (amounts, fees)
+                if values.size
+            ),
+            default=0,
+        )
+        factor = max([largest, 1, *(abs(numerator) for numerator, _ in self._ratios)])
+        return largest * factor * len(self.accounts) < _INT64_MAX
+
+    def _vectorized_shares(self, amounts: Any, fees: Any) -> SplitShares:
+        accounts = len(self.accounts)
+        gross = numpy.zeros((accounts, len(amounts)), dtype=numpy.int64)
+        for row, (numerator, denominator) in enumerate(self._ratios):
+            if self.type == Split.PERCENTAGE:
+                gross[row] = amounts * numerator // denominator
+            else:
+                gross[row] = numerator
+        gross[-1] = amounts - gross[:-1].sum(axis=0)
+        if (gross[-1] < 0).any():
+            amount = int(amounts[gross[-1] < 0][0])
+            raise ValueError(
+                f"the shares of the subaccounts exceed the amount {amount}"
+            )
+        borne = numpy.zeros_like(gross)
+        if self.bearer_type == Bearer.ALL_PROPORTIONAL:
+            borne[:-1] = numpy.where(
+                amounts > 0, fees * gross[:-1] // numpy.maximum(amounts, 1), 0
+            )
+        elif self.bearer_type == Bearer.ALL:
+            borne[:-1] = fees // accounts
+        borne[self._bearer] += fees - borne.sum(axis=0)
+        return SplitShares(
+            self.split_code,
+            self.currency,
+            self.accounts,
+            gross,
+            borne,
+            gross - borne,
+        )
+
+
+class _BaseSplitCalculator:
+    def __init__(self) -> None:
+        self._rules: dict[str, SplitRule] = {}
+
+    def _store(self, id_or_code: int | str, response: Response[Any]) -> SplitRule:
+        if not response.status or not isinstance(response.data, TransactionSplit):
+            raise PaystackResponseError(
+                f"unable to load split {id_or_code}: {response.message}", response
+            )
+        rule = SplitRule.from_split(response.data)
+        for key in (id_or_code, response.data.id, response.data.split_code):
+            self._rules[str(key)] = rule
+        return rule
+
+    def clear(self) -> None:
+        """Forgets the loaded splits, so they are fetched again on their next use."""
+        self._rules.clear()
+
+
+class SplitCalculator(_BaseSplitCalculator):
+    """Computes how transactions are divided by transaction splits without calling paystack per transaction.
+
+    Every split is fetched once with `TransactionSplitClient.get_split`, then the
+    shares of any number of transactions are computed locally, see `SplitRule` for
+    how. Fees default to those `calculate_fees` computes, pass the actual fees of the
+    transactions instead when they are known.
+
+    Example:
+        ```python
+        from pypaystack2 import PaystackClient
+        from pypaystack2.helpers import SplitCalculator
+
+        calculator = SplitCalculator(PaystackClient())
+        shares = calculator.shares("SPL_xxx", [500_000, 1_250_000, 80_000])
+        for account, total in shares.totals.items():
+            print(account, total)
+        ```
+    """
+
+    def __init__(self, client: "PaystackClient"):
+        """
+        Args:
+            client: The client used to fetch splits and calculate fees.
+        """
+        super().__init__()
+        self._client = client
+
+    def load(self, id_or_code: int | str) -> SplitRule:
+        """Returns a split, fetching it from paystack the first time.
+
+        Args:
+            id_or_code: The id or code of the split.
+
+        Raises:
+            PaystackResponseError: If paystack could not return the split.
+        """
+        rule = self._rules.get(str(id_or_code))
+        if rule is None:
+            rule = self._store(id_or_code, self._client.splits.get_split(id_or_code))
+        return rule
+
+    def shares(
+        self,
+        id_or_code: int | str,
+        amounts: Sequence[int] | Any,
+        fees: Sequence[int] | Any | None = None,
+        **fee_options: Any,
+    ) -> SplitShares:
+        """Computes how a split divides the amounts of a batch of transactions.
+
+        Args:
+            id_or_code: The id or code of the split.
+            amounts: The amount of every transaction in its subunit, e.g. kobo.
+            fees: The fee of every transaction. They are computed with `calculate_fees`
+                in the currency of the split if they are not provided.
+            **fee_options: The options of `calculate_fees`, e.g. `service`.
+        """
+        rule = self.load(id_or_code)
+        if fees is None:
+            fees = self._client.calculate_fees(amounts, rule.currency, **fee_options)
+        return rule.shares(amounts, fees)
+
+
+class AsyncSplitCalculator(_BaseSplitCalculator):
+    """Computes how transactions are divided by transaction splits without calling paystack per transaction.
+
+    The async version of `SplitCalculator`.
+
+    Example:
+        ```python
+        from pypaystack2 import AsyncPaystackClient
+        from pypaystack2.helpers import AsyncSplitCalculator
+
+        calculator = AsyncSplitCalculator(AsyncPaystackClient())
+        shares = await calculator.shares("SPL_xxx", [500_000, 1_250_000, 80_000])
+        print(shares.totals)
+        ```
+    """
+
+    def __init__(self, client: "AsyncPaystackClient"):
+        """
+        Args:
+            client: The client used to fetch splits and calculate fees.
+        """
+        super().__init__()
+        self._client = client
+
+    async def load(self, id_or_code: int | str) -> SplitRule:
+        """Returns a split, fetching it from paystack the first time.
+
+        Args:
+            id_or_code: The id or code of the split.
+
+        Raises:
+            PaystackResponseError: If paystack could not return the split.
+        """
+        rule = self._rules.get(str(id_or_code))
+        if rule is None:
+            response = await self._client.splits.get_split(id_or_code)
+            rule = self._store(id_or_code, response)
+        return rule
+
+    async def shares(
+        self,
+        id_or_code: int | str,
+        amounts: Sequence[int] | Any,
+        fees: Sequence[int] | Any | None = None,
+        **fee_options: Any,
+    ) -> SplitShares:
+        """Computes how a split divides the amounts of a batch of transactions.
+
+        Args:
+            id_or_code: The id or code of the split.
+            amounts: The amount of every transaction in its subunit, e.g. kobo.
+            fees: The fee of every transaction. They are computed with `calculate_fees`
+                in the currency of the split if they are not provided.
+            **fee_options: The options of `calculate_fees`, e.g. `service`.
+        """
+        rule = await self.load(id_or_code)
+        if fees is None:
+            fees = self._client.calculate_fees(amounts, rule.currency, **fee_options)
+        return rule.shares(amounts, fees)
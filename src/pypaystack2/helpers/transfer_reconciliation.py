@@ -0,0 +1,261 @@
+import asyncio
+import time
+from collections import deque
+from typing import TYPE_CHECKING, Any, AsyncIterator, Callable, Literal
+
+from pydantic import BaseModel, ValidationError
+
+from pypaystack2.helpers.batch import amap
+from pypaystack2.helpers.polling import AdaptivePollInterval
+from pypaystack2.models import Transfer
+from pypaystack2.webhook.enums import PaystackWebhookEvent
+from pypaystack2.webhook.models import PaystackWebhookPayload
+
+if TYPE_CHECKING:  # pragma: no cover
+    from pypaystack2.main_clients import AsyncPaystackClient
+
+FINAL_TRANSFER_STATUSES = frozenset(
+    {"success", "failed", "reversed", "abandoned", "blocked", "rejected"}
+)
+"""The statuses a transfer does not move out of."""
+
+_TRANSFER_WEBHOOK_STATUSES = {
+    PaystackWebhookEvent.TRANSFER_SUCCESS: "success",
+    PaystackWebhookEvent.TRANSFER_FAILED: "failed",
+    PaystackWebhookEvent.TRANSFER_REVERSED: "reversed",
+}
+
+
+class TransferStateChange(BaseModel):
+    """A pydantic model for representing a change in the status of a tracked transfer.
+
+    Attributes:
+        reference: The reference of the transfer.
+        previous_status: The status of the transfer before the change, `None` if it was unknown.
+        status: The new status of the transfer.
+        final: `True` if `status` is final and the transfer is no longer tracked.
+        source: `poll` if the change was found by verifying the transfer, `webhook`
+            if it was reported by a `transfer.*` webhook event.
+        transfer: The transfer as returned by paystack, `None` if it could not be
+            deserialized from a webhook event.
+    """
+
+    reference: str
+    previous_status: str | None
+    status: str
+    final: bool
+    source: Literal["poll", "webhook"]
+    transfer: Transfer | None = None
+
+
+class _TrackedTransfer:
+    def __init__(
+        self, reference: str, status: str | None, poll_interval: AdaptivePollInterval
+    ):
+        self.reference = reference
+        self.status = status
+        self.poll_interval = poll_interval
+        self.next_poll_at = time.monotonic()
+
+
+class TransferReconciler:
+    """Polls outstanding transfers concurrently until they reach a final status.
+
+    Every tracked transfer is verified with `AsyncPaystackClient.transfers.verify` at its
+    own interval, which starts at `poll_interval` and backs off exponentially up to
+    `max_poll_interval` while its status does not change. A transfer stops being polled
+    once its status is final (see `FINAL_TRANSFER_STATUSES`). `transfer.success`,
+    `transfer.failed` and `transfer.reversed` webhook events passed to
+    `TransferReconciler.handle_webhook` finalize a tracked transfer without waiting for
+    its next poll.
+
+    Example:
+        ```python
+        from pypaystack2 import AsyncPaystackClient
+        from pypaystack2.helpers import TransferReconciler
+
+        reconciler = TransferReconciler(AsyncPaystackClient(), concurrency=20)
+        for transfer in outstanding_transfers:
+            reconciler.track(transfer.reference, transfer.status)
+
+        async for change in reconciler.changes():
+            if change.final:
+                mark_payout(change.reference, change.status)
+
+        # in your webhook handler, running on the same event loop
+        reconciler.handle_webhook(payload)
+        ```
+    """
+
+    def __init__(
+        self,
+        client: "AsyncPaystackClient",
+        concurrency: int = 20,
+        poll_interval: float = 5.0,
+        max_poll_interval: float = 300.0,
+        backoff_factor: float = 2.0,
+    ):
+        """
+        Args:
+            client: The client used to verify the transfers.
+            concurrency: The maximum number of verifications in flight at once.
+            poll_interval: The interval in seconds between polls of a transfer whose status just changed.
+            max_poll_interval: The longest interval in seconds between polls of a transfer.
+            backoff_factor: The number the interval of a transfer is multiplied by on
+                every poll that finds its status unchanged.
+        """
+        self._client = client
+        self.concurrency = concurrency
+        self._poll_interval_options = (poll_interval, max_poll_interval, backoff_factor)
+        AdaptivePollInterval(*self._poll_interval_options)  # validate early
+        self._transfers: dict[str, _TrackedTransfer] = {}
+        self._webhook_changes: deque[TransferStateChange] = deque()
+        self._wakeup: asyncio.Event | None = None
+
+    @property
+    def outstanding(self) -> dict[str, str | None]:
+        """The last known status of every transfer that is not final yet."""
+        return {
+            reference: transfer.status
+            for reference, transfer in self._transfers.items()
+        }
+
+    def track(self, reference: str, status: str | None = None) -> None:
+        """Starts polling a transfer.
+
+        Args:
+            reference: The reference of the transfer.
+            status: The last known status of the transfer, e.g. `pending` or `otp`.
+        """
+        if status in FINAL_TRANSFER_STATUSES or reference in self._transfers:
+            return
+        self._transfers[reference] = _TrackedTransfer(
+            reference, status, AdaptivePollInterval(*self._poll_interval_options)
+        )
+        self._wake()
+
+    def handle_webhook(self, payload: PaystackWebhookPayload | dict[str, Any]) -> bool:
+        """Finalizes a tracked transfer with a `transfer.*` webhook event.
+
+        Args:
+            payload: A verified webhook payload.
+
+        Returns:
+            `True` if the event finalized a tracked transfer.
+        """
+        if isinstance(payload, dict):
+            try:
+                payload = PaystackWebhookPayload.model_validate(payload)
+            except ValidationError:
+                return False
+        status = _TRANSFER_WEBHOOK_STATUSES.get(payload.event)
+        reference = payload.data.get("reference")
+        if status is None or reference not in self._transfers:
+            return False
+        try:
+            transfer = Transfer.model_validate(payload.data)
+        except ValidationError:
+            transfer = None
+        tracked = self._transfers.pop(reference)
+        self._webhook_changes.append(
+            TransferStateChange(
+                reference=reference,
+                previous_status=tracked.status,
+                status=status,
+                final=True,
+                source="webhook",
+                transfer=transfer,
+            )
+        )
+        self._wake()
+        return True
+
+    def _wake(self) -> None:
+        if self._wakeup is not None:
+            self._wakeup.set()
+
+    def _due_references(self) -> list[str]:
+        now = time.monotonic()
+        return [
+            reference
+            for reference, transfer in self._transfers.items()
+            if transfer.next_poll_at <= now
+        ]
+
+    def _record(self, reference: str, response: Any) -> TransferStateChange | None:
+        tracked = self._transfers.get(reference)
+        if tracked is None:  # finalized by a webhook while it was being verified
+            return None
+        transfer = getattr(response, "data", None)
+        if not getattr(response, "status", False) or not isinstance(transfer, Transfer):
+            tracked.next_poll_at = time.monotonic() + tracked.poll_interval.next(False)
+            return None
+        changed = transfer.status != tracked.status
+        tracked.next_poll_at = time.monotonic() + tracked.poll_interval.next(changed)
+        if not changed:
+            return None
+        final = transfer.status in FINAL_TRANSFER_STATUSES
+        change = TransferStateChange(
+            reference=reference,
+            previous_status=tracked.status,
+            status=transfer.status,
+            final=final,
+            source="poll",
+            transfer=transfer,
+        )
+        tracked.status = transfer.status
+        if final:
+            del self._transfers[reference]
+        return change
+
+    async def changes(self) -> AsyncIterator[TransferStateChange]:
+        """Polls the tracked transfers and yields every change in their status.
+
+        The iteration ends once every tracked transfer is final. Transfers tracked
+        while iterating are picked up.
+        """
+        self._wakeup = asyncio.Event()
+        try:
+            while self._transfers or self._webhook_changes:
+                while self._webhook_changes:
+                    yield self._webhook_changes.popleft()
+                due = self._due_references()
+                if due:
+                    async for result in amap(
+                        self._client.transfers.verify, due, self.concurrency
+                    ):
+                        change = self._record(result.input, result.response)
+                        if change is not None:
+                            yield change
+                    continue
+                if not self._transfers:
+                    continue
+                self._wakeup.clear()
+                delay = min(t.next_poll_at for t in self._transfers.values())
+                try:
+                    await asyncio.wait_for(
+                        self._wakeup.wait(), max(0.0, delay - time.monotonic())
+                    )
+                except TimeoutError:
+                    pass
+        finally:
+            self._wakeup = None
+
+    async def run(
+        self, on_change: Callable[[TransferStateChange], None] | None = None
+    ) -> dict[str, str]:
+        """Polls the tracked transfers until every one of them is final.
+
+        Args:
+            on_change: A callable that is called with every `TransferStateChange`.
+
+        Returns:
+            The final status of every transfer that was finalized during the run.
+        """
+        final_statuses: dict[str, str] = {}
+        async for change in self.changes():
+            if on_change is not None:
+                on_change(change)
+            if change.final:
+                final_statuses[change.reference] = change.status
+        return final_statuses
@@ -9,6 +9,17 @@ from pypaystack2.sub_clients.sync_clients.preauthorizations import (
 from pypaystack2.sub_clients.sync_clients.orders import OrderClient
 from pypaystack2.sub_clients.sync_clients.storefronts import StorefrontClient
 from http import HTTPMethod
+from typing import Any, AsyncIterator, Awaitable, Callable, Iterable
+
+import httpx
+
+from pypaystack2.helpers.batch import BatchProgress, BatchResult, amap, map_in_threads
+from pypaystack2.helpers.events import EventBus
+from pypaystack2.helpers.settlement import await_transaction, wait_for_transaction
+from pypaystack2.caching import ResponseCache
+from pypaystack2.fees import FeeScheduleBook
+from pypaystack2.models import Response, Transaction
+from pypaystack2.rate_limiting import AsyncRateLimiter, RateLimiter
 from pypaystack2.types import PaystackDataModel
 from pypaystack2.sub_clients.async_clients.direct_debits import AsyncDirectDebitClient
 from pypaystack2.sub_clients.sync_clients.direct_debits import DirectDebitClient
@@ -132,64 +143,93 @@ class PaystackClient(BaseAPIClient):
             Preauthorization API e.g. `PreauthorizationClient.initialize`.
     """
 
-    def __init__(self, secret_key: str | None = None):
-        super().__init__(secret_key=secret_key)
-        self.apple_pay: ApplePayClient = ApplePayClient(secret_key=self._secret_key)
-        self.bulk_charges: BulkChargeClient = BulkChargeClient(
-            secret_key=self._secret_key
-        )
-        self.charge: ChargeClient = ChargeClient(secret_key=self._secret_key)
-        self.integration: IntegrationClient = IntegrationClient(
-            secret_key=self._secret_key
+    def __init__(
+        self,
+        secret_key: str | None = None,
+        rate_limiter: RateLimiter | None = None,
+        http_client: httpx.Client | None = None,
+        event_bus: EventBus | None = None,
+        response_cache: ResponseCache | None = None,
+        fee_schedule_book: FeeScheduleBook | None = None,
+    ):
+        """
+        Args:
+            secret_key: Your paystack integration secret key. Required only
+                if it is not provided in your environmental
+                variables as ``PAYSTACK_SECRET_KEY=your_key``
+            rate_limiter: An optional `RateLimiter` shared by all the sub clients.
+                Every request made through the client waits on it.
+            http_client: An optional `httpx.Client` shared by all the sub clients. Its
+                connection pool is reused across requests and threads.
+                When it is not provided, every request is made with a new connection.
+                The caller is responsible for closing it.
+            event_bus: An optional `EventBus` webhook events are published to. When it is
+                provided, `PaystackClient.await_transaction` returns as soon as the
+                `charge.success` event of the transaction is published instead of waiting
+                for its next verification.
+            response_cache: An optional `ResponseCache` shared by all the sub clients.
+                Responses of cacheable GET requests such as `plans.get_plan` are served
+                from it until they expire or a write request such as `plans.update`
+                invalidates them.
+            fee_schedule_book: An optional `FeeScheduleBook` shared by all the sub clients.
+                The fees of `calculate_fee`, `calculate_fees`, `calculate_gross_amount`
+                and `fee_schedule` are looked up in it instead of the built-in fees.
+        """
+        super().__init__(
+            secret_key=secret_key,
+            rate_limiter=rate_limiter,
+            http_client=http_client,
+            response_cache=response_cache,
+            fee_schedule_book=fee_schedule_book,
         )
-        self.customers: CustomerClient = CustomerClient(secret_key=self._secret_key)
+        self._event_bus = event_bus
+        sub_client_kwargs: dict[str, Any] = {
+            "secret_key": self._secret_key,
+            "rate_limiter": self._rate_limiter,
+            "http_client": self._http_client,
+            "response_cache": self._response_cache,
+            "fee_schedule_book": self.fee_schedule_book,
+        }
+        self.apple_pay: ApplePayClient = ApplePayClient(**sub_client_kwargs)
+        self.bulk_charges: BulkChargeClient = BulkChargeClient(**sub_client_kwargs)
+        self.charge: ChargeClient = ChargeClient(**sub_client_kwargs)
+        self.integration: IntegrationClient = IntegrationClient(**sub_client_kwargs)
+        self.customers: CustomerClient = CustomerClient(**sub_client_kwargs)
         self.dedicated_accounts: DedicatedAccountClient = DedicatedAccountClient(
-            secret_key=self._secret_key
+            **sub_client_kwargs
         )
-        self.disputes: DisputeClient = DisputeClient(secret_key=self._secret_key)
+        self.disputes: DisputeClient = DisputeClient(**sub_client_kwargs)
         self.payment_requests: PaymentRequestClient = PaymentRequestClient(
-            secret_key=self._secret_key
+            **sub_client_kwargs
         )
         self.miscellaneous: MiscellaneousClient = MiscellaneousClient(
-            secret_key=self._secret_key
-        )
-        self.payment_pages: PaymentPageClient = PaymentPageClient(
-            secret_key=self._secret_key
-        )
-        self.plans: PlanClient = PlanClient(secret_key=self._secret_key)
-        self.products: ProductClient = ProductClient(secret_key=self._secret_key)
-        self.refunds: RefundClient = RefundClient(secret_key=self._secret_key)
-        self.settlements: SettlementClient = SettlementClient(
-            secret_key=self._secret_key
+            **sub_client_kwargs
         )
+        self.payment_pages: PaymentPageClient = PaymentPageClient(**sub_client_kwargs)
+        self.plans: PlanClient = PlanClient(**sub_client_kwargs)
+        self.products: ProductClient = ProductClient(**sub_client_kwargs)
+        self.refunds: RefundClient = RefundClient(**sub_client_kwargs)
+        self.settlements: SettlementClient = SettlementClient(**sub_client_kwargs)
         self.splits: TransactionSplitClient = TransactionSplitClient(
-            secret_key=self._secret_key
-        )
-        self.subaccounts: SubAccountClient = SubAccountClient(
-            secret_key=self._secret_key
-        )
-        self.subscriptions: SubscriptionClient = SubscriptionClient(
-            secret_key=self._secret_key
-        )
-        self.terminals: TerminalClient = TerminalClient(secret_key=self._secret_key)
-        self.transactions: TransactionClient = TransactionClient(
-            secret_key=self._secret_key
+            **sub_client_kwargs
         )
+        self.subaccounts: SubAccountClient = SubAccountClient(**sub_client_kwargs)
+        self.subscriptions: SubscriptionClient = SubscriptionClient(**sub_client_kwargs)
+        self.terminals: TerminalClient = TerminalClient(**sub_client_kwargs)
+        self.transactions: TransactionClient = TransactionClient(**sub_client_kwargs)
         self.transfer_recipients: TransferRecipientClient = TransferRecipientClient(
-            secret_key=self._secret_key
+            **sub_client_kwargs
         )
-        self.transfers: TransferClient = TransferClient(secret_key=self._secret_key)
+        self.transfers: TransferClient = TransferClient(**sub_client_kwargs)
         self.transfer_control: TransferControlClient = TransferControlClient(
-            secret_key=self._secret_key
+            **sub_client_kwargs
         )
-        self.verification: VerificationClient = VerificationClient(
-            secret_key=self._secret_key
-        )
-        self.virtual_terminals = VirtualTerminalClient(secret_key=self._secret_key)
-        self.direct_debits = DirectDebitClient(secret_key=self._secret_key)
-        self.storefronts = StorefrontClient(secret_key=self._secret_key)
-        self.orders = OrderClient(secret_key=self._secret_key)
-        self.preauthorizations = PreauthorizationClient(secret_key=self._secret_key)
+        self.verification: VerificationClient = VerificationClient(**sub_client_kwargs)
+        self.virtual_terminals = VirtualTerminalClient(**sub_client_kwargs)
+        self.direct_debits = DirectDebitClient(**sub_client_kwargs)
+        self.storefronts = StorefrontClient(**sub_client_kwargs)
+        self.orders = OrderClient(**sub_client_kwargs)
+        self.preauthorizations = PreauthorizationClient(**sub_client_kwargs)
 
     def get_capitec_pay_transaction(
         self,
@@ -223,6 +263,94 @@ class PaystackClient(BaseAPIClient):
             response_data_model_class=alternate_model_class,
         )
 
+    def map(
+        self,
+        method: Callable[..., Response[Any]],
+        inputs: Iterable[Any],
+        workers: int = 8,
+        on_progress: Callable[[BatchProgress], None] | None = None,
+    ) -> list[BatchResult]:
+        """Calls a sub client method for every input in parallel on a pool of threads.
+
+        The client keeps no per-request state, so its sub clients can be shared by
+        the worker threads. An exception raised by a call is captured in
+        `BatchResult.error` and does not abort the batch. Calls wait on the client's
+        rate limiter if one was provided.
+
+        Example:
+            ```python
+            from pypaystack2 import PaystackClient
+
+            client = PaystackClient()
+            results = client.map(client.transactions.verify, references, workers=16)
+            for reference, result in zip(references, results):
+                if not result.ok:
+                    print(reference, result.error or result.response.message)
+            ```
+
+        Args:
+            method: A bound method of one of the client's sub clients.
+                e.g. `PaystackClient.transactions.verify`
+            inputs: The inputs to call `method` with. A `dict` is passed as keyword
+                arguments, a `tuple` as positional arguments and any other value as
+                the only positional argument.
+            workers: The number of threads making calls.
+            on_progress: A callable that is called from the calling thread with a
+                `BatchProgress` after every completed call.
+
+        Returns:
+            A list of `BatchResult`s in the same order as `inputs`.
+        """
+        return map_in_threads(method, inputs, workers, on_progress)
+
+    def await_transaction(
+        self,
+        reference: str,
+        timeout: float = 60.0,
+        poll_interval: float = 1.0,
+        max_poll_interval: float = 30.0,
+    ) -> Transaction:
+        """Blocks until a transaction is settled and returns it.
+
+        The transaction is verified right away and then at intervals that back off
+        from `poll_interval` to `max_poll_interval`, so a long wait costs few requests.
+        If the client was created with an `event_bus`, the `charge.success` webhook
+        event of the transaction ends the wait as soon as it is published. Waiters only
+        receive the events of their own reference, so many concurrent waiters can
+        share one event bus.
+
+        Example:
+            ```python
+            from pypaystack2 import PaystackClient
+            from pypaystack2.helpers import InProcessEventBus
+
+            event_bus = InProcessEventBus()
+            client = PaystackClient(event_bus=event_bus)
+            transaction = client.await_transaction(reference, timeout=120)
+            print(transaction.status)
+            ```
+
+        Args:
+            reference: The reference of the transaction.
+            timeout: The longest time in seconds to wait.
+            poll_interval: The interval in seconds before the second verification.
+            max_poll_interval: The longest interval in seconds between verifications.
+
+        Returns:
+            The settled `Transaction`, its status is one of `success`, `failed` or `reversed`.
+
+        Raises:
+            TimeoutError: If the transaction did not settle within `timeout` seconds.
+        """
+        return wait_for_transaction(
+            self,
+            reference,
+            timeout=timeout,
+            event_bus=self._event_bus,
+            poll_interval=poll_interval,
+            max_poll_interval=max_poll_interval,
+        )
+
 
 class AsyncPaystackClient(BaseAsyncAPIClient):
     """An asynchronous Paystack API client class with all the sub clients supported by pypaystack2.
@@ -290,42 +418,82 @@ class AsyncPaystackClient(BaseAsyncAPIClient):
 
     """
 
-    def __init__(self, secret_key: str | None = None):
-        super().__init__(secret_key=secret_key)
-        self.apple_pay = AsyncApplePayClient(secret_key=self._secret_key)
-        self.bulk_charges = AsyncBulkChargeClient(secret_key=self._secret_key)
-        self.charge = AsyncChargeClient(secret_key=self._secret_key)
-        self.integration = AsyncIntegrationClient(secret_key=self._secret_key)
-        self.customers = AsyncCustomerClient(secret_key=self._secret_key)
-        self.dedicated_accounts = AsyncDedicatedAccountClient(
-            secret_key=self._secret_key
-        )
-        self.disputes = AsyncDisputeClient(secret_key=self._secret_key)
-        self.payment_requests = AsyncPaymentRequestClient(secret_key=self._secret_key)
-        self.miscellaneous = AsyncMiscellaneousClient(secret_key=self._secret_key)
-        self.payment_pages = AsyncPaymentPageClient(secret_key=self._secret_key)
-        self.plans = AsyncPlanClient(secret_key=self._secret_key)
-        self.products = AsyncProductClient(secret_key=self._secret_key)
-        self.refunds = AsyncRefundClient(secret_key=self._secret_key)
-        self.settlements = AsyncSettlementClient(secret_key=self._secret_key)
-        self.splits = AsyncTransactionSplitClient(secret_key=self._secret_key)
-        self.subaccounts = AsyncSubAccountClient(secret_key=self._secret_key)
-        self.subscriptions = AsyncSubscriptionClient(secret_key=self._secret_key)
-        self.terminals = AsyncTerminalClient(secret_key=self._secret_key)
-        self.transactions = AsyncTransactionClient(secret_key=self._secret_key)
-        self.transfer_recipients = AsyncTransferRecipientClient(
-            secret_key=self._secret_key
-        )
-        self.transfers = AsyncTransferClient(secret_key=self._secret_key)
-        self.transfer_control = AsyncTransferControlClient(secret_key=self._secret_key)
-        self.verification = AsyncVerificationClient(secret_key=self._secret_key)
-        self.virtual_terminals = AsyncVirtualTerminalClient(secret_key=self._secret_key)
-        self.direct_debits = AsyncDirectDebitClient(secret_key=self._secret_key)
-        self.storefronts = AsyncStorefrontClient(secret_key=self._secret_key)
-        self.orders = AsyncOrderClient(secret_key=self._secret_key)
-        self.preauthorizations = AsyncPreauthorizationClient(
-            secret_key=self._secret_key
+    def __init__(
+        self,
+        secret_key: str | None = None,
+        rate_limiter: AsyncRateLimiter | None = None,
+        http_client: httpx.AsyncClient | None = None,
+        event_bus: EventBus | None = None,
+        response_cache: ResponseCache | None = None,
+        fee_schedule_book: FeeScheduleBook | None = None,
+    ):
+        """
+        Args:
+            secret_key: Your paystack integration secret key. Required only
+                if it is not provided in your environmental
+                variables as ``PAYSTACK_SECRET_KEY=your_key``
+            rate_limiter: An optional `AsyncRateLimiter` shared by all the sub clients.
+                Every request made through the client waits on it.
+            http_client: An optional `httpx.AsyncClient` shared by all the sub clients. Its
+                connection pool is reused across requests, so it must only be used
+                from the event loop it was created on.
+                When it is not provided, every request is made with a new connection.
+                The caller is responsible for closing it.
+            event_bus: An optional `EventBus` webhook events are published to. When it is
+                provided, `AsyncPaystackClient.await_transaction` returns as soon as the
+                `charge.success` event of the transaction is published instead of waiting
+                for its next verification.
+            response_cache: An optional `ResponseCache` shared by all the sub clients.
+                Responses of cacheable GET requests such as `plans.get_plan` are served
+                from it until they expire or a write request such as `plans.update`
+                invalidates them.
+            fee_schedule_book: An optional `FeeScheduleBook` shared by all the sub clients.
+                The fees of `calculate_fee`, `calculate_fees`, `calculate_gross_amount`
+                and `fee_schedule` are looked up in it instead of the built-in fees.
+        """
+        super().__init__(
+            secret_key=secret_key,
+            rate_limiter=rate_limiter,
+            http_client=http_client,
+            response_cache=response_cache,
+            fee_schedule_book=fee_schedule_book,
         )
+        self._event_bus = event_bus
+        sub_client_kwargs: dict[str, Any] = {
+            "secret_key": self._secret_key,
+            "rate_limiter": self._rate_limiter,
+            "http_client": self._http_client,
+            "response_cache": self._response_cache,
+            "fee_schedule_book": self.fee_schedule_book,
+        }
+        self.apple_pay = AsyncApplePayClient(**sub_client_kwargs)
+        self.bulk_charges = AsyncBulkChargeClient(**sub_client_kwargs)
+        self.charge = AsyncChargeClient(**sub_client_kwargs)
+        self.integration = AsyncIntegrationClient(**sub_client_kwargs)
+        self.customers = AsyncCustomerClient(**sub_client_kwargs)
+        self.dedicated_accounts = AsyncDedicatedAccountClient(**sub_client_kwargs)
+        self.disputes = AsyncDisputeClient(**sub_client_kwargs)
+        self.payment_requests = AsyncPaymentRequestClient(**sub_client_kwargs)
+        self.miscellaneous = AsyncMiscellaneousClient(**sub_client_kwargs)
+        self.payment_pages = AsyncPaymentPageClient(**sub_client_kwargs)
+        self.plans = AsyncPlanClient(**sub_client_kwargs)
+        self.products = AsyncProductClient(**sub_client_kwargs)
+        self.refunds = AsyncRefundClient(**sub_client_kwargs)
+        self.settlements = AsyncSettlementClient(**sub_client_kwargs)
+        self.splits = AsyncTransactionSplitClient(**sub_client_kwargs)
+        self.subaccounts = AsyncSubAccountClient(**sub_client_kwargs)
+        self.subscriptions = AsyncSubscriptionClient(**sub_client_kwargs)
+        self.terminals = AsyncTerminalClient(**sub_client_kwargs)
+        self.transactions = AsyncTransactionClient(**sub_client_kwargs)
+        self.transfer_recipients = AsyncTransferRecipientClient(**sub_client_kwargs)
+        self.transfers = AsyncTransferClient(**sub_client_kwargs)
+        self.transfer_control = AsyncTransferControlClient(**sub_client_kwargs)
+        self.verification = AsyncVerificationClient(**sub_client_kwargs)
+        self.virtual_terminals = AsyncVirtualTerminalClient(**sub_client_kwargs)
+        self.direct_debits = AsyncDirectDebitClient(**sub_client_kwargs)
+        self.storefronts = AsyncStorefrontClient(**sub_client_kwargs)
+        self.orders = AsyncOrderClient(**sub_client_kwargs)
+        self.preauthorizations = AsyncPreauthorizationClient(**sub_client_kwargs)
 
     async def get_capitec_pay_transaction(
         self,
@@ -358,3 +526,95 @@ class AsyncPaystackClient(BaseAsyncAPIClient):
             url,
             response_data_model_class=alternate_model_class,
         )
+
+    def map(
+        self,
+        method: Callable[..., Awaitable[Response[Any]]],
+        inputs: Iterable[Any],
+        concurrency: int = 10,
+        on_progress: Callable[[BatchProgress], None] | None = None,
+    ) -> AsyncIterator[BatchResult]:
+        """Calls a sub client method for every input with bounded concurrency.
+
+        Results are yielded as soon as each call completes, so they may arrive out of
+        order. Use `BatchResult.index` or `BatchResult.input` to correlate a result with
+        its input. An exception raised by a call is captured in `BatchResult.error`
+        and does not abort the batch. Calls wait on the client's rate limiter
+        if one was provided.
+
+        Example:
+            ```python
+            from pypaystack2 import AsyncPaystackClient
+            from pypaystack2.rate_limiting import AsyncRateLimiter
+
+            client = AsyncPaystackClient(rate_limiter=AsyncRateLimiter(rate=20))
+            async for result in client.map(
+                client.transactions.verify, references, concurrency=20
+            ):
+                if result.ok:
+                    print(result.input, result.response.data.status)
+            ```
+
+        Args:
+            method: A bound method of one of the client's sub clients.
+                e.g. `AsyncPaystackClient.transactions.verify`
+            inputs: The inputs to call `method` with. A `dict` is passed as keyword
+                arguments, a `tuple` as positional arguments and any other value as
+                the only positional argument. e.g. `[{"account_number": "0022728151",
+                "bank_code": "063"}]` for `AsyncPaystackClient.verification.resolve_account_number`
+            concurrency: The maximum number of calls in flight at once.
+            on_progress: A callable that is called with a `BatchProgress` after every
+                completed call.
+
+        Returns:
+            An async iterator of `BatchResult`s.
+        """
+        return amap(method, inputs, concurrency, on_progress)
+
+    async def await_transaction(
+        self,
+        reference: str,
+        timeout: float = 60.0,
+        poll_interval: float = 1.0,
+        max_poll_interval: float = 30.0,
+    ) -> Transaction:
+        """Waits until a transaction is settled and returns it.
+
+        The transaction is verified right away and then at intervals that back off
+        from `poll_interval` to `max_poll_interval`, so a long wait costs few requests.
+        If the client was created with an `event_bus`, the `charge.success` webhook
+        event of the transaction ends the wait as soon as it is published. Waiters only
+        receive the events of their own reference, so many concurrent waiters can
+        share one event bus.
+
+        Example:
+            ```python
+            from pypaystack2 import AsyncPaystackClient
+            from pypaystack2.helpers import InProcessEventBus
+
+            event_bus = InProcessEventBus()
+            client = AsyncPaystackClient(event_bus=event_bus)
+            transaction = await client.await_transaction(reference, timeout=120)
+            print(transaction.status)
+            ```
+
+        Args:
+            reference: The reference of the transaction.
+            timeout: The longest time in seconds to wait.
+            poll_interval: The interval in seconds before the second verification.
+            max_poll_interval: The longest interval in seconds between verifications.
+
+        Returns:
+            The settled `Transaction`, its status is one of `success`, `failed` or `reversed`.
+
+        Raises:
+            TimeoutError: If the transaction did not settle within `timeout` seconds.
+        """
+        return await await_transaction(
+            self,
+            reference,
+            timeout=timeout,
+            event_bus=self._event_bus,
+            poll_interval=poll_interval,
+            max_poll_interval=max_poll_interval,
+        )
@@ -583,6 +583,7 @@ class Settlement(BaseModel):
 
 class TransferRecipientDetail(BaseModel):
     authorization_code: str | None = None
+    account_number: str | None = None
     account_name: str | None = None
     bank_code: str
     bank_name: str
@@ -781,6 +782,7 @@ class Bank(BaseModel):
     id: int
     created_at: datetime | None
     updated_at: datetime
+    nip_sort_code: str | None = None
 
 
 class BankAccountInfo(BaseModel):
@@ -0,0 +1,96 @@
+import asyncio
+import threading
+import time
+
+
+class _TokenBucket:
+    """A token bucket that lets callers reserve tokens ahead of time.
+
+    When the bucket is empty a reservation puts it in debt, and the caller is told
+    how long to wait for its token. Later callers queue up behind it, so concurrent
+    callers are spaced evenly instead of stampeding when tokens become available.
+    """
+
+    def __init__(self, rate: float, period: float = 1.0, burst: int | None = None):
+        if rate <= 0:
+            raise ValueError("rate must be greater than 0")
+        if period <= 0:
+            raise ValueError("period must be greater than 0")
+        self.rate = rate
+        self.period = period
+        self.burst = burst if burst is not None else max(1, int(rate))
+        if self.burst < 1:
+            raise ValueError("burst must be at least 1")
+        self._tokens = float(self.burst)
+        self._updated_at = time.monotonic()
+
+    def _reserve(self) -> float:
+        """Takes a token from the bucket and returns how long to wait before using it."""
+        now = time.monotonic()
+        refill = (now - self._updated_at) * self.rate / self.period
+        self._tokens = min(float(self.burst), self._tokens + refill) - 1
+        self._updated_at = now
+        if self._tokens >= 0:
+            return 0.0
+        return -self._tokens * self.period / self.rate
+
+
+class RateLimiter(_TokenBucket):
+    """A thread-safe rate limiter for `PaystackClient`.
+
+    Example:
+        ```python
+        from pypaystack2 import PaystackClient
+        from pypaystack2.rate_limiting import RateLimiter
+
+        # at most 10 requests per second with bursts of up to 20 requests
+        client = PaystackClient(rate_limiter=RateLimiter(rate=10, burst=20))
+        ```
+    """
+
+    def __init__(self, rate: float, period: float = 1.0, burst: int | None = None):
+        """
+        Args:
+            rate: The number of requests allowed per `period`.
+            period: The length of the period in seconds.
+            burst: The number of requests that can be made back to back after
+                a quiet period. It defaults to `rate`.
+        """
+        super().__init__(rate, period, burst)
+        self._lock = threading.Lock()
+
+    def acquire(self) -> None:
+        """Blocks the calling thread until a request can be made."""
+        with self._lock:
+            delay = self._reserve()
+        if delay:
+            time.sleep(delay)
+
+
+class AsyncRateLimiter(_TokenBucket):
+    """A rate limiter for `AsyncPaystackClient`.
+
+    Example:
+        ```python
+        from pypaystack2 import AsyncPaystackClient
+        from pypaystack2.rate_limiting import AsyncRateLimiter
+
+        client = AsyncPaystackClient(rate_limiter=AsyncRateLimiter(rate=10))
+        ```
+    """
+
+    def __init__(self, rate: float, period: float = 1.0, burst: int | None = None):
+        """
+        Args:
+            rate: The number of requests allowed per `period`.
+            period: The length of the period in seconds.
+            burst: The number of requests that can be made back to back after
+                a quiet period. It defaults to `rate`.
+        """
+        super().__init__(rate, period, burst)
+
+    async def acquire(self) -> None:
+        """Waits until a request can be made."""
+        delay = self._reserve()
+        if delay:
+            await asyncio.sleep(delay)
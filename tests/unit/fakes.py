@@ -0,0 +1,43 @@
+from http import HTTPStatus
+from typing import Any, cast
+
+from pypaystack2.models import Response
+
+
+def make_response(
+    data: Any = None,
+    status: bool = True,
+    message: str = "ok",
+    status_code: int | None = None,
+    meta: dict[str, Any] | None = None,
+    raw: Any = None,
+) -> Response[Any]:
+    """Returns a `Response` like the ones the sub clients return.
+
+    The status code defaults to 200 for a successful response and 400 otherwise.
+    """
+    return Response(
+        status_code=cast(HTTPStatus, status_code or (200 if status else 400)),
+        status=status,
+        message=message,
+        data=data,
+        meta=meta,
+        type=None,
+        code=None,
+        raw=raw,
+    )
+
+
+class FakeClient:
+    """A stand-in for a client, with the fake sub clients it is given as attributes.
+
+    Example:
+        ```python
+        client = FakeClient(customers=FakeCustomers())
+        CustomerCache(cast(Any, client))
+        ```
+    """
+
+    def __init__(self, **sub_clients: Any):
+        for name, sub_client in sub_clients.items():
+            setattr(self, name, sub_client)
@@ -0,0 +1,118 @@
+import asyncio
+import threading
+from types import SimpleNamespace
+from typing import Any, cast
+from unittest import IsolatedAsyncioTestCase, TestCase
+
+from pypaystack2.caching import MemoryCache
+from pypaystack2.helpers import AccountResolver, AsyncAccountResolver
+from pypaystack2.models import BankAccountInfo, Response
+from tests.unit.fakes import make_response
+
+
+class FakeVerification:
+    """Resolves account numbers starting with 0 and rejects the others."""
+
+    def __init__(self, flaky: set[str] | None = None):
+        self.flaky = flaky or set()
+        self.calls: list[tuple[str, str]] = []
+        self.lock = threading.Lock()
+
+    def _resolve(self, account_number: str, bank_code: str) -> Response[Any]:
+        with self.lock:
+            self.calls.append((account_number, bank_code))
+        if account_number in self.flaky:
+            self.flaky.discard(account_number)
+            raise ConnectionError("connection reset")
+        ok = account_number.startswith("0")
+        return make_response(
+            BankAccountInfo(
+                account_number=account_number, account_name=f"Payee {account_number}"
+            )
+            if ok
+            else None,
+            status=ok,
+            message="Account number resolved"
+            if ok
+            else "Could not resolve account name",
+            status_code=200 if ok else 422,
+        )
+
+    def resolve_account_number(
+        self, account_number: str, bank_code: str
+    ) -> Response[Any]:
+        return self._resolve(account_number, bank_code)
+
+    async def aresolve_account_number(
+        self, account_number: str, bank_code: str
+    ) -> Response[Any]:
+        await asyncio.sleep(0)
+        return self._resolve(account_number, bank_code)
+
+
+def payroll(months: int) -> list[dict[str, str]]:
+    payees = [(f"{i % 3}{i:09d}", "058" if i % 2 else "044") for i in range(20)]
+    return [
+        {"account_number": account_number, "bank_code": bank_code, "month": str(month)}
+        for month in range(months)
+        for account_number, bank_code in payees
+    ]
+
+
+class AccountResolverTestCase(TestCase):
+    def test_resolves_each_distinct_account_once(self) -> None:
+        verification = FakeVerification()
+        client = SimpleNamespace(verification=verification)
+        resolver = AccountResolver(cast(Any, client), workers=4)
+        report = resolver.resolve(payroll(months=3))
+
+        self.assertEqual(len(report.rows), 60)
+        self.assertEqual((report.unique_accounts, report.api_calls), (20, 20))
+        self.assertEqual(len(verification.calls), 20)
+        first = report.rows[0]
+        self.assertEqual(
+            (first.account_number, first.bank_code, first.account_name, first.cached),
+            ("0000000000", "044", "Payee 0000000000", False),
+        )
+        self.assertEqual(report.rows[20], first.model_copy(update={"row": 20}))
+        failed = report.failed()
+        self.assertEqual(len(failed), 39)  # rows of accounts that do not start with 0
+        self.assertEqual(failed[0].error, "Could not resolve account name")
+
+    def test_serves_later_batches_from_the_cache(self) -> None:
+        verification = FakeVerification(flaky={"0000000003"})
+        client = SimpleNamespace(verification=verification)
+        cache = MemoryCache()
+        resolver = AccountResolver(cast(Any, client), cache=cache)
+        first = resolver.resolve([("0000000003", "058"), (" 0000000006 ", "044")])
+        self.assertEqual(first.failed()[0].error, "connection reset")
+
+        # rejected accounts are cached too, the failed request is retried
+        second = resolver.resolve(
+            [("0000000003", "058"), ("0000000006", "044"), ("1000000004", "044")]
+        )
+        self.assertEqual((second.cache_hits, second.api_calls), (1, 2))
+        self.assertTrue(second.rows[1].cached)
+        third = resolver.resolve([("1000000004", "044")])
+        self.assertEqual((third.cache_hits, third.api_calls), (1, 0))
+        self.assertFalse(third.rows[0].ok)
+
+
+class AsyncAccountResolverTestCase(IsolatedAsyncioTestCase):
+    async def test_resolves_each_distinct_account_once(self) -> None:
+        verification = FakeVerification()
+        client = SimpleNamespace(
+            verification=SimpleNamespace(
+                resolve_account_number=verification.aresolve_account_number
+            )
+        )
+        resolver = AsyncAccountResolver(cast(Any, client), concurrency=4)
+        report = await resolver.resolve(payroll(months=2))
+        again = await resolver.resolve(payroll(months=1))
+
+        self.assertEqual(len(verification.calls), 20)
+        self.assertEqual(
+            [row.account_name for row in report.rows[:20]],
+            [row.account_name for row in report.rows[20:]],
+        )
+        self.assertEqual((again.cache_hits, again.api_calls), (20, 0))
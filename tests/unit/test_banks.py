@@ -0,0 +1,190 @@
+import asyncio
+from typing import Any, cast
+from unittest import IsolatedAsyncioTestCase, TestCase
+
+from pypaystack2.enums import Country
+from pypaystack2.helpers import AsyncBankCatalog, BankCatalog
+from pypaystack2.models import Bank, Response, State
+from tests.unit.fakes import FakeClient, make_response
+
+NIGERIAN_BANKS = [
+    ("Access Bank", "044", "000014"),
+    ("First Bank of Nigeria", "011", "000016"),
+    ("First City Monument Bank", "214", "000003"),
+    ("Guaranty Trust Bank", "058", "000013"),
+    ("Zenith Bank", "057", "000015"),
+]
+GHANAIAN_BANKS = [("First Atlantic Bank", "280100", None), ("MTN", "MTN", None)]
+
+
+def make_bank(country: str, name: str, code: str, nip_sort_code: str | None) -> Bank:
+    return Bank.model_validate(
+        {
+            "name": name,
+            "slug": name.lower().replace(" ", "-"),
+            "code": code,
+            "longcode": code,
+            "pay_with_bank": False,
+            "supports_transfer": True,
+            "active": True,
+            "is_deleted": False,
+            "country": country,
+            "currency": "NGN" if country == "Nigeria" else "GHS",
+            "type": "nuban",
+            "id": int(code) if code.isdigit() else 1,
+            "created_at": None,
+            "updated_at": "2026-01-01T00:00:00.000Z",
+            "nip_sort_code": nip_sort_code,
+        }
+    )
+
+
+class FakeMiscellaneous:
+    """Serves the banks of a country two per page with cursor pagination."""
+
+    def __init__(self) -> None:
+        self.banks = {
+            Country.NIGERIA: [make_bank("Nigeria", *bank) for bank in NIGERIAN_BANKS],
+            Country.GHANA: [make_bank("Ghana", *bank) for bank in GHANAIAN_BANKS],
+        }
+        self.calls: list[tuple[str, Any]] = []
+        self.fail = False
+
+    def get_banks(
+        self,
+        country: Country,
+        use_cursor: bool,
+        next_: str | None,
+        pagination: int,
+        include_nip_sort_code: bool | None,
+    ) -> Response[Any]:
+        self.calls.append(("get_banks", (country, next_)))
+        if self.fail:
+            raise ConnectionError("connection reset")
+        start = int(next_ or 0)
+        banks = self.banks[country]
+        next_cursor = str(start + 2) if start + 2 < len(banks) else None
+        return make_response(banks[start : start + 2], meta={"next": next_cursor})
+
+    def get_states(self, country: Country) -> Response[Any]:
+        self.calls.append(("get_states", country))
+        return make_response([State(name="Lagos", slug="lagos", abbreviation="LA")])
+
+    def get_countries(self) -> Response[Any]:
+        self.calls.append(("get_countries", None))
+        return make_response([])
+
+
+class AsyncFakeMiscellaneous(FakeMiscellaneous):
+    async def get_banks(self, *args: Any, **kwargs: Any) -> Response[Any]:  # type: ignore[override]
+        await asyncio.sleep(0)
+        return super().get_banks(*args, **kwargs)
+
+    async def get_states(self, country: Country) -> Response[Any]:  # type: ignore[override]
+        return super().get_states(country)
+
+    async def get_countries(self) -> Response[Any]:  # type: ignore[override]
+        return super().get_countries()
+
+
+class BankCatalogTestCase(TestCase):
+    def setUp(self) -> None:
+        self.miscellaneous = FakeMiscellaneous()
+        self.catalog = BankCatalog(
+            cast(Any, FakeClient(miscellaneous=self.miscellaneous)),
+            countries=[Country.NIGERIA, Country.GHANA],
+        )
+
+    def test_loads_every_page_once_and_indexes_banks(self) -> None:
+        self.assertEqual(self.catalog.name("058"), "Guaranty Trust Bank")
+        self.assertEqual(cast(Bank, self.catalog.get("MTN", "GH")).name, "MTN")
+        self.assertIsNone(self.catalog.get("MTN"))
+        self.assertEqual(cast(Bank, self.catalog.by_slug("zenith-bank")).code, "057")
+        self.assertEqual(
+            cast(Bank, self.catalog.by_name("  access   BANK")).code, "044"
+        )
+        self.assertEqual(
+            cast(Bank, self.catalog.by_nip_sort_code("000016")).code, "011"
+        )
+        self.assertEqual(len(self.catalog.banks()), 5)
+        self.assertEqual(self.catalog.states("GH")[0].name, "Lagos")
+        get_banks_calls = [
+            call for call in self.miscellaneous.calls if call[0] == "get_banks"
+        ]
+        # 3 pages of nigerian banks and 1 page of ghanaian banks
+        self.assertEqual(len(get_banks_calls), 4)
+
+    def test_prefix_search(self) -> None:
+        self.assertEqual(
+            [bank.name for bank in self.catalog.search("first")],
+            [
+                "First Atlantic Bank",
+                "First Bank of Nigeria",
+                "First City Monument Bank",
+            ],
+        )
+        self.assertEqual(
+            [bank.code for bank in self.catalog.search("FIRST", country="NG", limit=1)],
+            ["011"],
+        )
+        self.assertEqual(
+            [bank.name for bank in self.catalog.search("trust b")],
+            ["Guaranty Trust Bank"],
+        )
+        self.assertEqual(self.catalog.search("unknown"), [])
+
+    def test_refreshes_in_the_background_and_serves_stale_data(self) -> None:
+        now = 1000.0
+        self.catalog._clock = lambda: now
+
+        def lookup_and_wait_for_refresh(code: str) -> str | None:
+            name = self.catalog.name(code)
+            refreshing = self.catalog._refreshing
+            if refreshing is not None:
+                refreshing.join()
+            return name
+
+        self.catalog.load()
+        calls = len(self.miscellaneous.calls)
+        now += self.catalog.ttl
+        self.miscellaneous.fail = True
+        self.assertEqual(lookup_and_wait_for_refresh("058"), "Guaranty Trust Bank")
+        self.assertIsInstance(self.catalog.last_error, ConnectionError)
+        # the failed refresh is not retried on every lookup
+        now += 59
+        self.assertEqual(lookup_and_wait_for_refresh("058"), "Guaranty Trust Bank")
+        self.assertEqual(len(self.miscellaneous.calls), calls + 1)
+
+        self.miscellaneous.fail = False
+        self.miscellaneous.banks[Country.NIGERIA].append(
+            make_bank("Nigeria", "Kuda Bank", "50211", "090267")
+        )
+        now += 1
+        self.assertIsNone(lookup_and_wait_for_refresh("50211"))
+        self.assertEqual(self.catalog.name("50211"), "Kuda Bank")
+        self.assertIsNone(self.catalog.last_error)
+        self.assertFalse(self.catalog.stale)
+
+
+class AsyncBankCatalogTestCase(IsolatedAsyncioTestCase):
+    async def test_loads_and_refreshes(self) -> None:
+        miscellaneous = AsyncFakeMiscellaneous()
+        catalog = AsyncBankCatalog(
+            cast(Any, FakeClient(miscellaneous=miscellaneous)),
+            countries=[Country.NIGERIA, Country.GHANA],
+        )
+        with self.assertRaises(RuntimeError):
+            catalog.get("058")
+        await catalog.load()
+        self.assertEqual(catalog.name("280100", Country.GHANA), "First Atlantic Bank")
+        self.assertEqual(len(catalog.search("bank")), 6)
+
+        catalog.ttl = 0
+        miscellaneous.banks[Country.GHANA].append(
+            make_bank("Ghana", "Absa Bank Ghana", "030100", None)
+        )
+        self.assertIsNone(catalog.get("030100", "GH"))  # served from the stale catalog
+        for _ in range(100):
+            await asyncio.sleep(0)
+        catalog.ttl = 3600
+        self.assertEqual(catalog.name("030100", "GH"), "Absa Bank Ghana")
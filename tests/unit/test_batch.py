@@ -0,0 +1,158 @@
+import asyncio
+import threading
+import time
+from http import HTTPMethod
+from typing import Any
+from unittest import IsolatedAsyncioTestCase, TestCase
+
+import httpx
+from dotenv import load_dotenv
+
+from pypaystack2 import AsyncPaystackClient, PaystackClient
+from pypaystack2.helpers import BatchProgress
+from pypaystack2.models import Response
+from pypaystack2.rate_limiting import AsyncRateLimiter, RateLimiter
+from tests.unit.fakes import make_response
+
+
+class RateLimiterTestCase(TestCase):
+    def test_allows_burst_then_spaces_requests(self) -> None:
+        limiter = RateLimiter(rate=50, burst=5)
+        started_at = time.monotonic()
+        for _ in range(10):
+            limiter.acquire()
+        elapsed = time.monotonic() - started_at
+        self.assertGreaterEqual(elapsed, 0.09)
+        self.assertLess(elapsed, 0.5)
+
+    def test_rejects_invalid_rate(self) -> None:
+        with self.assertRaises(ValueError):
+            RateLimiter(rate=0)
+
+    def test_main_client_shares_rate_limiter_with_sub_clients(self) -> None:
+        load_dotenv()
+        limiter = RateLimiter(rate=10)
+        client = PaystackClient(rate_limiter=limiter)
+        self.assertIs(client.transactions._rate_limiter, limiter)
+        self.assertIs(client.verification._rate_limiter, limiter)
+
+
+class ThreadedMapTestCase(TestCase):
+    client: PaystackClient
+
+    @classmethod
+    def setUpClass(cls) -> None:
+        load_dotenv()
+        cls.client = PaystackClient()
+
+    def test_map_returns_ordered_results_and_errors(self) -> None:
+        threads = set()
+
+        def verify(reference: str) -> Response[Any]:
+            threads.add(threading.get_ident())
+            time.sleep(0.001 * (int(reference) % 4))
+            if reference == "7":
+                raise ValueError("bad reference")
+            return make_response(reference)
+
+        references = [str(i) for i in range(40)]
+        progress: list[BatchProgress] = []
+        results = self.client.map(
+            verify, references, workers=4, on_progress=progress.append
+        )
+        self.assertEqual([result.index for result in results], list(range(40)))
+        self.assertEqual(
+            [result.response.data for result in results if result.ok],
+            [reference for reference in references if reference != "7"],
+        )
+        self.assertIsInstance(results[7].error, ValueError)
+        self.assertEqual(progress[-1], BatchProgress(completed=40, failed=1, total=40))
+        self.assertGreater(len(threads), 1)
+
+    def test_requests_share_the_provided_http_client(self) -> None:
+        def handler(request: httpx.Request) -> httpx.Response:
+            return httpx.Response(200, json={"status": True, "message": "ok"})
+
+        with httpx.Client(transport=httpx.MockTransport(handler)) as http_client:
+            client = PaystackClient(http_client=http_client)
+            self.assertIs(client.transactions._http_client, http_client)
+            response = client.transactions._handle_request(
+                HTTPMethod.GET, client._full_url("/transaction/verify/ref")
+            )
+        self.assertTrue(response.status)
+
+
+class AsyncMapTestCase(IsolatedAsyncioTestCase):
+    client: AsyncPaystackClient
+
+    @classmethod
+    def setUpClass(cls) -> None:
+        load_dotenv()
+        cls.client = AsyncPaystackClient()
+
+    async def test_map_streams_results_with_bounded_concurrency(self) -> None:
+        in_flight = 0
+        peak = 0
+
+        async def verify(reference: str) -> Response[Any]:
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.001 * (int(reference) % 3))
+            in_flight -= 1
+            return make_response(reference)
+
+        references = [str(i) for i in range(50)]
+        results = [
+            result
+            async for result in self.client.map(verify, references, concurrency=5)
+        ]
+        self.assertEqual(peak, 5)
+        self.assertEqual(sorted(result.index for result in results), list(range(50)))
+        for result in results:
+            self.assertTrue(result.ok)
+            self.assertEqual(result.response.data, references[result.index])
+
+    async def test_map_collects_errors_and_reports_progress(self) -> None:
+        async def resolve_account_number(
+            account_number: str, bank_code: str
+        ) -> Response[Any]:
+            if bank_code == "000":
+                raise ValueError("unknown bank")
+            return make_response(account_number)
+
+        inputs = [
+            {"account_number": "0001", "bank_code": "058"},
+            {"account_number": "0002", "bank_code": "000"},
+            ("0003", "058"),
+        ]
+        progress: list[BatchProgress] = []
+        results = {
+            result.index: result
+            async for result in self.client.map(
+                resolve_account_number, inputs, on_progress=progress.append
+            )
+        }
+        self.assertTrue(results[0].ok)
+        self.assertIsInstance(results[1].error, ValueError)
+        self.assertEqual(results[1].input, inputs[1])
+        self.assertEqual(results[2].response.data, "0003")
+        self.assertEqual(progress[-1], BatchProgress(completed=3, failed=1, total=3))
+
+    async def test_map_accepts_lazy_inputs(self) -> None:
+        async def verify(reference: str) -> Response[Any]:
+            return make_response(reference)
+
+        results = [
+            result
+            async for result in self.client.map(
+                verify, (str(i) for i in range(3)), concurrency=2
+            )
+        ]
+        self.assertEqual(len(results), 3)
+
+    async def test_async_rate_limiter(self) -> None:
+        limiter = AsyncRateLimiter(rate=100, burst=1)
+        started_at = time.monotonic()
+        await asyncio.gather(*(limiter.acquire() for _ in range(6)))
+        self.assertGreaterEqual(time.monotonic() - started_at, 0.045)
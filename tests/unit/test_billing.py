@@ -0,0 +1,306 @@
+import tempfile
+import threading
+from pathlib import Path
+from typing import Any, cast
+from types import SimpleNamespace
+from unittest import IsolatedAsyncioTestCase, TestCase
+
+from pypaystack2.enums import Currency
+from pypaystack2.helpers import (
+    AsyncBillingEngine,
+    BillingCheckpoint,
+    BillingEngine,
+    BillingItem,
+    BillingResult,
+)
+from pypaystack2.models import Response, Transaction
+from tests.unit.fakes import make_response
+
+
+class FakeTransactions:
+    """Charges customers against a balance and rejects duplicate references like paystack."""
+
+    def __init__(self, balances: dict[str, int]):
+        self.balances = balances
+        self.transactions: dict[str, Transaction] = {}
+        self.lock = threading.Lock()
+        self.calls: list[str] = []
+
+    def _transaction(
+        self, reference: str, amount: int, status: str, gateway_response: str
+    ) -> Transaction:
+        return Transaction.model_validate(
+            {
+                "id": len(self.transactions) + 1,
+                "domain": "test",
+                "status": status,
+                "reference": reference,
+                "amount": amount,
+                "gateway_response": gateway_response,
+                "channel": "card",
+                "currency": "NGN",
+                "customer": {
+                    "id": 1,
+                    "email": "customer@example.com",
+                    "customer_code": "CUS_1",
+                    "risk_action": "default",
+                },
+                "authorization": {},
+            }
+        )
+
+    def charge(
+        self, amount: int, email: str, auth_code: str, reference: str, **kwargs: Any
+    ) -> Response[Any]:
+        with self.lock:
+            self.calls.append(f"charge:{reference}")
+            if reference in self.transactions:
+                return make_response(
+                    None,
+                    status=False,
+                    message="Duplicate Transaction Reference",
+                    status_code=400,
+                )
+            if auth_code == "AUTH_invalid":
+                return make_response(
+                    None,
+                    status=False,
+                    message="Invalid authorization code",
+                    status_code=400,
+                )
+            if self.balances[email] < amount:
+                transaction = self._transaction(
+                    reference, amount, "failed", "Insufficient Funds"
+                )
+            else:
+                self.balances[email] -= amount
+                transaction = self._transaction(
+                    reference, amount, "success", "Approved"
+                )
+            self.transactions[reference] = transaction
+            return make_response(transaction, message="Charge attempted")
+
+    def partial_debit(
+        self,
+        auth_code: str,
+        currency: Currency,
+        amount: int,
+        email: str,
+        reference: str,
+        at_least: int | None = None,
+    ) -> Response[Any]:
+        with self.lock:
+            self.calls.append(f"partial_debit:{reference}")
+            if reference in self.transactions:
+                return make_response(
+                    None,
+                    status=False,
+                    message="Duplicate Transaction Reference",
+                    status_code=400,
+                )
+            collected = self.balances[email]
+            if at_least is not None and collected < at_least:
+                transaction = self._transaction(
+                    reference, 0, "failed", "Insufficient Funds"
+                )
+            else:
+                self.balances[email] = 0
+                transaction = self._transaction(
+                    reference, collected, "success", "Approved"
+                )
+            self.transactions[reference] = transaction
+            return make_response(transaction, message="Charge attempted")
+
+    def verify(self, reference: str) -> Response[Any]:
+        self.calls.append(f"verify:{reference}")
+        return make_response(
+            self.transactions[reference], message="Verification successful"
+        )
+
+
+def make_items() -> list[BillingItem]:
+    return [
+        BillingItem(
+            key=f"sub-{i}",
+            email=f"customer{i}@example.com",
+            auth_code="AUTH_invalid" if i == 9 else f"AUTH_{i}",
+            amount=5000,
+            at_least=1000,
+        )
+        for i in range(10)
+    ]
+
+
+class BillingEngineTestCase(TestCase):
+    def setUp(self) -> None:
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.checkpoint_path = Path(directory.name) / "2026-10.jsonl"
+        balances = {f"customer{i}@example.com": 10_000 for i in range(10)}
+        balances["customer3@example.com"] = 2_000  # partial debit
+        balances["customer4@example.com"] = 500  # below at_least
+        self.transactions = FakeTransactions(balances)
+        self.client = cast(Any, SimpleNamespace(transactions=self.transactions))
+
+    def make_engine(self) -> BillingEngine:
+        return BillingEngine(
+            self.client,
+            cycle="2026-10",
+            checkpoint_path=self.checkpoint_path,
+            workers=3,
+        )
+
+    def test_bills_items_with_partial_debit_fallback(self) -> None:
+        results: dict[str, BillingResult] = {}
+        summary = self.make_engine().run(
+            make_items(), on_result=lambda result: results.update({result.key: result})
+        )
+        self.assertEqual(summary.charged, 7)
+        self.assertEqual(summary.partially_charged, 1)
+        self.assertEqual(summary.failed, 2)
+        self.assertEqual(summary.amount, 7 * 5000 + 2000)
+        self.assertEqual(results["sub-3"].amount, 2000)
+        self.assertTrue(results["sub-3"].reference.endswith("-pd"))
+        self.assertEqual(results["sub-9"].message, "Invalid authorization code")
+        self.assertEqual(len(self.checkpoint_path.read_text().splitlines()), 10)
+
+    def test_references_are_deterministic(self) -> None:
+        engine = self.make_engine()
+        item = make_items()[0]
+        self.assertEqual(
+            engine.reference_for(item), self.make_engine().reference_for(item)
+        )
+        self.assertNotEqual(
+            engine.reference_for(item),
+            BillingEngine(self.client, "2026-11", self.checkpoint_path).reference_for(
+                item
+            ),
+        )
+        with self.assertRaises(ValueError):
+            BillingEngine(self.client, "2026/10", self.checkpoint_path)
+
+    def test_resumed_run_does_not_double_charge(self) -> None:
+        class Crash(Exception):
+            pass
+
+        reported = 0
+
+        def crash_after_four(result: BillingResult) -> None:
+            nonlocal reported
+            reported += 1
+            if reported == 4:
+                raise Crash
+
+        with self.assertRaises(Crash):
+            self.make_engine().run(make_items(), on_result=crash_after_four)
+        charged_before_resume = {
+            email: balance for email, balance in self.transactions.balances.items()
+        }
+        # simulate a line torn by the crash
+        with self.checkpoint_path.open("a") as file:
+            file.write('{"key": "sub-')
+
+        summary = self.make_engine().run(make_items())
+        self.assertEqual(summary.skipped, 4)
+        self.assertEqual(
+            summary.skipped
+            + summary.charged
+            + summary.partially_charged
+            + summary.failed,
+            10,
+        )
+        charges = [
+            call for call in self.transactions.calls if call.startswith("charge:")
+        ]
+        self.assertEqual(len(set(charges)), 10)
+        # 9 charges and 2 partial debits, the invalid authorization is never charged
+        self.assertEqual(len(self.transactions.transactions), 11)
+        for email, balance in self.transactions.balances.items():
+            self.assertLessEqual(balance, charged_before_resume[email])
+        self.assertEqual(self.transactions.balances["customer0@example.com"], 5000)
+
+    def test_records_after_a_torn_line(self) -> None:
+        def result(key: str) -> BillingResult:
+            return BillingResult(key=key, reference=f"ref-{key}", outcome="charged")
+
+        checkpoint = BillingCheckpoint(self.checkpoint_path)
+        checkpoint.record(result("a"))
+        checkpoint.close()
+        with self.checkpoint_path.open("a") as file:
+            file.write('{"key": "b", "refer')
+        checkpoint = BillingCheckpoint(self.checkpoint_path)
+        checkpoint.record(result("c"))
+        checkpoint.close()
+        self.assertEqual(
+            list(BillingCheckpoint(self.checkpoint_path).results), ["a", "c"]
+        )
+
+    def test_keeps_a_last_line_without_its_newline(self) -> None:
+        def result(key: str) -> BillingResult:
+            return BillingResult(key=key, reference=f"ref-{key}", outcome="charged")
+
+        with self.checkpoint_path.open("w") as file:
+            file.write(result("a").model_dump_json())
+        checkpoint = BillingCheckpoint(self.checkpoint_path)
+        self.assertIn("a", checkpoint)
+        checkpoint.record(result("b"))
+        checkpoint.close()
+        self.assertEqual(
+            list(BillingCheckpoint(self.checkpoint_path).results), ["a", "b"]
+        )
+
+    def test_rate_limited_items_are_billed_again(self) -> None:
+        charge = self.transactions.charge
+        rate_limited = True
+
+        def rate_limited_charge(**kwargs: Any) -> Response[Any]:
+            if rate_limited:
+                return make_response(
+                    None, status=False, message="Too many requests", status_code=429
+                )
+            return charge(**kwargs)
+
+        self.client.transactions = SimpleNamespace(
+            charge=rate_limited_charge,
+            partial_debit=self.transactions.partial_debit,
+            verify=self.transactions.verify,
+        )
+        summary = self.make_engine().run(make_items())
+        self.assertEqual((summary.errors, summary.failed), (10, 0))
+        rate_limited = False
+        summary = self.make_engine().run(make_items())
+        self.assertEqual(summary.skipped, 0)
+        self.assertEqual(summary.charged + summary.partially_charged, 8)
+
+
+class AsyncBillingEngineTestCase(IsolatedAsyncioTestCase):
+    async def test_bills_items(self) -> None:
+        transactions = FakeTransactions(
+            {f"customer{i}@example.com": 10_000 for i in range(10)}
+        )
+
+        async def charge(**kwargs: Any) -> Response[Any]:
+            return transactions.charge(**kwargs)
+
+        async def partial_debit(**kwargs: Any) -> Response[Any]:
+            return transactions.partial_debit(**kwargs)
+
+        async def verify(reference: str) -> Response[Any]:
+            return transactions.verify(reference)
+
+        client = SimpleNamespace(
+            transactions=SimpleNamespace(
+                charge=charge, partial_debit=partial_debit, verify=verify
+            )
+        )
+        with tempfile.TemporaryDirectory() as directory:
+            engine = AsyncBillingEngine(
+                cast(Any, client),
+                cycle="2026-10",
+                checkpoint_path=Path(directory) / "checkpoint.jsonl",
+                concurrency=4,
+            )
+            summary = await engine.run(make_items())
+            self.assertEqual((summary.charged, summary.failed), (9, 1))
+            summary = await engine.run(make_items())
+            self.assertEqual(summary.skipped, 10)
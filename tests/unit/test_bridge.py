@@ -0,0 +1,73 @@
+import asyncio
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any
+from unittest import TestCase
+
+from dotenv import load_dotenv
+
+from pypaystack2.helpers import AsyncBridge, BatchProgress
+from pypaystack2.models import Response
+from tests.unit.fakes import make_response
+
+
+class AsyncBridgeTestCase(TestCase):
+    def setUp(self) -> None:
+        load_dotenv()
+        self.bridge = AsyncBridge()
+        self.loop_threads: set[int] = set()
+
+        async def verify(reference: str) -> Response[Any]:
+            self.loop_threads.add(threading.get_ident())
+            await asyncio.sleep(0.02)
+            if reference == "bad":
+                raise ValueError("bad reference")
+            return make_response(reference)
+
+        self.bridge.client.transactions.verify = verify  # type: ignore[method-assign]
+
+    def tearDown(self) -> None:
+        self.bridge.close()
+
+    def test_blocking_calls_run_on_the_bridge_loop(self) -> None:
+        response = self.bridge.transactions.verify("ref-1")
+        self.assertEqual(response.data, "ref-1")
+        self.assertEqual(self.loop_threads, {self.bridge._thread.ident})
+        self.assertIs(
+            self.bridge.transactions.verify.__wrapped__,
+            self.bridge.client.transactions.verify,
+        )
+
+    def test_calls_from_many_threads_share_the_loop(self) -> None:
+        started_at = time.monotonic()
+        with ThreadPoolExecutor(max_workers=10) as executor:
+            responses = list(
+                executor.map(self.bridge.transactions.verify, map(str, range(10)))
+            )
+        self.assertLess(time.monotonic() - started_at, 0.15)
+        self.assertEqual(
+            [response.data for response in responses], list(map(str, range(10)))
+        )
+        self.assertEqual(len(self.loop_threads), 1)
+
+    def test_map_multiplexes_calls(self) -> None:
+        references = [str(i) for i in range(20)] + ["bad"]
+        progress: list[BatchProgress] = []
+        started_at = time.monotonic()
+        results = self.bridge.map(
+            self.bridge.transactions.verify,
+            references,
+            concurrency=21,
+            on_progress=progress.append,
+        )
+        self.assertLess(time.monotonic() - started_at, 0.15)
+        self.assertEqual([result.input for result in results], references)
+        self.assertIsInstance(results[-1].error, ValueError)
+        self.assertEqual(progress[-1], BatchProgress(completed=21, failed=1, total=21))
+
+    def test_closed_bridge_rejects_calls(self) -> None:
+        self.bridge.close()
+        self.assertFalse(self.bridge._thread.is_alive())
+        with self.assertRaises(RuntimeError):
+            self.bridge.transactions.verify("ref-1")
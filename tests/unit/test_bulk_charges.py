@@ -0,0 +1,236 @@
+from types import SimpleNamespace
+from typing import Any, cast
+from unittest import IsolatedAsyncioTestCase, TestCase
+
+from pypaystack2.enums import BulkChargeStatus, Status
+from pypaystack2.exceptions import PaystackResponseError
+from pypaystack2.helpers import (
+    AdaptivePollInterval,
+    AsyncBulkChargeDriver,
+    BulkChargeDriver,
+)
+from pypaystack2.models import (
+    BulkCharge,
+    BulkChargeInstruction,
+    BulkChargeUnitCharge,
+    Response,
+)
+from tests.unit.fakes import make_response
+
+
+class FakeBulkCharges:
+    """Processes `charges_per_poll` charges of a batch every time it is polled.
+
+    Charges are listed in the order they were processed, or newest first.
+    """
+
+    def __init__(
+        self,
+        charges_per_poll: int = 2,
+        stall_polls: int = 0,
+        newest_first: bool = False,
+    ):
+        self.charges_per_poll = charges_per_poll
+        self.stall_polls = stall_polls
+        self.newest_first = newest_first
+        self.batches: dict[str, list[BulkChargeInstruction]] = {}
+        self.processed: dict[str, int] = {}
+        self.polls: dict[str, int] = {}
+        self.paused: set[str] = set()
+        self.list_calls = 0
+
+    def initiate(self, body: list[BulkChargeInstruction]) -> Response[Any]:
+        batch_code = f"BCH_{len(self.batches)}"
+        self.batches[batch_code] = body
+        self.processed[batch_code] = 0
+        self.polls[batch_code] = 0
+        return make_response(self._batch(batch_code))
+
+    def _batch(self, batch_code: str) -> BulkCharge:
+        total = len(self.batches[batch_code])
+        pending = total - self.processed[batch_code]
+        if batch_code in self.paused:
+            status = BulkChargeStatus.PAUSED
+        else:
+            status = (
+                BulkChargeStatus.COMPLETE if not pending else BulkChargeStatus.ACTIVE
+            )
+        return BulkCharge.model_validate(
+            {
+                "batch_code": batch_code,
+                "id": 1,
+                "domain": "test",
+                "status": status,
+                "total_charges": total,
+                "pending_charges": pending,
+                "created_at": "2026-01-01T00:00:00.000Z",
+                "updated_at": "2026-01-01T00:00:00.000Z",
+            }
+        )
+
+    def get_batch(self, id_or_code: str) -> Response[Any]:
+        self.polls[id_or_code] += 1
+        if id_or_code not in self.paused and self.polls[id_or_code] > self.stall_polls:
+            self.processed[id_or_code] = min(
+                len(self.batches[id_or_code]),
+                self.processed[id_or_code] + self.charges_per_poll,
+            )
+        return make_response(self._batch(id_or_code))
+
+    def get_charges_in_batch(
+        self,
+        id_or_code: str,
+        status: Status,
+        pagination: int = 50,
+        page: int = 1,
+        start_date: str | None = None,
+        end_date: str | None = None,
+    ) -> Response[Any]:
+        self.list_calls += 1
+        processed = self.batches[id_or_code][: self.processed[id_or_code]]
+        if self.newest_first:
+            processed.reverse()
+        charges = [
+            BulkChargeUnitCharge.model_construct(
+                id=instruction.reference,
+                status=status,
+                transaction=SimpleNamespace(reference=instruction.reference),
+            )
+            for instruction in processed
+            if (instruction.amount % 2 == 0) == (status == Status.SUCCESS)
+        ]
+        return make_response(charges[(page - 1) * pagination : page * pagination])
+
+    def pause_batch(self, batch_code: str) -> Response[Any]:
+        self.paused.add(batch_code)
+        return make_response(None)
+
+    def resume_batch(self, batch_code: str) -> Response[Any]:
+        self.paused.discard(batch_code)
+        return make_response(None)
+
+
+def make_instructions(count: int) -> list[BulkChargeInstruction]:
+    return [
+        BulkChargeInstruction(
+            authorization=f"AUTH_{i}", amount=1000 + i, reference=f"charge-{i}"
+        )
+        for i in range(count)
+    ]
+
+
+class AdaptivePollIntervalTestCase(TestCase):
+    def test_backs_off_until_progress(self) -> None:
+        interval = AdaptivePollInterval(initial=1, maximum=5, factor=2)
+        self.assertEqual(
+            [interval.next(False) for _ in range(4)],
+            [2, 4, 5, 5],
+        )
+        self.assertEqual(interval.next(True), 1)
+
+
+class BulkChargeDriverTestCase(TestCase):
+    def setUp(self) -> None:
+        self.bulk_charges = FakeBulkCharges()
+        self.driver = BulkChargeDriver(
+            cast(Any, SimpleNamespace(bulk_charges=self.bulk_charges)),
+            chunk_size=5,
+            pagination=2,
+            poll_interval=0.001,
+            max_poll_interval=0.004,
+        )
+
+    def test_streams_every_final_charge_once(self) -> None:
+        self.assertEqual(
+            self.driver.submit(make_instructions(12)), ["BCH_0", "BCH_1", "BCH_2"]
+        )
+        outcomes = list(self.driver.outcomes())
+        self.assertEqual(
+            sorted(outcome.reference for outcome in outcomes),
+            sorted(f"charge-{i}" for i in range(12)),
+        )
+        statuses = {outcome.reference: outcome.status for outcome in outcomes}
+        self.assertEqual(statuses["charge-0"], Status.SUCCESS)
+        self.assertEqual(statuses["charge-1"], Status.FAILED)
+        self.assertTrue(all(batch.done for batch in self.driver.batches))
+        self.assertEqual(
+            [batch.reported_charges for batch in self.driver.batches], [5, 5, 2]
+        )
+
+    def test_stalled_batches_are_not_listed(self) -> None:
+        self.bulk_charges.stall_polls = 4
+        self.driver.submit(make_instructions(2))
+        list(self.driver.outcomes())
+        # polls that found the batch unchanged did not list its charges
+        self.assertGreaterEqual(self.bulk_charges.polls["BCH_0"], 5)
+        self.assertLessEqual(self.bulk_charges.list_calls, 2)
+
+    def test_listing_resumes_where_the_previous_poll_stopped(self) -> None:
+        self.bulk_charges.charges_per_poll = 1
+        self.driver.chunk_size = 40
+        self.driver.submit(make_instructions(40))
+        self.assertEqual(len(list(self.driver.outcomes())), 40)
+        # about one page per poll instead of every page listed so far
+        self.assertLessEqual(self.bulk_charges.list_calls, 2 * 40 + 2)
+
+    def test_lists_every_charge_when_newer_charges_come_first(self) -> None:
+        self.bulk_charges.newest_first = True
+        self.driver.submit(make_instructions(12))
+        outcomes = list(self.driver.outcomes())
+        self.assertEqual(
+            sorted(outcome.reference for outcome in outcomes),
+            sorted(f"charge-{i}" for i in range(12)),
+        )
+
+    def test_pause_and_resume(self) -> None:
+        self.driver.submit(make_instructions(10))
+        self.driver.pause("BCH_1")
+        outcomes = list(self.driver.outcomes())
+        self.assertEqual({outcome.batch_code for outcome in outcomes}, {"BCH_0"})
+        self.assertTrue(self.driver.batches[1].paused)
+        self.driver.resume()
+        outcomes = list(self.driver.outcomes())
+        self.assertEqual(len(outcomes), 5)
+        self.assertEqual(self.bulk_charges.paused, set())
+
+    def test_failed_initiation_raises(self) -> None:
+        self.bulk_charges.initiate = lambda body: make_response(
+            None, status=False, message="nope"
+        )  # type: ignore[method-assign]
+        with self.assertRaises(PaystackResponseError):
+            self.driver.submit(make_instructions(1))
+
+
+class AsyncBulkChargeDriverTestCase(IsolatedAsyncioTestCase):
+    async def test_streams_every_final_charge_once(self) -> None:
+        bulk_charges = FakeBulkCharges(charges_per_poll=3)
+
+        async def call(name: str, *args: Any, **kwargs: Any) -> Response[Any]:
+            return getattr(bulk_charges, name)(*args, **kwargs)
+
+        async def get_charges_in_batch(
+            id_or_code: str,
+            status: Status,
+            pagination: int = 50,
+            page: int = 1,
+            start_date: str | None = None,
+            end_date: str | None = None,
+        ) -> Response[Any]:
+            return bulk_charges.get_charges_in_batch(
+                id_or_code, status, pagination, page
+            )
+
+        client = SimpleNamespace(
+            bulk_charges=SimpleNamespace(
+                initiate=lambda body: call("initiate", body),
+                get_batch=lambda code: call("get_batch", code),
+                get_charges_in_batch=get_charges_in_batch,
+            )
+        )
+        driver = AsyncBulkChargeDriver(
+            cast(Any, client), chunk_size=4, poll_interval=0.001
+        )
+        await driver.submit(make_instructions(9))
+        references = [outcome.reference async for outcome in driver.outcomes()]
+        self.assertEqual(len(references), 9)
+        self.assertEqual(len(set(references)), 9)
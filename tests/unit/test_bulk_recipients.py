@@ -0,0 +1,136 @@
+from types import SimpleNamespace
+from typing import Any, cast
+from unittest import IsolatedAsyncioTestCase, TestCase
+
+from pypaystack2.enums import RecipientType
+from pypaystack2.helpers import AsyncBulkRecipientPipeline, BulkRecipientPipeline
+from pypaystack2.models import (
+    Recipient,
+    Response,
+    TransferRecipient,
+    TransferRecipientBulkCreateData,
+)
+from tests.unit.fakes import make_response
+
+
+def make_recipient(account_number: str, bank_code: str = "058") -> TransferRecipient:
+    return TransferRecipient.model_validate(
+        {
+            "active": True,
+            "created_at": "2026-01-01T00:00:00.000Z",
+            "currency": "NGN",
+            "domain": "test",
+            "id": int(account_number),
+            "integration": 1,
+            "name": f"Payee {account_number}",
+            "recipient_code": f"RCP_{account_number}_{bank_code}",
+            "type": "nuban",
+            "updated_at": "2026-01-01T00:00:00.000Z",
+            "is_deleted": False,
+            "details": {
+                "account_number": account_number,
+                "bank_code": bank_code,
+                "bank_name": "Guaranty Trust Bank",
+            },
+        }
+    )
+
+
+def make_payee(account_number: str, bank_code: str = "058") -> Recipient:
+    return Recipient(
+        type=RecipientType.NUBAN,
+        name=f"Payee {account_number}",
+        account_number=account_number,
+        bank_code=bank_code,
+    )
+
+
+def bulk_create(batch: list[Recipient]) -> Response[Any]:
+    return make_response(
+        TransferRecipientBulkCreateData(
+            success=[
+                make_recipient(payee.account_number, cast(str, payee.bank_code))
+                for payee in batch
+                if payee.account_number != "0000000404"
+            ],
+            errors=[
+                {"account_number": payee.account_number, "error": "Invalid account"}
+                for payee in batch
+                if payee.account_number == "0000000404"
+            ],
+        )
+    )
+
+
+class BulkRecipientPipelineTestCase(TestCase):
+    def setUp(self) -> None:
+        self.batches: list[list[Recipient]] = []
+
+        def recording_bulk_create(batch: list[Recipient]) -> Response[Any]:
+            self.batches.append(batch)
+            return bulk_create(batch)
+
+        def get_transfer_recipients(
+            page: int = 1,
+            pagination: int = 50,
+            start_date: str | None = None,
+            end_date: str | None = None,
+        ) -> Response[Any]:
+            existing = [make_recipient(f"{i:010}") for i in range(3)]
+            return make_response(existing[(page - 1) * pagination : page * pagination])
+
+        client = SimpleNamespace(
+            transfer_recipients=SimpleNamespace(
+                bulk_create=recording_bulk_create,
+                get_transfer_recipients=get_transfer_recipients,
+            )
+        )
+        self.pipeline = BulkRecipientPipeline(cast(Any, client), chunk_size=4)
+
+    def test_skips_existing_and_duplicate_rows(self) -> None:
+        self.assertEqual(self.pipeline.load_existing(pagination=2), 3)
+        payees = [make_payee(f"{i:010}") for i in range(10)]
+        payees.append(make_payee(f"{5:010}"))  # duplicate row
+        payees.append(make_payee(f"{5:010}", bank_code="011"))  # different bank
+        report = self.pipeline.create(payees)
+
+        self.assertTrue(report.ok)
+        self.assertEqual(report.existing, 3)
+        self.assertEqual(report.created, 8)
+        self.assertEqual([len(batch) for batch in self.batches], [4, 4])
+        self.assertEqual(report.recipient_codes[0], "RCP_0000000000_058")
+        self.assertEqual(report.recipient_codes[10], report.recipient_codes[5])
+        self.assertEqual(report.recipient_codes[11], "RCP_0000000005_011")
+        self.assertEqual(len(report.recipient_codes), 12)
+
+        self.batches.clear()
+        report = self.pipeline.create(payees)
+        self.assertEqual(report.existing, 12)
+        self.assertEqual(self.batches, [])
+
+    def test_reports_rows_that_could_not_be_created(self) -> None:
+        report = self.pipeline.create(
+            [make_payee("0000000001"), make_payee("0000000404")]
+        )
+        self.assertFalse(report.ok)
+        self.assertEqual(report.failed_rows, [1])
+        self.assertEqual(len(report.errors), 1)
+        self.assertEqual(report.recipient_codes, {0: "RCP_0000000001_058"})
+
+
+class AsyncBulkRecipientPipelineTestCase(IsolatedAsyncioTestCase):
+    async def test_creates_chunks_concurrently(self) -> None:
+        async def async_bulk_create(batch: list[Recipient]) -> Response[Any]:
+            if batch[0].account_number == "0000000000":
+                raise ConnectionError("network went away")
+            return bulk_create(batch)
+
+        client = SimpleNamespace(
+            transfer_recipients=SimpleNamespace(bulk_create=async_bulk_create)
+        )
+        pipeline = AsyncBulkRecipientPipeline(cast(Any, client), chunk_size=3)
+        report = await pipeline.create([make_payee(f"{i:010}") for i in range(9)])
+        self.assertEqual(report.failed_rows, [0, 1, 2])
+        self.assertEqual(len(report.failed_chunks), 1)
+        self.assertIsInstance(report.failed_chunks[0].error, ConnectionError)
+        self.assertEqual(sorted(report.recipient_codes), [3, 4, 5, 6, 7, 8])
@@ -0,0 +1,113 @@
+from types import SimpleNamespace
+from typing import Any, cast
+from unittest import IsolatedAsyncioTestCase, TestCase
+
+from pypaystack2.helpers import AsyncBulkTransferPipeline, BulkTransferPipeline
+from pypaystack2.models import BulkTransferItem, Response, TransferInstruction
+from tests.unit.fakes import make_response
+
+
+def bulk_transfer(
+    transfers: list[TransferInstruction], source: str = "balance"
+) -> Response[Any]:
+    if any(transfer.recipient == "RCP_broken" for transfer in transfers):
+        return make_response(None, status=False, message="Invalid recipient")
+    if any(transfer.recipient == "RCP_offline" for transfer in transfers):
+        raise ConnectionError("network went away")
+    # paystack does not promise to return the items in the submitted order
+    return make_response(
+        [
+            BulkTransferItem(
+                reference=cast(str, transfer.reference),
+                recipient=transfer.recipient,
+                amount=transfer.amount,
+                transfer_code=f"TRF_{transfer.reference}",
+                currency="NGN",
+                status="pending",
+            )
+            for transfer in reversed(transfers)
+        ]
+    )
+
+
+def make_instructions(count: int) -> list[TransferInstruction]:
+    return [
+        TransferInstruction(
+            amount=100 * (i + 1),
+            recipient=f"RCP_{i}",
+            reference=f"payroll-{i}" if i % 2 else None,
+            reason="salary",
+        )
+        for i in range(count)
+    ]
+
+
+class BulkTransferPipelineTestCase(TestCase):
+    def setUp(self) -> None:
+        self.chunks: list[list[TransferInstruction]] = []
+
+        def recording_bulk_transfer(
+            transfers: list[TransferInstruction], source: str = "balance"
+        ) -> Response[Any]:
+            self.chunks.append(transfers)
+            return bulk_transfer(transfers, source)
+
+        client = SimpleNamespace(
+            transfers=SimpleNamespace(bulk_transfer=recording_bulk_transfer)
+        )
+        self.pipeline = BulkTransferPipeline(cast(Any, client), chunk_size=10)
+
+    def test_submits_chunks_and_merges_items_in_input_order(self) -> None:
+        report = self.pipeline.submit(make_instructions(25))
+        self.assertTrue(report.ok)
+        self.assertEqual(sorted(len(chunk) for chunk in self.chunks), [5, 10, 10])
+        self.assertEqual(
+            [item.recipient for item in report.items],  # type: ignore[union-attr]
+            [f"RCP_{i}" for i in range(25)],
+        )
+        self.assertTrue(all(transfer.reference for transfer in report.transfers))
+        self.assertEqual(report.transfers[1].reference, "payroll-1")
+
+    def test_reports_failed_chunks_for_idempotent_retry(self) -> None:
+        instructions = make_instructions(25)
+        instructions[3].recipient = "RCP_broken"
+        instructions[22].recipient = "RCP_offline"
+        report = self.pipeline.submit(instructions)
+        self.assertFalse(report.ok)
+        self.assertEqual([chunk.index for chunk in report.failed_chunks], [0, 2])
+        self.assertEqual(report.failed_chunks[0].message, "Invalid recipient")
+        self.assertIsInstance(report.failed_chunks[1].error, ConnectionError)
+        pending = report.pending_transfers()
+        self.assertEqual(len(pending), 15)
+        self.assertEqual(
+            [transfer.reference for transfer in pending],
+            [transfer.reference for transfer in report.failed_chunks[0].transfers]
+            + [transfer.reference for transfer in report.failed_chunks[1].transfers],
+        )
+
+    def test_rejects_duplicate_references_and_invalid_chunk_sizes(self) -> None:
+        instructions = make_instructions(4)
+        instructions[3].reference = instructions[1].reference
+        with self.assertRaises(ValueError):
+            self.pipeline.submit(instructions)
+        with self.assertRaises(ValueError):
+            BulkTransferPipeline(cast(Any, None), chunk_size=101)
+
+
+class AsyncBulkTransferPipelineTestCase(IsolatedAsyncioTestCase):
+    async def test_submits_chunks_concurrently(self) -> None:
+        async def async_bulk_transfer(
+            transfers: list[TransferInstruction], source: str = "balance"
+        ) -> Response[Any]:
+            return bulk_transfer(transfers, source)
+
+        client = SimpleNamespace(
+            transfers=SimpleNamespace(bulk_transfer=async_bulk_transfer)
+        )
+        pipeline = AsyncBulkTransferPipeline(cast(Any, client), chunk_size=7)
+        report = await pipeline.submit(make_instructions(30))
+        self.assertTrue(report.ok)
+        self.assertEqual(
+            [item.amount for item in report.items],  # type: ignore[union-attr]
+            [100 * (i + 1) for i in range(30)],
+        )
@@ -0,0 +1,67 @@
+import tempfile
+import time
+from pathlib import Path
+from unittest import TestCase
+
+from pypaystack2.caching import CacheBackend, MemoryCache, SQLiteCache
+
+
+class CacheBackendTestMixin:
+    def make_cache(self, max_size: int | None = None) -> CacheBackend:
+        raise NotImplementedError
+
+    def test_get_set_delete(self) -> None:
+        cache = self.make_cache()
+        self.assertIsNone(cache.get("a"))
+        cache.set("a", {"name": "Ada", "amounts": [1, 2]})
+        self.assertEqual(cache.get("a"), {"name": "Ada", "amounts": [1, 2]})
+        cache.delete("a")
+        self.assertIsNone(cache.get("a"))
+
+    def test_entries_expire(self) -> None:
+        cache = self.make_cache()
+        cache.set("a", 1, ttl=0.01)
+        cache.set("b", 2)
+        time.sleep(0.02)
+        self.assertIsNone(cache.get("a"))
+        self.assertEqual(cache.get("b"), 2)
+
+    def test_evicts_least_recently_used(self) -> None:
+        cache = self.make_cache(max_size=2)
+        cache.set("a", 1)
+        time.sleep(0.001)
+        cache.set("b", 2)
+        time.sleep(0.001)
+        cache.get("a")
+        time.sleep(0.001)
+        cache.set("c", 3)
+        self.assertEqual(cache.get("a"), 1)
+        self.assertIsNone(cache.get("b"))
+        self.assertEqual(cache.get("c"), 3)
+        cache.clear()
+        self.assertIsNone(cache.get("a"))
+
+
+class MemoryCacheTestCase(CacheBackendTestMixin, TestCase):
+    def make_cache(self, max_size: int | None = None) -> CacheBackend:
+        return MemoryCache(max_size=max_size)
+
+
+class SQLiteCacheTestCase(CacheBackendTestMixin, TestCase):
+    def setUp(self) -> None:
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = Path(self.directory.name) / "cache.db"
+
+    def tearDown(self) -> None:
+        self.directory.cleanup()
+
+    def make_cache(self, max_size: int | None = None) -> CacheBackend:
+        cache = SQLiteCache(self.path, max_size=max_size)
+        self.addCleanup(cache.close)
+        return cache
+
+    def test_persists_across_instances(self) -> None:
+        with SQLiteCache(self.path) as cache:
+            cache.set_many({"a": 1, "b": 2}, ttl=60)
+        with SQLiteCache(self.path) as cache:
+            self.assertEqual((cache.get("a"), cache.get("b"), len(cache)), (1, 2, 2))
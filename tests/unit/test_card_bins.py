@@ -0,0 +1,126 @@
+import tempfile
+import threading
+from pathlib import Path
+from types import SimpleNamespace
+from typing import Any, cast
+from unittest import IsolatedAsyncioTestCase, TestCase
+
+from pypaystack2.helpers import AsyncCardBinIndex, CardBinIndex
+from pypaystack2.models import CardBin, Response
+from tests.unit.fakes import make_response
+
+
+class FakeVerification:
+    """Knows every BIN starting with 5."""
+
+    def __init__(self) -> None:
+        self.calls: list[str] = []
+        self.lock = threading.Lock()
+
+    def resolve_card_bin(self, bin_: str) -> Response[Any]:
+        with self.lock:
+            self.calls.append(bin_)
+        known = bin_.startswith("5")
+        return make_response(
+            CardBin.model_validate(
+                {
+                    "bin": bin_,
+                    "brand": "Mastercard",
+                    "sub_brand": "",
+                    "country_code": "NG",
+                    "country_name": "Nigeria",
+                    "card_type": "DEBIT",
+                    "bank": "Guaranty Trust Bank",
+                    "linked_bank_id": 9,
+                }
+            )
+            if known
+            else None,
+            status=known,
+            message="Bin resolved" if known else "Bin not found",
+            status_code=200 if known else 404,
+        )
+
+    async def aresolve_card_bin(self, bin_: str) -> Response[Any]:
+        return self.resolve_card_bin(bin_)
+
+
+class CardBinIndexTestCase(TestCase):
+    def setUp(self) -> None:
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.path = Path(directory.name) / "bins.db"
+        self.verification = FakeVerification()
+        self.client = cast(Any, SimpleNamespace(verification=self.verification))
+
+    def test_resolves_a_bin_once(self) -> None:
+        with CardBinIndex(self.client, self.path) as bins:
+            card = bins.lookup("5399 8300 0000 0008")
+            self.assertIsNotNone(card)
+            self.assertEqual(cast(CardBin, card).bank, "Guaranty Trust Bank")
+            self.assertIs(bins.lookup("539983"), card)
+            self.assertIsNone(bins.lookup("4084084084084081"))
+            self.assertIsNone(bins.lookup("408408"))
+        self.assertEqual(self.verification.calls, ["539983", "408408"])
+        with self.assertRaises(ValueError):
+            CardBinIndex(self.client).lookup("1234")
+
+    def test_resolves_a_miss_on_the_calling_thread(self) -> None:
+        resolving_threads: list[threading.Thread] = []
+
+        def resolve_card_bin(bin_: str) -> Response[Any]:
+            resolving_threads.append(threading.current_thread())
+            if bin_ == "500000":
+                raise ConnectionError("connection reset")
+            return self.verification.resolve_card_bin(bin_)
+
+        client = cast(
+            Any,
+            SimpleNamespace(
+                verification=SimpleNamespace(resolve_card_bin=resolve_card_bin)
+            ),
+        )
+        bins = CardBinIndex(client)
+        self.assertIsNotNone(bins.lookup("539983"))
+        # a failed call is not cached
+        self.assertIsNone(bins.lookup("500000"))
+        self.assertIsNone(bins.lookup("500000"))
+        self.assertEqual(resolving_threads, [threading.current_thread()] * 3)
+        self.assertEqual(bins.api_calls, 3)
+
+    def test_warm_up_persists_across_instances(self) -> None:
+        bins = [f"5{i:05d}" for i in range(50)] + ["400000", "500000"]
+        with CardBinIndex(self.client, self.path, memory_size=10) as index:
+            self.assertEqual(index.warm(bins, workers=4), 51)
+            self.assertEqual(index.warm(bins), 0)
+        with CardBinIndex(self.client, self.path) as index:
+            self.assertEqual(index.warm(bins), 0)
+            self.assertEqual(cast(CardBin, index.lookup("500049")).bin, "500049")
+            self.assertIsNone(index.lookup("400000"))
+            self.assertEqual(index.api_calls, 0)
+        self.assertEqual(len(self.verification.calls), 51)
+
+    def test_evicts_least_recently_used_bins(self) -> None:
+        with CardBinIndex(self.client, self.path, max_size=2, memory_size=1) as index:
+            index.warm(["500001"])
+            index.warm(["500002"])
+            index.lookup("500001")
+            index.warm(["500003"])
+            self.assertEqual(index.warm(["500001", "500002", "500003"]), 1)
+        self.assertEqual(self.verification.calls[-1], "500002")
+
+
+class AsyncCardBinIndexTestCase(IsolatedAsyncioTestCase):
+    async def test_resolves_a_bin_once(self) -> None:
+        verification = FakeVerification()
+        client = SimpleNamespace(
+            verification=SimpleNamespace(
+                resolve_card_bin=verification.aresolve_card_bin
+            )
+        )
+        with AsyncCardBinIndex(cast(Any, client)) as bins:
+            self.assertEqual(await bins.warm(["539983", "539983", "408408"]), 2)
+            card = await bins.lookup("5399830000000008")
+            self.assertEqual(cast(CardBin, card).brand, "Mastercard")
+            self.assertIsNone(await bins.lookup("408408"))
+        self.assertEqual(sorted(verification.calls), ["408408", "539983"])
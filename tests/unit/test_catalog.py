@@ -0,0 +1,173 @@
+from typing import Any, cast
+from unittest import IsolatedAsyncioTestCase, TestCase
+
+from pypaystack2.helpers import AsyncCatalog, Catalog, CatalogSnapshot
+from pypaystack2.models import PaymentPage, Plan, Product, Response
+from tests.unit.fakes import FakeClient, make_response
+
+
+def page_response(data: list[Any], page: int, page_count: int) -> Response[Any]:
+    return make_response(
+        data,
+        message="",
+        meta={"page": page, "pageCount": page_count},
+        raw={"status": True, "data": data},
+    )
+
+
+def paginate(records: list[Any], page: int, pagination: int) -> Response[Any]:
+    page_count = max(1, -(-len(records) // pagination))
+    return page_response(
+        records[(page - 1) * pagination : page * pagination], page, page_count
+    )
+
+
+PRODUCTS = [
+    Product.model_construct(id=id, product_code=f"PROD_{id}", slug=f"product-{id}")
+    for id in range(1, 6)
+]
+PLANS = [Plan.model_construct(id=10, plan_code="PLN_10")]
+PAGES = [
+    PaymentPage.model_construct(id=20, slug="monthly", plan=10, products=None),
+    PaymentPage.model_construct(id=21, slug="yearly", plan=10, products=None),
+    PaymentPage.model_construct(id=22, slug="shop", plan=None, products=PRODUCTS[:2]),
+]
+STOREFRONTS = [{"id": 30, "slug": "store"}, {"id": 31, "slug": "outlet"}]
+STOREFRONT_PRODUCTS = {
+    "30": [{"id": 1}, {"id": 3}],
+    "31": [{"product_code": "PROD_3"}, {"id": 99}],
+}
+
+
+class FakeResource:
+    def __init__(self, records: list[Any], calls: list[str], name: str):
+        self.records = records
+        self.calls = calls
+        self.name = name
+
+    def list(self, page: int = 1, pagination: int = 50) -> Response[Any]:
+        self.calls.append(self.name)
+        return paginate(self.records, page, pagination)
+
+
+class FakeStorefronts:
+    def __init__(self, calls: list[str]):
+        self.calls = calls
+
+    def get_storefronts(self, pagination: int = 50, page: int = 1) -> Response[Any]:
+        self.calls.append("storefronts")
+        response = paginate(STOREFRONTS, page, pagination)
+        return response.model_copy(update={"data": None})
+
+    def get_products(self, id: str) -> Response[Any]:
+        self.calls.append(f"storefront {id}")
+        return page_response(STOREFRONT_PRODUCTS[id], 1, 1)
+
+
+class FakeCatalogClient(FakeClient):
+    def __init__(self) -> None:
+        self.calls: list[str] = []
+        products = FakeResource(PRODUCTS, self.calls, "products")
+        products.get_products = products.list  # type: ignore[attr-defined]
+        plans = FakeResource(PLANS, self.calls, "plans")
+        plans.get_plans = plans.list  # type: ignore[attr-defined]
+        payment_pages = FakeResource(PAGES, self.calls, "pages")
+        payment_pages.get_pages = payment_pages.list  # type: ignore[attr-defined]
+        super().__init__(
+            products=products,
+            plans=plans,
+            payment_pages=payment_pages,
+            storefronts=FakeStorefronts(self.calls),
+        )
+
+
+class CatalogTestCase(TestCase):
+    def test_indexes_the_catalog(self) -> None:
+        client = FakeCatalogClient()
+        snapshot = Catalog(cast(Any, client), pagination=2).snapshot
+
+        self.assertEqual(len(snapshot.products), 5)
+        self.assertEqual(client.calls.count("products"), 3)
+        self.assertIs(snapshot.product("PROD_2"), PRODUCTS[1])
+        self.assertIs(snapshot.product("product-2"), PRODUCTS[1])
+        self.assertIs(snapshot.product("2"), PRODUCTS[1])
+        self.assertEqual(
+            [page.slug for page in snapshot.plan_pages("PLN_10")],
+            ["monthly", "yearly"],
+        )
+        self.assertEqual(snapshot.page_products("shop"), PRODUCTS[:2])
+        self.assertEqual([page.id for page in snapshot.product_pages(1)], [22])
+        self.assertEqual(
+            snapshot.storefront_products("store"), [PRODUCTS[0], PRODUCTS[2]]
+        )
+        self.assertEqual(snapshot.storefront_products(31), [PRODUCTS[2]])
+        self.assertEqual(
+            [
+                storefront["slug"]
+                for storefront in snapshot.product_storefronts("PROD_3")
+            ],
+            ["store", "outlet"],
+        )
+        self.assertIsNone(snapshot.plan("PLN_missing"))
+        self.assertEqual(snapshot.plan_pages("PLN_missing"), [])
+
+    def test_refreshes_a_stale_snapshot_in_the_background(self) -> None:
+        now = 1000.0
+        client = FakeCatalogClient()
+        catalog = Catalog(cast(Any, client), ttl=300)
+        catalog._clock = lambda: now
+
+        def read_and_wait_for_refresh() -> CatalogSnapshot:
+            snapshot = catalog.snapshot
+            refreshing = catalog._refreshing
+            if refreshing is not None:
+                refreshing.join()
+            return snapshot
+
+        first = catalog.load()
+        self.assertIs(read_and_wait_for_refresh(), first)
+        now += 300
+        get_plans = client.plans.get_plans  # type: ignore[attr-defined]
+        client.plans.get_plans = None  # type: ignore[attr-defined]
+        self.assertIs(read_and_wait_for_refresh(), first)  # served while refreshing
+        self.assertIsInstance(catalog.last_error, TypeError)
+        now += 59  # a failed refresh is retried a minute later
+        self.assertIs(read_and_wait_for_refresh(), first)
+        client.plans.get_plans = get_plans  # type: ignore[attr-defined]
+        now += 1
+        self.assertIs(read_and_wait_for_refresh(), first)
+        self.assertIsNot(catalog.snapshot, first)
+        self.assertIsNone(catalog.last_error)
+
+
+class AsyncCatalogTestCase(IsolatedAsyncioTestCase):
+    async def test_loads_the_catalog_concurrently(self) -> None:
+        client = FakeCatalogClient()
+        for resource in (client.products, client.plans, client.payment_pages):
+            method = resource.list
+
+            async def list_async(page: int = 1, pagination: int = 50, method=method):
+                return method(page, pagination)
+
+            setattr(resource, f"get_{resource.name}", list_async)
+        storefronts = client.storefronts
+        get_storefronts, get_products = (
+            storefronts.get_storefronts,
+            storefronts.get_products,
+        )
+
+        async def get_storefronts_async(pagination: int = 50, page: int = 1):
+            return get_storefronts(pagination, page)
+
+        async def get_products_async(id: str):
+            return get_products(id)
+
+        storefronts.get_storefronts = get_storefronts_async  # type: ignore[method-assign]
+        storefronts.get_products = get_products_async  # type: ignore[method-assign]
+
+        catalog = AsyncCatalog(cast(Any, client))
+        with self.assertRaises(RuntimeError):
+            catalog.snapshot
+        await catalog.load()
+        self.assertEqual(catalog.snapshot.storefront_products("outlet"), [PRODUCTS[2]])
+        self.assertEqual(len(catalog.snapshot.pages), 3)
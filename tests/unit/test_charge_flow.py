@@ -0,0 +1,206 @@
+import asyncio
+from typing import Any, cast
+from unittest import IsolatedAsyncioTestCase
+
+from pypaystack2.helpers import ChargeFlowDriver, ChargeFlowResult, ChargeInputRequest
+from pypaystack2.models import Response
+from tests.unit.fakes import FakeClient, make_response
+
+
+def charge_response(reference: str, status: str) -> Response[Any]:
+    data: dict[str, Any] = {"reference": reference, "status": status}
+    if status in ("success", "failed"):
+        data.update(
+            id=1,
+            domain="test",
+            amount=50_000,
+            channel="card",
+            currency="NGN",
+            customer={
+                "id": 1,
+                "email": "customer@example.com",
+                "customer_code": "CUS_1",
+                "risk_action": "default",
+            },
+            authorization={},
+        )
+    elif status.startswith("send_"):
+        data["display_text"] = f"Please {status.removeprefix('send_')}"
+    body = {"status": status != "failed", "message": status, "data": data}
+    return make_response(
+        None, status=body["status"], message=status, status_code=200, raw=body
+    )
+
+
+class FakeCharge:
+    """Moves every charge through the same scripted statuses, one per request."""
+
+    def __init__(self, script: list[str], fail_first_check: bool = False):
+        self.script = script
+        self.fail_first_check = fail_first_check
+        self.positions: dict[str, int] = {}
+        self.calls: list[tuple[str, str, Any]] = []
+        self.in_flight = 0
+        self.peak = 0
+
+    async def _advance(self, method: str, reference: str, value: Any) -> Response[Any]:
+        self.calls.append((method, reference, value))
+        self.in_flight += 1
+        self.peak = max(self.peak, self.in_flight)
+        await asyncio.sleep(0.001)
+        self.in_flight -= 1
+        if method == "check_pending_charge" and self.fail_first_check:
+            self.fail_first_check = False
+            raise ConnectionError("connection reset")
+        position = self.positions.get(reference, 0)
+        self.positions[reference] = position + 1
+        return charge_response(
+            reference, self.script[min(position, len(self.script) - 1)]
+        )
+
+    async def charge(self, reference: str, **kwargs: Any) -> Response[Any]:
+        return await self._advance("charge", reference, kwargs)
+
+    async def submit_pin(self, pin: str, reference: str) -> Response[Any]:
+        return await self._advance("submit_pin", reference, pin)
+
+    async def submit_otp(self, otp: str, reference: str) -> Response[Any]:
+        return await self._advance("submit_otp", reference, otp)
+
+    async def set_address(self, reference: str, **address: str) -> Response[Any]:
+        return await self._advance("set_address", reference, address)
+
+    async def check_pending_charge(self, reference: str) -> Response[Any]:
+        return await self._advance("check_pending_charge", reference, None)
+
+
+class ChargeFlowDriverTestCase(IsolatedAsyncioTestCase):
+    def make_driver(self, charge: FakeCharge, **kwargs: Any) -> ChargeFlowDriver:
+        kwargs.setdefault("poll_interval", 0.001)
+        kwargs.setdefault("max_poll_interval", 0.005)
+        return ChargeFlowDriver(cast(Any, FakeClient(charge=charge)), **kwargs)
+
+    async def test_drives_a_charge_through_every_step(self) -> None:
+        charge = FakeCharge(["send_pin", "send_otp", "pending", "pending", "success"])
+        requests: list[ChargeInputRequest] = []
+
+        async def provide(request: ChargeInputRequest) -> str:
+            requests.append(request)
+            return "1234" if request.step == "send_pin" else "123456"
+
+        driver = self.make_driver(
+            charge, input_providers={"send_pin": provide, "send_otp": provide}
+        )
+        result = await driver.drive(
+            email="a@example.com", amount=50_000, reference="r1"
+        )
+
+        self.assertTrue(result.ok)
+        self.assertEqual(
+            result.steps, ["send_pin", "send_otp", "pending", "pending", "success"]
+        )
+        self.assertIsNotNone(result.transaction)
+        self.assertEqual(
+            [(request.step, request.display_text) for request in requests],
+            [("send_pin", "Please pin"), ("send_otp", "Please otp")],
+        )
+        self.assertEqual(
+            [(method, value) for method, _, value in charge.calls[1:]],
+            [
+                ("submit_pin", "1234"),
+                ("submit_otp", "123456"),
+                ("check_pending_charge", None),
+                ("check_pending_charge", None),
+            ],
+        )
+
+    async def test_stops_at_a_step_without_input(self) -> None:
+        charge = FakeCharge(["send_address", "success"])
+
+        async def decline(request: ChargeInputRequest) -> None:
+            return None
+
+        result = await self.make_driver(charge).drive(email="a@example.com", amount=1)
+        self.assertEqual(result.status, "send_address")
+        self.assertEqual(len(result.reference), 32)  # a reference was assigned
+
+        driver = self.make_driver(charge, input_providers={"send_address": decline})
+        result = await driver.drive(email="a@example.com", amount=1, reference="r2")
+        self.assertEqual(
+            (result.status, result.steps), ("send_address", ["send_address"])
+        )
+
+    async def test_failed_request_is_checked_again(self) -> None:
+        charge = FakeCharge(["pending", "failed"], fail_first_check=True)
+        result = await self.make_driver(charge).drive(
+            email="a@example.com", amount=1, reference="r3"
+        )
+        self.assertEqual(result.status, "failed")
+        self.assertFalse(result.ok)
+        self.assertEqual(
+            [method for method, _, _ in charge.calls],
+            ["charge", "check_pending_charge", "check_pending_charge"],
+        )
+
+    async def test_gives_up_on_a_charge_pending_for_too_long(self) -> None:
+        charge = FakeCharge(["pending"])
+        result = await self.make_driver(charge, pending_timeout=0.02).drive(
+            email="a@example.com", amount=1, reference="r4"
+        )
+        self.assertEqual(result.status, "pending")
+
+    async def test_drives_many_charges_concurrently(self) -> None:
+        charge = FakeCharge(["send_otp", "pending", "success"])
+        customers_answered = asyncio.Event()
+
+        async def provide_otp(request: ChargeInputRequest) -> str:
+            # every charge waits on its customer at once
+            await customers_answered.wait()
+            return "123456"
+
+        driver = self.make_driver(
+            charge, input_providers={"send_otp": provide_otp}, concurrency=5
+        )
+        completed: list[ChargeFlowResult] = []
+        driving = asyncio.create_task(
+            driver.drive_many(
+                [
+                    {"email": "a@example.com", "amount": 1, "reference": f"ref-{i}"}
+                    for i in range(50)
+                ],
+                on_result=completed.append,
+            )
+        )
+        while len(charge.calls) < 50:
+            await asyncio.sleep(0.01)
+        self.assertFalse(driving.done())
+        customers_answered.set()
+        results = await asyncio.wait_for(driving, 5)
+
+        self.assertEqual(
+            [result.reference for result in results], [f"ref-{i}" for i in range(50)]
+        )
+        self.assertTrue(all(result.ok for result in results))
+        self.assertEqual(len(completed), 50)
+        self.assertLessEqual(charge.peak, 5)
+
+    async def test_failed_charge_does_not_discard_the_others(self) -> None:
+        charge = FakeCharge(["send_otp", "success"])
+
+        async def provide_otp(request: ChargeInputRequest) -> str:
+            if request.reference == "ref-1":
+                raise RuntimeError("customer went away")
+            return "123456"
+
+        driver = self.make_driver(charge, input_providers={"send_otp": provide_otp})
+        results = await driver.drive_many(
+            [
+                {"email": "a@example.com", "amount": 1, "reference": f"ref-{i}"}
+                for i in range(3)
+            ]
+        )
+        self.assertEqual(
+            [(result.reference, result.status) for result in results],
+            [("ref-0", "success"), ("ref-1", "error"), ("ref-2", "success")],
+        )
+        self.assertEqual(results[1].message, "customer went away")
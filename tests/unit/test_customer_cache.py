@@ -0,0 +1,122 @@
+import asyncio
+from typing import Any, cast
+from unittest import IsolatedAsyncioTestCase, TestCase
+
+from pypaystack2.enums import RiskAction
+from pypaystack2.helpers import AsyncCustomerCache, CustomerCache
+from pypaystack2.models import Customer, Response
+from tests.unit.fakes import FakeClient, make_response
+
+
+def customer_response(customer: Customer | None) -> Response[Any]:
+    return make_response(
+        customer,
+        status=customer is not None,
+        message="",
+        status_code=200 if customer else 404,
+        raw={},
+    )
+
+
+class FakeCustomers:
+    def __init__(self) -> None:
+        self.customers = {
+            "CUS_1": Customer(
+                id=1,
+                email="ada@example.com",
+                customer_code="CUS_1",
+                risk_action="default",
+            )
+        }
+        self.calls: list[str] = []
+
+    def find(self, email_or_code: str) -> Customer | None:
+        email_or_code = email_or_code.lower() if "@" in email_or_code else email_or_code
+        for customer in self.customers.values():
+            if email_or_code in (customer.email, customer.customer_code):
+                return customer
+        return None
+
+    def get_customer(self, email_or_code: str) -> Response[Any]:
+        self.calls.append(email_or_code)
+        return customer_response(self.find(email_or_code))
+
+    def flag(
+        self, customer: str, risk_action: RiskAction | None = None
+    ) -> Response[Any]:
+        found = cast(Customer, self.find(customer))
+        found = found.model_copy(update={"risk_action": risk_action})
+        self.customers[found.customer_code] = found
+        return customer_response(found)
+
+    def update(self, code: str, **kwargs: Any) -> Response[Any]:
+        updated = self.customers[code].model_copy(update=kwargs)
+        self.customers[code] = updated
+        return customer_response(updated)
+
+    def validate(self, email_or_code: str, **kwargs: Any) -> Response[Any]:
+        return customer_response(None)
+
+
+class FakeAsyncCustomers(FakeCustomers):
+    async def get_customer(self, email_or_code: str) -> Response[Any]:  # type: ignore[override]
+        await asyncio.sleep(0.01)
+        return super().get_customer(email_or_code)
+
+
+class CustomerCacheTestCase(TestCase):
+    def setUp(self) -> None:
+        self.customers = FakeCustomers()
+        self.cache = CustomerCache(
+            cast(Any, FakeClient(customers=self.customers)), max_size=2
+        )
+
+    def test_indexes_customers_by_email_and_code(self) -> None:
+        self.assertEqual(self.cache.get("Ada@Example.com").customer_code, "CUS_1")
+        self.assertEqual(self.cache.get("CUS_1").email, "ada@example.com")
+        self.assertEqual(self.cache.get("ada@example.com").id, 1)
+        self.assertEqual(self.customers.calls, ["Ada@Example.com"])
+        self.assertEqual((self.cache.hits, self.cache.misses), (2, 1))
+        self.assertAlmostEqual(self.cache.hit_rate, 2 / 3)
+
+        # unknown customers are looked up again
+        self.assertIsNone(self.cache.get("CUS_2"))
+        self.assertIsNone(self.cache.get("CUS_2"))
+        self.assertEqual(len(self.customers.calls), 3)
+
+    def test_writes_invalidate_the_customer(self) -> None:
+        self.cache.get("CUS_1")
+        self.cache.flag("ada@example.com", RiskAction.BLACKLIST)
+        self.assertEqual(self.cache.get("CUS_1").risk_action, RiskAction.BLACKLIST)
+        self.cache.validate("CUS_1", first_name="Ada")
+        self.cache.get("ada@example.com")
+        self.assertEqual(self.customers.calls, ["CUS_1", "CUS_1", "ada@example.com"])
+
+    def test_changed_email_is_not_served(self) -> None:
+        self.cache = CustomerCache(cast(Any, FakeClient(customers=self.customers)))
+        self.cache.get("ada@example.com")
+        self.cache.update("CUS_1", email="lovelace@example.com")
+        self.assertEqual(self.cache.get("CUS_1").email, "lovelace@example.com")
+        self.assertIsNone(self.cache.get("ada@example.com"))
+        self.assertEqual(self.cache.get("lovelace@example.com").customer_code, "CUS_1")
+        self.assertEqual(
+            self.customers.calls, ["ada@example.com", "CUS_1", "ada@example.com"]
+        )
+
+    def test_alias_outliving_its_customer_is_not_served(self) -> None:
+        self.cache = CustomerCache(cast(Any, FakeClient(customers=self.customers)))
+        self.cache.get("ada@example.com")
+        self.cache._customers.delete("code:CUS_1")  # evicted before its email
+        self.customers.update("CUS_1", email="lovelace@example.com")
+        self.cache.get("CUS_1")
+        self.assertIsNone(self.cache.get("ada@example.com"))
+
+
+class AsyncCustomerCacheTestCase(IsolatedAsyncioTestCase):
+    async def test_concurrent_misses_share_one_request(self) -> None:
+        customers = FakeAsyncCustomers()
+        cache = AsyncCustomerCache(cast(Any, FakeClient(customers=customers)))
+        found = await asyncio.gather(*(cache.get("CUS_1") for _ in range(10)))
+        self.assertTrue(all(customer is found[0] for customer in found))
+        self.assertEqual(customers.calls, ["CUS_1"])
+        self.assertIs(await cache.get("ada@example.com"), found[0])
@@ -0,0 +1,139 @@
+from datetime import datetime, timedelta, timezone
+from typing import Any, cast
+from unittest import IsolatedAsyncioTestCase, TestCase
+
+from pypaystack2.helpers import (
+    AsyncCustomerDirectoryBuilder,
+    CustomerDirectory,
+    CustomerDirectoryBuilder,
+)
+from pypaystack2.models import Customer, Response
+from tests.unit.fakes import FakeClient, make_response
+
+CREATED_AT = datetime(2026, 1, 1, tzinfo=timezone.utc)
+
+
+def make_customer(id: int, first_name: str, last_name: str, **kwargs: Any) -> Customer:
+    return Customer(
+        id=id,
+        email=f"{first_name}.{last_name}@example.com".lower(),
+        customer_code=f"CUS_{id}",
+        first_name=first_name,
+        last_name=last_name,
+        risk_action="default",
+        created_at=CREATED_AT + timedelta(days=id),
+        updated_at=CREATED_AT + timedelta(days=id),
+        **kwargs,
+    )
+
+
+class FakeCustomers:
+    def __init__(self, customers: list[Customer]):
+        self.customers = customers
+        self.start_dates: list[str | None] = []
+
+    def get_customers(
+        self,
+        start_date: str | None = None,
+        end_date: str | None = None,
+        page: int = 1,
+        pagination: int = 50,
+    ) -> Response[Any]:
+        if page == 1:
+            self.start_dates.append(start_date)
+        customers = [
+            customer
+            for customer in self.customers
+            if start_date is None
+            or cast(datetime, customer.created_at).isoformat() >= start_date[:19]
+        ]
+        data = customers[(page - 1) * pagination : page * pagination]
+        return make_response(
+            data,
+            message="",
+            meta={"pageCount": max(1, -(-len(customers) // pagination))},
+            raw={},
+        )
+
+
+class FakeAsyncCustomers(FakeCustomers):
+    async def get_customers(  # type: ignore[override]
+        self,
+        start_date: str | None = None,
+        end_date: str | None = None,
+        page: int = 1,
+        pagination: int = 50,
+    ) -> Response[Any]:
+        return super().get_customers(start_date, end_date, page, pagination)
+
+
+class CustomerDirectoryTestCase(TestCase):
+    def setUp(self) -> None:
+        self.directory = CustomerDirectory(
+            [
+                make_customer(1, "Ada", "Lovelace", phone="08012345678"),
+                make_customer(2, "Adaeze", "Okafor", phone="+234 801 234 5678"),
+                make_customer(3, "Kwame", "Mensah"),
+            ]
+        )
+
+    def test_lookups(self) -> None:
+        self.assertEqual(len(self.directory), 3)
+        self.assertEqual(self.directory.by_email("ADA.Lovelace@example.com").id, 1)
+        self.assertEqual(self.directory.by_code("CUS_3").last_name, "Mensah")
+        self.assertEqual(
+            [record.id for record in self.directory.by_phone("2348012345678")], [1, 2]
+        )
+        self.assertEqual([record.id for record in self.directory.search("ada")], [1, 2])
+        self.assertEqual([record.id for record in self.directory.search("ada l")], [1])
+        self.assertEqual([record.id for record in self.directory.search("mens")], [3])
+        self.assertEqual(self.directory.search("ada", limit=1)[0].id, 1)
+        self.assertIsNone(self.directory.by_email("missing@example.com"))
+
+    def test_upsert_keeps_the_newest_version(self) -> None:
+        renamed = make_customer(1, "Augusta", "King", phone="07000000000")
+        renamed.updated_at = CREATED_AT + timedelta(days=30)
+        self.assertTrue(self.directory.upsert(renamed))
+        older = make_customer(1, "Ada", "Lovelace").model_copy(
+            update={"updated_at": CREATED_AT}
+        )
+        self.assertFalse(self.directory.upsert(older))
+        self.assertEqual(self.directory.get(1).name, "Augusta King")
+        self.assertIsNone(self.directory.by_email("ada.lovelace@example.com"))
+        self.assertEqual(
+            [record.id for record in self.directory.by_phone("08012345678")], [2]
+        )
+        self.assertEqual([record.id for record in self.directory.search("ada")], [2])
+        self.assertEqual(self.directory.search("king")[0].id, 1)
+        self.assertTrue(self.directory.remove(3))
+        self.assertEqual(self.directory.search("kwame"), [])
+
+
+class CustomerDirectoryBuilderTestCase(TestCase):
+    def test_builds_and_refreshes_the_directory(self) -> None:
+        customers = FakeCustomers(
+            [make_customer(id, "Customer", str(id)) for id in range(1, 8)]
+        )
+        builder = CustomerDirectoryBuilder(
+            cast(Any, FakeClient(customers=customers)), pagination=3
+        )
+        directory = builder.build()
+        self.assertEqual(len(directory), 7)
+
+        customers.customers.append(make_customer(8, "Customer", "8"))
+        self.assertEqual(builder.refresh(), 1)
+        self.assertIs(builder.directory, directory)
+        self.assertEqual(len(directory), 8)
+        self.assertEqual(customers.start_dates, [None, "2026-01-08T00:00:00.000Z"])
+
+
+class AsyncCustomerDirectoryBuilderTestCase(IsolatedAsyncioTestCase):
+    async def test_builds_the_directory(self) -> None:
+        customers = FakeAsyncCustomers(
+            [make_customer(id, "Customer", str(id)) for id in range(1, 5)]
+        )
+        builder = AsyncCustomerDirectoryBuilder(
+            cast(Any, FakeClient(customers=customers)), pagination=3
+        )
+        self.assertEqual(await builder.refresh(), 4)
+        self.assertEqual(builder.directory.by_code("CUS_4").id, 4)
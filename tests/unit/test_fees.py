@@ -0,0 +1,525 @@
+import bisect
+import random
+import tempfile
+from datetime import date
+from decimal import Decimal
+from pathlib import Path
+from typing import Any
+from unittest import TestCase, skipIf
+
+from pypaystack2 import AsyncPaystackClient, PaystackClient
+from pypaystack2.enums import Currency
+from pypaystack2.fees import (
+    FeeRule,
+    FeeSchedule,
+    FeeScheduleBook,
+    FeeScheduleVersion,
+    FeeTier,
+    numpy,
+)
+from pypaystack2.models.payload_models import GhanaServiceFeeOptions
+
+FEE_OPTIONS: list[tuple[Currency, dict[str, Any]]] = [
+    (Currency.NGN, {}),
+    (Currency.NGN, {"is_international": True, "card": "visa"}),
+    (Currency.NGN, {"is_international": True, "card": "american_express"}),
+    (Currency.NGN, {"service": "transfers"}),
+    (Currency.NGN, {"service": "virtual_account_transactions"}),
+    (Currency.NGN, {"service": "virtual_terminal_transfers"}),
+    (Currency.NGN, {"service": "virtual_terminal_ussd_transactions"}),
+    (
+        Currency.NGN,
+        {
+            "service": "virtual_terminal_international_card_transactions",
+            "card": "mastercard",
+        },
+    ),
+    (Currency.NGN, {"service": "physical_terminal_live_smartpeak_p1000"}),
+    (Currency.NGN, {"service": "physical_terminal_test_smartpeak_p1000"}),
+    (Currency.NGN, {"service": "physical_terminal_card_transactions"}),
+    (Currency.GHS, {}),
+    (Currency.GHS, {"service": "transfers_to_mobile_money"}),
+    (Currency.GHS, {"service": "transfers_to_bank_accounts"}),
+    (Currency.ZAR, {"service": "transactions"}),
+    (Currency.ZAR, {"service": "transactions", "is_eft": True}),
+    (Currency.ZAR, {"service": "transactions", "is_international": True}),
+    (Currency.ZAR, {"service": "transfers"}),
+    (Currency.KES, {}),
+    (Currency.KES, {"service": "card_transactions"}),
+    (Currency.KES, {"service": "card_transactions", "is_international": True}),
+    (Currency.KES, {"service": "transfers_to_mpesa_wallet"}),
+    (Currency.KES, {"service": "transfers_to_mpesa_paybill"}),
+    (Currency.KES, {"service": "transfers_to_bank_account"}),
+    (Currency.XOF, {}),
+    (Currency.XOF, {"service": "card_transactions", "is_international": True}),
+    (Currency.RWF, {}),
+    (Currency.RWF, {"is_international": True}),
+    (Currency.EGP, {}),
+    (Currency.EGP, {"card": "meeza"}),
+    (Currency.EGP, {"is_international": True}),
+]
+
+# the boundaries of every tier, waiver and cap with their neighbours
+AMOUNTS = sorted(
+    {
+        amount + offset
+        for amount in [
+            0,
+            50,
+            100,
+            150,
+            250,
+            1000,
+            150_000,
+            150_100,
+            250_000,
+            500_000,
+            1_000_000,
+            1_000_100,
+            2_000_000,
+            2_000_100,
+            3_000_000,
+            4_000_000,
+            4_000_100,
+            5_000_000,
+            5_000_100,
+            13_333_333,
+            20_000_000,
+            99_999_900,
+            100_000_000,
+        ]
+        for offset in (-1, 0, 1)
+    }
+    | {random.Random(0).randrange(0, 10**11) for _ in range(2000)}
+)
+
+
+def scalar_fee(
+    client: PaystackClient, amount: int, currency: Currency, options: dict[str, Any]
+) -> Any:
+    try:
+        return client.calculate_fee(amount, currency, **options)  # type: ignore[misc]
+    except ValueError:
+        return ValueError
+
+
+class FeeRuleTestCase(TestCase):
+    def test_rounds_half_to_even(self) -> None:
+        rule = FeeRule(rate=Decimal("0.5"), flat_fee=10, flat_fee_waived_up_to=4)
+        self.assertEqual(rule.fees([1, 3, 4, 5, 7]), [0, 2, 2, 12, 14])
+        self.assertEqual(FeeRule(rate=Decimal("0.5"), cap=2).fees([3, 9]), [2, 2])
+
+    def test_tiers(self) -> None:
+        rule = FeeRule(
+            tiers=(FeeTier(maximum=10, fee=1), FeeTier(minimum=20, fee=2)),
+            invalid_amount_message="{amount} is not priced",
+        )
+        self.assertEqual(rule.fees([0, 10, 20]), [1, 1, 2])
+        with self.assertRaisesRegex(ValueError, "15 is not priced"):
+            rule.fees([10, 15])
+
+    def test_large_amounts_are_computed_exactly(self) -> None:
+        rule = FeeRule(rate=Decimal("0.015"))
+        self.assertEqual(rule.fees([10**20 + 100]), [rule.fee(10**20 + 100)])
+
+
+class CalculateFeesTestCase(TestCase):
+    @classmethod
+    def setUpClass(cls) -> None:
+        cls.client = PaystackClient(secret_key="sk_test_fees")
+
+    def test_matches_calculate_fee(self) -> None:
+        for currency, options in FEE_OPTIONS:
+            with self.subTest(currency=currency, **options):
+                expected = [
+                    scalar_fee(self.client, amount, currency, options)
+                    for amount in AMOUNTS
+                ]
+                if ValueError in expected:
+                    with self.assertRaises(ValueError):
+                        self.client.calculate_fees(AMOUNTS, currency, **options)
+                    valid = [
+                        amount
+                        for amount, fee in zip(AMOUNTS, expected)
+                        if fee is not ValueError
+                    ]
+                    expected = [fee for fee in expected if fee is not ValueError]
+                else:
+                    valid = AMOUNTS
+                self.assertEqual(
+                    self.client.calculate_fees(valid, currency, **options), expected
+                )
+
+    def test_per_amount_currency_and_options(self) -> None:
+        amounts = [240_000, 500_000, 500_000, 100_000]
+        currencies = [Currency.NGN, Currency.NGN, Currency.NGN, Currency.ZAR]
+        fees = self.client.calculate_fees(
+            amounts,
+            currencies,
+            service="transactions",
+            is_international=[False, True, True, False],
+            card=[None, "visa", "american_express", None],
+        )
+        self.assertEqual(
+            fees,
+            [
+                3600,
+                self.client.calculate_fee(
+                    500_000,
+                    Currency.NGN,
+                    is_international=True,
+                    card="visa",  # type: ignore[call-arg]
+                ),
+                22_500,
+                self.client.calculate_fee(
+                    100_000, Currency.ZAR, service="transactions"
+                ),  # type: ignore[call-arg]
+            ],
+        )
+        with self.assertRaises(ValueError):
+            self.client.calculate_fees([1, 2], [Currency.NGN])
+
+    @skipIf(numpy is None, "numpy is not installed")
+    def test_numpy_arrays(self) -> None:
+        amounts = numpy.array(AMOUNTS, dtype=numpy.int64)
+        fees = self.client.calculate_fees(amounts, Currency.NGN)
+        self.assertIsInstance(fees, numpy.ndarray)
+        self.assertEqual(
+            fees.tolist(),
+            [self.client.calculate_fee(amount, Currency.NGN) for amount in AMOUNTS],  # type: ignore[call-arg]
+        )
+        fees = self.client.calculate_fees(
+            amounts[:2],
+            Currency.NGN,
+            service=numpy.array(["transactions", "transfers"]),
+        )
+        self.assertEqual(
+            fees.tolist(), [self.client.calculate_fee(AMOUNTS[0], Currency.NGN), 1000]
+        )  # type: ignore[call-arg]
+
+
+class FeeScheduleTestCase(TestCase):
+    @classmethod
+    def setUpClass(cls) -> None:
+        cls.client = PaystackClient(secret_key="sk_test_fees")
+
+    def test_matches_calculate_fee(self) -> None:
+        for currency, options in FEE_OPTIONS:
+            with self.subTest(currency=currency, **options):
+                schedule = self.client.fee_schedule(currency, **options)
+                for amount in AMOUNTS:
+                    expected = scalar_fee(self.client, amount, currency, options)
+                    if expected is ValueError:
+                        with self.assertRaises(ValueError):
+                            schedule.fee(amount)
+                    else:
+                        self.assertEqual(schedule.fee(amount), expected)
+
+    def test_schedules_are_reused(self) -> None:
+        schedule = self.client.fee_schedule(Currency.NGN, service="transfers")
+        self.assertIs(
+            self.client.fee_schedule(Currency.NGN, service="transfers"), schedule
+        )
+        self.assertEqual(
+            self.client.fee_schedule(
+                Currency.NGN, service="transfers", is_international=False
+            ).key,
+            schedule.key,
+        )
+        with self.assertRaises(ValueError):
+            self.client.fee_schedule(Currency.NGN, service="unknown")
+        with self.assertRaises(ValueError):
+            self.client.fee_schedule(Currency.USD)
+        with self.assertRaises(ValueError):
+            self.client.fee_schedule(Currency.NGN, service=["transfers"])
+        with self.assertRaises(ValueError):
+            self.client.calculate_fee(100_000, Currency.NGN, card=["visa"])  # type: ignore[typeddict-item]
+
+    def test_overridden_scalar_fee_methods_are_used(self) -> None:
+        class FlatFeeClient(PaystackClient):
+            def _calculate_ngn_fee(self, amount: int, options: Any) -> int:
+                return 100
+
+        client = FlatFeeClient(secret_key="sk_test_fees")
+        self.assertEqual(client.calculate_fee(500_000, Currency.NGN), 100)
+        self.assertEqual(
+            client._calculate_ghs_fee(10_000, GhanaServiceFeeOptions()),
+            self.client.calculate_fee(10_000, Currency.GHS),
+        )
+
+    def test_book_round_trip(self) -> None:
+        book = FeeScheduleBook(versions=[self.client.fee_schedules()])
+        with tempfile.TemporaryDirectory() as directory:
+            path = Path(directory) / "fees.json"
+            book.save(path)
+            loaded = FeeScheduleBook.load(path)
+        self.assertEqual(loaded, book)
+        amounts = [100, 150_000, 5_000_000, 100_000_000]
+        for currency, options in FEE_OPTIONS:
+            with self.subTest(currency=currency, **options):
+                self.assertEqual(
+                    loaded.schedule(currency, **options).rule,
+                    self.client.fee_schedule(currency, **options).rule,
+                )
+                self.assertEqual(
+                    loaded.schedule(currency, **options).fees(amounts),
+                    [
+                        self.client.calculate_fee(amount, currency, **options)  # type: ignore[misc]
+                        for amount in amounts
+                    ],
+                )
+
+    def test_version_in_effect(self) -> None:
+        builtin = self.client.fee_schedules()
+        transfers = FeeSchedule(
+            currency=Currency.NGN,
+            options={"service": "transfers"},
+            rule=FeeRule(tiers=(FeeTier(fee=3000),)),
+        )
+        book = FeeScheduleBook(
+            versions=[
+                FeeScheduleVersion(
+                    version="2027-01",
+                    effective_from=date(2027, 1, 1),
+                    schedules=(transfers,),
+                ),
+                builtin,
+            ]
+        )
+        self.assertIs(book.version_at(date(2026, 12, 31)), builtin)
+        self.assertEqual(
+            book.schedule(Currency.NGN, on=date(2026, 12, 31), service="transfers").fee(
+                1_000_000
+            ),
+            2500,
+        )
+        self.assertEqual(
+            book.schedule(Currency.NGN, on=date(2027, 1, 1), service="transfers").fee(
+                1_000_000
+            ),
+            3000,
+        )
+        with self.assertRaisesRegex(ValueError, "no schedule"):
+            book.schedule(Currency.GHS, on=date(2027, 1, 1))
+        with self.assertRaisesRegex(ValueError, "no fee schedule version"):
+            FeeScheduleBook(versions=[book.versions[0]]).version_at(date(2026, 1, 1))
+
+    def test_client_with_a_book(self) -> None:
+        transfers = FeeSchedule(
+            currency=Currency.NGN,
+            options={"service": "transfers"},
+            rule=FeeRule(tiers=(FeeTier(fee=3000),)),
+        )
+        book = FeeScheduleBook(
+            versions=[FeeScheduleVersion(version="custom", schedules=(transfers,))]
+        )
+        client = PaystackClient(secret_key="sk_test_fees", fee_schedule_book=book)
+        self.assertEqual(
+            client.calculate_fee(1_000_000, Currency.NGN, service="transfers"),  # type: ignore[call-arg]
+            3000,
+        )
+        self.assertEqual(
+            client.calculate_fees([100, 1_000_000], Currency.NGN, service="transfers"),
+            [3000, 3000],
+        )
+        self.assertEqual(
+            client.calculate_gross_amount(1_000_000, Currency.NGN, service="transfers"),  # type: ignore[call-arg]
+            1_003_000,
+        )
+        with self.assertRaisesRegex(ValueError, "no schedule"):
+            client.calculate_fee(1_000_000, Currency.NGN)
+        # the built-in fees are still exported
+        self.assertEqual(client.fee_schedules(), self.client.fee_schedules())
+
+    def test_sub_clients_share_the_book(self) -> None:
+        transfers = FeeSchedule(
+            currency=Currency.NGN,
+            options={"service": "transfers"},
+            rule=FeeRule(tiers=(FeeTier(fee=3000),)),
+        )
+        book = FeeScheduleBook(
+            versions=[FeeScheduleVersion(version="custom", schedules=(transfers,))]
+        )
+        for client in (
+            PaystackClient(secret_key="sk_test_fees", fee_schedule_book=book),
+            AsyncPaystackClient(secret_key="sk_test_fees", fee_schedule_book=book),
+        ):
+            for sub_client in (client.transactions, client.transfers, client.charge):
+                with self.subTest(sub_client=type(sub_client).__name__):
+                    self.assertEqual(
+                        sub_client.calculate_fee(  # type: ignore[call-arg]
+                            1_000_000, Currency.NGN, service="transfers"
+                        ),
+                        3000,
+                    )
+
+
+def smallest_amounts(
+    schedule: FeeSchedule, largest_amount: int
+) -> tuple[list[int], list[int]]:
+    """Returns the largest net amount of each amount up to it, by trying every amount."""
+    amounts, nets, best = [], [], None
+    for amount in range(largest_amount + 1):
+        try:
+            net = amount - schedule.fee(amount)
+        except ValueError:
+            continue
+        if best is None or net > best:
+            amounts.append(amount)
+            nets.append(net)
+            best = net
+    return amounts, nets
+
+
+class GrossAmountTestCase(TestCase):
+    @classmethod
+    def setUpClass(cls) -> None:
+        cls.client = PaystackClient(secret_key="sk_test_fees")
+
+    def assert_brute_force(
+        self, currency: Currency, options: dict[str, Any], largest_amount: int
+    ) -> None:
+        schedule = self.client.fee_schedule(currency, **options)
+        amounts, nets = smallest_amounts(schedule, largest_amount)
+        targets = list(range(-100, nets[-1] + 1, 3))
+        expected = [amounts[bisect.bisect_left(nets, target)] for target in targets]
+        self.assertEqual(
+            self.client.calculate_gross_amounts(targets, currency, **options), expected
+        )
+        self.assertEqual(
+            [
+                self.client.calculate_gross_amount(target, currency, **options)  # type: ignore[misc]
+                for target in targets[::50]
+            ],
+            expected[::50],
+        )
+
+    def test_matches_brute_force(self) -> None:
+        for currency, options in FEE_OPTIONS:
+            if "smartpeak" in options.get("service", ""):
+                continue
+            with self.subTest(currency=currency, **options):
+                self.assert_brute_force(currency, options, 20_000)
+
+    def test_flat_fee_waiver(self) -> None:
+        # NGN local transactions net less just above the waiver than just below it
+        self.assert_brute_force(Currency.NGN, {}, 270_000)
+        self.assertEqual(
+            self.client.calculate_gross_amount(246_250, Currency.NGN), 250_000
+        )
+        self.assertEqual(
+            self.client.calculate_gross_amount(246_251, Currency.NGN), 260_153
+        )
+
+    def test_large_net_amounts(self) -> None:
+        targets = [random.Random(1).randrange(10**6, 10**11) for _ in range(500)]
+        for currency, options in FEE_OPTIONS:
+            if "smartpeak" in options.get("service", ""):
+                continue
+            with self.subTest(currency=currency, **options):
+                schedule = self.client.fee_schedule(currency, **options)
+                amounts = self.client.calculate_gross_amounts(
+                    targets, currency, **options
+                )
+                for target, amount in zip(targets, amounts):
+                    self.assertGreaterEqual(amount - schedule.fee(amount), target)
+                    self.assertLess(amount - 1 - schedule.fee(amount - 1), target)
+
+    def test_unsupported(self) -> None:
+        with self.assertRaises(ValueError):
+            self.client.calculate_gross_amount(
+                1000,
+                Currency.NGN,
+                service="physical_terminal_live_smartpeak_p1000",  # type: ignore[typeddict-item]
+            )
+        with self.assertRaises(ValueError):
+            self.client.calculate_gross_amounts(
+                [1000], Currency.XOF, service="card_transactions"
+            )
+        with self.assertRaisesRegex(ValueError, "no amount nets"):
+            FeeRule(tiers=(FeeTier(maximum=100, fee=10),)).gross_amount(100)
+
+    def test_per_amount_options(self) -> None:
+        targets = [1_000_000, 1_000_000, 1_000_000]
+        amounts = self.client.calculate_gross_amounts(
+            targets, [Currency.NGN, Currency.ZAR, Currency.EGP], service="transactions"
+        )
+        self.assertEqual(
+            amounts,
+            [
+                self.client.calculate_gross_amount(1_000_000, Currency.NGN),
+                self.client.calculate_gross_amount(
+                    1_000_000,
+                    Currency.ZAR,
+                    service="transactions",  # type: ignore[typeddict-item]
+                ),
+                self.client.calculate_gross_amount(1_000_000, Currency.EGP),
+            ],
+        )
+
+    @skipIf(numpy is None, "numpy is not installed")
+    def test_numpy_arrays(self) -> None:
+        targets = numpy.array([0, 246_250, 246_251, 10**9, 10**15], dtype=numpy.int64)
+        amounts = self.client.calculate_gross_amounts(targets, Currency.NGN)
+        self.assertIsInstance(amounts, numpy.ndarray)
+        self.assertEqual(
+            amounts.tolist(),
+            [
+                self.client.calculate_gross_amount(int(target), Currency.NGN)
+                for target in targets
+            ],
+        )
+
+
+class UnitConversionTestCase(TestCase):
+    @classmethod
+    def setUpClass(cls) -> None:
+        cls.client = PaystackClient(secret_key="sk_test_fees")
+        generator = random.Random(2)
+        cls.floats = (
+            [generator.uniform(-1e6, 1e6) for _ in range(5000)]
+            + [round(generator.uniform(0, 1e5), 3) for _ in range(5000)]
+            + [amount / 1000 for amount in range(20_000)]
+            + [0.125, 0.375, 1.005, 2.675, -0.0, 1e9, 1e12 + 0.005, 1e20]
+        )
+        cls.integers = [generator.randrange(-(10**12), 10**12) for _ in range(1000)]
+
+    def test_to_subunits_matches_to_subunit(self) -> None:
+        for values in (
+            self.floats,
+            self.integers,
+            [1, 2.5, Decimal("3.555"), 10**20, True],
+            [1, 2.5, 10**17],
+            [],
+        ):
+            expected = [self.client.to_subunit(value) for value in values]
+            self.assertEqual(self.client.to_subunits(values), expected)
+        with self.assertRaisesRegex(ValueError, "value must be"):
+            self.client.to_subunits(["1.5"])
+
+    def test_to_base_units_matches_to_base_unit(self) -> None:
+        values = [*self.integers, Decimal("10.0"), Decimal("12.345"), 10**40]
+        self.assertEqual(
+            [str(value) for value in self.client.to_base_units(values)],
+            [str(self.client.to_base_unit(value)) for value in values],
+        )
+        with self.assertRaisesRegex(ValueError, "value must be"):
+            self.client.to_base_units([1, 10.0])
+
+    @skipIf(numpy is None, "numpy is not installed")
+    def test_numpy_arrays(self) -> None:
+        subunits = self.client.to_subunits(numpy.array(self.floats))
+        self.assertIsInstance(subunits, numpy.ndarray)
+        self.assertEqual(
+            subunits.tolist(), [self.client.to_subunit(value) for value in self.floats]
+        )
+        subunits = self.client.to_subunits(numpy.array(self.integers).reshape(10, -1))
+        self.assertEqual(subunits.shape, (10, 100))
+        self.assertEqual(
+            subunits.reshape(-1).tolist(), [value * 100 for value in self.integers]
+        )
+        base_units = self.client.to_base_units(numpy.array([[1, 150], [100, 7]]))
+        self.assertEqual(
+            base_units.tolist(),
+            [[Decimal("0.01"), Decimal("1.5")], [Decimal(1), Decimal("0.07")]],
+        )
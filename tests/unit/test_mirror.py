@@ -0,0 +1,142 @@
+from datetime import UTC, datetime, timedelta
+from types import SimpleNamespace
+from typing import Any, cast
+from unittest import TestCase
+
+from pypaystack2.helpers import LocalMirror
+from pypaystack2.models import Customer, Response, Transaction
+from tests.unit.fakes import make_response
+
+EPOCH = datetime(2026, 1, 1, tzinfo=UTC)
+
+
+def make_customer(id_: int) -> Customer:
+    return Customer.model_validate(
+        {
+            "id": id_,
+            "email": f"customer{id_}@example.com",
+            "customer_code": f"CUS_{id_}",
+            "risk_action": "default",
+            "created_at": EPOCH + timedelta(hours=id_),
+        }
+    )
+
+
+def make_transaction(id_: int) -> Transaction:
+    return Transaction.model_validate(
+        {
+            "id": id_,
+            "domain": "test",
+            "status": "success" if id_ % 2 else "failed",
+            "reference": f"ref-{id_}",
+            "amount": id_ * 100,
+            "channel": "card",
+            "currency": "NGN",
+            "customer": make_customer(id_ % 3).model_dump(),
+            "authorization": {},
+            "created_at": EPOCH + timedelta(hours=id_),
+        }
+    )
+
+
+class FakeListEndpoint:
+    """Serves records newest first and honours `start_date` like paystack's list endpoints."""
+
+    def __init__(self, records: list[Any]):
+        self.records = records
+        self.calls: list[dict[str, Any]] = []
+
+    def __call__(
+        self,
+        start_date: str | None = None,
+        end_date: str | None = None,
+        page: int = 1,
+        pagination: int = 50,
+    ) -> Response[Any]:
+        self.calls.append({"start_date": start_date, "page": page})
+        records = sorted(self.records, key=lambda record: record.id, reverse=True)
+        if start_date:
+            lower_bound = datetime.fromisoformat(start_date.replace("Z", "+00:00"))
+            records = [record for record in records if record.created_at >= lower_bound]
+        start = (page - 1) * pagination
+        data = records[start : start + pagination]
+        return make_response(data, message="retrieved", raw={"data": data})
+
+
+class LocalMirrorTestCase(TestCase):
+    def setUp(self) -> None:
+        self.transactions = FakeListEndpoint([make_transaction(i) for i in range(1, 8)])
+        self.customers = FakeListEndpoint([make_customer(i) for i in range(0, 3)])
+        client = SimpleNamespace(
+            transactions=SimpleNamespace(get_transactions=self.transactions),
+            customers=SimpleNamespace(get_customers=self.customers),
+        )
+        self.mirror = LocalMirror(cast(Any, client), pagination=3)
+
+    def tearDown(self) -> None:
+        self.mirror.close()
+
+    def test_sync_and_local_queries(self) -> None:
+        self.assertEqual(self.mirror.sync(), {"transactions": 7, "customers": 3})
+        self.assertEqual(self.mirror.get_transaction("ref-4").amount, 400)
+        self.assertIsNone(self.mirror.get_transaction("missing"))
+        self.assertEqual(
+            [t.id for t in self.mirror.get_transactions(status="failed")], [6, 4, 2]
+        )
+        self.assertEqual(
+            [t.id for t in self.mirror.get_transactions(customer="CUS_1")], [7, 4, 1]
+        )
+        self.assertEqual(
+            [t.id for t in self.mirror.get_transactions(customer=2)], [5, 2]
+        )
+        self.assertEqual(
+            [
+                t.id
+                for t in self.mirror.get_transactions(
+                    start_date=EPOCH + timedelta(hours=3),
+                    end_date="2026-01-01T05:00:00Z",
+                )
+            ],
+            [5, 4, 3],
+        )
+        self.assertEqual(
+            self.mirror.get_customer("customer1@example.com").customer_code, "CUS_1"
+        )
+
+    def test_incremental_sync_uses_high_water_mark(self) -> None:
+        self.mirror.sync_transactions()
+        self.assertEqual(
+            self.mirror.high_water_mark("transactions"), "2026-01-01T07:00:00.000Z"
+        )
+        self.transactions.records.append(make_transaction(8))
+        self.transactions.calls.clear()
+        self.assertEqual(self.mirror.sync_transactions(), 2)
+        self.assertEqual(
+            self.transactions.calls[0]["start_date"], "2026-01-01T07:00:00.000Z"
+        )
+        self.assertEqual(len(self.mirror.get_transactions()), 8)
+
+    def test_interrupted_sync_resumes_from_checkpoint(self) -> None:
+        endpoint = self.transactions
+
+        def failing_endpoint(
+            start_date: str | None = None,
+            end_date: str | None = None,
+            page: int = 1,
+            pagination: int = 50,
+        ) -> Response[Any]:
+            if page == 2:
+                raise ConnectionError("network went away")
+            return endpoint(start_date, end_date, page, pagination)
+
+        self.mirror._client.transactions.get_transactions = failing_endpoint
+        with self.assertRaises(ConnectionError):
+            self.mirror.sync_transactions()
+        self.assertEqual(len(self.mirror.get_transactions()), 3)
+
+        self.mirror._client.transactions.get_transactions = endpoint
+        endpoint.calls.clear()
+        self.assertEqual(self.mirror.sync_transactions(), 4)
+        # the first page was stored before the interruption, so it is not listed again
+        self.assertEqual(endpoint.calls[0]["page"], 2)
+        self.assertEqual(len(self.mirror.get_transactions()), 7)
@@ -0,0 +1,150 @@
+import tempfile
+from pathlib import Path
+from typing import Any
+from unittest import IsolatedAsyncioTestCase, TestCase
+
+from pypaystack2.exceptions import PaystackResponseError
+from pypaystack2.helpers import AsyncPaginator, PaginationCheckpoint, Paginator
+from pypaystack2.models import Response
+from tests.unit.fakes import make_response
+
+
+def list_response(
+    data: list[Any] | None, status: bool = True, meta: dict[str, Any] | None = None
+) -> Response[Any]:
+    return make_response(
+        data,
+        status=status,
+        message="retrieved" if status else "failed",
+        meta=meta,
+        raw={"data": data},
+    )
+
+
+class FakeListMethod:
+    def __init__(self, records: list[int], fail_on_page: int | None = None):
+        self.records = records
+        self.fail_on_page = fail_on_page
+        self.calls: list[dict[str, Any]] = []
+
+    def __call__(
+        self,
+        page: int = 1,
+        pagination: int = 50,
+        start_date: str | None = None,
+        end_date: str | None = None,
+        status: str | None = None,
+    ) -> Response[Any]:
+        self.calls.append(
+            {
+                "page": page,
+                "pagination": pagination,
+                "start_date": start_date,
+                "end_date": end_date,
+                "status": status,
+            }
+        )
+        if page == self.fail_on_page:
+            return list_response(None, status=False)
+        start = (page - 1) * pagination
+        return list_response(self.records[start : start + pagination])
+
+
+class AsyncFakeListMethod(FakeListMethod):
+    async def __call__(  # type: ignore[override]
+        self, page: int = 1, pagination: int = 50
+    ) -> Response[Any]:
+        return super().__call__(page=page, pagination=pagination)
+
+
+class PaginatorTestCase(TestCase):
+    def test_iterates_over_every_page(self) -> None:
+        method = FakeListMethod(list(range(25)))
+        paginator = Paginator(method, pagination=10, status="success")
+        self.assertEqual(list(paginator), list(range(25)))
+        self.assertEqual([call["page"] for call in method.calls], [1, 2, 3])
+        self.assertEqual(method.calls[0]["status"], "success")
+        self.assertTrue(paginator.checkpoint.completed)
+
+    def test_freezes_end_date_across_pages(self) -> None:
+        method = FakeListMethod(list(range(25)))
+        list(Paginator(method, pagination=10))
+        end_dates = {call["end_date"] for call in method.calls}
+        self.assertEqual(len(end_dates), 1)
+        self.assertIsNotNone(end_dates.pop())
+
+    def test_resumes_from_saved_checkpoint(self) -> None:
+        method = FakeListMethod(list(range(25)))
+        paginator = Paginator(method, pagination=10, end_date="2026-01-01")
+        consumed = []
+        for record in paginator:
+            consumed.append(record)
+            if record == 13:
+                break
+        with tempfile.TemporaryDirectory() as directory:
+            path = Path(directory) / "checkpoint.json"
+            paginator.checkpoint.save(path)
+            checkpoint = PaginationCheckpoint.load(path)
+        self.assertEqual(checkpoint.page, 2)
+        self.assertEqual(checkpoint.offset, 4)
+
+        resumed_method = FakeListMethod(list(range(25)))
+        remaining = list(Paginator(resumed_method, checkpoint=checkpoint))
+        self.assertEqual(consumed + remaining, list(range(25)))
+        self.assertEqual(resumed_method.calls[0]["page"], 2)
+        self.assertEqual(resumed_method.calls[0]["end_date"], "2026-01-01")
+
+    def test_resumes_pages_after_the_last_yielded_page(self) -> None:
+        method = FakeListMethod(list(range(25)))
+        paginator = Paginator(method, pagination=10)
+        pages = paginator.pages()
+        consumed = next(pages)
+        checkpoint = paginator.checkpoint
+        self.assertEqual((checkpoint.page, checkpoint.offset), (2, 0))
+
+        resumed = list(Paginator(method, checkpoint=checkpoint).pages())
+        self.assertEqual(consumed + sum(resumed, []), list(range(25)))
+
+    def test_uses_page_count_from_meta(self) -> None:
+        def method(page: int = 1, pagination: int = 50) -> Response[Any]:
+            return list_response([page] * pagination, meta={"pageCount": 2})
+
+        self.assertEqual(list(Paginator(method, pagination=2)), [1, 1, 2, 2])
+
+    def test_raises_on_unsuccessful_response(self) -> None:
+        method = FakeListMethod(list(range(25)), fail_on_page=2)
+        paginator = Paginator(method, pagination=10)
+        with self.assertRaises(PaystackResponseError):
+            list(paginator)
+        self.assertEqual(paginator.checkpoint.page, 2)
+        self.assertEqual(paginator.checkpoint.offset, 0)
+
+    def test_rejects_methods_without_pages(self) -> None:
+        with self.assertRaises(ValueError):
+            Paginator(lambda reference: None)
+
+
+class AsyncPaginatorTestCase(IsolatedAsyncioTestCase):
+    async def test_iterates_over_every_page(self) -> None:
+        method = AsyncFakeListMethod(list(range(25)))
+        records = [record async for record in AsyncPaginator(method, pagination=10)]
+        self.assertEqual(records, list(range(25)))
+
+    async def test_pages(self) -> None:
+        method = AsyncFakeListMethod(list(range(25)))
+        pages = [page async for page in AsyncPaginator(method, pagination=10).pages()]
+        self.assertEqual([len(page) for page in pages], [10, 10, 5])
+
+    async def test_resumes_pages_after_the_last_yielded_page(self) -> None:
+        method = AsyncFakeListMethod(list(range(25)))
+        paginator = AsyncPaginator(method, pagination=10)
+        async for page in paginator.pages():
+            break
+        remaining = [
+            record
+            async for page in AsyncPaginator(
+                method, checkpoint=paginator.checkpoint
+            ).pages()
+            for record in page
+        ]
+        self.assertEqual(remaining, list(range(10, 25)))
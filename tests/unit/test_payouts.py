@@ -0,0 +1,205 @@
+import asyncio
+from types import SimpleNamespace
+from typing import Any, cast
+from unittest import IsolatedAsyncioTestCase
+
+from pypaystack2 import AsyncPaystackClient
+from pypaystack2.enums import Currency
+from pypaystack2.exceptions import PaystackResponseError
+from pypaystack2.helpers import PayoutScheduler
+from pypaystack2.models import (
+    BulkTransferItem,
+    IntegrationBalance,
+    Response,
+    TransferInstruction,
+)
+from tests.unit.fakes import make_response
+
+
+fees_client = AsyncPaystackClient(secret_key="sk_test_payouts")
+transfer_fees = fees_client.fee_schedule(Currency.NGN, service="transfers")
+
+
+class FakePaystack:
+    """Debits the balance with the amount and the transfer fee of every transfer."""
+
+    def __init__(self, balance: int):
+        self.balance = balance
+        self.balance_checks = 0
+        self.balance_errors: list[Exception] = []
+        self.transfer_errors: list[Exception] = []
+        self.batches: list[list[TransferInstruction]] = []
+
+    async def check_balance(self) -> Response[Any]:
+        self.balance_checks += 1
+        if self.balance_errors:
+            raise self.balance_errors.pop(0)
+        return make_response(
+            [
+                IntegrationBalance(currency="USD", balance=10**9),
+                IntegrationBalance(currency="NGN", balance=self.balance),
+            ]
+        )
+
+    async def bulk_transfer(
+        self, transfers: list[TransferInstruction], source: str = "balance"
+    ) -> Response[Any]:
+        self.batches.append(transfers)
+        if self.transfer_errors:
+            raise self.transfer_errors.pop(0)
+        total = sum(
+            transfer.amount + transfer_fees.fee(transfer.amount)
+            for transfer in transfers
+        )
+        if total > self.balance:
+            return make_response(
+                None, status=False, message="Your balance is not enough"
+            )
+        self.balance -= total
+        return make_response(
+            [
+                BulkTransferItem(
+                    reference=cast(str, transfer.reference),
+                    recipient=transfer.recipient,
+                    amount=transfer.amount,
+                    transfer_code=f"TRF_{transfer.reference}",
+                    currency="NGN",
+                    status="pending",
+                )
+                for transfer in transfers
+            ]
+        )
+
+
+def make_payout(i: int, amount: int = 1000) -> TransferInstruction:
+    return TransferInstruction(
+        amount=amount, recipient=f"RCP_{i}", reference=f"payout-{i}", reason="Payout"
+    )
+
+
+class PayoutSchedulerTestCase(IsolatedAsyncioTestCase):
+    def make_scheduler(self, paystack: FakePaystack, **kwargs: Any) -> PayoutScheduler:
+        client = SimpleNamespace(
+            transfers=SimpleNamespace(bulk_transfer=paystack.bulk_transfer),
+            transfer_control=SimpleNamespace(check_balance=paystack.check_balance),
+            fee_schedule=fees_client.fee_schedule,
+        )
+        return PayoutScheduler(cast(Any, client), **kwargs)
+
+    async def test_packs_payouts_into_bulk_transfers(self) -> None:
+        paystack = FakePaystack(balance=1_000_000)
+        async with self.make_scheduler(
+            paystack, max_batch_size=10, max_wait=0.05
+        ) as scheduler:
+            items = await asyncio.gather(
+                *(scheduler.submit(make_payout(i)) for i in range(25))
+            )
+        self.assertEqual(
+            [item.reference for item in items], [f"payout-{i}" for i in range(25)]
+        )
+        self.assertEqual([len(batch) for batch in paystack.batches], [10, 10, 5])
+        self.assertEqual(paystack.balance_checks, 1)
+
+    async def test_flushes_on_time(self) -> None:
+        paystack = FakePaystack(balance=1_000_000)
+        async with self.make_scheduler(paystack, max_wait=0.01) as scheduler:
+            item = await asyncio.wait_for(scheduler.submit(make_payout(1)), 1)
+        self.assertEqual(item.transfer_code, "TRF_payout-1")
+
+    async def test_only_sends_what_the_balance_covers(self) -> None:
+        paystack = FakePaystack(balance=4500)  # 1000 and a fee of 1000 per payout
+        async with self.make_scheduler(
+            paystack, max_wait=0.01, balance_ttl=0.05
+        ) as scheduler:
+            small = [
+                asyncio.create_task(scheduler.submit(make_payout(i))) for i in range(3)
+            ]
+            large = asyncio.create_task(scheduler.submit(make_payout(9, amount=5000)))
+            await asyncio.sleep(0.03)
+            self.assertEqual(sum(task.done() for task in small), 2)
+            self.assertFalse(large.done())
+            self.assertEqual(scheduler.pending, 2)
+
+            paystack.balance += 10_000  # the balance is topped up
+            await asyncio.wait_for(asyncio.gather(*small, large), 1)
+        self.assertTrue(all(len(batch) <= 2 for batch in paystack.batches))
+        self.assertEqual(paystack.balance, 14_500 - 3 * 2000 - 6000)
+
+    async def test_reserves_the_transfer_fee(self) -> None:
+        paystack = FakePaystack(balance=1500)
+        async with self.make_scheduler(
+            paystack, max_wait=0.01, balance_ttl=60
+        ) as scheduler:
+            payout = asyncio.create_task(scheduler.submit(make_payout(1)))
+            await asyncio.sleep(0.03)
+            self.assertFalse(payout.done())
+            self.assertEqual(paystack.batches, [])
+        with self.assertRaises(PaystackResponseError):
+            await payout
+        with self.assertRaises(ValueError):
+            self.make_scheduler(paystack, currency=Currency.USD)
+
+    async def test_retries_failed_balance_checks(self) -> None:
+        paystack = FakePaystack(balance=10_000)
+        paystack.balance_errors = [ConnectionError("reset"), ConnectionError("reset")]
+        async with self.make_scheduler(
+            paystack, max_wait=0.01, balance_retry_delay=0.01
+        ) as scheduler:
+            item = await asyncio.wait_for(scheduler.submit(make_payout(1)), 1)
+        self.assertEqual(item.transfer_code, "TRF_payout-1")
+        self.assertEqual(paystack.balance_checks, 3)
+
+        paystack = FakePaystack(balance=10_000)
+        paystack.balance_errors = [ConnectionError("reset")] * 5
+        async with self.make_scheduler(
+            paystack, max_wait=0.01, balance_retry_delay=0.01, max_balance_attempts=3
+        ) as scheduler:
+            with self.assertRaises(ConnectionError):
+                await asyncio.wait_for(scheduler.submit(make_payout(1)), 1)
+        self.assertEqual(paystack.balance_checks, 3)
+
+    async def test_failed_payout_is_retried_with_its_reference(self) -> None:
+        paystack = FakePaystack(balance=10_000)
+        paystack.transfer_errors = [ConnectionError("reset")]
+        async with self.make_scheduler(paystack, max_wait=0.01) as scheduler:
+            payout = make_payout(1)
+            with self.assertRaises(ConnectionError):
+                await asyncio.wait_for(scheduler.submit(payout), 1)
+            item = await asyncio.wait_for(scheduler.submit(payout), 1)
+            with self.assertRaises(ValueError):
+                await scheduler.submit(payout.model_copy(update={"reference": None}))
+        self.assertEqual(item.reference, "payout-1")
+        self.assertEqual(
+            [[transfer.reference for transfer in batch] for batch in paystack.batches],
+            [["payout-1"], ["payout-1"]],
+        )
+
+    async def test_rejected_balance_check_fails_payouts(self) -> None:
+        paystack = FakePaystack(balance=10_000)
+        response = make_response(
+            None, status=False, message="Invalid key", status_code=401
+        )
+        paystack.balance_errors = [PaystackResponseError("unable", response)]
+        async with self.make_scheduler(
+            paystack, max_wait=0.01, balance_retry_delay=0.01
+        ) as scheduler:
+            with self.assertRaises(PaystackResponseError):
+                await asyncio.wait_for(scheduler.submit(make_payout(1)), 1)
+        self.assertEqual(paystack.balance_checks, 1)
+
+    async def test_rejected_batch_and_close_fail_payouts(self) -> None:
+        paystack = FakePaystack(balance=10_000)
+        scheduler = self.make_scheduler(paystack, max_wait=0.01, balance_ttl=60)
+        async with scheduler:
+            await scheduler.available_balance()
+            paystack.balance = 0  # spent elsewhere after the balance was cached
+            with self.assertRaises(PaystackResponseError):
+                await scheduler.submit(make_payout(1))
+            unaffordable = asyncio.create_task(
+                scheduler.submit(make_payout(2, amount=10**6))
+            )
+            await asyncio.sleep(0.02)
+        with self.assertRaises(PaystackResponseError):
+            await unaffordable
+        with self.assertRaises(RuntimeError):
+            await scheduler.submit(make_payout(3))
@@ -0,0 +1,141 @@
+import json
+from unittest import IsolatedAsyncioTestCase, TestCase
+
+import httpx
+
+from pypaystack2 import AsyncPaystackClient, PaystackClient
+from pypaystack2.caching import MemoryCache, ResponseCache
+from pypaystack2.models import Plan
+
+
+class FakePaystack:
+    """Serves plans by id or code and counts the requests it receives."""
+
+    def __init__(self) -> None:
+        self.requests: list[tuple[str, str]] = []
+        self.plan = {
+            "id": 1,
+            "name": "Monthly",
+            "plan_code": "PLN_1",
+            "amount": 5000,
+            "interval": "monthly",
+            "currency": "NGN",
+            "integration": 1,
+            "domain": "test",
+            "send_invoices": True,
+            "send_sms": True,
+            "hosted_page": False,
+            "is_deleted": False,
+            "is_archived": False,
+            "migrate": False,
+            "createdAt": "2026-01-01T00:00:00.000Z",
+            "updatedAt": "2026-01-01T00:00:00.000Z",
+        }
+
+    def handle(self, request: httpx.Request) -> httpx.Response:
+        self.requests.append((request.method, request.url.path))
+        if request.method == "PUT":
+            self.plan.update(json.loads(request.content))
+            return httpx.Response(200, json={"status": True, "message": "Plan updated"})
+        if request.url.path.rstrip("/").split("/")[-1] not in ("1", "PLN_1"):
+            return httpx.Response(
+                404, json={"status": False, "message": "Plan not found"}
+            )
+        return httpx.Response(
+            200, json={"status": True, "message": "Plan retrieved", "data": self.plan}
+        )
+
+
+class ResponseCacheTestCase(TestCase):
+    def setUp(self) -> None:
+        self.paystack = FakePaystack()
+        self.http_client = httpx.Client(
+            transport=httpx.MockTransport(self.paystack.handle)
+        )
+        self.addCleanup(self.http_client.close)
+        self.cache = ResponseCache(MemoryCache())
+        self.client = PaystackClient(
+            http_client=self.http_client, response_cache=self.cache
+        )
+
+    def test_serves_repeated_reads_from_the_cache(self) -> None:
+        first = self.client.plans.get_plan("PLN_1")
+        second = self.client.plans.get_plan("PLN_1")
+        self.assertIsInstance(second.data, Plan)
+        self.assertEqual(first, second)
+        self.assertEqual(len(self.paystack.requests), 1)
+        self.assertEqual((self.cache.hits, self.cache.misses), (1, 1))
+
+        # failed and list responses are not cached
+        self.client.plans.get_plan("PLN_404")
+        self.client.plans.get_plan("PLN_404")
+        self.assertEqual(len(self.paystack.requests), 3)
+
+    def test_updates_invalidate_the_resource_by_id_and_code(self) -> None:
+        self.client.plans.get_plan("PLN_1")
+        self.client.plans.get_plan(1)
+        self.client.plans.update(1, name="Monthly Pro", amount=6000, interval="monthly")
+        plan = self.client.plans.get_plan("PLN_1").data
+        self.assertEqual(getattr(plan, "name"), "Monthly Pro")
+        self.assertEqual(
+            self.paystack.requests,
+            [
+                ("GET", "/plan/PLN_1/"),
+                ("GET", "/plan/1/"),
+                ("PUT", "/plan/1/"),
+                ("GET", "/plan/PLN_1/"),
+            ],
+        )
+
+    def test_caches_per_secret_key_and_resource(self) -> None:
+        other_client = PaystackClient(
+            secret_key="sk_test_other",
+            http_client=self.http_client,
+            response_cache=self.cache,
+        )
+        self.client.plans.get_plan("PLN_1")
+        other_client.plans.get_plan("PLN_1")
+        self.assertEqual(len(self.paystack.requests), 2)
+
+        cache = ResponseCache(ttls={"plan": 0})
+        self.assertFalse(cache.cacheable("https://api.paystack.co/plan/PLN_1/"))
+        self.assertTrue(cache.cacheable("https://api.paystack.co/product/1"))
+        self.assertFalse(cache.cacheable("https://api.paystack.co/product?perPage=50"))
+        self.assertFalse(cache.cacheable("https://api.paystack.co/transaction/1"))
+
+    def test_invalidates_responses_whose_tags_were_evicted(self) -> None:
+        cache = ResponseCache(MemoryCache(max_size=4))
+
+        def store(plan_id: int) -> None:
+            body = {
+                "status": True,
+                "data": {"id": plan_id, "plan_code": f"PLN_{plan_id}"},
+            }
+            cache.store("sk", f"https://api.paystack.co/plan/PLN_{plan_id}", 200, body)
+
+        store(1)
+        self.assertIsNotNone(cache.get("sk", "https://api.paystack.co/plan/PLN_1"))
+        store(2)
+        cache.invalidate("sk", "https://api.paystack.co/plan/1", {"status": True})
+        self.assertIsNone(cache.get("sk", "https://api.paystack.co/plan/PLN_1"))
+        self.assertIsNotNone(cache.get("sk", "https://api.paystack.co/plan/PLN_2"))
+        self.assertEqual((cache.hits, cache.misses), (2, 1))
+
+
+class AsyncResponseCacheTestCase(IsolatedAsyncioTestCase):
+    async def test_serves_repeated_reads_from_the_cache(self) -> None:
+        paystack = FakePaystack()
+        async with httpx.AsyncClient(
+            transport=httpx.MockTransport(paystack.handle)
+        ) as http_client:
+            client = AsyncPaystackClient(
+                http_client=http_client, response_cache=ResponseCache()
+            )
+            await client.plans.get_plan("PLN_1")
+            await client.plans.get_plan("PLN_1")
+            await client.plans.update(
+                "PLN_1", name="Yearly", amount=50000, interval="annually"
+            )
+            plan = (await client.plans.get_plan("PLN_1")).data
+        self.assertEqual(getattr(plan, "name"), "Yearly")
+        self.assertEqual(len(paystack.requests), 3)
@@ -0,0 +1,187 @@
+import asyncio
+import threading
+import time
+from types import SimpleNamespace
+from typing import Any, cast
+from unittest import IsolatedAsyncioTestCase, TestCase
+
+from pypaystack2 import AsyncPaystackClient, PaystackClient
+from pypaystack2.exceptions import ClientNetworkError
+from pypaystack2.helpers import InProcessEventBus
+from pypaystack2.models import Response, Transaction
+from tests.unit.fakes import make_response
+
+
+def transaction_data(reference: str, status: str) -> dict[str, Any]:
+    return {
+        "id": 1,
+        "domain": "test",
+        "status": status,
+        "reference": reference,
+        "amount": 5000,
+        "gateway_response": "Approved",
+        "channel": "card",
+        "currency": "NGN",
+        "customer": {
+            "id": 1,
+            "email": "customer@example.com",
+            "customer_code": "CUS_1",
+            "risk_action": "default",
+        },
+        "authorization": {},
+    }
+
+
+def verify_response(reference: str, status: str) -> Response[Any]:
+    return make_response(
+        Transaction.model_validate(transaction_data(reference, status)),
+        message="Verification successful",
+    )
+
+
+class FakeTransactions:
+    """Reports every transaction as `ongoing` until `settle_after` verifications."""
+
+    def __init__(self, settle_after: int | None = None):
+        self.settle_after = settle_after
+        self.network_errors = 0
+        self.verifications: dict[str, int] = {}
+        self.lock = threading.Lock()
+
+    def _verify(self, reference: str) -> Response[Any]:
+        with self.lock:
+            count = self.verifications[reference] = (
+                self.verifications.get(reference, 0) + 1
+            )
+            if self.network_errors:
+                self.network_errors -= 1
+                raise ClientNetworkError("network error occurred: connection reset")
+        settled = self.settle_after is not None and count >= self.settle_after
+        return verify_response(reference, "success" if settled else "ongoing")
+
+    def verify(self, reference: str) -> Response[Any]:
+        return self._verify(reference)
+
+    async def averify(self, reference: str) -> Response[Any]:
+        return self._verify(reference)
+
+
+class AwaitTransactionTestCase(TestCase):
+    def make_client(
+        self, transactions: FakeTransactions, event_bus: InProcessEventBus | None = None
+    ) -> PaystackClient:
+        client = PaystackClient(event_bus=event_bus)
+        client.transactions = cast(Any, SimpleNamespace(verify=transactions.verify))
+        return client
+
+    def test_polls_until_settled(self) -> None:
+        transactions = FakeTransactions(settle_after=3)
+        client = self.make_client(transactions)
+        transaction = client.await_transaction(
+            "ref-1", poll_interval=0.001, max_poll_interval=0.01
+        )
+        self.assertEqual(transaction.status, "success")
+        self.assertEqual(transactions.verifications, {"ref-1": 3})
+
+    def test_network_errors_do_not_end_the_wait(self) -> None:
+        transactions = FakeTransactions(settle_after=2)
+        transactions.network_errors = 1
+        client = self.make_client(transactions)
+        transaction = client.await_transaction("ref-1", poll_interval=0.001)
+        self.assertEqual(transaction.status, "success")
+        self.assertEqual(transactions.verifications, {"ref-1": 2})
+
+    def test_webhook_event_ends_the_wait(self) -> None:
+        transactions = FakeTransactions()
+        event_bus = InProcessEventBus()
+        client = self.make_client(transactions, event_bus)
+        threading.Timer(
+            0.05,
+            event_bus.publish,
+            [{"event": "charge.success", "data": transaction_data("ref-1", "success")}],
+        ).start()
+
+        started = time.monotonic()
+        transaction = client.await_transaction("ref-1", poll_interval=30)
+        self.assertLess(time.monotonic() - started, 5)
+        self.assertEqual(transaction.status, "success")
+        self.assertEqual(transactions.verifications, {"ref-1": 1})
+        # the waiter unsubscribed once it returned
+        self.assertEqual(
+            event_bus.publish(
+                {
+                    "event": "charge.success",
+                    "data": transaction_data("ref-1", "success"),
+                }
+            ),
+            0,
+        )
+
+    def test_incomplete_event_falls_back_to_verify(self) -> None:
+        transactions = FakeTransactions(settle_after=2)
+        event_bus = InProcessEventBus()
+        client = self.make_client(transactions, event_bus)
+        threading.Timer(
+            0.05,
+            event_bus.publish,
+            [{"event": "charge.success", "data": {"reference": "ref-1"}}],
+        ).start()
+        transaction = client.await_transaction("ref-1", poll_interval=30)
+        self.assertEqual(transaction.status, "success")
+        self.assertEqual(transactions.verifications, {"ref-1": 2})
+
+    def test_times_out(self) -> None:
+        client = self.make_client(FakeTransactions())
+        with self.assertRaises(TimeoutError):
+            client.await_transaction("ref-1", timeout=0.05, poll_interval=0.01)
+
+
+class AsyncAwaitTransactionTestCase(IsolatedAsyncioTestCase):
+    async def test_many_waiters_share_one_event_bus(self) -> None:
+        transactions = FakeTransactions()
+        event_bus = InProcessEventBus()
+        client = AsyncPaystackClient(event_bus=event_bus)
+        client.transactions = cast(Any, SimpleNamespace(verify=transactions.averify))
+        references = [f"ref-{i}" for i in range(200)]
+        waiters = asyncio.gather(
+            *(
+                client.await_transaction(reference, poll_interval=30)
+                for reference in references
+            )
+        )
+        await asyncio.sleep(0.05)
+
+        def deliver() -> None:
+            for reference in references:
+                self.assertEqual(
+                    event_bus.publish(
+                        {
+                            "event": "charge.success",
+                            "data": transaction_data(reference, "success"),
+                        }
+                    ),
+                    1,
+                )
+
+        # webhook servers usually publish from another thread
+        await asyncio.to_thread(deliver)
+        settled = await asyncio.wait_for(waiters, 5)
+        self.assertEqual([transaction.reference for transaction in settled], references)
+        self.assertEqual(set(transactions.verifications.values()), {1})
+
+    async def test_network_errors_do_not_end_the_wait(self) -> None:
+        transactions = FakeTransactions(settle_after=2)
+        transactions.network_errors = 1
+        client = AsyncPaystackClient()
+        client.transactions = cast(Any, SimpleNamespace(verify=transactions.averify))
+        transaction = await client.await_transaction("ref-1", poll_interval=0.001)
+        self.assertEqual(transaction.status, "success")
+        self.assertEqual(transactions.verifications, {"ref-1": 2})
+
+    async def test_times_out(self) -> None:
+        transactions = FakeTransactions()
+        client = AsyncPaystackClient()
+        client.transactions = cast(Any, SimpleNamespace(verify=transactions.averify))
+        with self.assertRaises(TimeoutError):
+            await client.await_transaction("ref-1", timeout=0.05, poll_interval=0.01)
+        self.assertGreater(transactions.verifications["ref-1"], 1)
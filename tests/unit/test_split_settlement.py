@@ -0,0 +1,212 @@
+import asyncio
+import random
+from datetime import datetime
+from types import SimpleNamespace
+from typing import Any, cast
+from unittest import IsolatedAsyncioTestCase, TestCase, skipIf
+
+from pypaystack2 import PaystackClient
+from pypaystack2.enums import Bearer, Currency, Domain, Split
+from pypaystack2.exceptions import PaystackResponseError
+from pypaystack2.fees import numpy
+from pypaystack2.helpers import (
+    MAIN_ACCOUNT,
+    AsyncSplitCalculator,
+    SplitCalculator,
+    SplitRule,
+)
+from pypaystack2.models import Response, TransactionSplit
+from tests.unit.fakes import make_response
+
+
+def make_split(
+    type: str = "percentage",
+    bearer_type: str = "account",
+    shares: tuple[int | float, ...] = (20, 30.5),
+    bearer_subaccount: str | None = None,
+) -> TransactionSplit:
+    return TransactionSplit.model_validate(
+        {
+            "id": 7,
+            "name": "Revenue share",
+            "type": type,
+            "currency": Currency.NGN,
+            "integration": 1,
+            "domain": Domain.TEST,
+            "split_code": "SPL_abc",
+            "active": True,
+            "bearer_type": bearer_type,
+            "bearer_subaccount": bearer_subaccount,
+            "created_at": datetime(2026, 1, 1),
+            "updated_at": datetime(2026, 1, 1),
+            "is_dynamic": False,
+            "subaccounts": [
+                {
+                    "subaccount": {
+                        "id": 100 + index,
+                        "subaccount_code": f"ACCT_{index}",
+                        "business_name": f"Partner {index}",
+                        "settlement_bank": "Access Bank",
+                        "account_number": f"012345678{index}",
+                        "currency": Currency.NGN,
+                    },
+                    "share": share,
+                }
+                for index, share in enumerate(shares)
+            ],
+            "total_subaccounts": len(shares),
+        }
+    )
+
+
+class FakeSplits:
+    def __init__(self, split: TransactionSplit | None):
+        self.split = split
+        self.calls: list[int | str] = []
+
+    def _get(self, id_or_code: int | str) -> Response[Any]:
+        self.calls.append(id_or_code)
+        return make_response(
+            self.split,
+            status=self.split is not None,
+            message="Split retrieved" if self.split else "Split not found",
+            status_code=200 if self.split else 404,
+        )
+
+    def get_split(self, id_or_code: int | str) -> Response[Any]:
+        return self._get(id_or_code)
+
+
+class AsyncFakeSplits(FakeSplits):
+    async def get_split(self, id_or_code: int | str) -> Response[Any]:  # type: ignore[override]
+        await asyncio.sleep(0)
+        return self._get(id_or_code)
+
+
+def as_lists(matrix: Any) -> list[list[int]]:
+    return matrix.tolist() if hasattr(matrix, "tolist") else matrix
+
+
+class SplitRuleTestCase(TestCase):
+    def test_percentage_shares(self) -> None:
+        rule = SplitRule.from_split(make_split())
+        shares = rule.shares([100_000, 1_001], [1_500, 15])
+        self.assertEqual(shares.accounts, ("ACCT_0", "ACCT_1", MAIN_ACCOUNT))
+        self.assertEqual(
+            as_lists(shares.gross_shares), [[20_000, 200], [30_500, 305], [49_500, 496]]
+        )
+        self.assertEqual(as_lists(shares.fee_shares), [[0, 0], [0, 0], [1_500, 15]])
+        self.assertEqual(
+            shares.totals, {"ACCT_0": 20_200, "ACCT_1": 30_805, MAIN_ACCOUNT: 48_481}
+        )
+        self.assertEqual(list(shares.share("ACCT_1")), [30_500, 305])
+        with self.assertRaises(KeyError):
+            shares.share("ACCT_9")
+
+    def test_bearer_types(self) -> None:
+        amounts, fees = [100_000, 7], [1_501, 3]
+        cases: dict[Bearer, list[list[int]]] = {
+            Bearer.SUB_ACCOUNT: [[0, 0], [1_501, 3], [0, 0]],
+            Bearer.ALL_PROPORTIONAL: [[300, 0], [457, 0], [744, 3]],
+            Bearer.ALL: [[500, 1], [500, 1], [501, 1]],
+        }
+        for bearer_type, expected in cases.items():
+            with self.subTest(bearer_type=bearer_type):
+                rule = SplitRule.from_split(
+                    make_split(bearer_type=bearer_type, bearer_subaccount="101")
+                )
+                shares = rule.shares(amounts, fees)
+                self.assertEqual(as_lists(shares.fee_shares), expected)
+                self.assertEqual(sum(shares.totals.values()), sum(amounts) - sum(fees))
+        with self.assertRaisesRegex(ValueError, "not part of the split"):
+            SplitRule.from_split(make_split(bearer_type=Bearer.SUB_ACCOUNT))
+
+    def test_flat_shares(self) -> None:
+        rule = SplitRule.from_split(make_split(type=Split.FLAT, shares=(10_000, 500)))
+        shares = rule.shares([50_000, 10_500], [750, 158])
+        self.assertEqual(
+            shares.totals, {"ACCT_0": 20_000, "ACCT_1": 1_000, MAIN_ACCOUNT: 38_592}
+        )
+        with self.assertRaisesRegex(ValueError, "exceed the amount 10000"):
+            rule.shares([10_000], [150])
+        with self.assertRaisesRegex(ValueError, "whole amounts"):
+            SplitRule.from_split(make_split(type=Split.FLAT, shares=(10.5,)))
+
+    def test_large_amounts_match(self) -> None:
+        generator = random.Random(3)
+        amounts = [generator.randrange(0, 10**10) for _ in range(1000)]
+        fees = [amount // 50 for amount in amounts]
+        for bearer_type in Bearer:
+            with self.subTest(bearer_type=bearer_type):
+                rule = SplitRule.from_split(
+                    make_split(bearer_type=bearer_type, bearer_subaccount="ACCT_0")
+                )
+                # too large for int64, computed without numpy
+                huge = rule.shares(
+                    [amount * 10**10 for amount in amounts[:20]], fees[:20]
+                )
+                self.assertEqual(
+                    sum(huge.totals.values()),
+                    sum(amounts[:20]) * 10**10 - sum(fees[:20]),
+                )
+                totals = rule.shares(amounts, fees).totals
+                self.assertEqual(
+                    totals,
+                    {
+                        account: sum(
+                            rule.shares([amount], [fee]).totals[account]
+                            for amount, fee in zip(amounts, fees)
+                        )
+                        for account in rule.accounts
+                    },
+                )
+
+
+class SplitCalculatorTestCase(TestCase):
+    def test_loads_each_split_once(self) -> None:
+        splits = FakeSplits(make_split())
+        fees_client = PaystackClient(secret_key="sk_test_splits")
+        client = SimpleNamespace(
+            splits=splits, calculate_fees=fees_client.calculate_fees
+        )
+        calculator = SplitCalculator(cast(Any, client))
+        shares = calculator.shares("SPL_abc", [240_000, 500_000])
+        calculator.shares(7, [240_000])
+        calculator.shares("7", [240_000], fees=[0])
+        self.assertEqual(splits.calls, ["SPL_abc"])
+        self.assertEqual(as_lists(shares.fee_shares)[-1], [3_600, 17_500])
+        self.assertEqual(sum(shares.totals.values()), 740_000 - 3_600 - 17_500)
+        calculator.clear()
+        calculator.load(7)
+        self.assertEqual(splits.calls, ["SPL_abc", 7])
+
+    def test_failed_load(self) -> None:
+        calculator = SplitCalculator(
+            cast(Any, SimpleNamespace(splits=FakeSplits(None)))
+        )
+        with self.assertRaisesRegex(PaystackResponseError, "Split not found"):
+            calculator.load("SPL_missing")
+
+    @skipIf(numpy is None, "numpy is not installed")
+    def test_numpy_arrays(self) -> None:
+        rule = SplitRule.from_split(make_split(bearer_type=Bearer.ALL_PROPORTIONAL))
+        amounts = numpy.array([100_000, 7, 0], dtype=numpy.int64)
+        shares = rule.shares(amounts, numpy.array([1_501, 3, 0]))
+        self.assertIsInstance(shares.net_shares, numpy.ndarray)
+        self.assertEqual(
+            shares.totals, rule.shares(amounts.tolist(), [1_501, 3, 0]).totals
+        )
+
+
+class AsyncSplitCalculatorTestCase(IsolatedAsyncioTestCase):
+    async def test_loads_each_split_once(self) -> None:
+        splits = AsyncFakeSplits(make_split(bearer_type=Bearer.ALL))
+        fees_client = PaystackClient(secret_key="sk_test_splits")
+        client = SimpleNamespace(
+            splits=splits, calculate_fees=fees_client.calculate_fees
+        )
+        calculator = AsyncSplitCalculator(cast(Any, client))
+        shares = await calculator.shares("SPL_abc", [500_000], service="transfers")
+        await calculator.shares("SPL_abc", [500_000])
+        self.assertEqual(splits.calls, ["SPL_abc"])
+        self.assertEqual(as_lists(shares.fee_shares), [[333], [333], [334]])
@@ -0,0 +1,134 @@
+import asyncio
+from types import SimpleNamespace
+from typing import Any, AsyncIterator, cast
+from unittest import IsolatedAsyncioTestCase
+
+from pypaystack2.helpers import TransferReconciler, TransferStateChange
+from pypaystack2.models import Response, Transfer
+from tests.unit.fakes import make_response
+
+
+def make_transfer(reference: str, status: str) -> Transfer:
+    return Transfer.model_validate(
+        {
+            "integration": 1,
+            "domain": "test",
+            "amount": 5000,
+            "currency": "NGN",
+            "source": "balance",
+            "reason": "payout",
+            "reference": reference,
+            "recipient": 1,
+            "status": status,
+            "transfer_code": f"TRF_{reference}",
+            "id": 1,
+            "created_at": "2026-01-01T00:00:00.000Z",
+            "updated_at": "2026-01-01T00:00:00.000Z",
+            "session": {},
+        }
+    )
+
+
+class FakeTransfers:
+    """Moves each transfer through a scripted list of statuses, one per verification."""
+
+    def __init__(self, timelines: dict[str, list[str]]):
+        self.timelines = timelines
+        self.verifications: dict[str, int] = {reference: 0 for reference in timelines}
+        self.in_flight = 0
+        self.peak = 0
+
+    async def verify(self, reference: str) -> Response[Any]:
+        self.in_flight += 1
+        self.peak = max(self.peak, self.in_flight)
+        await asyncio.sleep(0.001)
+        self.in_flight -= 1
+        timeline = self.timelines[reference]
+        status = timeline[min(self.verifications[reference], len(timeline) - 1)]
+        self.verifications[reference] += 1
+        return make_response(
+            make_transfer(reference, status), message="Transfer retrieved"
+        )
+
+
+class TransferReconcilerTestCase(IsolatedAsyncioTestCase):
+    def make_reconciler(
+        self, transfers: FakeTransfers, **kwargs: Any
+    ) -> TransferReconciler:
+        return TransferReconciler(
+            cast(Any, SimpleNamespace(transfers=transfers)),
+            poll_interval=0.001,
+            max_poll_interval=0.01,
+            **kwargs,
+        )
+
+    async def test_polls_until_every_transfer_is_final(self) -> None:
+        timelines = {
+            f"ref-{i}": ["pending"] * (i % 4) + ["success" if i % 3 else "failed"]
+            for i in range(30)
+        }
+        transfers = FakeTransfers(timelines)
+        reconciler = self.make_reconciler(transfers, concurrency=8)
+        for reference in timelines:
+            reconciler.track(reference, "pending")
+        changes: list[TransferStateChange] = []
+        final_statuses = await reconciler.run(on_change=changes.append)
+
+        self.assertEqual(
+            final_statuses,
+            {reference: timeline[-1] for reference, timeline in timelines.items()},
+        )
+        self.assertEqual(reconciler.outstanding, {})
+        self.assertLessEqual(transfers.peak, 8)
+        self.assertTrue(all(change.previous_status == "pending" for change in changes))
+        # a transfer is no longer verified once it is final
+        for reference, timeline in timelines.items():
+            self.assertEqual(transfers.verifications[reference], len(timeline))
+
+    async def test_reports_intermediate_changes(self) -> None:
+        transfers = FakeTransfers({"ref-1": ["otp", "pending", "pending", "reversed"]})
+        reconciler = self.make_reconciler(transfers)
+        reconciler.track("ref-1")
+        changes = [change async for change in reconciler.changes()]
+        self.assertEqual(
+            [(change.status, change.final) for change in changes],
+            [("otp", False), ("pending", False), ("reversed", True)],
+        )
+
+    async def test_webhook_short_circuits_polling(self) -> None:
+        transfers = FakeTransfers({"ref-1": ["pending"], "ref-2": ["pending"]})
+        reconciler = TransferReconciler(
+            cast(Any, SimpleNamespace(transfers=transfers)), poll_interval=60
+        )
+        reconciler.track("ref-1", "pending")
+        reconciler.track("ref-2", "pending")
+
+        async def deliver_webhooks() -> None:
+            await asyncio.sleep(0.01)
+            self.assertFalse(
+                reconciler.handle_webhook({"event": "charge.success", "data": {}})
+            )
+            for reference, event in (
+                ("ref-1", "transfer.success"),
+                ("ref-2", "transfer.reversed"),
+            ):
+                self.assertTrue(
+                    reconciler.handle_webhook(
+                        {"event": event, "data": {"reference": reference}}
+                    )
+                )
+
+        delivery = asyncio.create_task(deliver_webhooks())
+        received = await asyncio.wait_for(self.collect(reconciler.changes()), timeout=1)
+        await delivery
+        self.assertEqual(
+            {(change.reference, change.status, change.source) for change in received},
+            {("ref-1", "success", "webhook"), ("ref-2", "reversed", "webhook")},
+        )
+        self.assertEqual(transfers.verifications, {"ref-1": 1, "ref-2": 1})
+
+    @staticmethod
+    async def collect(
+        changes: AsyncIterator[TransferStateChange],
+    ) -> list[TransferStateChange]:
+        return [change async for change in changes]